@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Dict
 
 from edenai_apis.features import OcrInterface
@@ -14,6 +15,7 @@ from edenai_apis.features.ocr.receipt_parser import ReceiptParserDataClass
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.credentials import credential_broker
 from edenai_apis.utils.types import ResponseType
 from .client import Client
 from .document import FileParameter, UploadDocumentParams
@@ -28,6 +30,7 @@ from .standardization import (
 
 class AffindaApi(ProviderInterface, OcrInterface):
     provider_name = "affinda"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}):
         super().__init__()
@@ -35,18 +38,37 @@ class AffindaApi(ProviderInterface, OcrInterface):
             ProviderDataEnum.KEY, self.provider_name, api_keys=api_keys
         )
 
-        self.client = Client(self.api_settings["api_key"])
-        self.client.current_organization = self.client.get_organizations()[0].identifier
+        self.credentials = {"api_key": self.api_settings["api_key"]}
+        # the organization is looked up once per api key
+        self.organization = credential_broker.get(
+            self.provider_name,
+            self.credentials,
+            lambda: (self._new_client().get_organizations()[0], None),
+        )
+
+    def _new_client(self) -> Client:
+        return Client(
+            self.api_settings["api_key"],
+            on_unauthorized=partial(
+                credential_broker.invalidate, self.provider_name, self.credentials
+            ),
+        )
+
+    def _workspace_client(self, workspace_key: str) -> Client:
+        """Return a client for one call, the client keeps the current workspace and
+        the last response so it is not shared between concurrent calls"""
+        client = self._new_client()
+        client.current_organization = self.organization
+        client.current_workspace = self.api_settings[workspace_key]
+        return client
 
     def ocr__resume_parser(
         self, file: str, file_url: str = "", model: str = None
     ) -> ResponseType[ResumeParserDataClass]:
-        self.client.current_workspace = self.api_settings["nextgen_resume_parser"]
+        client = self._workspace_client("nextgen_resume_parser")
 
-        document = self.client.create_document(
-            file=FileParameter(file=file, url=file_url)
-        )
-        original_response = self.client.last_api_response
+        document = client.create_document(file=FileParameter(file=file, url=file_url))
+        original_response = client.last_api_response
 
         standardizer = ResumeStandardizer(document=document)
         standardizer.std_personnal_information()
@@ -55,7 +77,7 @@ class AffindaApi(ProviderInterface, OcrInterface):
         standardizer.std_skills()
         standardizer.std_miscellaneous()
 
-        self.client.delete_document(document.meta.identifier)
+        client.delete_document(document.meta.identifier)
 
         return ResponseType[ResumeParserDataClass](
             original_response=original_response,
@@ -65,12 +87,10 @@ class AffindaApi(ProviderInterface, OcrInterface):
     def ocr__invoice_parser(
         self, file: str, language: str, file_url: str = ""
     ) -> ResponseType[InvoiceParserDataClass]:
-        self.client.current_workspace = self.api_settings["invoice_workspace"]
+        client = self._workspace_client("invoice_workspace")
 
-        document = self.client.create_document(
-            file=FileParameter(file=file, url=file_url)
-        )
-        original_response = self.client.last_api_response
+        document = client.create_document(file=FileParameter(file=file, url=file_url))
+        original_response = client.last_api_response
 
         standardizer = InvoiceStandardizer(document=document)
         standardizer.std_merchant_informations()
@@ -89,12 +109,12 @@ class AffindaApi(ProviderInterface, OcrInterface):
     def ocr__receipt_parser(
         self, file: str, language: str, file_url: str = ""
     ) -> ResponseType[ReceiptParserDataClass]:
-        self.client.current_workspace = self.api_settings["receipt_workspace"]
-        document = self.client.create_document(
+        client = self._workspace_client("receipt_workspace")
+        document = client.create_document(
             file=FileParameter(file=file, url=file_url),
             parameters=UploadDocumentParams(language=language),
         )
-        original_response = self.client.last_api_response
+        original_response = client.last_api_response
 
         standardizer = ReceiptStandardizer(document=document)
         standardizer.std_merchant_informations()
@@ -112,11 +132,9 @@ class AffindaApi(ProviderInterface, OcrInterface):
     def ocr__identity_parser(
         self, file: str, file_url: str = "", model: str = None
     ) -> ResponseType[IdentityParserDataClass]:
-        self.client.current_workspace = self.api_settings["identity_workspace"]
-        document = self.client.create_document(
-            file=FileParameter(file=file, url=file_url)
-        )
-        original_response = self.client.last_api_response
+        client = self._workspace_client("identity_workspace")
+        document = client.create_document(file=FileParameter(file=file, url=file_url))
+        original_response = client.last_api_response
 
         standardizer = IdentityStandardizer(document=document)
         standardizer.std_names_information()
@@ -141,11 +159,9 @@ class AffindaApi(ProviderInterface, OcrInterface):
             if document_type == FinancialParserType.RECEIPT.value
             else "invoice_workspace"
         )
-        self.client.current_workspace = self.api_settings[workspace_key]
-        document = self.client.create_document(
-            file=FileParameter(file=file, url=file_url)
-        )
-        original_response = self.client.last_api_response
+        client = self._workspace_client(workspace_key)
+        document = client.create_document(file=FileParameter(file=file, url=file_url))
+        original_response = client.last_api_response
         standardizer = FinancialStandardizer(
             document=document, original_response=original_response
         )
@@ -2,13 +2,13 @@ from enum import Enum
 from http import HTTPStatus
 from io import BufferedReader
 from json import JSONDecodeError
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
 from warnings import warn
 
 import requests
 
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.http import HTTPMethod
+from edenai_apis.utils.http import HTTPMethod, http_client
 from .document import DocumentState, FileParameter, QueryBuilder, UploadDocumentParams
 from .models import Document, Organization, Workspace, Collection
 
@@ -87,8 +87,11 @@ class Client:
     __current_collection: Optional[Collection]
     __last_api_response: Optional[dict]
 
-    def __init__(self, api_keys: str) -> None:
+    def __init__(
+        self, api_keys: str, on_unauthorized: Optional[Callable[[], None]] = None
+    ) -> None:
         self.__api_keys = api_keys
+        self.__on_unauthorized = on_unauthorized
         self.headers = {"Authorization": f"Bearer {self.__api_keys}"}
         self.__current_organization = None
         self.__current_workspace = None
@@ -127,7 +130,7 @@ class Client:
         Returns:
             dict: The response of the request in json format. If status_code is 204, return { 'status_code': 204 }
         """
-        response: requests.Response = requests.request(
+        response: requests.Response = http_client.request(
             method=method.value,
             url=url,
             data=data,
@@ -146,6 +149,11 @@ class Client:
             self.__last_api_response = response.json()
             return self.__last_api_response
         except requests.exceptions.HTTPError as exc:
+            if (
+                response.status_code == HTTPStatus.UNAUTHORIZED
+                and self.__on_unauthorized is not None
+            ):
+                self.__on_unauthorized()
             raise ProviderException(
                 message=f"{exc}\nError message: {exc.response.text}",
                 code=response.status_code,
@@ -196,7 +204,7 @@ class Client:
             Return the current_organization property
 
         Set:
-            Set the current_organization property by the given identifier
+            Set the current_organization property by the given identifier (or organization)
 
         Exemples:
             >>> from edenai_apis.apis.affinda import client
@@ -207,8 +215,11 @@ class Client:
         return self.__current_organization
 
     @current_organization.setter
-    def current_organization(self, identifier: str) -> None:
-        self.__current_organization = self.get_organization(identifier)
+    def current_organization(self, identifier: Union[str, Organization]) -> None:
+        if isinstance(identifier, Organization):
+            self.__current_organization = identifier
+        else:
+            self.__current_organization = self.get_organization(identifier)
 
     @current_organization.deleter
     def current_organization(self) -> None:
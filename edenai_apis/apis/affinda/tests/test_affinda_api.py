@@ -0,0 +1,56 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest_mock import MockerFixture
+
+from edenai_apis.apis.affinda.affinda_api import AffindaApi
+from edenai_apis.apis.affinda.client import Client
+from edenai_apis.features.ocr import InvoiceParserDataClass
+from edenai_apis.features.ocr.receipt_parser import ReceiptParserDataClass
+from edenai_apis.loaders.provider_pool import ProviderPool
+
+
+def test_concurrent_calls_on_pooled_instance(mocker: MockerFixture):
+    mocker.patch(
+        "edenai_apis.apis.affinda.affinda_api.load_provider",
+        return_value={
+            "api_key": "pooled key",
+            "invoice_workspace": "invoices",
+            "receipt_workspace": "receipts",
+        },
+    )
+    mocker.patch.object(Client, "get_organizations", return_value=["organization"])
+    mocker.patch.object(Client, "get_organization", side_effect=lambda id_: id_)
+    mocker.patch.object(Client, "get_workspace", side_effect=lambda id_: id_)
+
+    def create_document(client, file, parameters=None):
+        # the workspace is read after the upload, as the request would
+        time.sleep(0.05)
+        client._Client__last_api_response = {"workspace": client.current_workspace}
+        return mocker.MagicMock()
+
+    mocker.patch.object(Client, "create_document", create_document)
+    for standardizer, dataclass in (
+        ("InvoiceStandardizer", InvoiceParserDataClass),
+        ("ReceiptStandardizer", ReceiptParserDataClass),
+    ):
+        mocker.patch(
+            f"edenai_apis.apis.affinda.affinda_api.{standardizer}"
+        ).return_value.standardized_response = dataclass(extracted_data=[])
+
+    pool = ProviderPool(max_size=4, ttl=0, factory=lambda _, keys: AffindaApi(keys))
+    api = pool.get("affinda")
+    assert pool.get("affinda") is api
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            (
+                workspace,
+                executor.submit(
+                    getattr(api, f"ocr__{workspace[:-1]}_parser"), "file", "en"
+                ),
+            )
+            for workspace in ["invoices", "receipts"] * 4
+        ]
+        for workspace, future in futures:
+            assert future.result().original_response == {"workspace": workspace}
@@ -1,6 +1,5 @@
 from typing import Dict, Any, List, Optional, Union
 import json
-import requests
 import boto3
 from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.features.text import GenerationDataClass, SummarizeDataClass
@@ -15,6 +14,7 @@ from edenai_apis.features.text.spell_check.spell_check_dataclass import (
 )
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.apis.amazon.helpers import handle_amazon_call
 from edenai_apis.utils.exception import ProviderException
@@ -22,6 +22,7 @@ from edenai_apis.utils.exception import ProviderException
 
 class Ai21labsApi(ProviderInterface, TextInterface):
     provider_name = "ai21labs"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}) -> None:
         self.api_settings = load_provider(
@@ -77,7 +78,7 @@ class Ai21labsApi(ProviderInterface, TextInterface):
         Returns:
             Union[Dict[str, Any], None]: The JSON response from the API, or None if there's an error.
         """
-        response = requests.post(
+        response = http_client.post(
             f"{self.base_url}/{url}", json=payload, headers=self.headers
         )
         try:
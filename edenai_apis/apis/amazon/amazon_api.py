@@ -22,6 +22,7 @@ class AmazonApi(
     AmazonVideoApi,
 ):
     provider_name = "amazon"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}) -> None:
         self.api_settings = load_provider(
@@ -6,7 +6,6 @@ from io import BufferedReader, BytesIO
 from pathlib import Path
 from typing import Optional
 
-import requests
 from botocore.exceptions import BotoCoreError, ClientError
 
 from edenai_apis.apis.amazon.helpers import (
@@ -27,6 +26,7 @@ from edenai_apis.features.audio.text_to_speech.text_to_speech_dataclass import (
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.ssml import is_ssml
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
@@ -93,7 +93,9 @@ class AmazonAudioApi(AudioInterface):
         voice_type = 1
 
         audio_content.seek(0)
-        resource_url = upload_file_bytes_to_s3(audio_content, f".{ext}", USER_PROCESS)
+        resource_url = upload_file_bytes_to_s3(
+            audio_content, f".{ext}", USER_PROCESS, background=True
+        )
 
         standardized_response = TextToSpeechDataClass(
             audio=audio_file, voice_type=voice_type, audio_resource_url=resource_url
@@ -434,7 +436,7 @@ class AmazonAudioApi(AudioInterface):
                 output_uri.split("/")[-1], URL_LONG_PERIOD
             )
             synthesis_task["OutputUri"] = file_url
-            response_file = requests.get(file_url)
+            response_file = http_client.get(file_url)
             print(response_file.content)
             audio_content = BytesIO(response_file.content)
             audio = base64.b64encode(audio_content.read()).decode("utf-8")
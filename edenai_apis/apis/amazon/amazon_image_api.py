@@ -66,7 +66,7 @@ from edenai_apis.features.image.object_detection.object_detection_dataclass impo
 from edenai_apis.utils.conversion import standardized_confidence_score
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.types import ResponseType
-from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
+from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_files_bytes_to_s3
 
 
 class AmazonImageApi(ImageInterface):
@@ -502,14 +502,18 @@ class AmazonImageApi(ImageInterface):
             self.clients["bedrock"].invoke_model, **request_params
         )
         response_body = json.loads(response.get("body").read())
-        generated_images = []
-        for image in response_body["images"]:
-            base64_bytes = image.encode("ascii")
-            image_bytes = BytesIO(base64.b64decode(base64_bytes))
-            resource_url = upload_file_bytes_to_s3(image_bytes, ".png", USER_PROCESS)
-            generated_images.append(
-                GeneratedImageDataClass(image=image, image_resource_url=resource_url)
-            )
+        resource_urls = upload_files_bytes_to_s3(
+            [
+                (BytesIO(base64.b64decode(image.encode("ascii"))), ".png")
+                for image in response_body["images"]
+            ],
+            USER_PROCESS,
+            background=True,
+        )
+        generated_images = [
+            GeneratedImageDataClass(image=image, image_resource_url=resource_url)
+            for image, resource_url in zip(response_body["images"], resource_urls)
+        ]
 
         return ResponseType[GenerationDataClass](
             original_response=response_body,
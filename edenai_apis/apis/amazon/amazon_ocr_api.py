@@ -34,7 +34,6 @@ from edenai_apis.features.ocr.receipt_parser.receipt_parser_dataclass import (
 from edenai_apis.features.ocr.financial_parser.financial_parser_dataclass import (
     FinancialParserDataClass,
 )
-from edenai_apis.utils.async_to_sync import fibonacci_waiting_call
 from edenai_apis.utils.exception import (
     AsyncJobException,
     AsyncJobExceptionReason,
@@ -55,7 +54,10 @@ from .helpers import (
     amazon_invoice_parser_formatter,
     amazon_receipt_parser_formatter,
     amazon_financial_parser_formatter,
+    amazon_paginated_responses,
+    collect_pages,
     handle_amazon_call,
+    wait_for_textract_job,
 )
 
 
@@ -78,16 +80,16 @@ class AmazonOcrApi(OcrInterface):
             self.clients["textract"].detect_document_text, **payload
         )
 
-        final_text = ""
         output_value = json.dumps(response, ensure_ascii=False)
         original_response = json.loads(output_value)
+        lines_text: List[str] = []
         boxes: Sequence[Bounding_box] = []
 
         # Get region of text
         for region in original_response.get("Blocks"):
             if region.get("BlockType") == "LINE":
                 # Read line by region
-                final_text += " " + region.get("Text")
+                lines_text.append(region.get("Text"))
 
             if region.get("BlockType") == "WORD":
                 boxes.append(
@@ -100,6 +102,7 @@ class AmazonOcrApi(OcrInterface):
                     )
                 )
 
+        final_text = " ".join(lines_text)
         standardized = OcrDataClass(
             text=final_text.replace("\n", " ").strip(), bounding_boxes=boxes
         )
@@ -251,26 +254,12 @@ class AmazonOcrApi(OcrInterface):
             )
             raise ProviderException(error)
 
-        pagination_token = response.get("NextToken")
-        pages = [response]
-        if not pagination_token:
-            return AsyncResponseType[OcrTablesAsyncDataClass](
-                original_response=pages,
-                standardized_response=amazon_ocr_tables_parser(pages),
-                provider_job_id=job_id,
+        # tables can span several pages, they are parsed once all pages are fetched
+        pages = list(
+            amazon_paginated_responses(
+                self.clients["textract"].get_document_analysis, response, JobId=job_id
             )
-
-        finished = False
-        while not finished:
-            response = self.clients["textract"].get_document_analysis(
-                JobId=job_id,
-                NextToken=pagination_token,
-            )
-            pages.append(response)
-            if "NextToken" in response:
-                pagination_token = response["NextToken"]
-            else:
-                finished = True
+        )
 
         return AsyncResponseType[OcrTablesAsyncDataClass](
             original_response=pages,
@@ -336,30 +325,21 @@ class AmazonOcrApi(OcrInterface):
             )
             raise ProviderException(error)
 
-        pagination_token = response.get("NextToken")
-        pages = [response]
-        if not pagination_token:
-            return AsyncResponseType[CustomDocumentParsingAsyncDataClass](
-                original_response=pages,
-                standardized_response=amazon_custom_document_parsing_formatter(pages),
-                provider_job_id=provider_job_id,
+        pages: List[dict] = []
+        standardized_response = amazon_custom_document_parsing_formatter(
+            collect_pages(
+                amazon_paginated_responses(
+                    self.clients["textract"].get_document_analysis,
+                    response,
+                    JobId=provider_job_id,
+                ),
+                pages,
             )
-
-        finished = False
-        while not finished:
-            response = self.clients["textract"].get_document_analysis(
-                JobId=provider_job_id,
-                NextToken=pagination_token,
-            )
-            pages.append(response)
-            if "NextToken" in response:
-                pagination_token = response["NextToken"]
-            else:
-                finished = True
+        )
 
         return AsyncResponseType[CustomDocumentParsingAsyncDataClass](
             original_response=pages,
-            standardized_response=amazon_custom_document_parsing_formatter(pages),
+            standardized_response=standardized_response,
             provider_job_id=provider_job_id,
         )
 
@@ -386,46 +366,29 @@ class AmazonOcrApi(OcrInterface):
         # Get job result
         job_id = launch_job_response.get("JobId")
         get_response = self.clients["textract"].get_expense_analysis(JobId=job_id)
+        get_response = wait_for_textract_job(
+            self.clients["textract"].get_expense_analysis,
+            timeout=60,
+            first_response=get_response,
+            JobId=job_id,
+        )
 
-        if get_response["JobStatus"] == "FAILED":
-            error: str = get_response.get(
-                "StatusMessage", "Amazon returned a job status: FAILED"
-            )
-            raise ProviderException(error)
-
-        waiting_args = {"JobId": job_id}
-        get_response = fibonacci_waiting_call(
-            max_time=60,
-            status="SUCCEEDED",
-            func=self.clients["textract"].get_expense_analysis,
-            provider_handel_call=handle_amazon_call,
-            **waiting_args,
-        )  # waiting exponentially using fibonacci
-
-        # Check if NextToken exist
-        pagination_token = get_response.get("NextToken")
-        pages = [get_response]
-        if not pagination_token:
-            return ResponseType(
-                original_response=pages,
-                standardized_response=amazon_invoice_parser_formatter(pages),
-            )
-
-        finished = False
-        while not finished:
-            get_response = self.clients["textract"].get_expense_analysis(
-                JobId=job_id,
-                NextToken=pagination_token,
+        # expense documents are standardized while the next pages are fetched
+        pages: List[dict] = []
+        standardized_response = amazon_invoice_parser_formatter(
+            collect_pages(
+                amazon_paginated_responses(
+                    self.clients["textract"].get_expense_analysis,
+                    get_response,
+                    JobId=job_id,
+                ),
+                pages,
             )
-            pages.append(get_response)
-            if "NextToken" in get_response:
-                pagination_token = get_response["NextToken"]
-            else:
-                finished = True
+        )
 
         return ResponseType(
             original_response=pages,
-            standardized_response=amazon_invoice_parser_formatter(pages),
+            standardized_response=standardized_response,
         )
 
     def ocr__receipt_parser(
@@ -451,46 +414,29 @@ class AmazonOcrApi(OcrInterface):
         # Get job result
         job_id = launch_job_response.get("JobId")
         get_response = self.clients["textract"].get_expense_analysis(JobId=job_id)
-
-        if get_response["JobStatus"] == "FAILED":
-            error: str = get_response.get(
-                "StatusMessage", "Amazon returned a job status: FAILED"
-            )
-            raise ProviderException(error)
-
-        waiting_args = {"JobId": job_id}
-        get_response = fibonacci_waiting_call(
-            max_time=60,
-            status="SUCCEEDED",
-            func=self.clients["textract"].get_expense_analysis,
-            provider_handel_call=handle_amazon_call,
-            **waiting_args,
+        get_response = wait_for_textract_job(
+            self.clients["textract"].get_expense_analysis,
+            timeout=60,
+            first_response=get_response,
+            JobId=job_id,
         )
 
-        # Check if NextToken exist
-        pagination_token = get_response.get("NextToken")
-        pages = [get_response]
-        if not pagination_token:
-            return ResponseType(
-                original_response=pages,
-                standardized_response=amazon_receipt_parser_formatter(pages),
-            )
-
-        finished = False
-        while not finished:
-            get_response = self.clients["textract"].get_expense_analysis(
-                JobId=job_id,
-                NextToken=pagination_token,
+        # expense documents are standardized while the next pages are fetched
+        pages: List[dict] = []
+        standardized_response = amazon_receipt_parser_formatter(
+            collect_pages(
+                amazon_paginated_responses(
+                    self.clients["textract"].get_expense_analysis,
+                    get_response,
+                    JobId=job_id,
+                ),
+                pages,
             )
-            pages.append(get_response)
-            if "NextToken" in get_response:
-                pagination_token = get_response["NextToken"]
-            else:
-                finished = True
+        )
 
         return ResponseType(
             original_response=pages,
-            standardized_response=amazon_receipt_parser_formatter(pages),
+            standardized_response=standardized_response,
         )
 
     def ocr__ocr_async__launch_job(
@@ -529,30 +475,22 @@ class AmazonOcrApi(OcrInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["textract"].get_document_text_detection, **payload
+            # pages are standardized while the next ones are fetched
+            responses: List[dict] = []
+            standardized_response = amazon_ocr_async_formatter(
+                collect_pages(
+                    amazon_paginated_responses(
+                        self.clients["textract"].get_document_text_detection,
+                        response,
+                        JobId=provider_job_id,
+                    ),
+                    responses,
                 )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
+            )
 
             return AsyncResponseType(
                 original_response=responses,
-                standardized_response=amazon_ocr_async_formatter(responses),
+                standardized_response=standardized_response,
                 provider_job_id=provider_job_id,
             )
 
@@ -581,46 +519,24 @@ class AmazonOcrApi(OcrInterface):
                 self.clients["textract"].start_document_analysis, **payload
             )
 
-            waiting_args = {"JobId": launch_job_response["JobId"]}
-            response = fibonacci_waiting_call(
-                max_time=100,
-                status="IN_PROGRESS",
-                func=self.clients["textract"].get_document_analysis,
-                provider_handel_call=handle_amazon_call,
-                status_positif=False,
-                **waiting_args,
+            response = wait_for_textract_job(
+                self.clients["textract"].get_document_analysis,
+                timeout=100,
+                JobId=launch_job_response["JobId"],
             )
 
-            if response["JobStatus"] == "FAILED":
-                error: str = response.get(
-                    "StatusMessage", "Amazon returned a job status: FAILED"
+            # key/value relationships can span pages, keep all of them
+            responses = list(
+                amazon_paginated_responses(
+                    self.clients["textract"].get_document_analysis,
+                    response,
+                    JobId=launch_job_response["JobId"],
                 )
-                raise ProviderException(error)
-
-            responses = [response]
-
-            standardized_response = amazon_data_extraction_formatter(responses)
-
-            while pagination_token := response.get("NextToken"):
-                payload = {
-                    "JobId": launch_job_response["JobId"],
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["textract"].get_document_analysis, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
+            )
 
             return ResponseType[DataExtractionDataClass](
-                original_response=response,
-                standardized_response=standardized_response,
+                original_response=responses[-1],
+                standardized_response=amazon_data_extraction_formatter(responses),
             )
 
     def ocr__financial_parser(
@@ -650,44 +566,27 @@ class AmazonOcrApi(OcrInterface):
         # Get job result
         job_id = launch_job_response.get("JobId")
         get_response = self.clients["textract"].get_expense_analysis(JobId=job_id)
+        get_response = wait_for_textract_job(
+            self.clients["textract"].get_expense_analysis,
+            timeout=60,
+            first_response=get_response,
+            JobId=job_id,
+        )
 
-        if get_response["JobStatus"] == "FAILED":
-            error: str = get_response.get(
-                "StatusMessage", "Amazon returned a job status: FAILED"
-            )
-            raise ProviderException(error)
-
-        waiting_args = {"JobId": job_id}
-        get_response = fibonacci_waiting_call(
-            max_time=60,
-            status="SUCCEEDED",
-            func=self.clients["textract"].get_expense_analysis,
-            provider_handel_call=handle_amazon_call,
-            **waiting_args,
-        )  # waiting exponentially using fibonacci
-
-        # Check if NextToken exist
-        pagination_token = get_response.get("NextToken")
-        pages = [get_response]
-        if not pagination_token:
-            return ResponseType(
-                original_response=pages,
-                standardized_response=amazon_financial_parser_formatter(pages),
-            )
-
-        finished = False
-        while not finished:
-            get_response = self.clients["textract"].get_expense_analysis(
-                JobId=job_id,
-                NextToken=pagination_token,
+        # expense documents are standardized while the next pages are fetched
+        pages: List[dict] = []
+        standardized_response = amazon_financial_parser_formatter(
+            collect_pages(
+                amazon_paginated_responses(
+                    self.clients["textract"].get_expense_analysis,
+                    get_response,
+                    JobId=job_id,
+                ),
+                pages,
             )
-            pages.append(get_response)
-            if "NextToken" in get_response:
-                pagination_token = get_response["NextToken"]
-            else:
-                finished = True
+        )
 
         return ResponseType(
             original_response=pages,
-            standardized_response=amazon_financial_parser_formatter(pages),
+            standardized_response=standardized_response,
         )
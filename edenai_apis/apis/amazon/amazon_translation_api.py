@@ -1,9 +1,18 @@
-from typing import Sequence
+from typing import List, Sequence
 
 from edenai_apis.apis.amazon.helpers import handle_amazon_call
 from edenai_apis.features.translation.automatic_translation.automatic_translation_dataclass import (
     AutomaticTranslationDataClass,
 )
+from edenai_apis.features.translation.automatic_translation_batch import (
+    AutomaticTranslationBatchDataClass,
+)
+from edenai_apis.features.translation.automatic_translation_batch.helpers import (
+    BatchLimits,
+    TranslatedPack,
+    translate_in_batches,
+    utf8_size,
+)
 from edenai_apis.features.translation.language_detection.language_detection_dataclass import (
     InfosLanguageDetectionDataClass,
     LanguageDetectionDataClass,
@@ -12,6 +21,10 @@ from edenai_apis.features.translation.translation_interface import TranslationIn
 from edenai_apis.utils.languages import get_language_name_from_code
 from edenai_apis.utils.types import ResponseType
 
+# TranslateText takes one text of up to 10 000 bytes, batch translation jobs go
+# through S3 and are too slow for synchronous calls
+AMAZON_BATCH_LIMITS = BatchLimits(max_items=1, max_size=10000, text_size=utf8_size)
+
 
 class AmazonTranslationApi(TranslationInterface):
     def translation__language_detection(
@@ -52,3 +65,23 @@ class AmazonTranslationApi(TranslationInterface):
         return ResponseType[AutomaticTranslationDataClass](
             original_response=response, standardized_response=standardized
         )
+
+    def translation__automatic_translation_batch(
+        self, source_language: str, target_language: str, texts: List[str]
+    ) -> ResponseType[AutomaticTranslationBatchDataClass]:
+        def translate_pack(pack: List[str]) -> TranslatedPack:
+            response = handle_amazon_call(
+                self.clients["translate"].translate_text,
+                Text=pack[0],
+                SourceLanguageCode=source_language,
+                TargetLanguageCode=target_language,
+            )
+            return [response["TranslatedText"]], response
+
+        standardized_response, original_response = translate_in_batches(
+            texts, translate_pack, AMAZON_BATCH_LIMITS
+        )
+        return ResponseType[AutomaticTranslationBatchDataClass](
+            original_response=original_response,
+            standardized_response=standardized_response,
+        )
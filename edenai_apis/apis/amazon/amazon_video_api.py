@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 import base64
 from io import BytesIO
 
@@ -32,6 +32,8 @@ from edenai_apis.utils.types import (
 )
 from .helpers import (
     amazon_get_video_data,
+    amazon_paginated_responses,
+    collect_pages,
     handle_amazon_call,
     amazon_video_person_tracking_parser,
     amazon_video_labels_parser,
@@ -166,29 +168,18 @@ class AmazonVideoApi(VideoInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_label_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
+            # pages are standardized while the next ones are fetched
+            responses: List[dict] = []
             labels = []
-            for response in responses:
-                labels.extend(amazon_video_labels_parser(response))
+            for page in collect_pages(
+                amazon_paginated_responses(
+                    self.clients["video"].get_label_detection,
+                    response,
+                    JobId=provider_job_id,
+                ),
+                responses,
+            ):
+                labels.extend(amazon_video_labels_parser(page))
 
             return AsyncResponseType(
                 original_response=responses,
@@ -212,29 +203,18 @@ class AmazonVideoApi(VideoInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_text_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
+            # pages are standardized while the next ones are fetched
+            responses: List[dict] = []
             texts = []
-            for response in responses:
-                texts.extend(amazon_video_text_parser(response))
+            for page in collect_pages(
+                amazon_paginated_responses(
+                    self.clients["video"].get_text_detection,
+                    response,
+                    JobId=provider_job_id,
+                ),
+                responses,
+            ):
+                texts.extend(amazon_video_text_parser(page))
 
             return AsyncResponseType(
                 original_response=responses,
@@ -258,29 +238,18 @@ class AmazonVideoApi(VideoInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_face_detection, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
+            # pages are standardized while the next ones are fetched
+            responses: List[dict] = []
             faces = []
-            for response in responses:
-                faces.extend(amazon_video_face_parser(response))
+            for page in collect_pages(
+                amazon_paginated_responses(
+                    self.clients["video"].get_face_detection,
+                    response,
+                    JobId=provider_job_id,
+                ),
+                responses,
+            ):
+                faces.extend(amazon_video_face_parser(page))
 
             return AsyncResponseType(
                 original_response=responses,
@@ -304,29 +273,18 @@ class AmazonVideoApi(VideoInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_person_tracking, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
+            # pages are standardized while the next ones are fetched
+            responses: List[dict] = []
             persons = []
-            for response in responses:
-                persons.extend(amazon_video_person_tracking_parser(response))
+            for page in collect_pages(
+                amazon_paginated_responses(
+                    self.clients["video"].get_person_tracking,
+                    response,
+                    JobId=provider_job_id,
+                ),
+                responses,
+            ):
+                persons.extend(amazon_video_person_tracking_parser(page))
 
             return AsyncResponseType(
                 original_response=responses,
@@ -350,29 +308,18 @@ class AmazonVideoApi(VideoInterface):
             raise ProviderException(error)
 
         if response["JobStatus"] == "SUCCEEDED":
-            pagination_token = response.get("NextToken")
-            responses = [response]
-            while pagination_token:
-                payload = {
-                    "JobId": provider_job_id,
-                    "NextToken": pagination_token,
-                }
-                response = handle_amazon_call(
-                    self.clients["video"].get_content_moderation, **payload
-                )
-
-                if response["JobStatus"] == "FAILED":
-                    error: str = response.get(
-                        "StatusMessage", "Amazon returned a job status: FAILED"
-                    )
-                    raise ProviderException(error)
-
-                responses.append(response)
-                pagination_token = response.get("NextToken")
-
+            # pages are standardized while the next ones are fetched
+            responses: List[dict] = []
             moderated_content = []
-            for response in responses:
-                moderated_content.extend(amazon_video_explicit_parser(response))
+            for page in collect_pages(
+                amazon_paginated_responses(
+                    self.clients["video"].get_content_moderation,
+                    response,
+                    JobId=provider_job_id,
+                ),
+                responses,
+            ):
+                moderated_content.extend(amazon_video_explicit_parser(page))
 
             return AsyncResponseType(
                 original_response=responses,
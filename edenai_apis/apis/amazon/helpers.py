@@ -1,9 +1,23 @@
+import os
+import queue
+import threading
 import urllib
+from collections import defaultdict
+from functools import partial
 from pathlib import Path
 from time import time
-from typing import Callable, Dict, List, Optional, Tuple, TypeVar, Sequence
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Sequence,
+)
 
-import requests
 from botocore.exceptions import ClientError, ParamValidationError
 from trp import Document
 
@@ -92,6 +106,7 @@ from edenai_apis.features.video.text_detection_async.text_detection_async_datacl
 )
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.async_to_sync import PollingPolicy, poll_until
 from edenai_apis.utils.bounding_box import BoundingBox as BBox
 from edenai_apis.utils.conversion import convert_string_to_number
 from edenai_apis.utils.exception import (
@@ -99,10 +114,13 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.ssml import convert_audio_attr_in_prosody_tag
 from edenai_apis.utils.types import (
     ResponseType,
+    include_original_response,
 )
+from edenai_apis.utils.upload_cache import cached_upload, hash_file
 from .config import storage_clients
 
 
@@ -121,7 +139,7 @@ def check_webhook_result(job_id: str, api_settings: dict) -> Dict:
         f"https://webhook.site/token/{webhook_token}/requests"
         + f"?sorting=newest&query={urllib.parse.quote_plus('content:'+str(job_id))}"
     )
-    webhook_response = requests.get(url=webhook_get_url, headers={"Api-Key": api_key})
+    webhook_response = http_client.get(url=webhook_get_url, headers={"Api-Key": api_key})
     response_status = webhook_response.status_code
     try:
         return webhook_response.json().get("data"), response_status
@@ -187,6 +205,12 @@ def _ocr_tables_standarize_cell(cell) -> Cell:
 
 T = TypeVar("T")
 
+# NextToken pages fetched ahead while the current page is standardized, see
+# `amazon_paginated_responses`
+AMAZON_PAGINATION_PREFETCH = int(os.environ.get("AMAZON_PAGINATION_PREFETCH", 2))
+# Textract jobs of a few pages are usually done in a few seconds
+AMAZON_POLLING_POLICY = PollingPolicy(initial_delay=1, max_delay=8)
+
 
 # Video analysis async
 def _upload_video_file_to_amazon_server(file: str, file_name: str, api_settings: Dict):
@@ -196,12 +220,18 @@ def _upload_video_file_to_amazon_server(file: str, file_name: str, api_settings:
     """
     # Store file in an Amazon server
     file_extension = file.split(".")[-1]
-    filename = str(int(time())) + file_name.stem + "_video_." + file_extension
-    storage_clients(api_settings)["video"].meta.client.upload_file(
-        file, api_settings["bucket_video"], filename
-    )
 
-    return filename
+    def upload() -> str:
+        filename = str(int(time())) + file_name.stem + "_video_." + file_extension
+        storage_clients(api_settings)["video"].meta.client.upload_file(
+            file, api_settings["bucket_video"], filename
+        )
+        return filename
+
+    # the same video is only uploaded once for all video features
+    return cached_upload(
+        ("s3", api_settings["bucket_video"], file_extension), hash_file(file), upload
+    )
 
 
 def amazon_get_video_data(file: str):
@@ -237,14 +267,16 @@ def amazon_video_original_response(
 
 
 def amazon_custom_document_parsing_formatter(
-    pages: List[dict],
+    pages: Iterable[dict],
 ) -> ResponseType[CustomDocumentParsingAsyncDataClass]:
     """
     Take response form amazon by pages
     Return custom document parser dataclass
     """
+    block_index = TextractBlockIndex()
     items = []
     for index, page in enumerate(pages):
+        block_index.add_response(page)
         for block in page["Blocks"]:
             if block["BlockType"] == "QUERY_RESULT":
                 if block.get("Geometry"):
@@ -260,7 +292,7 @@ def amazon_custom_document_parsing_formatter(
                     width=width,
                     height=height,
                 )
-                query = query_answer_result(page["Blocks"], block["Id"])
+                query = query_answer_result(block_index, block["Id"])
                 if not query:
                     continue
                 item = CustomDocumentParsingAsyncItem(
@@ -274,28 +306,23 @@ def amazon_custom_document_parsing_formatter(
     return CustomDocumentParsingAsyncDataClass(items=items)
 
 
-def query_answer_result(page: List[dict], identifier: str):
+def query_answer_result(block_index: "TextractBlockIndex", identifier: str):
     """
     Retrieve the text of a query based on its relationship ID.
 
     Parameters:
-        page (List[dict]): List of blocks, each representing a query or answer.
+        block_index (TextractBlockIndex): index of the blocks of the queries and answers.
         identifier (str): The relationship ID to match against.
 
     Returns:
         str: The text of the query with a matching relationship ID. If no match is found, returns None.
     """
-    queries = [q for q in page if q["BlockType"] == "QUERY"]
-    for query in queries:
-        relationships = query.get("Relationships")
-        if relationships:
-            for relationship in relationships:
-                if identifier in relationship["Ids"]:
-                    return query["Query"]["Text"]
+    for query in block_index.referrers(identifier, block_type="QUERY"):
+        return query["Query"]["Text"]
     return None
 
 
-def amazon_invoice_parser_formatter(pages: List[dict]) -> InvoiceParserDataClass:
+def amazon_invoice_parser_formatter(pages: Iterable[dict]) -> InvoiceParserDataClass:
     extracted_data = []
     for page in pages:
         if page.get("JobStatus") == "FAILED":
@@ -422,7 +449,7 @@ def amazon_invoice_parser_formatter(pages: List[dict]) -> InvoiceParserDataClass
     return InvoiceParserDataClass(extracted_data=extracted_data)
 
 
-def amazon_receipt_parser_formatter(pages: List[dict]) -> ReceiptParserDataClass:
+def amazon_receipt_parser_formatter(pages: Iterable[dict]) -> ReceiptParserDataClass:
     extracted_data = []
     for page in pages:
         for receipt in page.get("ExpenseDocuments") or []:
@@ -508,12 +535,14 @@ def amazon_receipt_parser_formatter(pages: List[dict]) -> ReceiptParserDataClass
     return ReceiptParserDataClass(extracted_data=extracted_data)
 
 
-def amazon_financial_parser_formatter(pages: List[dict]) -> FinancialParserDataClass:
+def amazon_financial_parser_formatter(
+    pages: Iterable[dict],
+) -> FinancialParserDataClass:
     """
     Parse Amazon financial response into a data class response by organizing the response.
 
     Args:
-    - pages (List[dict]): List of pages from the Amazon financial response.
+    - pages (Iterable[dict]): pages from the Amazon financial response.
 
     Returns:
     - FinancialParserDataClass: Parsed financial data organized into a data class.
@@ -723,75 +752,179 @@ def get_right_audio_support_and_sampling_rate(audio_format: str, sampling_rate:
     return audio_format, returned_audio_format, nearest_sampling
 
 
-def _convert_response_to_blocks_with_id(responses: list) -> dict:
+class TextractBlockIndex:
     """
-    Convert the blocks from the response to a dict with Id as key
+    Index of the blocks of Textract responses, built in one pass over the blocks so
+    formatters can follow relationships in constant time instead of scanning blocks.
+
+    Attributes:
+        blocks (dict): block id -> block, in the order of the responses
+        children (dict): block id -> relationship type -> related block ids
+        parents (dict): block id -> relationship type -> ids of the blocks related to it
+        blocks_by_type (dict): block type -> block id -> block
+        pages (dict): page number -> blocks of the page
     """
 
-    blocks_dict = {}
-    for response in responses:
+    def __init__(self, responses: Sequence[dict] = ()) -> None:
+        self.blocks: Dict[str, dict] = {}
+        self.children: Dict[str, Dict[str, List[str]]] = {}
+        self.parents: Dict[str, Dict[str, List[str]]] = defaultdict(dict)
+        self.blocks_by_type: Dict[str, Dict[str, dict]] = defaultdict(dict)
+        self.pages: Dict[int, List[dict]] = defaultdict(list)
+        for response in responses:
+            self.add_response(response)
+
+    def add_response(self, response: dict) -> None:
+        """Index the blocks of a Textract response, eg: a `NextToken` page"""
         for block in response.get("Blocks", []) or []:
-            blocks_dict[block["Id"]] = block
-    return blocks_dict
+            block_id = block["Id"]
+            if block_id in self.blocks:
+                continue
+            self.blocks[block_id] = block
+            self.blocks_by_type[block["BlockType"]][block_id] = block
+            self.pages[block.get("Page", 1)].append(block)
+            relationships: Dict[str, List[str]] = {}
+            for relationship in block.get("Relationships", []) or []:
+                relationships.setdefault(relationship["Type"], []).extend(
+                    relationship["Ids"]
+                )
+                for related_id in relationship["Ids"]:
+                    self.parents[related_id].setdefault(
+                        relationship["Type"], []
+                    ).append(block_id)
+            self.children[block_id] = relationships
+
+    def related(
+        self,
+        block_id: str,
+        relationship_type: str = "CHILD",
+        block_type: Optional[str] = None,
+    ) -> List[dict]:
+        """Blocks related to `block_id` (eg: words of a line), in Textract order"""
+        related_blocks = []
+        for related_id in self.children.get(block_id, {}).get(relationship_type, []):
+            related_block = self.blocks.get(related_id)
+            if related_block is None:
+                continue
+            if block_type is None or related_block["BlockType"] == block_type:
+                related_blocks.append(related_block)
+        return related_blocks
+
+    def referrers(
+        self,
+        block_id: str,
+        relationship_type: Optional[str] = None,
+        block_type: Optional[str] = None,
+    ) -> List[dict]:
+        """Blocks having a relationship to `block_id` (eg: the query of an answer)"""
+        parents = self.parents.get(block_id, {})
+        if relationship_type is None:
+            parent_ids = [parent_id for ids in parents.values() for parent_id in ids]
+        else:
+            parent_ids = parents.get(relationship_type, [])
+        return [
+            self.blocks[parent_id]
+            for parent_id in parent_ids
+            if block_type is None or self.blocks[parent_id]["BlockType"] == block_type
+        ]
 
+    def pop_page(self, page: int) -> List[dict]:
+        """Remove the blocks of a page from the index, once it has been standardized"""
+        blocks = self.pages.pop(page, [])
+        for block in blocks:
+            block_id = block["Id"]
+            del self.blocks[block_id]
+            del self.children[block_id]
+            self.parents.pop(block_id, None)
+            del self.blocks_by_type[block["BlockType"]][block_id]
+        return blocks
 
-def amazon_ocr_async_formatter(responses: list) -> OcrAsyncDataClass:
-    """
-    Format the response from the OCR API to be more easily parsable
 
-    Args
-        response: the response from the OCR API
+class AmazonOcrAsyncFormatter:
+    """
+    Standardize Textract text detection responses as they are fetched
 
-    Returns
-        OcrAsyncDataClass: the formatted response
+    Pages are standardized, and their blocks released, as soon as a block of a
+    following page is received since Textract returns the blocks page by page.
     """
-    blocks: dict = _convert_response_to_blocks_with_id(responses)
 
-    pages: Sequence[OcrAsyncPage] = []
-    for _, block in blocks.items():
-        if block["BlockType"] != "PAGE":
-            continue
+    def __init__(self) -> None:
+        self.index = TextractBlockIndex()
+        self.pages: Dict[int, OcrAsyncPage] = {}
+        self.lines_text: Dict[int, List[str]] = {}
+
+    def add_response(self, response: dict) -> None:
+        self.index.add_response(response)
+        if not self.index.pages:
+            return
+        last_page = max(self.index.pages)
+        for page_number in sorted(self.index.pages):
+            if page_number < last_page:
+                self._standardize_page(page_number)
+
+    def result(self) -> OcrAsyncDataClass:
+        for page_number in sorted(self.index.pages):
+            self._standardize_page(page_number)
+        page_numbers = sorted(self.pages)
+        return OcrAsyncDataClass(
+            raw_text="".join(
+                text for number in page_numbers for text in self.lines_text[number]
+            ),
+            pages=[self.pages[number] for number in page_numbers],
+            number_of_pages=len(page_numbers),
+        )
 
-        lines: Sequence[Line] = []
-        for block_id in block.get("Relationships", [{}])[0].get("Ids", []):
-            if blocks[block_id]["BlockType"] != "LINE":
+    def _standardize_page(self, page_number: int) -> None:
+        index = self.index
+        for page_block in index.pages[page_number]:
+            if page_block["BlockType"] != "PAGE":
                 continue
+            lines: Sequence[Line] = []
+            lines_text: List[str] = []
+            for line_block in index.related(page_block["Id"], block_type="LINE"):
+                words: Sequence[Word] = []
+                for word_block in index.related(line_block["Id"], block_type="WORD"):
+                    word = Word(
+                        text=word_block["Text"],
+                        bounding_box=BoundingBox.from_json(
+                            bounding_box=word_block["Geometry"]["BoundingBox"],
+                            modifiers=lambda x: x.title(),
+                        ),
+                        confidence=word_block["Confidence"],
+                    )
+                    words.append(word)
 
-            words: Sequence[Word] = []
-            for word_id in blocks[block_id]["Relationships"][0]["Ids"]:
-                if blocks[word_id]["BlockType"] != "WORD":
-                    continue
-
-                word = Word(
-                    text=blocks[word_id]["Text"],
+                line = Line(
+                    text=line_block["Text"],
+                    words=words,
                     bounding_box=BoundingBox.from_json(
-                        bounding_box=blocks[word_id]["Geometry"]["BoundingBox"],
+                        bounding_box=line_block["Geometry"]["BoundingBox"],
                         modifiers=lambda x: x.title(),
                     ),
-                    confidence=blocks[word_id]["Confidence"],
+                    confidence=line_block["Confidence"],
                 )
-                words.append(word)
-
-            line = Line(
-                text=blocks[block_id]["Text"],
-                words=words,
-                bounding_box=BoundingBox.from_json(
-                    bounding_box=blocks[block_id]["Geometry"]["BoundingBox"],
-                    modifiers=lambda x: x.title(),
-                ),
-                confidence=blocks[block_id]["Confidence"],
-            )
-            lines.append(line)
+                lines.append(line)
+                lines_text.append(line.text + "\n")
 
-        page = OcrAsyncPage(lines=lines)
-        pages.append(page)
+            self.pages[page_number] = OcrAsyncPage(lines=lines)
+            self.lines_text[page_number] = lines_text
+        index.pop_page(page_number)
 
-    text = ""
-    for page in pages:
-        for line in page.lines:
-            text += line.text + "\n"
 
-    return OcrAsyncDataClass(raw_text=text, pages=pages, number_of_pages=len(pages))
+def amazon_ocr_async_formatter(responses: Iterable[dict]) -> OcrAsyncDataClass:
+    """
+    Format the response from the OCR API to be more easily parsable
+
+    Args
+        responses: the responses from the OCR API, eg: a `amazon_paginated_responses`
+
+    Returns
+        OcrAsyncDataClass: the formatted response
+    """
+    formatter = AmazonOcrAsyncFormatter()
+    for response in responses:
+        formatter.add_response(response)
+    return formatter.result()
 
 
 def amazon_data_extraction_formatter(
@@ -805,13 +938,11 @@ def amazon_data_extraction_formatter(
 
     return DataExtractionDataClass
     """
-    blocks = _convert_response_to_blocks_with_id(responses)
+    index = TextractBlockIndex(responses)
+    blocks = index.blocks
     items: Sequence[ItemDataExtraction] = []
 
-    for _, block in blocks.items():
-        if block["BlockType"] != "KEY_VALUE_SET":
-            continue
-
+    for block in index.blocks_by_type["KEY_VALUE_SET"].values():
         if block["EntityTypes"] != ["KEY"]:
             continue
 
@@ -825,7 +956,7 @@ def amazon_data_extraction_formatter(
                     item["key"] = blocks[relation["Ids"][0]]["Text"]
                 elif relation["Type"] == "VALUE":
                     value_id = relation["Ids"][0]
-                    child = blocks[blocks[value_id]["Relationships"][0]["Ids"][0]]
+                    child = blocks[index.children[value_id]["CHILD"][0]]
                     item["value"] = child["Text"]
                     item["bounding_box"] = BBox.from_json(
                         child["Geometry"]["BoundingBox"],
@@ -841,6 +972,143 @@ def amazon_data_extraction_formatter(
     return DataExtractionDataClass(fields=items)
 
 
+class _PaginationDone:
+    pass
+
+
+def amazon_paginated_responses(
+    func: Callable,
+    first_response: dict,
+    prefetch: int = AMAZON_PAGINATION_PREFETCH,
+    **payload,
+) -> Iterator[dict]:
+    """
+    Yield `first_response` and the following `NextToken` pages of an async job result
+
+    A page can only be requested with the token of the previous one, so the next
+    pages are fetched on a background thread, at most `prefetch` pages ahead, while
+    the caller standardizes the current one. Pages are not kept, the caller can
+    release each page once it has been standardized.
+
+    Args:
+        func (Callable): client method returning the pages (eg: `get_label_detection`)
+        first_response (dict): response of the first call, without token
+        prefetch (int, optional): pages fetched ahead, 0 to fetch them on demand.
+            Defaults to `AMAZON_PAGINATION_PREFETCH`.
+        **payload: arguments of `func`, eg: the `JobId`
+
+    Raises:
+        ProviderException: if a page reports a failed job
+    """
+
+    def fetch_page(token: str) -> dict:
+        response = handle_amazon_call(func, **payload, NextToken=token)
+        if response.get("JobStatus") == "FAILED":
+            raise ProviderException(
+                response.get("StatusMessage", "Amazon returned a job status: FAILED")
+            )
+        return response
+
+    yield first_response
+    token = first_response.get("NextToken")
+    if not token:
+        return
+
+    if prefetch <= 0:
+        while token:
+            response = fetch_page(token)
+            yield response
+            token = response.get("NextToken")
+        return
+
+    pages: queue.Queue = queue.Queue(maxsize=prefetch)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        # waits for a free slot, unless the caller stopped reading pages
+        while not stopped.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch_pages(token: Optional[str]) -> None:
+        try:
+            while token and not stopped.is_set():
+                response = fetch_page(token)
+                if not put(response):
+                    return
+                token = response.get("NextToken")
+        except Exception as exc:
+            put(exc)
+        else:
+            put(_PaginationDone)
+
+    fetcher = threading.Thread(
+        target=fetch_pages, args=(token,), name="amazon-pagination", daemon=True
+    )
+    fetcher.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _PaginationDone:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+
+
+def collect_pages(pages: Iterable[dict], collected: List[dict]) -> Iterator[dict]:
+    """Yield `pages`, appending them to `collected` only if the caller wants the
+    original response (see `include_original_response`)"""
+    keep_pages = include_original_response()
+    for page in pages:
+        if keep_pages:
+            collected.append(page)
+        yield page
+
+
+def _is_textract_job_done(response: dict) -> bool:
+    if response["JobStatus"] == "FAILED":
+        raise ProviderException(
+            response.get("StatusMessage", "Amazon returned a job status: FAILED")
+        )
+    return response["JobStatus"] != "IN_PROGRESS"
+
+
+def wait_for_textract_job(
+    func: Callable,
+    timeout: float,
+    first_response: Optional[dict] = None,
+    **kwargs,
+) -> dict:
+    """Poll a Textract `get_*` method until the job is no longer IN_PROGRESS
+
+    Raises:
+        ProviderException: if the job FAILED
+
+    Args:
+        func (Callable): client method returning the job status (eg: `get_expense_analysis`)
+        timeout (float): time in seconds after which `PollingTimeout` is raised
+        first_response (dict, optional): status already received for the job
+        **kwargs: arguments of `func` (eg: JobId)
+
+    Returns:
+        dict: The first page of the job result
+    """
+    return poll_until(
+        partial(handle_amazon_call, func, **kwargs),
+        _is_textract_job_done,
+        AMAZON_POLLING_POLICY.with_options(timeout=timeout),
+        first_response=first_response,
+        name="amazon",
+    )
+
+
 def handle_amazon_call(func: Callable, **kwargs):
     job_id_strings_errors = [
         "InvalidJobIdException",
@@ -0,0 +1,145 @@
+import threading
+import time
+
+import pytest
+
+from edenai_apis.apis.amazon import helpers
+from edenai_apis.apis.amazon.helpers import (
+    AmazonOcrAsyncFormatter,
+    amazon_paginated_responses,
+    collect_pages,
+    wait_for_textract_job,
+)
+from edenai_apis.utils.async_to_sync import PollingPolicy
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.types import original_response_included
+
+
+def text_page(page: int) -> dict:
+    geometry = {"BoundingBox": {"Width": 0.1, "Height": 0.1, "Left": 0.1, "Top": 0.1}}
+    line = {
+        "BlockType": "LINE",
+        "Id": f"line-{page}",
+        "Page": page,
+        "Text": f"page {page}",
+        "Confidence": 99.0,
+        "Geometry": geometry,
+    }
+    page_block = {
+        "BlockType": "PAGE",
+        "Id": f"page-{page}",
+        "Page": page,
+        "Relationships": [{"Type": "CHILD", "Ids": [line["Id"]]}],
+    }
+    return {"JobStatus": "SUCCEEDED", "Blocks": [page_block, line]}
+
+
+class FakeJobPages:
+    """`get_*` client method of a job result split in `count` NextToken pages"""
+
+    def __init__(self, count: int, failing_page: int = -1):
+        self.count = count
+        self.failing_page = failing_page
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def page(self, index: int) -> dict:
+        page = {"JobStatus": "SUCCEEDED", "Index": index}
+        if index == self.failing_page:
+            page.update(JobStatus="FAILED", StatusMessage="page failed")
+        if index < self.count - 1:
+            page["NextToken"] = f"token-{index + 1}"
+        return page
+
+    def __call__(self, JobId: str, NextToken: str) -> dict:
+        assert JobId == "job"
+        with self.lock:
+            self.calls.append(NextToken)
+        return self.page(int(NextToken.split("-")[1]))
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_paginated_responses_in_order(prefetch):
+    get_pages = FakeJobPages(6)
+
+    pages = amazon_paginated_responses(
+        get_pages, get_pages.page(0), prefetch=prefetch, JobId="job"
+    )
+
+    assert [page["Index"] for page in pages] == list(range(6))
+    assert get_pages.calls == [f"token-{index}" for index in range(1, 6)]
+
+
+def test_single_page_is_not_fetched_again():
+    get_pages = FakeJobPages(1)
+
+    pages = list(amazon_paginated_responses(get_pages, get_pages.page(0), JobId="job"))
+
+    assert len(pages) == 1
+    assert get_pages.calls == []
+
+
+def test_failed_page_raises():
+    get_pages = FakeJobPages(5, failing_page=3)
+
+    with pytest.raises(ProviderException, match="page failed"):
+        list(amazon_paginated_responses(get_pages, get_pages.page(0), JobId="job"))
+
+
+def test_job_failing_while_polled_raises(mocker):
+    mocker.patch.object(
+        helpers, "AMAZON_POLLING_POLICY", PollingPolicy(initial_delay=0.01)
+    )
+    statuses = iter(
+        [
+            {"JobStatus": "IN_PROGRESS"},
+            {"JobStatus": "FAILED", "StatusMessage": "Unsupported document"},
+        ]
+    )
+
+    with pytest.raises(ProviderException, match="Unsupported document"):
+        wait_for_textract_job(
+            lambda JobId: next(statuses),
+            timeout=1,
+            first_response={"JobStatus": "IN_PROGRESS"},
+            JobId="job",
+        )
+
+
+def test_prefetch_is_bounded():
+    get_pages = FakeJobPages(50)
+
+    pages = amazon_paginated_responses(
+        get_pages, get_pages.page(0), prefetch=2, JobId="job"
+    )
+    next(pages)
+    next(pages)
+    time.sleep(0.3)
+
+    # one page consumed, two waiting in the window and one waiting for a free slot
+    assert len(get_pages.calls) <= 4
+    pages.close()
+
+
+def test_ocr_async_pages_are_released_once_standardized():
+    formatter = AmazonOcrAsyncFormatter()
+
+    formatter.add_response(text_page(1))
+    formatter.add_response(text_page(2))
+
+    assert list(formatter.pages) == [1]
+    assert list(formatter.index.pages) == [2]
+    result = formatter.result()
+    assert result.number_of_pages == 2
+    assert not formatter.index.blocks
+
+
+@pytest.mark.parametrize("include", [True, False])
+def test_collect_pages(include):
+    collected = []
+
+    with original_response_included(include):
+        pages = list(collect_pages([{"page": 1}, {"page": 2}], collected))
+
+    assert len(pages) == 2
+    assert collected == (pages if include else [])
@@ -0,0 +1,123 @@
+import json
+import os
+
+import pytest
+
+from edenai_apis.apis.amazon.helpers import (
+    TextractBlockIndex,
+    amazon_custom_document_parsing_formatter,
+    amazon_ocr_async_formatter,
+    query_answer_result,
+)
+
+OUTPUTS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "outputs", "ocr"
+)
+
+
+def load_output(subfeature: str) -> dict:
+    with open(os.path.join(OUTPUTS_PATH, f"{subfeature}_output.json")) as file:
+        return json.load(file)
+
+
+def geometry() -> dict:
+    return {"BoundingBox": {"Width": 0.1, "Height": 0.1, "Left": 0.1, "Top": 0.1}}
+
+
+def text_page(page: int, lines: int = 2) -> dict:
+    """Textract response of a page with `lines` lines of two words"""
+    blocks = []
+    line_ids = []
+    for line in range(lines):
+        line_id = f"line-{page}-{line}"
+        word_ids = [f"word-{page}-{line}-{word}" for word in range(2)]
+        line_ids.append(line_id)
+        blocks.append(
+            {
+                "BlockType": "LINE",
+                "Id": line_id,
+                "Page": page,
+                "Text": f"line {line} of page {page}",
+                "Confidence": 99.0,
+                "Geometry": geometry(),
+                "Relationships": [{"Type": "CHILD", "Ids": word_ids}],
+            }
+        )
+        blocks.extend(
+            {
+                "BlockType": "WORD",
+                "Id": word_id,
+                "Page": page,
+                "Text": "word",
+                "Confidence": 98.0,
+                "Geometry": geometry(),
+            }
+            for word_id in word_ids
+        )
+    page_block = {
+        "BlockType": "PAGE",
+        "Id": f"page-{page}",
+        "Page": page,
+        "Relationships": [{"Type": "CHILD", "Ids": line_ids}],
+    }
+    return {"JobStatus": "SUCCEEDED", "Blocks": [page_block, *blocks]}
+
+
+def test_block_index_relationships():
+    index = TextractBlockIndex([text_page(1), text_page(2)])
+
+    assert len(index.blocks_by_type["PAGE"]) == 2
+    assert [block["Id"] for block in index.related("line-2-0")] == [
+        "word-2-0-0",
+        "word-2-0-1",
+    ]
+    assert index.related("page-1", block_type="WORD") == []
+    assert [block["Id"] for block in index.referrers("word-1-1-0")] == ["line-1-1"]
+    assert len(index.pages[2]) == 7
+
+
+def test_query_answer_result():
+    index = TextractBlockIndex(
+        [
+            {
+                "Blocks": [
+                    {
+                        "BlockType": "QUERY",
+                        "Id": "query",
+                        "Query": {"Text": "What is the total?"},
+                        "Relationships": [{"Type": "ANSWER", "Ids": ["answer"]}],
+                    },
+                    {"BlockType": "QUERY_RESULT", "Id": "answer", "Text": "42"},
+                ]
+            }
+        ]
+    )
+
+    assert query_answer_result(index, "answer") == "What is the total?"
+    assert query_answer_result(index, "query") is None
+
+
+def test_ocr_async_formatter_on_many_pages():
+    responses = [text_page(page) for page in range(1, 201)]
+
+    result = amazon_ocr_async_formatter(responses)
+
+    assert result.number_of_pages == 200
+    assert result.raw_text.count("\n") == 400
+    assert result.pages[199].lines[1].text == "line 1 of page 200"
+    assert len(result.pages[0].lines[0].words) == 2
+
+
+@pytest.mark.parametrize(
+    ("subfeature", "formatter"),
+    [
+        ("ocr_async", amazon_ocr_async_formatter),
+        ("custom_document_parsing_async", amazon_custom_document_parsing_formatter),
+    ],
+)
+def test_formatters_on_saved_outputs(subfeature, formatter):
+    output = load_output(subfeature)
+
+    result = formatter(output["original_response"])
+
+    assert result.model_dump() == output["standardized_response"]
@@ -35,6 +35,7 @@ from edenai_apis.apis.anthropic.prompts import LOGO_DETECTION_SYSTEM_PROMPT
 
 class AnthropicApi(ProviderInterface, TextInterface, ImageInterface):
     provider_name = "anthropic"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}) -> None:
         self.api_settings = load_provider(
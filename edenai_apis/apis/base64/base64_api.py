@@ -55,6 +55,7 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.bounding_box import BoundingBox
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -113,7 +114,7 @@ class Base64Api(ProviderInterface, OcrInterface):
 
         headers = {"Content-type": "application/json", "Authorization": self.api_key}
 
-        response = requests.post(url=self.url, headers=headers, json=data)
+        response = http_client.post(url=self.url, headers=headers, json=data)
 
         if response.status_code != 200:
             raise ProviderException(response.text, code=response.status_code)
@@ -190,7 +191,7 @@ class Base64Api(ProviderInterface, OcrInterface):
                 "Authorization": self.api_key,
             }
 
-            response = requests.post(url=self.url, headers=headers, data=payload)
+            response = http_client.post(url=self.url, headers=headers, data=payload)
 
         original_response = self._get_response(response)
 
@@ -353,7 +354,7 @@ class Base64Api(ProviderInterface, OcrInterface):
                     }
                 )
 
-        response = requests.request("POST", url, headers=headers, data=payload)
+        response = http_client.request("POST", url, headers=headers, data=payload)
         original_response = self._get_response(response)
 
         faces = []
@@ -391,7 +392,7 @@ class Base64Api(ProviderInterface, OcrInterface):
                 "Authorization": self.api_key,
             }
 
-            response = requests.post(url=self.url, headers=headers, data=payload)
+            response = http_client.post(url=self.url, headers=headers, data=payload)
 
         original_response = self._get_response(response)
 
@@ -438,7 +439,7 @@ class Base64Api(ProviderInterface, OcrInterface):
                 "Authorization": self.api_key,
             }
 
-            response = requests.post(url=self.url, headers=headers, data=payload)
+            response = http_client.post(url=self.url, headers=headers, data=payload)
             original_response = self._get_response(response)
 
             items: Sequence[ItemBankCheckParsingDataClass] = []
@@ -509,7 +510,7 @@ class Base64Api(ProviderInterface, OcrInterface):
 
         headers = {"Content-Type": "application/json", "Authorization": self.api_key}
 
-        response = requests.post(url=self.url, headers=headers, data=payload)
+        response = http_client.post(url=self.url, headers=headers, data=payload)
 
         original_response = self._get_response(response)
 
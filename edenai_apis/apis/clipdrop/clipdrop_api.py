@@ -1,12 +1,12 @@
 import base64
 import json
 from typing import Dict, Optional, Any
-import requests
 from edenai_apis.features import ProviderInterface, ImageInterface
 from edenai_apis.features.image import BackgroundRemovalDataClass
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -33,7 +33,7 @@ class ClipdropApi(ProviderInterface, ImageInterface):
         with open(file, "rb") as f:
             files = {"image_file": f.read()}
 
-            response = requests.post(url, files=files, headers=self.headers)
+            response = http_client.post(url, files=files, headers=self.headers)
 
         if response.status_code != 200:
             try:
@@ -36,13 +36,15 @@ from edenai_apis.features.text.summarize import SummarizeDataClass
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.conversion import construct_word_list
+from edenai_apis.utils.embedding_index import embed_texts, get_corpus_index
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.metrics import METRICS
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
 class CohereApi(ProviderInterface, TextInterface):
     provider_name = "cohere"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}):
         self.api_settings = load_provider(
@@ -145,7 +147,7 @@ List of corrected words:
         if max_tokens != 0:
             payload["max_tokens"] = max_tokens
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         if response.status_code >= 500:
             raise ProviderException("Internal Server Error")
 
@@ -185,7 +187,7 @@ List of corrected words:
             "examples": example_dict,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = response.json()
 
         # Handle provider errors
@@ -234,7 +236,7 @@ List of corrected words:
             "text": text,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         try:
             original_response = response.json()
         except json.JSONDecodeError as exc:
@@ -317,7 +319,7 @@ Your answer :
             "stop_sequences": ["--"],
             "truncate": "END",
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         if response.status_code != 200:
             raise ProviderException(response.text, response.status_code)
 
@@ -354,7 +356,7 @@ Your answer :
             "truncate": "END",
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         original_response = response.json()
 
         if "message" in original_response:
@@ -400,7 +402,7 @@ Your answer :
         url = f"{self.base_url}embed"
         model = model.split("__")[1]
         payload = {"texts": texts, "model": model}
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         if response.status_code >= 500:
             raise ProviderException("Internal Server Error")
 
@@ -434,38 +436,34 @@ Your answer :
     ) -> ResponseType[SearchDataClass]:
         if model is None:
             model = "768__embed-multilingual-v2.0"
-        # Import the function
-        function_score = METRICS[similarity_metric]
-
-        # Embed the texts & query
-        texts_embed_response = self.text__embeddings(
-            texts=texts, model=model
-        ).original_response
-        query_embed_response = self.text__embeddings(
-            texts=[query], model=model
-        ).original_response
-
-        # Extracts embeddings from texts & query
-        texts_embed = list(texts_embed_response["embeddings"])
-        query_embed = query_embed_response["embeddings"][0]
-
-        items = []
-        # Calculate score for each text index
-        for index, text in enumerate(texts_embed):
-            score = function_score(query_embed, text)
-            items.append(
-                InfosSearchDataClass(
-                    object="search_result", document=index, score=score
-                )
-            )
 
-        # Sort items by score in descending order
-        sorted_items = sorted(items, key=lambda x: x.score, reverse=True)
+        def embed(texts_to_embed: List[str]):
+            response = self.text__embeddings(
+                texts=texts_to_embed, model=model
+            ).original_response
+            return list(response["embeddings"]), response
+
+        # Embed the texts & query, only texts not embedded yet are sent to the provider
+        index, texts_embed_response = get_corpus_index(
+            self.provider_name, model, texts, embed
+        )
+        query_embed, query_embed_response = embed_texts(
+            self.provider_name, model, [query], embed
+        )
+
+        # Score all texts at once, sorted by descending score
+        sorted_items = [
+            InfosSearchDataClass(object="search_result", document=document, score=score)
+            for document, score in index.search(query_embed[0], similarity_metric)
+        ]
 
         # Calculate total tokens
         usage = {
-            "total_tokens": texts_embed_response["meta"]["billed_units"]["input_tokens"]
-            + query_embed_response["meta"]["billed_units"]["input_tokens"]
+            "total_tokens": sum(
+                response["meta"]["billed_units"]["input_tokens"]
+                for response in (texts_embed_response, query_embed_response)
+                if response is not None
+            )
         }
         # Build the original response
         original_response = {
@@ -549,7 +547,7 @@ Your answer :
         if not available_tools and not tool_results:
             payload["connectors"] = [{"id": "web-search"}]
 
-        response = requests.post(
+        response = http_client.post(
             f"{self.base_url}chat", headers=self.headers, json=payload
         )
 
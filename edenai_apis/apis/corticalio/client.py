@@ -1,10 +1,10 @@
 import json
 from typing import Dict
 
-import requests as requests
 from requests import Response
 
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 
 
 class CorticalClient:
@@ -28,7 +28,7 @@ class CorticalClient:
         Returns:
             List of keywords with corresponding scores and other metrics
         """
-        response = requests.post(
+        response = http_client.post(
             url=f"{self.base_url}/keywords",
             headers=self.auth_headers,
             json={
@@ -15,6 +15,7 @@ class CorticalioApi(
     TextInterface
 ):
     provider_name = "corticalio"
+    poolable = True
 
     def __init__(self, api_keys: Dict = None):
         api_keys = api_keys or {}
@@ -12,6 +12,7 @@ from edenai_apis.features.image.generation import (
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -42,7 +43,7 @@ class DeepAIApi(ProviderInterface, ImageInterface):
             "width": int(size[0]),
             "height": int(size[1]),
         }
-        response = requests.post(
+        response = http_client.post(
             url, data=payload, headers=self.headers
         )
         try:
@@ -55,7 +56,7 @@ class DeepAIApi(ProviderInterface, ImageInterface):
             raise ProviderException(err_msg, response.status_code)
 
         image_url = original_response.get("output_url")
-        image_response = requests.get(image_url)
+        image_response = http_client.get(image_url)
         if not image_response.ok:
             raise ProviderException(image_response.text, code=image_response.status_code)
         image_bytes = base64.b64encode(image_response.content)
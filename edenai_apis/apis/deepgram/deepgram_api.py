@@ -3,9 +3,7 @@ import json
 from io import BytesIO
 from pathlib import Path
 from time import time
-from typing import Dict, List, Optional
-
-import requests
+from typing import Dict, List, Optional, Tuple
 
 from edenai_apis.features import AudioInterface, ProviderInterface
 from edenai_apis.features.audio import (
@@ -18,7 +16,9 @@ from edenai_apis.features.audio.text_to_speech.text_to_speech_dataclass import (
 )
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.concurrency import run_sync
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import async_http_client, http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -43,18 +43,17 @@ class DeepgramApi(ProviderInterface, AudioInterface):
         self.api_key = self.api_settings["deepgram_key"]
         self.url = "https://api.deepgram.com/v1/listen"
 
-    def audio__speech_to_text_async__launch_job(
+    def _speech_to_text_request(
         self,
         file: str,
         language: str,
-        speakers: int,
         profanity_filter: bool,
-        vocabulary: Optional[List[str]],
         audio_attributes: tuple,
-        model: Optional[str] = None,
-        file_url: str = "",
-        provider_params: Optional[dict] = None,
-    ) -> AsyncLaunchJobResponseType:
+        model: Optional[str],
+        file_url: str,
+        provider_params: Optional[dict],
+    ) -> Tuple[Dict, Dict, Dict]:
+        """Return headers, body and query parameters of a transcription request"""
         provider_params = provider_params or {}
         export_format, channels, frame_rate = audio_attributes
 
@@ -96,14 +95,16 @@ class DeepgramApi(ProviderInterface, AudioInterface):
             if isinstance(value, bool):
                 data_config[key] = str(value).lower()
 
-        response = requests.post(
-            self.url, headers=headers, json=data, params=data_config
-        )
-        original_response = response.json()
-        if response.status_code != 200:
+        return headers, data, data_config
+
+    @staticmethod
+    def _speech_to_text_response(
+        status_code: int, original_response: Dict, profanity_filter: bool
+    ) -> AsyncResponseType:
+        if status_code != 200:
             raise ProviderException(
                 f"{original_response.get('err_code')}: {original_response.get('err_msg')}",
-                code=response.status_code,
+                code=status_code,
             )
 
         text = ""
@@ -113,7 +114,7 @@ class DeepgramApi(ProviderInterface, AudioInterface):
         if original_response.get("err_code"):
             raise ProviderException(
                 f"{original_response.get('err_code')}: {original_response.get('err_msg')}",
-                code=response.status_code,
+                code=status_code,
             )
 
         channels = original_response["results"].get("channels", [])
@@ -150,6 +151,64 @@ class DeepgramApi(ProviderInterface, AudioInterface):
             provider_job_id=original_response["metadata"]["request_id"],
         )
 
+    def audio__speech_to_text_async__launch_job(
+        self,
+        file: str,
+        language: str,
+        speakers: int,
+        profanity_filter: bool,
+        vocabulary: Optional[List[str]],
+        audio_attributes: tuple,
+        model: Optional[str] = None,
+        file_url: str = "",
+        provider_params: Optional[dict] = None,
+    ) -> AsyncLaunchJobResponseType:
+        headers, data, data_config = self._speech_to_text_request(
+            file,
+            language,
+            profanity_filter,
+            audio_attributes,
+            model,
+            file_url,
+            provider_params,
+        )
+        response = http_client.post(
+            self.url, headers=headers, json=data, params=data_config
+        )
+        return self._speech_to_text_response(
+            response.status_code, response.json(), profanity_filter
+        )
+
+    async def aaudio__speech_to_text_async__launch_job(
+        self,
+        file: str,
+        language: str,
+        speakers: int,
+        profanity_filter: bool,
+        vocabulary: Optional[List[str]],
+        audio_attributes: tuple,
+        model: Optional[str] = None,
+        file_url: str = "",
+        provider_params: Optional[dict] = None,
+    ) -> AsyncLaunchJobResponseType:
+        # uploading the file to s3 is blocking, run it on the provider executor
+        headers, data, data_config = await run_sync(
+            self._speech_to_text_request,
+            file,
+            language,
+            profanity_filter,
+            audio_attributes,
+            model,
+            file_url,
+            provider_params,
+        )
+        response = await async_http_client.post(
+            self.url, headers=headers, json=data, params=data_config
+        )
+        return self._speech_to_text_response(
+            response.status_code, response.json(), profanity_filter
+        )
+
     def audio__text_to_speech(
         self,
         language: str,
@@ -176,7 +235,7 @@ class DeepgramApi(ProviderInterface, AudioInterface):
         }
 
         payload = {"text": text}
-        response = requests.post(
+        response = http_client.post(
             base_url,
             headers=headers,
             json=payload,
@@ -197,7 +256,7 @@ class DeepgramApi(ProviderInterface, AudioInterface):
         audio = base64.b64encode(audio_content.read()).decode("utf-8")
         audio_content.seek(0)
         resource_url = upload_file_bytes_to_s3(
-            audio_content, f".{audio_format}", USER_PROCESS
+            audio_content, f".{audio_format}", USER_PROCESS, background=True
         )
 
         return ResponseType[TextToSpeechDataClass](
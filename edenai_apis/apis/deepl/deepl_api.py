@@ -3,28 +3,45 @@ import http.client
 import json
 import mimetypes
 from io import BytesIO
-from time import sleep
-from typing import Dict
-
-import requests
+from typing import Dict, List
+from urllib.parse import quote_plus
 
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.features.translation.automatic_translation import (
     AutomaticTranslationDataClass,
 )
+from edenai_apis.features.translation.automatic_translation_batch import (
+    AutomaticTranslationBatchDataClass,
+)
+from edenai_apis.features.translation.automatic_translation_batch.helpers import (
+    BatchLimits,
+    TranslatedPack,
+    translate_in_batches,
+)
 from edenai_apis.features.translation.document_translation.document_translation_dataclass import (
     DocumentTranslationDataClass,
 )
 from edenai_apis.features.translation.translation_interface import TranslationInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.async_to_sync import PollingPolicy, poll_until
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import upload_file_bytes_to_s3, USER_PROCESS
 
+# documents of a few pages are translated in a few seconds
+DEEPL_POLLING_POLICY = PollingPolicy(initial_delay=0.5, max_delay=5)
+
+# 50 texts and 128 KiB of form-encoded body per /translate request
+DEEPL_BATCH_LIMITS = BatchLimits(
+    max_items=50, max_size=127 * 1024, text_size=lambda text: len(quote_plus(text))
+)
+
 
 class DeeplApi(ProviderInterface, TranslationInterface):
     provider_name = "deepl"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}) -> None:
         self.api_settings = load_provider(
@@ -36,18 +53,18 @@ class DeeplApi(ProviderInterface, TranslationInterface):
             "authorization": f"DeepL-Auth-Key {self.api_key}",
         }
 
-    def translation__automatic_translation(
-        self, source_language: str, target_language: str, text: str
-    ) -> ResponseType[AutomaticTranslationDataClass]:
-        url = f"{self.url}translate"
-
+    def _translate(
+        self, source_language: str, target_language: str, texts: List[str]
+    ) -> dict:
         data = {
-            "text": text,
+            "text": texts,
             "source_lang": source_language,
             "target_lang": target_language,
         }
 
-        response = requests.request("POST", url, headers=self.header, data=data)
+        response = http_client.request(
+            "POST", f"{self.url}translate", headers=self.header, data=data
+        )
 
         if response.status_code >= 500:
             raise ProviderException(message=response.text, code=response.status_code)
@@ -63,6 +80,12 @@ class DeeplApi(ProviderInterface, TranslationInterface):
             raise ProviderException(
                 message=original_response["message"], code=response.status_code
             )
+        return original_response
+
+    def translation__automatic_translation(
+        self, source_language: str, target_language: str, text: str
+    ) -> ResponseType[AutomaticTranslationDataClass]:
+        original_response = self._translate(source_language, target_language, [text])
 
         standardized_response = AutomaticTranslationDataClass(
             text=original_response["translations"][0]["text"]
@@ -73,6 +96,21 @@ class DeeplApi(ProviderInterface, TranslationInterface):
             standardized_response=standardized_response,
         )
 
+    def translation__automatic_translation_batch(
+        self, source_language: str, target_language: str, texts: List[str]
+    ) -> ResponseType[AutomaticTranslationBatchDataClass]:
+        def translate_pack(pack: List[str]) -> TranslatedPack:
+            response = self._translate(source_language, target_language, pack)
+            return [item["text"] for item in response["translations"]], response
+
+        standardized_response, original_response = translate_in_batches(
+            texts, translate_pack, DEEPL_BATCH_LIMITS
+        )
+        return ResponseType[AutomaticTranslationBatchDataClass](
+            original_response=original_response,
+            standardized_response=standardized_response,
+        )
+
     def translation__document_translation(
         self,
         file: str,
@@ -92,7 +130,7 @@ class DeeplApi(ProviderInterface, TranslationInterface):
             data = {"target_lang": target_language, "source_lang": source_language}
 
             try:
-                response = requests.post(
+                response = http_client.post(
                     f"{self.url}document", headers=self.header, data=data, files=files
                 )
             except:
@@ -118,23 +156,30 @@ class DeeplApi(ProviderInterface, TranslationInterface):
 
         doc_key = {"document_key": document_key}
 
-        response_status = requests.post(
-            f"{self.url}document/{document_id}", headers=self.header, data=doc_key
-        ).json()
+        def is_done(response_status: dict) -> bool:
+            if response_status["status"] == "error":
+                raise ProviderException(response_status["error_message"])
+            return response_status["status"] == "done"
+
         try:
-            while response_status["status"] != "done":
-                response_status = requests.post(
+            poll_until(
+                lambda: http_client.post(
                     f"{self.url}document/{document_id}",
                     headers=self.header,
                     data=doc_key,
-                ).json()
-                if response_status["status"] == "error":
-                    raise ProviderException(response_status["error_message"])
-                sleep(0.5)
+                ).json(),
+                is_done,
+                DEEPL_POLLING_POLICY,
+                # estimated by DeepL while the document is translated
+                retry_after=lambda response_status: response_status.get(
+                    "seconds_remaining"
+                ),
+                name="deepl",
+            )
         except KeyError as exc:
             raise ProviderException("Internal server error", 500) from exc
 
-        response = requests.post(
+        response = http_client.post(
             f"{self.url}document/{document_id}/result",
             headers=self.header,
             data=doc_key,
@@ -18,6 +18,7 @@ from edenai_apis.apis.openai.helpers import convert_tools_to_openai
 
 class DeepseekApi(ProviderInterface, TextInterface):
     provider_name = "deepseek"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}) -> None:
         self.api_settings = load_provider(
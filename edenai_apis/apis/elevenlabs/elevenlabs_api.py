@@ -2,8 +2,6 @@ import base64
 from io import BytesIO
 from typing import Dict
 
-import requests
-
 from edenai_apis.features import AudioInterface
 from edenai_apis.features.audio.text_to_speech.text_to_speech_dataclass import (
     TextToSpeechDataClass,
@@ -12,6 +10,7 @@ from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
 from .config import voice_ids
@@ -54,7 +53,7 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
         headers = {
             "Authorization": f"Bearer {api_key}",
         }
-        response = requests.post(
+        response = http_client.post(
             "https://api.openai.com/v1/moderations",
             headers=headers,
             json={"input": text},
@@ -96,7 +95,7 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
             "model_id": model,
             "voice_settings": {"stability": 0.5, "similarity_boost": 0.5},
         }
-        response = requests.post(url, json=data, headers=self.headers)
+        response = http_client.post(url, json=data, headers=self.headers)
 
         if response.status_code != 200:
             raise ProviderException(response.text, code=response.status_code)
@@ -106,7 +105,7 @@ class ElevenlabsApi(ProviderInterface, AudioInterface):
 
         audio_content.seek(0)
         resource_url = upload_file_bytes_to_s3(
-            audio_content, f".{audio_format}", USER_PROCESS
+            audio_content, f".{audio_format}", USER_PROCESS, background=True
         )
 
         return ResponseType[TextToSpeechDataClass](
@@ -3,8 +3,6 @@ import json
 import mimetypes
 from typing import List, Dict, Union
 
-import requests
-
 from edenai_apis.apis.extracta.extracta_ocr_normalizer import (
     extracta_resume_parser,
     extracta_bank_check_parsing,
@@ -27,6 +25,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -108,7 +107,7 @@ class ExtractaApi(
         }
 
         # call api
-        response = requests.post(
+        response = http_client.post(
             url=self.url + self.uploadFileRoute, headers=headers, data=payload
         )
 
@@ -146,7 +145,7 @@ class ExtractaApi(
         }
 
         # call api
-        response = requests.post(
+        response = http_client.post(
             url=self.url + self.getResultRoute, headers=headers, data=payload
         )
 
@@ -264,7 +263,7 @@ class ExtractaApi(
         }
 
         # call api
-        response = requests.post(
+        response = http_client.post(
             url=self.url + self.processFileRoute, headers=headers, data=payload
         )
 
@@ -326,7 +325,7 @@ class ExtractaApi(
         }
 
         # call api
-        response = requests.post(
+        response = http_client.post(
             url=self.url + self.processFileRoute, headers=headers, data=payload
         )
 
@@ -395,7 +394,7 @@ class ExtractaApi(
         }
 
         # call api
-        response = requests.post(
+        response = http_client.post(
             url=self.url + self.processFileRoute, headers=headers, data=payload
         )
 
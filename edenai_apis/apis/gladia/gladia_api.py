@@ -3,8 +3,6 @@ from pathlib import Path
 from time import time
 from typing import Dict, List, Optional
 
-import requests
-
 from edenai_apis.features import ProviderInterface, AudioInterface
 from edenai_apis.features.audio import SpeechDiarizationEntry, SpeechDiarization
 from edenai_apis.features.audio.speech_to_text_async.speech_to_text_async_dataclass import (
@@ -13,6 +11,7 @@ from edenai_apis.features.audio.speech_to_text_async.speech_to_text_async_datacl
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -53,7 +52,7 @@ class GladiaApi(ProviderInterface, AudioInterface):
         files = [
             ("audio", (file, file_content, f"audio/{extension}"))
         ]
-        upload_response = requests.post(
+        upload_response = http_client.post(
             "https://api.gladia.io/v2/upload/",
             headers=headers,
             files=files
@@ -84,7 +83,7 @@ class GladiaApi(ProviderInterface, AudioInterface):
             data.update({"detect_language": False, "language": language})
         data.update(provider_params)
 
-        transcription_response = requests.post(self.url, headers=headers, json=data)
+        transcription_response = http_client.post(self.url, headers=headers, json=data)
         if transcription_response.status_code not in (200, 201):
             raise ProviderException(
                 message=transcription_response.text, code=transcription_response.status_code
@@ -105,7 +104,7 @@ class GladiaApi(ProviderInterface, AudioInterface):
         
         headers = {"x-gladia-key": self.api_key, "accept": "application/json"}
 
-        response = requests.get(provider_job_id, headers=headers)
+        response = http_client.get(provider_job_id, headers=headers)
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
         
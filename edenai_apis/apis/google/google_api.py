@@ -29,6 +29,7 @@ class GoogleApi(
     GoogleMultimodalApi,
 ):
     provider_name = "google"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}):
         self.api_settings, self.location = load_provider(
@@ -90,7 +90,9 @@ class GoogleAudioApi(AudioInterface):
         audio = base64.b64encode(audio_content.read()).decode("utf-8")
 
         audio_content.seek(0)
-        resource_url = upload_file_bytes_to_s3(audio_content, f".{ext}", USER_PROCESS)
+        resource_url = upload_file_bytes_to_s3(
+            audio_content, f".{ext}", USER_PROCESS, background=True
+        )
 
         standardized_response = TextToSpeechDataClass(
             audio=audio, voice_type=voice_type, audio_resource_url=resource_url
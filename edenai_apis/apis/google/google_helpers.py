@@ -1,14 +1,20 @@
 import enum
 import json
+import logging
+import os
 import re
-from typing import List, Sequence
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Union
 from typing import Tuple
 from http import HTTPStatus
-import requests
 
 import google
 import google.auth
+import google_auth_httplib2
 import googleapiclient.discovery
+import httplib2
 from google.cloud.documentai_v1beta3 import Document
 from google.api_core.exceptions import GoogleAPIError
 from google.oauth2 import service_account
@@ -37,7 +43,9 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.concurrency import get_provider_executor
 from edenai_apis.utils.conversion import convert_string_to_number
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import AsyncResponseType
 from edenai_apis.features.ocr.financial_parser.financial_parser_dataclass import (
     FinancialParserDataClass,
@@ -52,6 +60,8 @@ from edenai_apis.features.ocr.financial_parser.financial_parser_dataclass import
     FinancialParserObjectDataClass,
 )
 
+CLOUD_PLATFORM_SCOPES = ("https://www.googleapis.com/auth/cloud-platform",)
+
 
 class GoogleVideoFeatures(enum.Enum):
     LABEL = "LABEL"
@@ -113,25 +123,154 @@ def score_to_rate(score):
     return abs(score)
 
 
-def google_video_get_job(provider_job_id: str):
-    scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-    credentials, _ = google.auth.default(scopes=scopes)
-    service = googleapiclient.discovery.build(
-        serviceName="videointelligence",
-        version="v1",
-        credentials=credentials,
-        client_options={
-            "api_endpoint": "https://videointelligence.googleapis.com/",
-        },
+# Video Intelligence services by credentials file, `None` for the default credentials
+_VIDEO_OPERATIONS_SERVICES: Dict[Optional[str], Tuple[Any, Any]] = {}
+_VIDEO_OPERATIONS_LOCK = threading.Lock()
+_VIDEO_OPERATIONS_HTTP = threading.local()
+
+# operations are fetched on a dedicated thread pool, not on the provider executor,
+# since `google_video_get_jobs` may itself run on it
+GOOGLE_VIDEO_JOBS_MAX_WORKERS = int(os.environ.get("GOOGLE_VIDEO_JOBS_MAX_WORKERS", 8))
+_VIDEO_JOBS_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_VIDEO_JOBS_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_video_operations_service(location: Optional[str] = None) -> Tuple[Any, Any]:
+    """Get the Video Intelligence service and its credentials for a credentials file
+
+    Services are built once per credentials file, and again when the file changed, so
+    that a job is always polled with the credentials it was launched with.
+    """
+    credentials = (
+        get_cached_credentials(location).credentials if location is not None else None
     )
+    cached = _VIDEO_OPERATIONS_SERVICES.get(location)
+    if cached is None or (credentials is not None and cached[1] is not credentials):
+        with _VIDEO_OPERATIONS_LOCK:
+            cached = _VIDEO_OPERATIONS_SERVICES.get(location)
+            if cached is None or (
+                credentials is not None and cached[1] is not credentials
+            ):
+                if credentials is None:
+                    credentials, _ = google.auth.default(
+                        scopes=list(CLOUD_PLATFORM_SCOPES)
+                    )
+                service = googleapiclient.discovery.build(
+                    serviceName="videointelligence",
+                    version="v1",
+                    credentials=credentials,
+                    client_options={
+                        "api_endpoint": "https://videointelligence.googleapis.com/",
+                    },
+                )
+                cached = _VIDEO_OPERATIONS_SERVICES[location] = (service, credentials)
+    return cached
+
+
+def get_video_operations_client(location: Optional[str] = None):
+    """Get the Video Intelligence operations resource of a credentials file
+
+    Args:
+        location (str, optional): service account credentials file, the default
+            credentials are used when not given
+    """
+    service, _ = _get_video_operations_service(location)
+    return service.projects().locations().operations()
+
+
+def _video_operations_http(credentials):
+    # httplib2 connections are not thread safe, each thread gets its own
+    https = getattr(_VIDEO_OPERATIONS_HTTP, "https", None)
+    if https is None:
+        https = _VIDEO_OPERATIONS_HTTP.https = {}
+    http = https.get(id(credentials))
+    if http is None or http.credentials is not credentials:
+        http = https[id(credentials)] = google_auth_httplib2.AuthorizedHttp(
+            credentials, http=httplib2.Http()
+        )
+    return http
+
+
+def clear_video_operations_client() -> None:
+    """Drop the cached Video Intelligence clients, eg: after credentials changed"""
+    with _VIDEO_OPERATIONS_LOCK:
+        _VIDEO_OPERATIONS_SERVICES.clear()
+
+
+def merge_video_annotation_results(result: Dict) -> Dict:
+    """Merge the annotation results of a video annotated with several features
+
+    Google may split the annotations of one video into several results, the
+    subfeatures parsers expect all of them in the first one.
+    """
+    annotation_results = result.get("response", {}).get("annotationResults", [])
+    if len(annotation_results) < 2 or any(
+        annotation.get("inputUri") != annotation_results[0].get("inputUri")
+        for annotation in annotation_results
+    ):
+        return result
+
+    merged = {}
+    for annotation in annotation_results:
+        for key, value in annotation.items():
+            if isinstance(value, list) and isinstance(merged.get(key), list):
+                merged[key] = merged[key] + value
+            else:
+                merged.setdefault(key, value)
+    return {**result, "response": {**result["response"], "annotationResults": [merged]}}
+
+
+def google_video_get_job(provider_job_id: str, location: Optional[str] = None):
+    service, credentials = _get_video_operations_service(location)
+    operations = service.projects().locations().operations()
     payload_request = {"name": provider_job_id}
-    request = handle_google_call(
-        service.projects().locations().operations().get, **payload_request
+    request = handle_google_call(operations.get, **payload_request)
+
+    result = handle_google_call(
+        request.execute, http=_video_operations_http(credentials)
     )
 
-    result = handle_google_call(request.execute)
+    return merge_video_annotation_results(result)
+
+
+def _get_video_jobs_executor() -> ThreadPoolExecutor:
+    global _VIDEO_JOBS_EXECUTOR
+    if _VIDEO_JOBS_EXECUTOR is None:
+        with _VIDEO_JOBS_EXECUTOR_LOCK:
+            if _VIDEO_JOBS_EXECUTOR is None:
+                _VIDEO_JOBS_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=GOOGLE_VIDEO_JOBS_MAX_WORKERS,
+                    thread_name_prefix="edenai-google-video-jobs",
+                )
+    return _VIDEO_JOBS_EXECUTOR
 
-    return result
+
+def google_video_get_jobs(
+    provider_job_ids: Sequence[str], location: Optional[str] = None
+) -> Dict[str, Union[Dict, Exception]]:
+    """Get many Video Intelligence operations at once, on a dedicated thread pool
+
+    Args:
+        provider_job_ids (Sequence[str]): operations names
+        location (str, optional): service account credentials file the jobs were
+            launched with, the default credentials are used when not given
+
+    Returns:
+        Dict[str, Union[Dict, Exception]]: operation or raised exception by job id
+    """
+    job_ids = list(dict.fromkeys(provider_job_ids))
+    executor = _get_video_jobs_executor()
+    futures = {
+        job_id: executor.submit(google_video_get_job, job_id, location)
+        for job_id in job_ids
+    }
+    results = {}
+    for job_id, future in futures.items():
+        try:
+            results[job_id] = future.result()
+        except Exception as exc:
+            results[job_id] = exc
+    return results
 
 
 def score_to_sentiment(score: float) -> str:
@@ -421,12 +560,108 @@ def handle_done_response_ocr_async(
     )
 
 
-def get_access_token(location: str):
+# Access tokens are refreshed in the background when they expire in less than
+# `GOOGLE_TOKEN_REFRESH_MARGIN` seconds, and synchronously when they expire in less
+# than `GOOGLE_TOKEN_EXPIRY_MARGIN` seconds.
+GOOGLE_TOKEN_REFRESH_MARGIN = float(os.environ.get("GOOGLE_TOKEN_REFRESH_MARGIN", 300))
+GOOGLE_TOKEN_EXPIRY_MARGIN = float(os.environ.get("GOOGLE_TOKEN_EXPIRY_MARGIN", 60))
+
+
+class CachedCredentials:
+    """Service account credentials shared by all threads, refreshed by only one of them
+
+    Args:
+        credentials (service_account.Credentials): credentials to refresh
+    """
+
+    def __init__(self, credentials: service_account.Credentials) -> None:
+        self.credentials = credentials
+        self._refresh_lock = threading.Lock()
+        self._background_refresh = False
+
+    def _remaining_seconds(self) -> float:
+        if not self.credentials.token or self.credentials.expiry is None:
+            return 0
+        # google-auth expiry is a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (self.credentials.expiry - now).total_seconds()
+
+    def _refresh(self) -> None:
+        self.credentials.refresh(google.auth.transport.requests.Request())
+
+    def _refresh_in_background(self) -> None:
+        try:
+            with self._refresh_lock:
+                if self._remaining_seconds() < GOOGLE_TOKEN_REFRESH_MARGIN:
+                    self._refresh()
+        except Exception as exc:
+            # the token is still valid, next calls will retry
+            logging.warning("Google access token background refresh failed: %s", exc)
+        finally:
+            self._background_refresh = False
+
+    def get_token(self) -> str:
+        """Return a valid access token, refreshing it only when needed"""
+        remaining = self._remaining_seconds()
+        if remaining > GOOGLE_TOKEN_EXPIRY_MARGIN:
+            if remaining < GOOGLE_TOKEN_REFRESH_MARGIN and not self._background_refresh:
+                with self._refresh_lock:
+                    start_refresh = not self._background_refresh
+                    self._background_refresh = True
+                if start_refresh:
+                    get_provider_executor().submit(self._refresh_in_background)
+            return self.credentials.token
+
+        with self._refresh_lock:
+            # another thread may have refreshed the token while we were waiting
+            if self._remaining_seconds() <= GOOGLE_TOKEN_EXPIRY_MARGIN:
+                self._refresh()
+            return self.credentials.token
+
+
+_CREDENTIALS: Dict[Tuple[str, int, Tuple[str, ...]], CachedCredentials] = {}
+_CREDENTIALS_LOCK = threading.Lock()
+
+
+def get_cached_credentials(
+    location: str, scopes: Sequence[str] = CLOUD_PLATFORM_SCOPES
+) -> CachedCredentials:
+    """Get the process-wide credentials of a service account file, loaded on first use
+
+    Credentials are cached by file and scopes, a modified file is loaded again.
+    """
+    key = (location, os.stat(location).st_mtime_ns, tuple(scopes))
+    cached = _CREDENTIALS.get(key)
+    if cached is None:
+        with _CREDENTIALS_LOCK:
+            cached = _CREDENTIALS.get(key)
+            if cached is None:
+                credentials = service_account.Credentials.from_service_account_file(
+                    location, scopes=list(scopes)
+                )
+                # drop credentials of previous versions of the file
+                for stale_key in [k for k in _CREDENTIALS if k[0] == location]:
+                    del _CREDENTIALS[stale_key]
+                cached = _CREDENTIALS[key] = CachedCredentials(credentials)
+    return cached
+
+
+def clear_cached_credentials() -> None:
+    """Forget all cached credentials and their access tokens"""
+    with _CREDENTIALS_LOCK:
+        _CREDENTIALS.clear()
+
+
+def get_access_token(location: str, scopes: Optional[Sequence[str]] = None) -> str:
     """
     Retrieves an access token for the Google Cloud Platform using service account credentials.
 
+    The token is cached and reused until shortly before it expires, so most calls do
+    not make any request to Google (see `CachedCredentials`).
+
     Args:
         location (str): The file location of the service account credentials.
+        scopes (Sequence[str], optional): OAuth scopes. Defaults to cloud-platform.
 
     Returns:
         str: The access token required for making API REST calls.
@@ -435,16 +670,10 @@ def get_access_token(location: str):
         location = "/path/to/credentials.json"
         access_token = get_access_token(location)
         # Use the access_token for API REST calls
-        response = requests.get(url, headers={"Authorization": f"Bearer {access_token}"})
+        response = http_client.get(url, headers={"Authorization": f"Bearer {access_token}"})
 
     """
-    scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-    credentials = service_account.Credentials.from_service_account_file(
-        location, scopes=scopes
-    )
-    auth_req = google.auth.transport.requests.Request()
-    credentials.refresh(auth_req)
-    return credentials.token
+    return get_cached_credentials(location, scopes or CLOUD_PLATFORM_SCOPES).get_token()
 
 
 # *****************************Financial Parser***************************************************
@@ -608,7 +837,7 @@ def calculate_usage_tokens(original_response: dict) -> dict:
 
 def gemini_request(payload: dict, model: str, api_key: str):
     url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
-    response = requests.post(url, json=payload)
+    response = http_client.post(url, json=payload)
     try:
         original_response = response.json()
     except json.JSONDecodeError as exc:
@@ -634,7 +863,7 @@ def palm_request(payload: dict, model: str, location: str, token: str, project_i
     }
     url = f"https://{url_subdomain}.googleapis.com/v1/projects/{project_id}/locations/{location}/publishers/google/models/{model}:predict"
 
-    response = requests.post(url=url, headers=headers, json=payload)
+    response = http_client.post(url=url, headers=headers, json=payload)
     try:
         original_response = response.json()
     except json.JSONDecodeError as exc:
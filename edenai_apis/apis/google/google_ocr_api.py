@@ -61,6 +61,7 @@ from edenai_apis.utils.types import (
     AsyncPendingResponseType,
     AsyncResponseType,
     ResponseType,
+    lazy_original_response,
 )
 
 
@@ -96,7 +97,8 @@ class GoogleOcrApi(OcrInterface):
 
         boxes: Sequence[Bounding_box] = []
         final_text = ""
-        original_response = MessageToDict(response._pb)
+        # converting the whole protobuf response is costly, only do it when needed
+        original_response = lazy_original_response(lambda: MessageToDict(response._pb))
 
         text_annotations: Sequence[EntityAnnotation] = response.text_annotations
         if text_annotations and isinstance(text_annotations[0], EntityAnnotation):
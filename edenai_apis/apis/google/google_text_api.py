@@ -1,5 +1,5 @@
 import json
-from typing import Dict, Generator, List, Literal, Optional, Sequence, Union
+from typing import Dict, Generator, List, Literal, Optional, Sequence, Tuple, Union
 
 import requests
 from edenai_apis.apis.google.google_helpers import (
@@ -50,9 +50,11 @@ from edenai_apis.features.text.topic_extraction.topic_extraction_dataclass impor
     ExtractedTopic,
     TopicExtractionDataClass,
 )
+from edenai_apis.utils.concurrency import run_sync
 from edenai_apis.utils.conversion import standardized_confidence_score
+from edenai_apis.utils.embedding_index import embed_texts, get_corpus_index
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.metrics import METRICS
+from edenai_apis.utils.http import AsyncHTTPResponse, async_http_client, http_client
 from edenai_apis.utils.parsing import extract
 from edenai_apis.utils.types import ResponseType
 
@@ -274,7 +276,7 @@ class GoogleTextApi(TextInterface):
             },
         }
 
-        response = requests.post(url=url, headers=headers, json=payload)
+        response = http_client.post(url=url, headers=headers, json=payload)
 
         try:
             original_response = response.json()
@@ -583,7 +585,7 @@ class GoogleTextApi(TextInterface):
             )
             api_key = self.api_settings.get("genai_api_key")
             base_url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
-            response = requests.post(url=base_url, json=payload)
+            response = http_client.post(url=base_url, json=payload)
             try:
                 original_response = response.json()
                 if "error" in original_response:
@@ -619,7 +621,7 @@ class GoogleTextApi(TextInterface):
                 "Authorization": f"Bearer {token}",
             }
 
-            response = requests.post(url=url, headers=headers, json=payload)
+            response = http_client.post(url=url, headers=headers, json=payload)
             try:
                 original_response = response.json()
                 if "error" in original_response:
@@ -669,7 +671,7 @@ class GoogleTextApi(TextInterface):
             )
             api_key = self.api_settings.get("genai_api_key")
             base_url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent?alt=sse&key={api_key}"
-            response = requests.post(base_url, json=payload, stream=True)
+            response = http_client.post(base_url, json=payload, stream=True)
         else:
             url_subdomain = "us-central1-aiplatform"
             location = "us-central1"
@@ -688,7 +690,7 @@ class GoogleTextApi(TextInterface):
                 max_tokens,
                 context,
             )
-            response = requests.post(
+            response = http_client.post(
                 url=url, headers=headers, json=payload, stream=True
             )
         if response.status_code != 200:
@@ -743,9 +745,10 @@ class GoogleTextApi(TextInterface):
                 model,
             )
 
-    def text__embeddings(
+    def _embeddings_request(
         self, texts: List[str], model: str
-    ) -> ResponseType[EmbeddingsDataClass]:
+    ) -> Tuple[str, Dict, Dict]:
+        """Return url, headers and payload of an embeddings request"""
         model = model.split("__")
         url_subdomain = "us-central1-aiplatform"
         location = "us-central1"
@@ -759,7 +762,12 @@ class GoogleTextApi(TextInterface):
         for text in texts:
             instances.append({"content": text})
         payload = {"instances": instances}
-        response = requests.post(url=url, headers=headers, json=payload)
+        return url, headers, payload
+
+    @staticmethod
+    def _embeddings_response(
+        response: Union[requests.Response, AsyncHTTPResponse],
+    ) -> ResponseType[EmbeddingsDataClass]:
         try:
             original_response = response.json()
         except json.JSONDecodeError as exc:
@@ -783,6 +791,21 @@ class GoogleTextApi(TextInterface):
             standardized_response=standardized_response,
         )
 
+    def text__embeddings(
+        self, texts: List[str], model: str
+    ) -> ResponseType[EmbeddingsDataClass]:
+        url, headers, payload = self._embeddings_request(texts, model)
+        response = http_client.post(url=url, headers=headers, json=payload)
+        return self._embeddings_response(response)
+
+    async def atext__embeddings(
+        self, texts: List[str], model: str
+    ) -> ResponseType[EmbeddingsDataClass]:
+        # getting the access token may refresh it with a blocking call
+        url, headers, payload = await run_sync(self._embeddings_request, texts, model)
+        response = await async_http_client.post(url, headers=headers, json=payload)
+        return self._embeddings_response(response)
+
     def text__code_generation(
         self, instruction: str, temperature: float, max_tokens: int, prompt: str = ""
     ) -> ResponseType[CodeGenerationDataClass]:
@@ -805,7 +828,7 @@ class GoogleTextApi(TextInterface):
             ],
             "parameters": {"temperature": temperature, "maxOutputTokens": max_tokens},
         }
-        response = requests.post(url=url, headers=headers, json=payload)
+        response = http_client.post(url=url, headers=headers, json=payload)
         original_response = response.json()
         print("THe original response is\n\n", original_response)
         if "error" in original_response:
@@ -936,35 +959,28 @@ class GoogleTextApi(TextInterface):
             )
         if model is None:
             model = "768__textembedding-gecko"
-        # Import the function
-        function_score = METRICS[similarity_metric]
-
-        # Embed the texts & query
-        texts_embed_response = GoogleTextApi.text__embeddings(
-            self, texts=texts, model=model
-        ).original_response
-        query_embed_response = GoogleTextApi.text__embeddings(
-            self, texts=[query], model=model
-        ).original_response
-
-        # Extracts embeddings from texts & query
-        texts_embed = [
-            item["embeddings"]["values"] for item in texts_embed_response["predictions"]
-        ]
-        query_embed = query_embed_response["predictions"][0]["embeddings"]["values"]
 
-        items = []
-        # Calculate score for each text index
-        for index, text in enumerate(texts_embed):
-            score = function_score(query_embed, text)
-            items.append(
-                InfosSearchDataClass(
-                    object="search_result", document=index, score=score
-                )
-            )
+        def embed(texts_to_embed: List[str]):
+            response = GoogleTextApi.text__embeddings(
+                self, texts=texts_to_embed, model=model
+            ).original_response
+            return [
+                item["embeddings"]["values"] for item in response["predictions"]
+            ], response
+
+        # Embed the texts & query, only texts not embedded yet are sent to the provider
+        index, texts_embed_response = get_corpus_index(
+            self.provider_name, model, texts, embed
+        )
+        query_embed, query_embed_response = embed_texts(
+            self.provider_name, model, [query], embed
+        )
 
-        # Sort items by score in descending order
-        sorted_items = sorted(items, key=lambda x: x.score, reverse=True)
+        # Score all texts at once, sorted by descending score
+        sorted_items = [
+            InfosSearchDataClass(object="search_result", document=document, score=score)
+            for document, score in index.search(query_embed[0], similarity_metric)
+        ]
 
         # Build the original response
         original_response = {
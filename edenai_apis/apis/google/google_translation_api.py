@@ -1,7 +1,7 @@
 import base64
 import mimetypes
 from io import BytesIO
-from typing import Sequence
+from typing import List, Sequence
 
 from google.protobuf.json_format import MessageToDict
 
@@ -9,6 +9,14 @@ from edenai_apis.apis.google.google_helpers import handle_google_call
 from edenai_apis.features.translation.automatic_translation import (
     AutomaticTranslationDataClass,
 )
+from edenai_apis.features.translation.automatic_translation_batch import (
+    AutomaticTranslationBatchDataClass,
+)
+from edenai_apis.features.translation.automatic_translation_batch.helpers import (
+    BatchLimits,
+    TranslatedPack,
+    translate_in_batches,
+)
 from edenai_apis.features.translation.document_translation import (
     DocumentTranslationDataClass,
 )
@@ -19,9 +27,12 @@ from edenai_apis.features.translation.language_detection import (
 from edenai_apis.features.translation.translation_interface import TranslationInterface
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.languages import get_language_name_from_code
-from edenai_apis.utils.types import ResponseType
+from edenai_apis.utils.types import ResponseType, lazy_original_response
 from edenai_apis.utils.upload_s3 import upload_file_bytes_to_s3, USER_PROCESS
 
+# 1024 texts and 30 000 codepoints per translate_text request
+GOOGLE_BATCH_LIMITS = BatchLimits(max_items=1024, max_size=30000)
+
 
 class GoogleTranslationApi(TranslationInterface):
     def translation__automatic_translation(
@@ -50,7 +61,37 @@ class GoogleTranslationApi(TranslationInterface):
         else:
             raise ProviderException("Empty Text was returned")
         return ResponseType[AutomaticTranslationDataClass](
-            original_response=MessageToDict(response._pb), standardized_response=std
+            original_response=lazy_original_response(
+                lambda: MessageToDict(response._pb)
+            ),
+            standardized_response=std,
+        )
+
+    def translation__automatic_translation_batch(
+        self, source_language: str, target_language: str, texts: List[str]
+    ) -> ResponseType[AutomaticTranslationBatchDataClass]:
+        client = self.clients["translate"]
+        parent = f"projects/{self.project_id}/locations/global"
+
+        def translate_pack(pack: List[str]) -> TranslatedPack:
+            response = handle_google_call(
+                client.translate_text,
+                parent=parent,
+                contents=pack,
+                mime_type="text/plain",
+                source_language_code=source_language,
+                target_language_code=target_language,
+            )
+            return [item.translated_text for item in response.translations], response
+
+        standardized_response, responses = translate_in_batches(
+            texts, translate_pack, GOOGLE_BATCH_LIMITS
+        )
+        return ResponseType[AutomaticTranslationBatchDataClass](
+            original_response=lazy_original_response(
+                lambda: [MessageToDict(response._pb) for response in responses]
+            ),
+            standardized_response=standardized_response,
         )
 
     def translation__language_detection(
@@ -78,7 +119,9 @@ class GoogleTranslationApi(TranslationInterface):
                 )
             )
         return ResponseType[LanguageDetectionDataClass](
-            original_response=MessageToDict(response._pb),
+            original_response=lazy_original_response(
+                lambda: MessageToDict(response._pb)
+            ),
             standardized_response=LanguageDetectionDataClass(items=items),
         )
 
@@ -2,10 +2,9 @@ import base64
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from time import sleep, time
-from typing import Any, Dict, List
+from time import time
+from typing import Any, Dict, List, Tuple
 
-import requests
 from dateutil.parser import parse
 from google.cloud import videointelligence
 
@@ -14,6 +13,7 @@ from edenai_apis.apis.google.google_helpers import (
     GoogleVideoFeatures,
     calculate_usage_tokens,
     google_video_get_job,
+    google_video_get_jobs,
     score_to_content,
 )
 from edenai_apis.features.video import (
@@ -70,18 +70,56 @@ from edenai_apis.features.video.text_detection_async.text_detection_async_datacl
     VideoTextFrames,
 )
 from edenai_apis.features.video.video_interface import VideoInterface
+from edenai_apis.utils.async_to_sync import PollingPolicy, poll_until
 from edenai_apis.utils.exception import (
     ProviderException,
     AsyncJobException,
     AsyncJobExceptionReason,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
+    AsyncErrorResponseType,
     AsyncLaunchJobResponseType,
     AsyncPendingResponseType,
     AsyncResponseType,
     ResponseType,
 )
+from edenai_apis.utils.upload_cache import cached_upload, hash_file
+
+# Video Intelligence feature and video context of each async subfeature
+VIDEO_SUBFEATURES: Dict[str, Tuple[videointelligence.Feature, Dict[str, Any]]] = {
+    "label_detection_async": (videointelligence.Feature.LABEL_DETECTION, {}),
+    "text_detection_async": (videointelligence.Feature.TEXT_DETECTION, {}),
+    "face_detection_async": (
+        videointelligence.Feature.FACE_DETECTION,
+        {
+            "face_detection_config": videointelligence.FaceDetectionConfig(
+                include_bounding_boxes=True, include_attributes=True
+            )
+        },
+    ),
+    "person_tracking_async": (
+        videointelligence.Feature.PERSON_DETECTION,
+        {
+            "person_detection_config": videointelligence.PersonDetectionConfig(
+                include_bounding_boxes=True,
+                include_attributes=True,
+                include_pose_landmarks=True,
+            )
+        },
+    ),
+    "logo_detection_async": (videointelligence.Feature.LOGO_RECOGNITION, {}),
+    "object_tracking_async": (videointelligence.Feature.OBJECT_TRACKING, {}),
+    "explicit_content_detection_async": (
+        videointelligence.Feature.EXPLICIT_CONTENT_DETECTION,
+        {},
+    ),
+    "shot_change_detection_async": (
+        videointelligence.Feature.SHOT_CHANGE_DETECTION,
+        {},
+    ),
+}
 
 
 class GoogleVideoApi(VideoInterface):
@@ -93,16 +131,21 @@ class GoogleVideoApi(VideoInterface):
         storage_client = self.clients["storage"]
         bucket_name = "audios-speech2text"
         file_extension = file.split(".")[-1]
-        file_name = str(int(time())) + Path(file).stem + "_video_." + file_extension
 
-        # Upload video to GCS
-        bucket = storage_client.get_bucket(bucket_name)
-        blob = bucket.blob(file_name)
+        def upload() -> str:
+            file_name = str(int(time())) + Path(file).stem + "_video_." + file_extension
 
-        blob.upload_from_filename(file)
-        gcs_uri = f"gs://{bucket_name}/{file_name}"
+            # Upload video to GCS
+            bucket = storage_client.get_bucket(bucket_name)
+            blob = bucket.blob(file_name)
 
-        return gcs_uri
+            blob.upload_from_filename(file)
+            return f"gs://{bucket_name}/{file_name}"
+
+        # the same video is only uploaded once for all video features
+        return cached_upload(
+            ("gcs", bucket_name, file_extension), hash_file(file), upload
+        )
 
     def _is_older_than_3_hours(self, create_time: str) -> bool:
         created_at = parse(create_time)
@@ -114,7 +157,7 @@ class GoogleVideoApi(VideoInterface):
 
     def _check_file_status(self, file_uri: str, api_key: str) -> Dict[str, Any]:
         url = f"{file_uri}?key={api_key}"
-        response = requests.get(url)
+        response = http_client.get(url)
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
         try:
@@ -130,7 +173,7 @@ class GoogleVideoApi(VideoInterface):
 
         with open(file, "rb") as video_file:
             file = {"file": video_file}
-            response = requests.post(upload_url, files=file)
+            response = http_client.post(upload_url, files=file)
 
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
@@ -147,146 +190,193 @@ class GoogleVideoApi(VideoInterface):
         delete_url = (
             f"https://generativelanguage.googleapis.com/v1beta/{file}?key={api_key}"
         )
-        response = requests.delete(url=delete_url)
+        response = http_client.delete(url=delete_url)
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
 
+    def _annotate_video(self, file: str, subfeatures: List[str]) -> str:
+        """Launch one annotation operation for all subfeatures, return its name"""
+        unknown_subfeatures = set(subfeatures) - VIDEO_SUBFEATURES.keys()
+        if unknown_subfeatures:
+            raise ProviderException(
+                f"Google does not support video {', '.join(sorted(unknown_subfeatures))}"
+            )
+        gcs_uri = self.google_upload_video(file=file)
+
+        features = []
+        video_context = {}
+        for subfeature in dict.fromkeys(subfeatures):
+            feature, context = VIDEO_SUBFEATURES[subfeature]
+            features.append(feature)
+            video_context.update(context)
+        request = {"features": features, "input_uri": gcs_uri}
+        if video_context:
+            request["video_context"] = videointelligence.VideoContext(**video_context)
+
+        operation = self.clients["video"].annotate_video(request=request)
+        return operation.operation.name
+
+    def launch_combined_job(
+        self, file: str, subfeatures: List[str]
+    ) -> Dict[str, AsyncLaunchJobResponseType]:
+        """Launch several video subfeatures with a single annotation request
+
+        The video is uploaded and annotated once, all subfeatures share the same
+        operation: their job results can be fetched with `get_combined_job_results`
+        or with each subfeature `get_job_result`.
+
+        Args:
+            file (str): video file path
+            subfeatures (List[str]): async subfeatures, eg: `label_detection_async`
+
+        Returns:
+            Dict[str, AsyncLaunchJobResponseType]: job handle by subfeature
+        """
+        operation_name = self._annotate_video(file, subfeatures)
+        return {
+            subfeature: AsyncLaunchJobResponseType(provider_job_id=operation_name)
+            for subfeature in subfeatures
+        }
+
     # Launch label detection job
     def video__label_detection_async__launch_job(
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
-        gcs_uri = self.google_upload_video(file=file)
-        operation = self.clients["video"].annotate_video(
-            request={
-                "features": [videointelligence.Feature.LABEL_DETECTION],
-                "input_uri": gcs_uri,
-            }
+        return AsyncLaunchJobResponseType(
+            provider_job_id=self._annotate_video(file, ["label_detection_async"])
         )
-        return AsyncLaunchJobResponseType(provider_job_id=operation.operation.name)
 
     # Launch text detection job
     def video__text_detection_async__launch_job(
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
-        gcs_uri = self.google_upload_video(file=file)
-        operation = self.clients["video"].annotate_video(
-            request={
-                "features": [videointelligence.Feature.TEXT_DETECTION],
-                "input_uri": gcs_uri,
-            }
+        return AsyncLaunchJobResponseType(
+            provider_job_id=self._annotate_video(file, ["text_detection_async"])
         )
 
-        return AsyncLaunchJobResponseType(provider_job_id=operation.operation.name)
-
     # Launch face detection job
     def video__face_detection_async__launch_job(
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
-        gcs_uri = self.google_upload_video(file=file)
-
-        # Configure the request for each feature
-        operation = self.clients["video"].annotate_video(
-            request={
-                "features": [videointelligence.Feature.FACE_DETECTION],
-                "input_uri": gcs_uri,
-                "video_context": videointelligence.VideoContext(
-                    face_detection_config=videointelligence.FaceDetectionConfig(
-                        include_bounding_boxes=True, include_attributes=True
-                    )
-                ),
-            }
+        return AsyncLaunchJobResponseType(
+            provider_job_id=self._annotate_video(file, ["face_detection_async"])
         )
-        return AsyncLaunchJobResponseType(provider_job_id=operation.operation.name)
 
     # Launch person tracking job
     def video__person_tracking_async__launch_job(
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
-        gcs_uri = self.google_upload_video(file=file)
-        # Configure the request for each feature
-        operation = self.clients["video"].annotate_video(
-            request={
-                "features": [videointelligence.Feature.PERSON_DETECTION],
-                "input_uri": gcs_uri,
-                "video_context": videointelligence.VideoContext(
-                    person_detection_config=videointelligence.PersonDetectionConfig(
-                        include_bounding_boxes=True,
-                        include_attributes=True,
-                        include_pose_landmarks=True,
-                    )
-                ),
-            }
+        return AsyncLaunchJobResponseType(
+            provider_job_id=self._annotate_video(file, ["person_tracking_async"])
         )
 
-        # Return job id (operation name)
-        return AsyncLaunchJobResponseType(provider_job_id=operation.operation.name)
-
     # Launch logo detection job
     def video__logo_detection_async__launch_job(
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
-        gcs_uri = self.google_upload_video(file=file)
-        # Configure the request for each feature
-        operation = self.clients["video"].annotate_video(
-            request={
-                "features": [videointelligence.Feature.LOGO_RECOGNITION],
-                "input_uri": gcs_uri,
-            }
+        return AsyncLaunchJobResponseType(
+            provider_job_id=self._annotate_video(file, ["logo_detection_async"])
         )
 
-        # Return job id (operation name)
-        return AsyncLaunchJobResponseType(provider_job_id=operation.operation.name)
-
     # Launch object tracking job
     def video__object_tracking_async__launch_job(
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
-        gcs_uri = self.google_upload_video(file=file)
-        # Configure the request for each feature
-        operation = self.clients["video"].annotate_video(
-            request={
-                "features": [videointelligence.Feature.OBJECT_TRACKING],
-                "input_uri": gcs_uri,
-            }
+        return AsyncLaunchJobResponseType(
+            provider_job_id=self._annotate_video(file, ["object_tracking_async"])
         )
 
-        # Return job id (operation name)
-        return AsyncLaunchJobResponseType(provider_job_id=operation.operation.name)
-
     # Launch explicit content detection job
     def video__explicit_content_detection_async__launch_job(
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
-        gcs_uri = self.google_upload_video(file=file)
-        # Configure the request for each feature
-        operation = self.clients["video"].annotate_video(
-            request={
-                "features": [videointelligence.Feature.EXPLICIT_CONTENT_DETECTION],
-                "input_uri": gcs_uri,
-            }
+        return AsyncLaunchJobResponseType(
+            provider_job_id=self._annotate_video(
+                file, ["explicit_content_detection_async"]
+            )
         )
 
-        # Return job id (operation name)
-        return AsyncLaunchJobResponseType(provider_job_id=operation.operation.name)
-
+    # Launch shot change detection job
     def video__shot_change_detection_async__launch_job(
         self, file: str, file_url: str = ""
     ) -> AsyncLaunchJobResponseType:
-        gcs_uri = self.google_upload_video(file=file)
-        operation = self.clients["video"].annotate_video(
-            request={
-                "features": [videointelligence.Feature.SHOT_CHANGE_DETECTION],
-                "input_uri": gcs_uri,
-            }
+        return AsyncLaunchJobResponseType(
+            provider_job_id=self._annotate_video(file, ["shot_change_detection_async"])
         )
 
-        return AsyncLaunchJobResponseType(provider_job_id=operation.operation.name)
+    def get_combined_job_results(
+        self, provider_job_id: str, subfeatures: List[str]
+    ) -> Dict[str, AsyncBaseResponseType]:
+        """Get the results of a job launched with `launch_combined_job`
+
+        The operation is fetched once and parsed by each subfeature parser.
+
+        Returns:
+            Dict[str, AsyncBaseResponseType]: job result by subfeature
+        """
+        formatters = {
+            subfeature: self._get_job_result_formatter(subfeature)
+            for subfeature in subfeatures
+        }
+        result = google_video_get_job(provider_job_id, self.location)
+        if result.get("error"):
+            raise ProviderException(result["error"].get("message"))
+        return {
+            subfeature: format_job_result(provider_job_id, result)
+            for subfeature, format_job_result in formatters.items()
+        }
+
+    def _get_job_result_formatter(self, subfeature: str):
+        format_job_result = getattr(
+            self, f"_{subfeature.replace('_async', '')}_job_result", None
+        )
+        if subfeature not in VIDEO_SUBFEATURES or format_job_result is None:
+            raise ProviderException(
+                f"Google does not support video {subfeature} job results"
+            )
+        return format_job_result
+
+    def get_job_results(
+        self, subfeature: str, provider_job_ids: List[str]
+    ) -> Dict[str, AsyncBaseResponseType]:
+        """Poll many Video Intelligence jobs of a subfeature at once
+
+        Operations are fetched concurrently with a shared client, a job which can not
+        be fetched or formatted is returned as failed instead of failing the others.
+
+        Args:
+            subfeature (str): async subfeature of the jobs, eg: `label_detection_async`
+            provider_job_ids (List[str]): operations names returned by `launch_job`
+
+        Returns:
+            Dict[str, AsyncBaseResponseType]: job result by provider job id
+        """
+        format_job_result = self._get_job_result_formatter(subfeature)
+
+        results = google_video_get_jobs(provider_job_ids, self.location)
+        job_results = {}
+        for job_id, result in results.items():
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                if result.get("error"):
+                    raise ProviderException(result["error"].get("message"))
+                job_results[job_id] = format_job_result(job_id, result)
+            except Exception as exc:
+                job_results[job_id] = AsyncErrorResponseType(
+                    provider_job_id=job_id, error={"message": str(exc)}
+                )
+        return job_results
 
     def video__label_detection_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[LabelDetectionAsyncDataClass]:
-        result = google_video_get_job(provider_job_id)
+        result = google_video_get_job(provider_job_id, self.location)
+        return self._label_detection_job_result(provider_job_id, result)
 
+    def _label_detection_job_result(
+        self, provider_job_id: str, result: Dict
+    ) -> AsyncBaseResponseType[LabelDetectionAsyncDataClass]:
         if result.get("done"):
             annotations = result["response"]["annotationResults"][0]
             label: List[dict] = annotations.get(
@@ -334,8 +424,12 @@ class GoogleVideoApi(VideoInterface):
     def video__text_detection_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[TextDetectionAsyncDataClass]:
-        result = google_video_get_job(provider_job_id)
+        result = google_video_get_job(provider_job_id, self.location)
+        return self._text_detection_job_result(provider_job_id, result)
 
+    def _text_detection_job_result(
+        self, provider_job_id: str, result: Dict
+    ) -> AsyncBaseResponseType[TextDetectionAsyncDataClass]:
         if result.get("done"):
             annotations = result["response"]["annotationResults"][0]
             texts = []
@@ -380,8 +474,12 @@ class GoogleVideoApi(VideoInterface):
     def video__face_detection_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[FaceDetectionAsyncDataClass]:
-        result = google_video_get_job(provider_job_id)
+        result = google_video_get_job(provider_job_id, self.location)
+        return self._face_detection_job_result(provider_job_id, result)
 
+    def _face_detection_job_result(
+        self, provider_job_id: str, result: Dict
+    ) -> AsyncBaseResponseType[FaceDetectionAsyncDataClass]:
         if result.get("done"):
             faces = []
             response = result["response"]["annotationResults"][0]
@@ -457,8 +555,12 @@ class GoogleVideoApi(VideoInterface):
     def video__person_tracking_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[PersonTrackingAsyncDataClass]:
-        result = google_video_get_job(provider_job_id)
+        result = google_video_get_job(provider_job_id, self.location)
+        return self._person_tracking_job_result(provider_job_id, result)
 
+    def _person_tracking_job_result(
+        self, provider_job_id: str, result: Dict
+    ) -> AsyncBaseResponseType[PersonTrackingAsyncDataClass]:
         if result.get("done"):
             response = result["response"]["annotationResults"][0]
             persons = response.get("personDetectionAnnotations")
@@ -583,8 +685,12 @@ class GoogleVideoApi(VideoInterface):
     def video__logo_detection_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[LogoDetectionAsyncDataClass]:
-        result = google_video_get_job(provider_job_id)
+        result = google_video_get_job(provider_job_id, self.location)
+        return self._logo_detection_job_result(provider_job_id, result)
 
+    def _logo_detection_job_result(
+        self, provider_job_id: str, result: Dict
+    ) -> AsyncBaseResponseType[LogoDetectionAsyncDataClass]:
         if result.get("done"):
             response = result["response"]["annotationResults"][0]
             tracks = []
@@ -647,8 +753,12 @@ class GoogleVideoApi(VideoInterface):
     def video__object_tracking_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[ObjectTrackingAsyncDataClass]:
-        result = google_video_get_job(provider_job_id)
+        result = google_video_get_job(provider_job_id, self.location)
+        return self._object_tracking_job_result(provider_job_id, result)
 
+    def _object_tracking_job_result(
+        self, provider_job_id: str, result: Dict
+    ) -> AsyncBaseResponseType[ObjectTrackingAsyncDataClass]:
         if result.get("done"):
             response = result["response"]["annotationResults"][0]
             objects = response["objectAnnotations"]
@@ -695,8 +805,12 @@ class GoogleVideoApi(VideoInterface):
     def video__explicit_content_detection_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[ExplicitContentDetectionAsyncDataClass]:
-        result = google_video_get_job(provider_job_id)
+        result = google_video_get_job(provider_job_id, self.location)
+        return self._explicit_content_detection_job_result(provider_job_id, result)
 
+    def _explicit_content_detection_job_result(
+        self, provider_job_id: str, result: Dict
+    ) -> AsyncBaseResponseType[ExplicitContentDetectionAsyncDataClass]:
         if result.get("error"):
             raise ProviderException(result["error"].get("message"))
 
@@ -730,8 +844,12 @@ class GoogleVideoApi(VideoInterface):
     def video__shot_change_detection_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[ShotChangeDetectionAsyncDataClass]:
+        result = google_video_get_job(provider_job_id, self.location)
+        return self._shot_change_detection_job_result(provider_job_id, result)
 
-        result = google_video_get_job(provider_job_id)
+    def _shot_change_detection_job_result(
+        self, provider_job_id: str, result: Dict
+    ) -> AsyncBaseResponseType[ShotChangeDetectionAsyncDataClass]:
         if result.get("done"):
             response = result["response"]["annotationResults"][0]
             shot_annotations = response.get("shotAnnotations", [])
@@ -777,7 +895,7 @@ class GoogleVideoApi(VideoInterface):
             ],
             "generationConfig": {"candidateCount": 1, "temperature": temperature},
         }
-        response = requests.post(url, json=payload)
+        response = http_client.post(url, json=payload)
         try:
             original_response = response.json()
         except json.JSONDecodeError as exc:
@@ -814,9 +932,14 @@ class GoogleVideoApi(VideoInterface):
             raise ProviderException(
                 message="The video file is too large (over 100 MB). Please use the asynchronous video question answering api instead.",
             )
-        while file_data["state"] == "PROCESSING":
-            sleep(5)
-            file_data = self._check_file_status(file_data["uri"], api_key)
+        file_uri = file_data["uri"]
+        file_data = poll_until(
+            lambda: self._check_file_status(file_uri, api_key),
+            lambda file_data: file_data["state"] != "PROCESSING",
+            PollingPolicy(initial_delay=1, max_delay=5),
+            first_response=file_data,
+            name="google",
+        )
 
         original_response, generated_text = self._request_question_answer(
             model=model,
@@ -865,7 +988,7 @@ class GoogleVideoApi(VideoInterface):
         inputs = json.loads(base64.b64decode(provider_job_id))
         process_file_id = inputs["process_file_id"]
         url = f"https://generativelanguage.googleapis.com/v1beta/files/{process_file_id}?key={api_key}"
-        response = requests.get(url=url)
+        response = http_client.get(url=url)
         if response.status_code == 403:
             raise AsyncJobException(
                 reason=AsyncJobExceptionReason.DEPRECATED_JOB_ID, code=403
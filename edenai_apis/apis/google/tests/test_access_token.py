@@ -0,0 +1,104 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pytest_mock import MockerFixture
+
+from edenai_apis.apis.google import google_helpers
+from edenai_apis.apis.google.google_helpers import (
+    clear_cached_credentials,
+    get_access_token,
+)
+
+
+class FakeCredentials:
+    def __init__(self, lifetime: float) -> None:
+        self.lifetime = lifetime
+        self.token = None
+        self.expiry = None
+        self.refresh_count = 0
+
+    def refresh(self, request) -> None:
+        time.sleep(0.01)
+        self.refresh_count += 1
+        self.token = f"token-{self.refresh_count}"
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.expiry = now + timedelta(seconds=self.lifetime)
+
+
+@pytest.fixture(autouse=True)
+def clear_credentials():
+    clear_cached_credentials()
+    yield
+    clear_cached_credentials()
+
+
+@pytest.fixture
+def location(tmp_path):
+    path = tmp_path / "google_settings.json"
+    path.write_text("{}")
+    return str(path)
+
+
+def mock_credentials(mocker: MockerFixture, lifetime: float) -> FakeCredentials:
+    credentials = FakeCredentials(lifetime)
+    mocker.patch.object(
+        google_helpers.service_account.Credentials,
+        "from_service_account_file",
+        return_value=credentials,
+    )
+    return credentials
+
+
+def test_token_is_reused_until_expiry(mocker: MockerFixture, location):
+    credentials = mock_credentials(mocker, lifetime=3600)
+
+    tokens = [get_access_token(location) for _ in range(5)]
+
+    assert tokens == ["token-1"] * 5
+    assert credentials.refresh_count == 1
+
+
+def test_concurrent_calls_refresh_once(mocker: MockerFixture, location):
+    credentials = mock_credentials(mocker, lifetime=3600)
+    tokens = []
+
+    threads = [
+        threading.Thread(target=lambda: tokens.append(get_access_token(location)))
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tokens == ["token-1"] * 10
+    assert credentials.refresh_count == 1
+
+
+def test_token_close_to_expiry_is_refreshed_in_background(
+    mocker: MockerFixture, location
+):
+    # valid token, but within the proactive refresh margin
+    credentials = mock_credentials(
+        mocker, lifetime=google_helpers.GOOGLE_TOKEN_REFRESH_MARGIN - 10
+    )
+    assert get_access_token(location) == "token-1"
+
+    # the current token is returned while the new one is fetched
+    assert get_access_token(location) == "token-1"
+    for _ in range(100):
+        if credentials.refresh_count == 2:
+            break
+        time.sleep(0.01)
+    assert credentials.refresh_count == 2
+    assert credentials.token == "token-2"
+
+
+def test_expired_token_is_refreshed(mocker: MockerFixture, location):
+    credentials = mock_credentials(mocker, lifetime=0)
+
+    assert get_access_token(location) == "token-1"
+    assert get_access_token(location) == "token-2"
+    assert credentials.refresh_count == 2
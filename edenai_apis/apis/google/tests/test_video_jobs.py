@@ -0,0 +1,223 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from google.cloud import videointelligence
+from pytest_mock import MockerFixture
+
+from edenai_apis.apis.google import google_helpers
+from edenai_apis.apis.google.google_helpers import (
+    clear_video_operations_client,
+    google_video_get_job,
+    google_video_get_jobs,
+)
+from edenai_apis.apis.google.google_video_api import GoogleVideoApi
+from edenai_apis.utils import concurrency
+from edenai_apis.utils.exception import ProviderException
+
+SHOT_CHANGE_OPERATION = {
+    "done": True,
+    "response": {
+        "annotationResults": [
+            {"shotAnnotations": [{"startTimeOffset": "0s", "endTimeOffset": "1.5s"}]}
+        ]
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_client():
+    clear_video_operations_client()
+    yield
+    clear_video_operations_client()
+
+
+@pytest.fixture
+def discovery_build(mocker: MockerFixture):
+    mocker.patch.object(
+        google_helpers.google.auth, "default", return_value=(MagicMock(), "project")
+    )
+    mocker.patch.object(google_helpers, "_video_operations_http")
+    operations = {
+        "operations/done": SHOT_CHANGE_OPERATION,
+        "operations/pending": {"done": False},
+        "operations/failed": {"done": True, "error": {"message": "Bad video"}},
+    }
+
+    def get(name):
+        request = MagicMock()
+        request.execute.side_effect = lambda http: operations[name]
+        return request
+
+    build = mocker.patch.object(google_helpers.googleapiclient.discovery, "build")
+    build.return_value.projects().locations().operations().get.side_effect = get
+    return build
+
+
+def test_operations_client_is_built_once(discovery_build):
+    for _ in range(3):
+        assert google_video_get_job("operations/pending") == {"done": False}
+
+    assert discovery_build.call_count == 1
+
+
+def test_get_jobs_returns_operations_and_errors(discovery_build):
+    results = google_video_get_jobs(
+        ["operations/done", "operations/pending", "operations/unknown"]
+    )
+
+    assert results["operations/done"] == SHOT_CHANGE_OPERATION
+    assert results["operations/pending"] == {"done": False}
+    assert isinstance(results["operations/unknown"], Exception)
+    assert discovery_build.call_count == 1
+
+
+def test_jobs_are_polled_with_their_credentials(mocker: MockerFixture, tmp_path):
+    default = mocker.patch.object(google_helpers.google.auth, "default")
+    http = mocker.patch.object(google_helpers, "_video_operations_http")
+    mocker.patch.object(
+        google_helpers.service_account.Credentials,
+        "from_service_account_file",
+        side_effect=lambda location, scopes: MagicMock(location=location),
+    )
+    mocker.patch.object(google_helpers, "_CREDENTIALS", {})
+    locations = [str(tmp_path / "first.json"), str(tmp_path / "second.json")]
+    for location in locations:
+        open(location, "w").close()
+
+    def build(credentials, **kwargs):
+        service = MagicMock()
+        service.projects().locations().operations().get.side_effect = lambda name: (
+            MagicMock(
+                execute=MagicMock(
+                    return_value={"name": name, "location": credentials.location}
+                )
+            )
+        )
+        return service
+
+    build = mocker.patch.object(
+        google_helpers.googleapiclient.discovery, "build", side_effect=build
+    )
+
+    for _ in range(2):
+        for location in locations:
+            results = google_video_get_jobs(["operations/1", "operations/2"], location)
+            assert all(result["location"] == location for result in results.values())
+            assert google_video_get_job("operations/3", location) == {
+                "name": "operations/3",
+                "location": location,
+            }
+
+    # one service per credentials file, each request authorized with its own
+    assert build.call_count == 2
+    assert {
+        call.kwargs["credentials"].location for call in build.call_args_list
+    } == set(locations)
+    assert {call.args[0].location for call in http.call_args_list} == set(locations)
+    default.assert_not_called()
+
+
+def test_get_jobs_from_a_busy_provider_executor(discovery_build, mocker):
+    # every worker of the provider executor is busy waiting for the jobs
+    mocker.patch.object(concurrency, "_EXECUTOR", ThreadPoolExecutor(max_workers=1))
+
+    future = concurrency.get_provider_executor().submit(
+        google_video_get_jobs, ["operations/done", "operations/pending"]
+    )
+
+    assert future.result(timeout=5)["operations/done"] == SHOT_CHANGE_OPERATION
+
+
+def test_get_job_results(discovery_build):
+    api = GoogleVideoApi.__new__(GoogleVideoApi)
+    api.location = None
+
+    results = api.get_job_results(
+        "shot_change_detection_async",
+        ["operations/done", "operations/pending", "operations/failed"],
+    )
+
+    assert results["operations/done"].status == "succeeded"
+    shots = results["operations/done"].standardized_response.shotAnnotations
+    assert [(shot.startTimeOffset, shot.endTimeOffset) for shot in shots] == [
+        (0.0, 1.5)
+    ]
+    assert results["operations/pending"].status == "pending"
+    assert results["operations/failed"].status == "failed"
+    assert results["operations/failed"].error == {"message": "Bad video"}
+
+
+def test_launch_combined_job_annotates_once(mocker: MockerFixture):
+    api = GoogleVideoApi.__new__(GoogleVideoApi)
+    api.clients = {"video": MagicMock()}
+    api.clients["video"].annotate_video.return_value.operation.name = "operations/1"
+    mocker.patch.object(api, "google_upload_video", return_value="gs://bucket/v.mp4")
+
+    handles = api.launch_combined_job(
+        "video.mp4", ["label_detection_async", "face_detection_async"]
+    )
+
+    assert {
+        subfeature: handle.provider_job_id for subfeature, handle in handles.items()
+    } == {
+        "label_detection_async": "operations/1",
+        "face_detection_async": "operations/1",
+    }
+    api.google_upload_video.assert_called_once()
+    request = api.clients["video"].annotate_video.call_args.kwargs["request"]
+    assert request["features"] == [
+        videointelligence.Feature.LABEL_DETECTION,
+        videointelligence.Feature.FACE_DETECTION,
+    ]
+    assert request["video_context"].face_detection_config.include_attributes
+
+
+def test_get_combined_job_results_merges_annotation_results(discovery_build):
+    operation = {
+        "done": True,
+        "response": {
+            "annotationResults": [
+                {
+                    "inputUri": "/bucket/v.mp4",
+                    "shotAnnotations": [
+                        {"startTimeOffset": "0s", "endTimeOffset": "1s"}
+                    ],
+                },
+                {
+                    "inputUri": "/bucket/v.mp4",
+                    "explicitAnnotation": {
+                        "frames": [
+                            {
+                                "timeOffset": "0.5s",
+                                "pornographyLikelihood": "VERY_UNLIKELY",
+                            }
+                        ]
+                    },
+                },
+            ]
+        },
+    }
+    get = discovery_build.return_value.projects().locations().operations().get
+    get.side_effect = None
+    get.return_value.execute.side_effect = lambda http: operation
+    api = GoogleVideoApi.__new__(GoogleVideoApi)
+    api.location = None
+
+    results = api.get_combined_job_results(
+        "operations/1",
+        ["shot_change_detection_async", "explicit_content_detection_async"],
+    )
+
+    assert get.call_count == 1
+    shots = results["shot_change_detection_async"].standardized_response
+    assert len(shots.shotAnnotations) == 1
+    moderation = results["explicit_content_detection_async"].standardized_response
+    assert [frame.timestamp for frame in moderation.moderation] == [0.5]
+
+
+def test_unknown_combined_subfeature():
+    api = GoogleVideoApi.__new__(GoogleVideoApi)
+
+    with pytest.raises(ProviderException):
+        api.launch_combined_job("video.mp4", ["question_answer_async"])
@@ -1,8 +1,6 @@
 from collections import defaultdict
 from typing import Dict, List
 
-import requests
-
 from edenai_apis.features import OcrInterface
 from edenai_apis.features.ocr import (
     ResumeEducationEntry,
@@ -23,6 +21,7 @@ from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -44,7 +43,7 @@ class HireabilityApi(ProviderInterface, OcrInterface):
             files = {"document": file_}
 
             # Generate Api output
-            response = requests.post(
+            response = http_client.post(
                 self.url,
                 data={
                     "product_code": self.product_code,
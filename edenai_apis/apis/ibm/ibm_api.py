@@ -10,6 +10,7 @@ from .config import ibm_clients
 
 class IbmApi(ProviderInterface, IbmTextApi):
     provider_name = "ibm"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}):
         self.api_settings = load_provider(
@@ -14,6 +14,7 @@ from edenai_apis.utils.exception import ProviderException
 
 class JinaApi(ProviderInterface, TextInterface):
     provider_name = "jina"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}):
         self.api_settings = load_provider(
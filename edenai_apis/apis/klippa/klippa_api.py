@@ -2,8 +2,6 @@ from io import BufferedReader
 from json import JSONDecodeError
 from typing import Dict
 
-import requests
-
 from edenai_apis.features import OcrInterface, ProviderInterface
 from edenai_apis.features.ocr.financial_parser.financial_parser_dataclass import (
     FinancialParserDataClass,
@@ -16,6 +14,7 @@ from edenai_apis.features.ocr.receipt_parser import ReceiptParserDataClass
 from edenai_apis.features.ocr.resume_parser import ResumeParserDataClass
 from edenai_apis.loaders.loaders import ProviderDataEnum, load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.apis.klippa.klippa_ocr_normalizer import (
     klippa_invoice_parser,
@@ -45,7 +44,7 @@ class KlippaApi(ProviderInterface, OcrInterface):
             "document": file,
         }
         data = {"pdf_text_extraction": "full"}
-        response = requests.post(
+        response = http_client.post(
             url=self.url + endpoint, headers=self.headers, files=files, data=data
         )
 
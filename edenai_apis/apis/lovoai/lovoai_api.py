@@ -1,10 +1,7 @@
 import base64
 import json
-from time import sleep
 from typing import Dict
 
-import requests
-
 from edenai_apis.features.audio import AudioInterface
 from edenai_apis.features.audio.text_to_speech.text_to_speech_dataclass import (
     TextToSpeechDataClass,
@@ -14,11 +11,13 @@ from edenai_apis.features.audio.text_to_speech_async.text_to_speech_async_datacl
 )
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.loaders import load_provider, ProviderDataEnum
+from edenai_apis.utils.async_to_sync import PollingPolicy, poll_until
 from edenai_apis.utils.exception import (
     ProviderException,
     AsyncJobException,
     AsyncJobExceptionReason,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -72,7 +71,7 @@ class LovoaiApi(ProviderInterface, AudioInterface):
             }
         )
 
-        response = requests.post(
+        response = http_client.post(
             f"{self.url}v1/tts/sync", headers=self.headers, data=payload
         )
 
@@ -88,23 +87,27 @@ class LovoaiApi(ProviderInterface, AudioInterface):
             )
 
         if original_response.get("status") == "in_progress":
-            while True:
-                sleep(1)
-                response_status = requests.get(
-                    f"{self.url}v1/tts/{original_response['id']}",
-                    headers=self.headers,
-                )
+            status_url = f"{self.url}v1/tts/{original_response['id']}"
+
+            def get_status() -> dict:
+                response_status = http_client.get(status_url, headers=self.headers)
                 if response_status.status_code != 200:
                     raise ProviderException(
                         response_status.json().get("error", "Something went wrong"),
                         code=response_status.status_code,
                     )
                 try:
-                    original_response = response_status.json()
+                    return response_status.json()
                 except json.JSONDecodeError as exc:
                     raise ProviderException("Internal Server Error", code=500) from exc
-                if original_response.get("status") == "done":
-                    break
+
+            original_response = poll_until(
+                get_status,
+                lambda status: status.get("status") == "done",
+                PollingPolicy(initial_delay=1, max_delay=5),
+                first_response=original_response,
+                name="lovoai",
+            )
 
         data = original_response["data"][0]
         if error := data.get("error"):
@@ -113,7 +116,7 @@ class LovoaiApi(ProviderInterface, AudioInterface):
             raise ProviderException(error_message, error_code)
 
         audio_url = original_response["data"][0]["urls"][0]
-        audio_content = base64.b64encode(requests.get(audio_url).content)
+        audio_content = base64.b64encode(http_client.get(audio_url).content)
         audio_content_string = audio_content.decode("utf-8")
 
         return ResponseType[TextToSpeechDataClass](
@@ -144,7 +147,7 @@ class LovoaiApi(ProviderInterface, AudioInterface):
                 "speed": self.__adjust_speaking_rate(speaking_rate),
             }
         )
-        response = requests.post(
+        response = http_client.post(
             url,
             headers={
                 "X-API-KEY": self.api_settings["api_key_async"],
@@ -172,7 +175,7 @@ class LovoaiApi(ProviderInterface, AudioInterface):
         }
         url_status = f"https://api.genny.lovo.ai/api/v1/tts/{provider_job_id}"
 
-        response_status = requests.get(url=url_status, headers=headers)
+        response_status = http_client.get(url=url_status, headers=headers)
         original_response = response_status.json()
 
         if response_status.status_code == 422:
@@ -199,7 +202,7 @@ class LovoaiApi(ProviderInterface, AudioInterface):
             raise ProviderException(error_message, error_code)
 
         audio_url = original_response["data"][0]["urls"][0]
-        audio_content = base64.b64encode(requests.get(audio_url).content)
+        audio_content = base64.b64encode(http_client.get(audio_url).content)
         audio_content_string = audio_content.decode("utf-8")
 
         return AsyncResponseType[TextToSpeechAsyncDataClass](
@@ -18,6 +18,7 @@ import json
 
 class MetaApi(ProviderInterface, TextInterface):
     provider_name = "meta"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}) -> None:
         self.api_settings = load_provider(
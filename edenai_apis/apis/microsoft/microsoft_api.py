@@ -23,6 +23,7 @@ class MicrosoftApi(
     MicrosoftAudioApi,
 ):
     provider_name = "microsoft"
+    poolable = True
 
     def __init__(self, user=None, api_keys: Dict = {}):
         super().__init__()
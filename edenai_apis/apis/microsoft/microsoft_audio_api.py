@@ -5,7 +5,6 @@ from pathlib import Path
 from typing import List, Optional
 
 import azure.cognitiveservices.speech as speechsdk
-import requests
 
 from edenai_apis.apis.microsoft.microsoft_helpers import (
     generate_right_ssml_text,
@@ -25,6 +24,7 @@ from edenai_apis.utils.exception import (
     LanguageException,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.ssml import is_ssml
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
@@ -88,7 +88,9 @@ class MicrosoftAudioApi(AudioInterface):
         voice_type = 1
 
         audio_content.seek(0)
-        resource_url = upload_file_bytes_to_s3(audio_content, f".{ext}", USER_PROCESS)
+        resource_url = upload_file_bytes_to_s3(
+            audio_content, f".{ext}", USER_PROCESS, background=True
+        )
 
         standardized_response = TextToSpeechDataClass(
             audio=audio, voice_type=voice_type, audio_resource_url=resource_url
@@ -145,7 +147,7 @@ class MicrosoftAudioApi(AudioInterface):
         #     config["properties"]["profanityFilterMode"] = "Removed"
 
         config.update(provider_params)
-        response = requests.post(
+        response = http_client.post(
             url=self.url["speech"], headers=headers, data=json.dumps(config)
         )
         if response.status_code == 201:
@@ -159,7 +161,7 @@ class MicrosoftAudioApi(AudioInterface):
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[SpeechToTextAsyncDataClass]:
         headers = self.headers["speech"]
-        response = requests.get(
+        response = http_client.get(
             url=f'{self.url["speech"]}/{provider_job_id}/files', headers=headers
         )
         original_response = None
@@ -175,7 +177,7 @@ class MicrosoftAudioApi(AudioInterface):
                 diarization_entries = []
                 speakers = set()
                 for file_url in files_urls:
-                    response = requests.get(file_url, headers=headers)
+                    response = http_client.get(file_url, headers=headers)
                     original_response = response.json()
                     if response.status_code != 200:
                         error = original_response.get("message")
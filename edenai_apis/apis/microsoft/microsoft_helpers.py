@@ -2,8 +2,8 @@ import datetime
 
 from collections import defaultdict
 from copy import deepcopy
-from math import floor
-from typing import Dict, List, Sequence, Optional, Any
+from math import floor, isqrt
+from typing import Dict, List, Sequence, Optional, Any, Tuple
 
 from edenai_apis.features.image.face_detection.face_detection_dataclass import (
     FaceAccessories,
@@ -72,7 +72,7 @@ from edenai_apis.utils.conversion import (
     convert_time_to_string,
     standardized_confidence_score,
 )
-from edenai_apis.utils.parsing import extract, extract_amount
+from edenai_apis.utils.parsing import PathExtractor, extract, extract_amount
 from edenai_apis.utils.ssml import convert_audio_attr_in_prosody_tag
 from statistics import mean
 
@@ -555,28 +555,105 @@ def get_right_audio_support_and_sampling_rate(
     return extension, right_audio_format
 
 
+def _polygon_extent(polygon: List[float]) -> Tuple[float, float, float, float]:
+    """(left, top, right, bottom) of the top-left and bottom-right points of a polygon"""
+    return (
+        min(polygon[0], polygon[4]),
+        min(polygon[1], polygon[5]),
+        max(polygon[0], polygon[4]),
+        max(polygon[1], polygon[5]),
+    )
+
+
+class WordGrid:
+    """Uniform grid of the words of a page, used to find the words of a table cell
+    without comparing its bounding box to every word of the page
+
+    The page area covered by words is split in about as many buckets as there are
+    words, each word being referenced in the buckets its polygon overlaps.
+
+    Args:
+        words (List[Dict]): words of a page, with their `polygon`
+    """
+
+    def __init__(self, words: List[Dict]) -> None:
+        self.words = words
+        self.buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        if not words:
+            return
+
+        extents = [_polygon_extent(word["polygon"]) for word in words]
+        self.size = max(1, isqrt(len(words)))
+        self.left = min(extent[0] for extent in extents)
+        self.top = min(extent[1] for extent in extents)
+        self.bucket_width = (
+            max(extent[2] for extent in extents) - self.left
+        ) / self.size or 1.0
+        self.bucket_height = (
+            max(extent[3] for extent in extents) - self.top
+        ) / self.size or 1.0
+
+        for index, extent in enumerate(extents):
+            for bucket in self._buckets(extent):
+                self.buckets[bucket].append(index)
+
+    def _bucket_index(self, value: float, origin: float, bucket_size: float) -> int:
+        return min(self.size - 1, max(0, int((value - origin) // bucket_size)))
+
+    def _buckets(self, extent: Tuple[float, float, float, float]):
+        left, top, right, bottom = extent
+        first_col = self._bucket_index(left, self.left, self.bucket_width)
+        last_col = self._bucket_index(right, self.left, self.bucket_width)
+        first_row = self._bucket_index(top, self.top, self.bucket_height)
+        last_row = self._bucket_index(bottom, self.top, self.bucket_height)
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                yield col, row
+
+    def words_in_bounding_box(self, bounding_box: List[float]) -> List[Dict]:
+        """Words overlapping `bounding_box` (see `_is_word_in_bounding_box`), in page order"""
+        if not self.words:
+            return []
+        candidates = set()
+        for bucket in self._buckets(_polygon_extent(bounding_box)):
+            candidates.update(self.buckets.get(bucket, ()))
+        return [
+            self.words[index]
+            for index in sorted(candidates)
+            if _is_word_in_bounding_box(self.words[index]["polygon"], bounding_box)
+        ]
+
+
 def microsoft_ocr_tables_standardize_response(
     original_response: dict,
 ) -> OcrTablesAsyncDataClass:
     num_pages = len(original_response["pages"])
     pages: List[Page] = [Page() for _ in range(num_pages)]
+    # built on first use, once per page, and shared by all tables of the page
+    word_grids: Dict[int, WordGrid] = {}
 
     for table in original_response.get("tables", []):
         page_index: int = table["boundingRegions"][0]["pageNumber"] - 1
-        std_table = _ocr_tables_standardize_table(table, original_response, page_index)
+        if page_index not in word_grids:
+            word_grids[page_index] = WordGrid(
+                original_response["pages"][page_index]["words"]
+            )
+        std_table = _ocr_tables_standardize_table(
+            table, original_response, word_grids[page_index]
+        )
         pages[page_index].tables.append(std_table)
 
     return OcrTablesAsyncDataClass(pages=pages, num_pages=num_pages)
 
 
 def _ocr_tables_standardize_table(
-    table: dict, original_response: dict, page_index: int
+    table: dict, original_response: dict, word_grid: WordGrid
 ) -> Table:
     num_rows = table.get("rowCount", 0)
     rows = [Row() for _ in range(num_rows)]
 
     for cell in table["cells"]:
-        std_cell = _ocr_tables_standardize_cell(cell, original_response, page_index)
+        std_cell = _ocr_tables_standardize_cell(cell, original_response, word_grid)
         row = rows[cell["rowIndex"]]
         row.cells.append(std_cell)
 
@@ -587,7 +664,7 @@ def _ocr_tables_standardize_table(
 
 
 def _ocr_tables_standardize_cell(
-    cell: dict, original_response: dict, page_index: int
+    cell: dict, original_response: dict, word_grid: WordGrid
 ) -> Cell:
     current_page_num = cell["boundingRegions"][0]["pageNumber"]
     width = original_response["pages"][current_page_num - 1]["width"]
@@ -596,8 +673,7 @@ def _ocr_tables_standardize_cell(
     bounding_box = cell["boundingRegions"][0]["polygon"]
 
     # Get the confidence of the words within the cell's bounding box
-    words = original_response["pages"][page_index]["words"]
-    cell_confidence = _calculate_cell_confidence(words, bounding_box)
+    cell_confidence = _calculate_cell_confidence(word_grid, bounding_box)
 
     return Cell(
         text=cell["content"],
@@ -616,12 +692,8 @@ def _ocr_tables_standardize_cell(
     )
 
 
-def _calculate_cell_confidence(words: List[Dict], bounding_box: List[float]) -> float:
-    cell_words = [
-        word
-        for word in words
-        if _is_word_in_bounding_box(word["polygon"], bounding_box)
-    ]
+def _calculate_cell_confidence(word_grid: WordGrid, bounding_box: List[float]) -> float:
+    cell_words = word_grid.words_in_bounding_box(bounding_box)
     if not cell_words:
         return 1.0
     confidences = [word["confidence"] for word in cell_words]
@@ -743,6 +815,32 @@ def microsoft_parser_normalizer(original_response: Dict) -> List[Dict]:
     return new_response
 
 
+_FINANCIAL_CUSTOMER_FIELDS = PathExtractor(
+    {
+        "name": "CustomerName.value",
+        "id_reference": "CustomerId.value",
+        "tax_id": "CustomerTaxId.value",
+        "mailling_address": "CustomerAddress.content",
+        "billing_address": "BillingAddress.content",
+        "shipping_address": "ShippingAddress.content",
+        "remittance_address": "RemittanceAddress.content",
+        "service_address": "ServiceAddress.content",
+        "remit_to_name": "CustomerAddressRecipient.content",
+    }
+)
+_FINANCIAL_MERCHANT_FIELDS = PathExtractor(
+    {
+        "phone": "MerchantPhoneNumber.value",
+        "tax_id": "VendorTaxId.value",
+        "house_number": "MerchantAddress.value.house_number",
+        "street_name": "MerchantAddress.value.street_address",
+        "city": "MerchantAddress.value.city_district",
+        "zip_code": "MerchantAddress.value.postal_code",
+        "province": "MerchantAddress.value.state_district",
+    }
+)
+
+
 def microsoft_financial_parser_formatter(
     original_response: dict,
 ) -> FinancialParserDataClass:
@@ -760,36 +858,12 @@ def microsoft_financial_parser_formatter(
     for page_idx, page_document in enumerate(responses):
         # Customer information
         customer_information = FinancialCustomerInformation(
-            name=extract(page_document, ["CustomerName", "value"]),
-            id_reference=extract(page_document, ["CustomerId", "value"]),
-            tax_id=extract(page_document, ["CustomerTaxId", "value"]),
-            mailling_address=extract(page_document, ["CustomerAddress", "content"]),
-            billing_address=extract(page_document, ["BillingAddress", "content"]),
-            shipping_address=extract(page_document, ["ShippingAddress", "content"]),
-            remittance_address=extract(page_document, ["RemittanceAddress", "content"]),
-            service_address=extract(page_document, ["ServiceAddress", "content"]),
-            remit_to_name=extract(
-                page_document, ["CustomerAddressRecipient", "content"]
-            ),
+            **_FINANCIAL_CUSTOMER_FIELDS.extract(page_document)
         )
 
         # Merchant information
         merchant_information = FinancialMerchantInformation(
-            phone=extract(page_document, ["MerchantPhoneNumber", "value"]),
-            tax_id=extract(page_document, ["VendorTaxId", "value"]),
-            house_number=extract(
-                page_document, ["MerchantAddress", "value", "house_number"]
-            ),
-            street_name=extract(
-                page_document, ["MerchantAddress", "value", "street_address"]
-            ),
-            city=extract(page_document, ["MerchantAddress", "value", "city_district"]),
-            zip_code=extract(
-                page_document, ["MerchantAddress", "value", "postal_code"]
-            ),
-            province=extract(
-                page_document, ["MerchantAddress", "value", "state_district"]
-            ),
+            **_FINANCIAL_MERCHANT_FIELDS.extract(page_document),
             name=extract(
                 obj=page_document,
                 path=["VendorName", "value"],
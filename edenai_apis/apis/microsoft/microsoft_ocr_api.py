@@ -2,7 +2,6 @@ import json
 from collections import defaultdict
 from typing import Sequence
 
-import requests
 from PIL import Image as Img
 from azure.ai.formrecognizer import DocumentAnalysisClient
 from azure.core.credentials import AzureKeyCredential
@@ -53,6 +52,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -74,7 +74,7 @@ class MicrosoftOcrApi(OcrInterface):
 
         url = f"{self.api_settings['vision']['url']}/ocr?detectOrientation=true"
 
-        request = requests.post(
+        request = http_client.post(
             url=add_query_param_in_url(url, {"language": language}),
             headers=self.headers["vision"],
             data=file_content,
@@ -369,7 +369,7 @@ class MicrosoftOcrApi(OcrInterface):
         )
         url = add_query_param_in_url(url, {"locale": language})
 
-        response = requests.post(
+        response = http_client.post(
             url,
             headers={
                 "Content-Type": "application/octet-stream",
@@ -403,7 +403,7 @@ class MicrosoftOcrApi(OcrInterface):
             + f"documentintelligence/documentModels/prebuilt-layout/"
             f"analyzeResults/{provider_job_id}?api-version=2024-02-29-preview"
         )
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
 
         if response.status_code >= 400:
             try:
@@ -447,7 +447,7 @@ class MicrosoftOcrApi(OcrInterface):
             f"{self.url['documentintelligence']}documentintelligence/documentModels/"
             f"prebuilt-layout:analyze?api-version=2024-02-29-preview"
         )
-        response = requests.post(
+        response = http_client.post(
             url,
             headers={
                 "Content-Type": "application/octet-stream",
@@ -478,7 +478,7 @@ class MicrosoftOcrApi(OcrInterface):
             + f"documentintelligence/documentModels/prebuilt-layout/"
             f"analyzeResults/{provider_job_id}?api-version=2024-02-29-preview"
         )
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, headers=headers)
 
         if response.status_code >= 400:
             error = response.json()["error"]["message"]
@@ -1,11 +1,8 @@
 import sys
 from collections import defaultdict
 from http import HTTPStatus
-from time import sleep
 from typing import Dict, Sequence
 
-import requests
-
 from edenai_apis.features.text import AnonymizationDataClass, ModerationDataClass
 from edenai_apis.features.text import (
     InfosKeywordExtractionDataClass,
@@ -24,7 +21,13 @@ from edenai_apis.features.text.sentiment_analysis.sentiment_analysis_dataclass i
 )
 from edenai_apis.features.text.spell_check import SpellCheckItem, SpellCheckDataClass
 from edenai_apis.features.text.text_interface import TextInterface
+from edenai_apis.utils.async_to_sync import (
+    PollingPolicy,
+    poll_until,
+    retry_after_header,
+)
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from .microsoft_helpers import microsoft_text_moderation_personal_infos
 
@@ -36,7 +39,7 @@ class MicrosoftTextApi(TextInterface):
         if not language:
             language = ""
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url['text_moderation']}&language={language}",
                 headers=self.headers["text_moderation"],
                 json={"text": text},
@@ -71,7 +74,7 @@ class MicrosoftTextApi(TextInterface):
         the entities and their importances
         """
 
-        response = requests.post(
+        response = http_client.post(
             f"{self.url['text']}",
             headers=self.headers["text"],
             json={
@@ -129,7 +132,7 @@ class MicrosoftTextApi(TextInterface):
         :return:            String that contains output result
         """
 
-        response = requests.post(
+        response = http_client.post(
             self.url["summarization"],
             headers=self.headers["text"],
             json={
@@ -158,31 +161,34 @@ class MicrosoftTextApi(TextInterface):
         if get_url is None:
             raise ProviderException("Microsoft Azure couldn't create job")
 
-        get_response = requests.get(url=get_url, headers=self.headers["text"])
+        get_response = http_client.get(url=get_url, headers=self.headers["text"])
         if get_response.status_code != 200:
             err = get_response.json().get("error", {})
             error_msg = err.get("message", "Microsoft Azure couldn't fetch job")
             raise ProviderException(error_msg, code=get_response.status_code)
 
-        data = get_response.json()
-        wait_time = 0
-        summary = ""
-        while wait_time < 60:  # Wait for the answer from provider
+        def is_done(get_response) -> bool:
+            data = get_response.json()
             if error := data.get("error"):
                 raise ProviderException(
                     error.get("message") or "Error calling the summarize feature",
                     400,
                 )
-            if data["status"] == "succeeded":
-                sentences = data["tasks"]["extractiveSummarizationTasks"][0]["results"][
-                    "documents"
-                ][0]["sentences"]
-                summary = " ".join([sentence["text"] for sentence in sentences])
-                break
-            sleep(6)
-            wait_time += 6
-            get_response = requests.get(url=get_url, headers=self.headers["text"])
-            data = get_response.json()
+            return data["status"] == "succeeded"
+
+        get_response = poll_until(
+            lambda: http_client.get(url=get_url, headers=self.headers["text"]),
+            is_done,
+            PollingPolicy(initial_delay=1, max_delay=6, timeout=60),
+            first_response=get_response,
+            retry_after=retry_after_header,
+            name="microsoft",
+        )
+        data = get_response.json()
+        sentences = data["tasks"]["extractiveSummarizationTasks"][0]["results"][
+            "documents"
+        ][0]["sentences"]
+        summary = " ".join([sentence["text"] for sentence in sentences])
 
         standardized_response = SummarizeDataClass(result=summary)
 
@@ -194,7 +200,7 @@ class MicrosoftTextApi(TextInterface):
         self, text: str, language: str
     ) -> ResponseType[AnonymizationDataClass]:
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url['text']}",
                 headers=self.headers["text"],
                 json={
@@ -267,7 +273,7 @@ class MicrosoftTextApi(TextInterface):
         :return:            TextSentimentAnalysis Object that contains sentiments and their rates
         """
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url['text']}",
                 headers=self.headers["text"],
                 json={
@@ -359,7 +365,7 @@ class MicrosoftTextApi(TextInterface):
         """
 
         try:
-            response = requests.post(
+            response = http_client.post(
                 f"{self.url['text']}",
                 headers=self.headers["text"],
                 json={
@@ -404,7 +410,7 @@ class MicrosoftTextApi(TextInterface):
         data = {"text": text}
         params = {"mkt": language, "mode": "spell"}
 
-        response = requests.post(
+        response = http_client.post(
             self.url["spell_check"],
             headers=self.headers["spell_check"],
             data=data,
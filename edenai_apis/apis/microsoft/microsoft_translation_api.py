@@ -1,19 +1,29 @@
 from http import HTTPStatus
-from typing import Sequence
+from typing import List, Sequence
 
 import requests
 
 from edenai_apis.features.translation import (
+    AutomaticTranslationBatchDataClass,
     AutomaticTranslationDataClass,
     InfosLanguageDetectionDataClass,
     LanguageDetectionDataClass,
 )
+from edenai_apis.features.translation.automatic_translation_batch.helpers import (
+    BatchLimits,
+    TranslatedPack,
+    translate_in_batches,
+)
 from edenai_apis.features.translation.translation_interface import TranslationInterface
 from edenai_apis.utils.conversion import add_query_param_in_url
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.languages import get_language_name_from_code
 from edenai_apis.utils.types import ResponseType
 
+# 1000 texts and 50 000 characters per Translator request
+MICROSOFT_BATCH_LIMITS = BatchLimits(max_items=1000, max_size=50000)
+
 
 class MicrosoftTranslationApi(TranslationInterface):
 
@@ -36,7 +46,7 @@ class MicrosoftTranslationApi(TranslationInterface):
     def translation__language_detection(
         self, text
     ) -> ResponseType[LanguageDetectionDataClass]:
-        response = requests.post(
+        response = http_client.post(
             url=f"{self.url['text']}",
             headers=self.headers["text"],
             json={
@@ -88,7 +98,7 @@ class MicrosoftTranslationApi(TranslationInterface):
             }
         ]
         # Getting response of API
-        response = requests.post(url, headers=self.headers["translator"], json=body)
+        response = http_client.post(url, headers=self.headers["translator"], json=body)
         self._raise_on_error(response)
         data = response.json()
 
@@ -100,3 +110,29 @@ class MicrosoftTranslationApi(TranslationInterface):
         return ResponseType[AutomaticTranslationDataClass](
             original_response=data, standardized_response=standardized_response
         )
+
+    def translation__automatic_translation_batch(
+        self, source_language: str, target_language: str, texts: List[str]
+    ) -> ResponseType[AutomaticTranslationBatchDataClass]:
+        url = add_query_param_in_url(
+            url=self.url["translator"],
+            query_params={"from": source_language, "to": target_language},
+        )
+
+        def translate_pack(pack: List[str]) -> TranslatedPack:
+            response = http_client.post(
+                url,
+                headers=self.headers["translator"],
+                json=[{"text": text} for text in pack],
+            )
+            self._raise_on_error(response)
+            data = response.json()
+            return [item["translations"][0]["text"] for item in data], data
+
+        standardized_response, original_response = translate_in_batches(
+            texts, translate_pack, MICROSOFT_BATCH_LIMITS
+        )
+        return ResponseType[AutomaticTranslationBatchDataClass](
+            original_response=original_response,
+            standardized_response=standardized_response,
+        )
@@ -0,0 +1,70 @@
+import json
+import os
+import random
+
+import pytest
+
+from edenai_apis.apis.microsoft.microsoft_helpers import (
+    WordGrid,
+    _is_word_in_bounding_box,
+    microsoft_ocr_tables_standardize_response,
+)
+
+OUTPUT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    "outputs",
+    "ocr",
+    "ocr_tables_async_output.json",
+)
+
+
+def box(left: float, top: float, right: float, bottom: float) -> list:
+    return [left, top, right, top, right, bottom, left, bottom]
+
+
+def random_words(rng: random.Random, count: int) -> list:
+    words = []
+    for index in range(count):
+        left, top = rng.uniform(0, 8), rng.uniform(0, 11)
+        polygon = box(left, top, left + rng.uniform(0, 1), top + rng.uniform(0, 0.3))
+        if index % 10 == 0:
+            # rotated words have their "bottom right" point above or left of the first one
+            polygon[4], polygon[5] = polygon[0] - 0.2, polygon[1] - 0.1
+        words.append({"polygon": polygon, "confidence": rng.random()})
+    return words
+
+
+def test_standardize_saved_output():
+    with open(OUTPUT_PATH) as file:
+        output = json.load(file)
+
+    result = microsoft_ocr_tables_standardize_response(
+        output["original_response"]["analyzeResult"]
+    )
+
+    assert result.model_dump() == output["standardized_response"]
+
+
+@pytest.mark.parametrize("count", [0, 1, 5, 500])
+def test_word_grid_matches_page_scan(count):
+    rng = random.Random(count)
+    words = random_words(rng, count)
+    grid = WordGrid(words)
+
+    for _ in range(200):
+        left, top = rng.uniform(-1, 9), rng.uniform(-1, 12)
+        cell_box = box(left, top, left + rng.uniform(0, 3), top + rng.uniform(0, 1))
+        expected = [
+            word
+            for word in words
+            if _is_word_in_bounding_box(word["polygon"], cell_box)
+        ]
+        assert grid.words_in_bounding_box(cell_box) == expected
+
+
+def test_word_grid_touching_boxes():
+    words = [{"polygon": box(0, 0, 1, 1)}, {"polygon": box(2, 0, 3, 1)}]
+    grid = WordGrid(words)
+
+    assert grid.words_in_bounding_box(box(1, 1, 2, 2)) == words
+    assert grid.words_in_bounding_box(box(1.1, 0, 1.9, 1)) == []
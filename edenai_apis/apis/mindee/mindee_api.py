@@ -3,8 +3,6 @@ from collections import defaultdict
 from io import BufferedReader
 from typing import Dict, Optional, Sequence, TypeVar, TypedDict
 
-import requests
-
 from edenai_apis.apis.mindee.mindee_ocr_normalizer import mindee_financial_parser
 from edenai_apis.features import ProviderInterface, OcrInterface
 from edenai_apis.features.ocr import (
@@ -52,6 +50,7 @@ from edenai_apis.utils.conversion import (
     convert_string_to_number,
 )
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     ResponseType,
     AsyncLaunchJobResponseType,
@@ -103,7 +102,7 @@ class MindeeApi(ProviderInterface, OcrInterface):
     ) -> ResponseType[ReceiptParserDataClass]:
         with open(file, "rb") as file_:
             args = self._get_api_attributes(file_)
-            response = requests.post(
+            response = http_client.post(
                 self.url_receipt,
                 headers=args["headers"],
                 files=args["files"],
@@ -199,7 +198,7 @@ class MindeeApi(ProviderInterface, OcrInterface):
         }
         with open(file, "rb") as file_:
             files = {"document": file_}
-            response = requests.post(self.url, headers=headers, files=files)
+            response = http_client.post(self.url, headers=headers, files=files)
             original_response = response.json()
 
         if "document" not in original_response:
@@ -355,7 +354,7 @@ class MindeeApi(ProviderInterface, OcrInterface):
         with open(file, "rb") as file_:
             args = self._get_api_attributes(file_)
 
-            response = requests.post(
+            response = http_client.post(
                 url=self.url_identity, files=args["files"], headers=args["headers"]
             )
 
@@ -460,7 +459,7 @@ class MindeeApi(ProviderInterface, OcrInterface):
             files = {"document": file_}
 
             try:
-                response = requests.post(
+                response = http_client.post(
                     self.url_bank_check, headers=headers, files=files
                 )
             except:
@@ -536,7 +535,7 @@ class MindeeApi(ProviderInterface, OcrInterface):
         }
         with open(file, "rb") as file_:
             files = {"document": file_}
-            response = requests.post(self.url_financial, headers=headers, files=files)
+            response = http_client.post(self.url_financial, headers=headers, files=files)
             original_response = response.json()
 
         if "document" not in original_response:
@@ -556,7 +555,7 @@ class MindeeApi(ProviderInterface, OcrInterface):
     ) -> AsyncLaunchJobResponseType:
         with open(file, "rb") as file_:
             args = self._get_api_attributes(file_)
-            response = requests.post(
+            response = http_client.post(
                 url=self.url_invoice_splitter + "predict_async",
                 headers=args["headers"],
                 files=args["files"],
@@ -576,7 +575,7 @@ class MindeeApi(ProviderInterface, OcrInterface):
             "Authorization": self.api_key,
         }
 
-        response = requests.get(
+        response = http_client.get(
             f"{self.url_invoice_splitter}documents/queue/{provider_job_id}",
             headers=headers,
         )
@@ -18,12 +18,15 @@ from edenai_apis.features.text.generation.generation_dataclass import (
 )
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.concurrency import run_sync
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import AsyncHTTPResponse, async_http_client, http_client
 from edenai_apis.utils.types import ResponseType
 
 
 class MistralApi(ProviderInterface, TextInterface):
     provider_name = "mistral"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}) -> None:
         self.api_settings = load_provider(
@@ -71,7 +74,7 @@ class MistralApi(ProviderInterface, TextInterface):
             "temperature": temperature,
             "max_tokens": max_tokens,
         }
-        response = requests.post(
+        response = http_client.post(
             self.url + "v1/chat/completions", json=payload, headers=self.headers
         )
         try:
@@ -94,20 +97,29 @@ class MistralApi(ProviderInterface, TextInterface):
             standardized_response=GenerationDataClass(generated_text=generated_text),
         )
 
-    def text__chat(
+    @staticmethod
+    def _get_response(response: Union[requests.Response, AsyncHTTPResponse]) -> Dict:
+        try:
+            original_response = response.json()
+            if "message" in original_response or response.status_code >= 400:
+                message_error = original_response["message"]
+                raise ProviderException(message_error, code=response.status_code)
+        except Exception:
+            raise ProviderException(response.text, code=response.status_code)
+        return original_response
+
+    def _chat_payload(
         self,
         text: str,
-        chatbot_global_action: Optional[str] = None,
-        previous_history: Optional[List[Dict[str, str]]] = None,
-        temperature: float = 0.0,
-        max_tokens: int = 25,
-        model: Optional[str] = None,
-        stream: bool = False,
-        available_tools: Optional[List[dict]] = None,
-        tool_choice: Literal["auto", "required", "none"] = "auto",
-        tool_results: Optional[List[dict]] = None,
-    ) -> ResponseType[Union[ChatDataClass, StreamChat]]:
-        previous_history = previous_history or []
+        chatbot_global_action: Optional[str],
+        previous_history: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        model: Optional[str],
+        available_tools: Optional[List[dict]],
+        tool_choice: Literal["auto", "required", "none"],
+        tool_results: Optional[List[dict]],
+    ) -> Dict:
         messages = []
         for msg in previous_history:
             message = {
@@ -163,58 +175,84 @@ class MistralApi(ProviderInterface, TextInterface):
         if available_tools:
             payload["tools"] = convert_tools_to_openai(available_tools)
             payload["tool_choice"] = "any" if tool_choice == "required" else tool_choice
+        return payload
 
-        if not stream:
-            response = requests.post(
-                self.url + "v1/chat/completions", json=payload, headers=self.headers
-            )
-            try:
-                original_response = response.json()
-                if "message" in original_response or response.status_code >= 400:
-                    message_error = original_response["message"]
-                    raise ProviderException(message_error, code=response.status_code)
-            except Exception:
-                raise ProviderException(response.text, code=response.status_code)
-
-            # Build a list of ChatMessageDataClass objects for the conversation history
-            message = original_response["choices"][0]["message"]
-            generated_text = message["content"]
-            original_tools_calls = message.get("tool_calls") or []
-            tool_calls = []
-            for tool_call in original_tools_calls:
-                tool_calls.append(
-                    ToolCall(
-                        id=tool_call["id"],
-                        name=tool_call["function"]["name"],
-                        arguments=tool_call["function"]["arguments"],
-                    )
+    @staticmethod
+    def _chat_response(
+        original_response: Dict, text: str, available_tools: Optional[List[dict]]
+    ) -> ResponseType[ChatDataClass]:
+        # Build a list of ChatMessageDataClass objects for the conversation history
+        message = original_response["choices"][0]["message"]
+        generated_text = message["content"]
+        original_tools_calls = message.get("tool_calls") or []
+        tool_calls = []
+        for tool_call in original_tools_calls:
+            tool_calls.append(
+                ToolCall(
+                    id=tool_call["id"],
+                    name=tool_call["function"]["name"],
+                    arguments=tool_call["function"]["arguments"],
                 )
+            )
 
-            message = [
-                ChatMessageDataClass(role="user", message=text, tools=available_tools),
-                ChatMessageDataClass(
-                    role="assistant", message=generated_text, tool_calls=tool_calls
-                ),
-            ]
+        message = [
+            ChatMessageDataClass(role="user", message=text, tools=available_tools),
+            ChatMessageDataClass(
+                role="assistant", message=generated_text, tool_calls=tool_calls
+            ),
+        ]
 
-            # Build the standardized response
-            standardized_response = ChatDataClass(
-                generated_text=generated_text, message=message
-            )
+        # Build the standardized response
+        standardized_response = ChatDataClass(
+            generated_text=generated_text, message=message
+        )
 
-            # Calculate number of tokens :
-            original_response["usage"]["total_tokens"] = (
-                original_response["usage"]["completion_tokens"]
-                + original_response["usage"]["prompt_tokens"]
-            )
+        # Calculate number of tokens :
+        original_response["usage"]["total_tokens"] = (
+            original_response["usage"]["completion_tokens"]
+            + original_response["usage"]["prompt_tokens"]
+        )
+
+        return ResponseType[ChatDataClass](
+            original_response=original_response,
+            standardized_response=standardized_response,
+        )
 
-            return ResponseType[ChatDataClass](
-                original_response=original_response,
-                standardized_response=standardized_response,
+    def text__chat(
+        self,
+        text: str,
+        chatbot_global_action: Optional[str] = None,
+        previous_history: Optional[List[Dict[str, str]]] = None,
+        temperature: float = 0.0,
+        max_tokens: int = 25,
+        model: Optional[str] = None,
+        stream: bool = False,
+        available_tools: Optional[List[dict]] = None,
+        tool_choice: Literal["auto", "required", "none"] = "auto",
+        tool_results: Optional[List[dict]] = None,
+    ) -> ResponseType[Union[ChatDataClass, StreamChat]]:
+        payload = self._chat_payload(
+            text,
+            chatbot_global_action,
+            previous_history or [],
+            temperature,
+            max_tokens,
+            model,
+            available_tools,
+            tool_choice,
+            tool_results,
+        )
+
+        if not stream:
+            response = http_client.post(
+                self.url + "v1/chat/completions", json=payload, headers=self.headers
+            )
+            return self._chat_response(
+                self._get_response(response), text, available_tools
             )
         else:
             payload["stream"] = True
-            response = requests.post(
+            response = http_client.post(
                 self.url + "v1/chat/completions",
                 json=payload,
                 headers=self.headers,
@@ -226,22 +264,54 @@ class MistralApi(ProviderInterface, TextInterface):
                 standardized_response=StreamChat(stream=response),
             )
 
-    def text__embeddings(
-        self, texts: List[str], model: Optional[str] = None
-    ) -> ResponseType[EmbeddingsDataClass]:
-        model = model.split("__")[1]
-        payload = {"model": model, "input": texts}
-        response = requests.post(
-            url=self.url + "v1/embeddings", json=payload, headers=self.headers
+    async def atext__chat(
+        self,
+        text: str,
+        chatbot_global_action: Optional[str] = None,
+        previous_history: Optional[List[Dict[str, str]]] = None,
+        temperature: float = 0.0,
+        max_tokens: int = 25,
+        model: Optional[str] = None,
+        stream: bool = False,
+        available_tools: Optional[List[dict]] = None,
+        tool_choice: Literal["auto", "required", "none"] = "auto",
+        tool_results: Optional[List[dict]] = None,
+    ) -> ResponseType[Union[ChatDataClass, StreamChat]]:
+        if stream:
+            # streamed chunks are consumed synchronously by the caller
+            return await run_sync(
+                self.text__chat,
+                text,
+                chatbot_global_action,
+                previous_history,
+                temperature,
+                max_tokens,
+                model,
+                stream,
+                available_tools,
+                tool_choice,
+                tool_results,
+            )
+        payload = self._chat_payload(
+            text,
+            chatbot_global_action,
+            previous_history or [],
+            temperature,
+            max_tokens,
+            model,
+            available_tools,
+            tool_choice,
+            tool_results,
         )
-        try:
-            original_response = response.json()
-            if "message" in original_response or response.status_code >= 400:
-                message_error = original_response["message"]
-                raise ProviderException(message_error, code=response.status_code)
-        except Exception:
-            raise ProviderException(response.text, code=response.status_code)
+        response = await async_http_client.post(
+            self.url + "v1/chat/completions", json=payload, headers=self.headers
+        )
+        return self._chat_response(self._get_response(response), text, available_tools)
 
+    @staticmethod
+    def _embeddings_response(
+        original_response: Dict,
+    ) -> ResponseType[EmbeddingsDataClass]:
         items = []
         embeddings = original_response["data"]
 
@@ -252,3 +322,23 @@ class MistralApi(ProviderInterface, TextInterface):
             original_response=original_response,
             standardized_response=EmbeddingsDataClass(items=items),
         )
+
+    def text__embeddings(
+        self, texts: List[str], model: Optional[str] = None
+    ) -> ResponseType[EmbeddingsDataClass]:
+        model = model.split("__")[1]
+        payload = {"model": model, "input": texts}
+        response = http_client.post(
+            url=self.url + "v1/embeddings", json=payload, headers=self.headers
+        )
+        return self._embeddings_response(self._get_response(response))
+
+    async def atext__embeddings(
+        self, texts: List[str], model: Optional[str] = None
+    ) -> ResponseType[EmbeddingsDataClass]:
+        model = model.split("__")[1]
+        payload = {"model": model, "input": texts}
+        response = await async_http_client.post(
+            self.url + "v1/embeddings", json=payload, headers=self.headers
+        )
+        return self._embeddings_response(self._get_response(response))
@@ -1,8 +1,7 @@
 import base64
 import json
-import time
 import uuid
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
@@ -43,7 +42,9 @@ from edenai_apis.features.image.search.upload_image.search_upload_image_dataclas
 )
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.credentials import credential_broker
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncErrorResponseType,
@@ -71,34 +72,58 @@ class NyckelApi(ProviderInterface, ImageInterface):
             ProviderDataEnum.KEY, self.provider_name, api_keys=api_keys
         )
         self._session = requests.Session()
-        self._renew_at = 0
+        self._session.hooks["response"].append(self._retry_unauthorized)
         self.webhook_settings = load_provider(ProviderDataEnum.KEY, "webhooksite")
         self.webhook_token = self.webhook_settings["webhook_token"]
 
+    @property
+    def _credentials(self) -> Dict[str, str]:
+        return {
+            "client_id": self.api_settings["client_id"],
+            "client_secret": self.api_settings["client_secret"],
+        }
+
     def _refresh_session_auth_headers_if_needed(self) -> None:
-        if time.time() > self._renew_at:
-            self._renew_session_auth_header()
+        """Set the access token of the session, shared by all instances using the
+        same client credentials and only renewed when it expires"""
+        access_token = credential_broker.get(
+            self.provider_name, self._credentials, self._fetch_access_token
+        )
+        self._session.headers.update({"authorization": "Bearer " + access_token})
 
-    def _renew_session_auth_header(self) -> None:
+    def _fetch_access_token(self) -> Tuple[str, float]:
         RENEW_MARGIN_SECONDS = 10 * 60
 
         url = "https://www.nyckel.com/connect/token"
-        data = {
-            "client_id": self.api_settings["client_id"],
-            "client_secret": self.api_settings["client_secret"],
-            "grant_type": "client_credentials",
-        }
+        data = {**self._credentials, "grant_type": "client_credentials"}
 
-        response = requests.post(url, data=data)
+        response = http_client.post(url, data=data)
         if not response.status_code == 200:
             self._raise_provider_exception(url, data, response)
 
-        self._session.headers.update(
-            {"authorization": "Bearer " + response.json()["access_token"]}
+        response_json = response.json()
+        return (
+            response_json["access_token"],
+            response_json["expires_in"] - RENEW_MARGIN_SECONDS,
         )
-        self._renew_at = (
-            time.time() + response.json()["expires_in"] - RENEW_MARGIN_SECONDS
+
+    def _retry_unauthorized(
+        self, response: requests.Response, *args, **kwargs
+    ) -> requests.Response:
+        """Session response hook: renew a rejected access token and send the request again"""
+        if response.status_code != 401:
+            return response
+
+        authorization = response.request.headers.get("authorization", "")
+        credential_broker.invalidate(
+            self.provider_name, self._credentials, authorization[len("Bearer ") :]
         )
+        self._refresh_session_auth_headers_if_needed()
+
+        retry = response.request.copy()
+        retry.headers["authorization"] = self._session.headers["authorization"]
+        retry.deregister_hook("response", self._retry_unauthorized)
+        return self._session.send(retry, **kwargs)
 
     def _raise_provider_exception(
         self, url: str, data: dict, response: requests.Response
@@ -160,7 +185,7 @@ class NyckelApi(ProviderInterface, ImageInterface):
 
         # The response 'data' key points to a url where we can fetch the image.
         try:
-            fetch_image_response = requests.get(response.json()[0]["data"])
+            fetch_image_response = http_client.get(response.json()[0]["data"])
             if fetch_image_response.status_code >= 400:
                 self._raise_provider_exception(url, {}, fetch_image_response)
         except IndexError:
@@ -1,8 +1,6 @@
 import json
 from typing import Dict, List, Optional
 
-import requests
-
 from edenai_apis.features import (
     AudioInterface,
     OcrInterface,
@@ -40,6 +38,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.languages import get_code_from_language_name
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
@@ -69,7 +68,7 @@ class OneaiApi(
     ) -> ResponseType[AnonymizationDataClass]:
         data = json.dumps({"input": text, "steps": [{"skill": "anonymize"}]})
 
-        response = requests.post(url=self.url, headers=self.header, data=data)
+        response = http_client.post(url=self.url, headers=self.header, data=data)
         original_response = response.json()
 
         if response.status_code != 200:
@@ -98,7 +97,7 @@ class OneaiApi(
             "steps": [{"skill": "keywords"}],
         }
 
-        response = requests.post(url=self.url, headers=self.header, json=payload)
+        response = http_client.post(url=self.url, headers=self.header, json=payload)
         original_response = response.json()
 
         if response.status_code != 200:
@@ -126,7 +125,7 @@ class OneaiApi(
     ) -> ResponseType[NamedEntityRecognitionDataClass]:
         data = json.dumps({"input": text, "steps": [{"skill": "names"}]})
 
-        response = requests.post(url=self.url, headers=self.header, data=data)
+        response = http_client.post(url=self.url, headers=self.header, data=data)
         original_response = response.json()
 
         if response.status_code != 200:
@@ -156,7 +155,7 @@ class OneaiApi(
     ) -> ResponseType[SentimentAnalysisDataClass]:
         data = json.dumps({"input": text, "steps": [{"skill": "sentiments"}]})
 
-        response = requests.post(url=self.url, headers=self.header, data=data)
+        response = http_client.post(url=self.url, headers=self.header, data=data)
         original_response = response.json()
 
         if response.status_code != 200:
@@ -200,7 +199,7 @@ class OneaiApi(
     ) -> ResponseType[SummarizeDataClass]:
         data = json.dumps({"input": text, "steps": [{"skill": "summarize"}]})
 
-        response = requests.post(url=self.url, headers=self.header, data=data)
+        response = http_client.post(url=self.url, headers=self.header, data=data)
         original_response = response.json()
 
         if response.status_code != 200:
@@ -228,7 +227,7 @@ class OneaiApi(
             }
         )
 
-        response = requests.post(url=self.url, headers=self.header, data=data)
+        response = http_client.post(url=self.url, headers=self.header, data=data)
         original_response = response.json()
 
         if response.status_code != 200:
@@ -279,7 +278,7 @@ class OneaiApi(
         }
 
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 url=f"{self.url}/async/file?pipeline={json.dumps(data)}",
                 headers=self.header,
                 data=file_.read(),
@@ -296,7 +295,7 @@ class OneaiApi(
     def audio__speech_to_text_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[SpeechToTextAsyncDataClass]:
-        response = requests.get(
+        response = http_client.get(
             url=f"{self.url}/async/tasks/{provider_job_id}", headers=self.header
         )
 
@@ -366,7 +365,7 @@ class OneaiApi(
             with open(file, "rb") as _file:
                 file_param = _file.read()
 
-        response = requests.post(
+        response = http_client.post(
             f"{self.url}/async/file",
             params={"pipeline": json.dumps(params)},
             headers=self.header,
@@ -385,7 +384,7 @@ class OneaiApi(
     def ocr__ocr_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[OcrAsyncDataClass]:
-        response = requests.get(
+        response = http_client.get(
             url=f"{self.url}/async/tasks/{provider_job_id}", headers=self.header
         )
         status_code = response.status_code
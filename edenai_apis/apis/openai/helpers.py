@@ -1,11 +1,15 @@
+import hashlib
 import json
+import os
 import aiohttp
 from enum import Enum
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Union
 
 from requests import Response
 
+from edenai_apis.utils.cache import LRUCache
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import AsyncHTTPResponse, async_http_client, http_client
 from edenai_apis.utils.languages import get_language_name_from_code
 from .prompts_guidelines import (
     anthropic_prompt_guidelines,
@@ -131,9 +135,9 @@ def construct_topic_extraction_context(text: str) -> str:
     """
 
 
-def get_openapi_response(response: Response):
+def get_openapi_response(response: Union[Response, AsyncHTTPResponse]):
     """
-    This function takes a requests.Response as input and return it's response.json()
+    This function takes a requests.Response (or an AsyncHTTPResponse) as input and return it's response.json()
     raises a ProviderException if the response contains an error.
     """
     try:
@@ -403,36 +407,106 @@ def convert_tool_results_to_openai_tool_calls(tools_results: List[dict]):
     return result
 
 
-async def moderate_content(headers, content: str) -> bool:
-    if not content:
-        return False
+MODERATION_URL = "https://api.openai.com/v1/moderations"
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            "https://api.openai.com/v1/moderations",
-            headers=headers,
-            json={"input": content},
-        ) as response:
-            response_data = await get_openapi_response_async(response)
-
-            if response_data is None:
-                return False
+# Verdicts of already moderated contents, keyed by content hash, so that replayed
+# chat history is never sent to moderation again
+MODERATION_CACHE = LRUCache(
+    max_size=int(os.environ.get("MODERATION_CACHE_MAX_SIZE", 10000)),
+    ttl=float(os.environ.get("MODERATION_CACHE_TTL", 3600)),
+)
+REJECTED_CONTENT_MESSAGE = "Content rejected due to violation of sexual content policies."
 
-            flagged = response_data["results"][0]["flagged"]
 
-            if flagged:
-                categories = response_data["results"][0]["categories"]
-                if categories["sexual"] or categories["sexual/minors"]:
-                    message = "Content rejected due to violation of sexual content policies."
-                    raise ProviderException(message=message, code=400)
+def extract_moderation_contents(**kwargs) -> List[str]:
+    """
+    This function takes the inputs of a text generation call and returns all the texts to moderate.
+    """
+    contents = [
+        kwargs.get("text"),
+        kwargs.get("chatbot_global_action"),
+        kwargs.get("instruction"),
+    ]
+    contents.extend(
+        item.get("message")
+        for item in kwargs.get("previous_history") or []
+        if isinstance(item, dict)
+    )
+    contents.extend(kwargs.get("texts") or [])
+    for message in kwargs.get("messages") or []:
+        if isinstance(message, dict) and "content" in message:
+            for content in message["content"]:
+                if isinstance(content, dict) and "content" in content:
+                    contents.append(content["content"].get("text"))
+    return [content for content in contents if content and isinstance(content, str)]
+
+
+def _contents_to_moderate(contents: List[str]) -> Dict[str, str]:
+    """Return not yet moderated contents by hash, raise if a content was already rejected"""
+    to_moderate = {}
+    for content in contents:
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        if content_hash in to_moderate:
+            continue
+        rejected = MODERATION_CACHE.get(content_hash)
+        if rejected:
+            raise ProviderException(message=REJECTED_CONTENT_MESSAGE, code=400)
+        if rejected is None:
+            to_moderate[content_hash] = content
+    return to_moderate
+
+
+def _check_moderation_results(
+    content_hashes: List[str], response: Union[Response, AsyncHTTPResponse]
+) -> None:
+    try:
+        response_data = response.json()
+    except Exception:
+        raise ProviderException(response.text, code=response.status_code)
+    if "error" in response_data or response.status_code >= 400:
+        error = response_data.get("error") or {}
+        if error.get("code") == OpenAIErrorCode.RATE_LIMIT_EXCEEDED.value:
+            # do not block the call if moderation is not available
+            return
+        raise ProviderException(
+            error.get("message", response.text), code=response.status_code
+        )
 
-                return False
-    return not flagged
+    rejected = False
+    for content_hash, result in zip(content_hashes, response_data["results"]):
+        categories = result["categories"]
+        is_rejected = result["flagged"] and bool(
+            categories["sexual"] or categories["sexual/minors"]
+        )
+        MODERATION_CACHE.set(content_hash, is_rejected)
+        rejected = rejected or is_rejected
+    if rejected:
+        raise ProviderException(message=REJECTED_CONTENT_MESSAGE, code=400)
 
 
-async def moderate_if_exists(headers, value):
-    if value and isinstance(value, str):
-        await moderate_content(headers, value)  # could be a problem
+def moderate_contents(headers: Dict, contents: List[str]) -> None:
+    """
+    Moderate all contents in a single batched call, raises a ProviderException
+    if one of them violates sexual content policies.
+    """
+    to_moderate = _contents_to_moderate(contents)
+    if not to_moderate:
+        return
+    response = http_client.post(
+        MODERATION_URL, headers=headers, json={"input": list(to_moderate.values())}
+    )
+    _check_moderation_results(list(to_moderate), response)
+
+
+async def moderate_contents_async(headers: Dict, contents: List[str]) -> None:
+    """asyncio version of `moderate_contents`"""
+    to_moderate = _contents_to_moderate(contents)
+    if not to_moderate:
+        return
+    response = await async_http_client.post(
+        MODERATION_URL, headers=headers, json={"input": list(to_moderate.values())}
+    )
+    _check_moderation_results(list(to_moderate), response)
 
 
 async def get_openapi_response_async(response: aiohttp.ClientResponse):
@@ -14,6 +14,7 @@ from edenai_apis.features.audio.speech_to_text_async.speech_to_text_async_datacl
     SpeechToTextAsyncDataClass,
 )
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -39,17 +40,18 @@ class OpenaiAudioApi(AudioInterface):
         file_url: str = "",
         provider_params: Optional[dict] = None,
     ):
+        key_setting = self._key_setting()
         provider_params = provider_params or {}
         data_job_id = {}
         headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "OpenAI-Organization": self.org_key,
+            "Authorization": f"Bearer {key_setting['api_key']}",
+            "OpenAI-Organization": key_setting["org_key"],
         }
         url = "https://api.openai.com/v1/audio/transcriptions"
         with open(file, "rb") as file_:
             files = {"file": file_}
             payload = {"model": "whisper-1", "language": language, **provider_params}
-            response = requests.post(url, data=payload, files=files, headers=headers)
+            response = http_client.post(url, data=payload, files=files, headers=headers)
             if response.status_code != 200:
                 raise ProviderException(response.text, response.status_code)
 
@@ -103,6 +105,7 @@ class OpenaiAudioApi(AudioInterface):
         speaking_volume: int,
         sampling_rate: int,
     ) -> ResponseType[TextToSpeechDataClass]:
+        headers = self._key_setting()["headers"]
         url = "https://api.openai.com/v1/audio/speech"
         speed = convert_tts_audio_rate(speaking_rate)
         if not audio_format:
@@ -114,14 +117,14 @@ class OpenaiAudioApi(AudioInterface):
             "speed": speed,
             "response_format": audio_format,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = response.content
         audio_content = BytesIO(response.content)
         audio = base64.b64encode(audio_content.read()).decode("utf-8")
         voice_type = 1
         audio_content.seek(0)
         resource_url = upload_file_bytes_to_s3(
-            audio_content, f".{audio_format}", USER_PROCESS
+            audio_content, f".{audio_format}", USER_PROCESS, background=True
         )
         standardized_response = TextToSpeechDataClass(
             audio=audio, voice_type=voice_type, audio_resource_url=resource_url
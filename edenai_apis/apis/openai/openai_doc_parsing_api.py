@@ -1,7 +1,6 @@
 import json
 import os
 import fitz
-from time import sleep
 
 from edenai_apis.features.ocr import (
     FinancialParserDataClass,
@@ -41,10 +40,11 @@ class OpenaiDocParsingApi(OcrInterface):
         model,
     ):
 
+        client = self._key_setting()["client"]
         with open(os.path.join(os.path.dirname(__file__), example_file), "r") as f:
             output_response = json.load(f)["standardized_response"]
 
-        assistant = self.client.beta.assistants.create(
+        assistant = client.beta.assistants.create(
             response_format={"type": "json_object"},
             name=name,
             instructions="{} You return a json output and nothing else than a json output. The json should be shaped like the following with the exact same structure and the exact same keys but change the values to extract the inputed document informations : \n {}  \n\n The json output should follow this pydantic schema \n {} \n\n Your response should directly start with '{{' ".format(
@@ -55,7 +55,7 @@ class OpenaiDocParsingApi(OcrInterface):
 
         input_file_text = extract_text_from_pdf(input_file)
 
-        thread = self.client.beta.threads.create(
+        thread = client.beta.threads.create(
             messages=[
                 {
                     "role": "user",
@@ -64,15 +64,20 @@ class OpenaiDocParsingApi(OcrInterface):
             ]
         )
 
-        run = self.client.beta.threads.runs.create_and_poll(
+        run = client.beta.threads.runs.create_and_poll(
             thread_id=thread.id,
             assistant_id=assistant.id,
         )
 
-        while run.status != "completed":
-            sleep(1)
+        # create_and_poll returns once the run is over, it will not complete later
+        if run.status != "completed":
+            raise ProviderException(
+                run.last_error.message
+                if run.last_error
+                else f"Assistant run ended with status {run.status}"
+            )
 
-        messages = self.client.beta.threads.messages.list(thread_id=thread.id)
+        messages = client.beta.threads.messages.list(thread_id=thread.id)
         usage = run.to_dict()["usage"]
         original_response = messages.to_dict()
         original_response["usage"] = usage
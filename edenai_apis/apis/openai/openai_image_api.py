@@ -5,12 +5,10 @@ import json
 from io import BytesIO
 from json import JSONDecodeError
 from typing import Sequence, Literal, Optional
-from time import sleep
 
 from openai import OpenAI, APIError
 
 
-import requests
 import mimetypes
 
 from edenai_apis.features import ImageInterface
@@ -29,8 +27,9 @@ from edenai_apis.features.image.variation import (
     VariationDataClass,
     VariationImageDataClass,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
-from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
+from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_files_bytes_to_s3
 from .tools import OpenAIFunctionTools
 from .helpers import get_openapi_response
 from ...features.image.question_answer import QuestionAnswerDataClass
@@ -46,6 +45,7 @@ class OpenaiImageApi(ImageInterface):
         num_images: int = 1,
         model: Optional[str] = None,
     ) -> ResponseType[ImageGenerationDataClass]:
+        headers = self._key_setting()["headers"]
         self.check_content_moderation(text=text)
         url = f"{self.url}/images/generations"
         payload = {
@@ -55,21 +55,25 @@ class OpenaiImageApi(ImageInterface):
             "size": resolution,
             "response_format": "b64_json",
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = get_openapi_response(response)
 
-        generations: Sequence[GeneratedImageDataClass] = []
-        for generated_image in original_response.get("data"):
-            image_b64 = generated_image.get("b64_json")
-
-            image_data = image_b64.encode()
-            image_content = BytesIO(base64.b64decode(image_data))
-            resource_url = upload_file_bytes_to_s3(image_content, ".png", USER_PROCESS)
-            generations.append(
-                GeneratedImageDataClass(
-                    image=image_b64, image_resource_url=resource_url
-                )
-            )
+        images_b64 = [
+            generated_image.get("b64_json")
+            for generated_image in original_response.get("data")
+        ]
+        resource_urls = upload_files_bytes_to_s3(
+            [
+                (BytesIO(base64.b64decode(image_b64.encode())), ".png")
+                for image_b64 in images_b64
+            ],
+            USER_PROCESS,
+            background=True,
+        )
+        generations: Sequence[GeneratedImageDataClass] = [
+            GeneratedImageDataClass(image=image_b64, image_resource_url=resource_url)
+            for image_b64, resource_url in zip(images_b64, resource_urls)
+        ]
 
         return ResponseType[ImageGenerationDataClass](
             original_response=original_response,
@@ -85,6 +89,7 @@ class OpenaiImageApi(ImageInterface):
         model: Optional[str] = None,
         question: Optional[str] = None,
     ) -> ResponseType[QuestionAnswerDataClass]:
+        headers = self._key_setting()["headers"]
         with open(file, "rb") as fstream:
             file_content = fstream.read()
             file_b64 = base64.b64encode(file_content).decode("utf-8")
@@ -113,7 +118,7 @@ class OpenaiImageApi(ImageInterface):
                 "temperature": temperature,
             }
 
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = http_client.post(url, json=payload, headers=headers)
 
             if response.status_code >= 500:
                 raise ProviderException(
@@ -151,9 +156,10 @@ class OpenaiImageApi(ImageInterface):
         model: Optional[str] = None,
         file_url: str = "",
     ) -> ResponseType[VariationDataClass]:
+        client = self._key_setting()["client"]
         try:
             with open(file, "rb") as file_:
-                response = self.client.images.create_variation(
+                response = client.images.create_variation(
                     image=file_,
                     n=num_images,
                     model=model,
@@ -164,17 +170,21 @@ class OpenaiImageApi(ImageInterface):
             raise ProviderException(message=error.user_message, code=error.code)
 
         original_response = response
-        generations: Sequence[VariationImageDataClass] = []
-        for generated_image in original_response.data:
-            image_b64 = generated_image.b64_json
-            image_data = image_b64.encode()
-            image_content = BytesIO(base64.b64decode(image_data))
-            resource_url = upload_file_bytes_to_s3(image_content, ".png", USER_PROCESS)
-            generations.append(
-                VariationImageDataClass(
-                    image=image_b64, image_resource_url=resource_url
-                )
-            )
+        images_b64 = [
+            generated_image.b64_json for generated_image in original_response.data
+        ]
+        resource_urls = upload_files_bytes_to_s3(
+            [
+                (BytesIO(base64.b64decode(image_b64.encode())), ".png")
+                for image_b64 in images_b64
+            ],
+            USER_PROCESS,
+            background=True,
+        )
+        generations: Sequence[VariationImageDataClass] = [
+            VariationImageDataClass(image=image_b64, image_resource_url=resource_url)
+            for image_b64, resource_url in zip(images_b64, resource_urls)
+        ]
 
         return ResponseType[VariationDataClass](
             original_response=original_response.to_dict(),
@@ -185,12 +195,13 @@ class OpenaiImageApi(ImageInterface):
         self, name, instruction, message_text, example_file, input_file, dataclass
     ):
 
-        file = self.client.files.create(file=open(input_file, "rb"), purpose="vision")
+        client = self._key_setting()["client"]
+        file = client.files.create(file=open(input_file, "rb"), purpose="vision")
 
         with open(os.path.join(os.path.dirname(__file__), example_file), "r") as f:
             output_response = json.load(f)["standardized_response"]
 
-        assistant = self.client.beta.assistants.create(
+        assistant = client.beta.assistants.create(
             response_format={"type": "json_object"},
             model="gpt-4o",
             name=name,
@@ -198,7 +209,7 @@ class OpenaiImageApi(ImageInterface):
                 instruction, output_response, dataclass.schema()
             ),
         )
-        thread = self.client.beta.threads.create(
+        thread = client.beta.threads.create(
             messages=[
                 {
                     "role": "user",
@@ -216,15 +227,20 @@ class OpenaiImageApi(ImageInterface):
             ]
         )
 
-        run = self.client.beta.threads.runs.create_and_poll(
+        run = client.beta.threads.runs.create_and_poll(
             thread_id=thread.id,
             assistant_id=assistant.id,
         )
 
-        while run.status != "completed":
-            sleep(1)
+        # create_and_poll returns once the run is over, it will not complete later
+        if run.status != "completed":
+            raise ProviderException(
+                run.last_error.message
+                if run.last_error
+                else f"Assistant run ended with status {run.status}"
+            )
 
-        messages = self.client.beta.threads.messages.list(thread_id=thread.id)
+        messages = client.beta.threads.messages.list(thread_id=thread.id)
         usage = run.to_dict()["usage"]
         original_response = messages.to_dict()
         original_response["usage"] = usage
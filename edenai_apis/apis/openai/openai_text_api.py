@@ -2,7 +2,6 @@ import itertools
 import json
 import asyncio
 import os
-from time import sleep
 from typing import Dict, List, Literal, Optional, Sequence, Union
 from edenai_apis.features.text.chat.helpers import get_tool_call_from_history_by_id
 
@@ -65,8 +64,10 @@ from edenai_apis.utils.conversion import (
     find_all_occurrence,
     standardized_confidence_score,
 )
+from edenai_apis.utils.concurrency import run_sync
+from edenai_apis.utils.embedding_index import embed_texts, get_corpus_index
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.metrics import METRICS
+from edenai_apis.utils.http import async_http_client, http_client
 from edenai_apis.utils.types import ResponseType
 from .helpers import (
     construct_anonymization_context,
@@ -92,10 +93,11 @@ class OpenaiTextApi(TextInterface):
         self, name, instruction, message_text, example_file, dataclass
     ):
 
+        client = self._key_setting()["client"]
         with open(os.path.join(os.path.dirname(__file__), example_file), "r") as f:
             output_response = json.load(f)["standardized_response"]
 
-        assistant = self.client.beta.assistants.create(
+        assistant = client.beta.assistants.create(
             response_format={"type": "json_object"},
             model="gpt-4o",
             name=name,
@@ -103,7 +105,7 @@ class OpenaiTextApi(TextInterface):
                 instruction, output_response, dataclass.schema()
             ),
         )
-        thread = self.client.beta.threads.create(
+        thread = client.beta.threads.create(
             messages=[
                 {
                     "role": "user",
@@ -117,15 +119,20 @@ class OpenaiTextApi(TextInterface):
             ]
         )
 
-        run = self.client.beta.threads.runs.create_and_poll(
+        run = client.beta.threads.runs.create_and_poll(
             thread_id=thread.id,
             assistant_id=assistant.id,
         )
 
-        while run.status != "completed":
-            sleep(1)
+        # create_and_poll returns once the run is over, it will not complete later
+        if run.status != "completed":
+            raise ProviderException(
+                run.last_error.message
+                if run.last_error
+                else f"Assistant run ended with status {run.status}"
+            )
 
-        messages = self.client.beta.threads.messages.list(thread_id=thread.id)
+        messages = client.beta.threads.messages.list(thread_id=thread.id)
         usage = run.to_dict()["usage"]
         original_response = messages.to_dict()
         original_response["usage"] = usage
@@ -144,6 +151,7 @@ class OpenaiTextApi(TextInterface):
     def text__summarize(
         self, text: str, output_sentences: int, language: str, model: str
     ) -> ResponseType[SummarizeDataClass]:
+        headers = self._key_setting()["headers"]
         url = f"{self.url}/chat/completions"
         prompt = f"""Given the following text, please provide a concise summary in the same language:
         text : {text}
@@ -156,7 +164,7 @@ class OpenaiTextApi(TextInterface):
             "messages": messages,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = get_openapi_response(response)
 
         standardized_response = SummarizeDataClass(
@@ -172,9 +180,10 @@ class OpenaiTextApi(TextInterface):
     def text__moderation(
         self, text: str, language: str
     ) -> ResponseType[ModerationDataClass]:
+        headers = self._key_setting()["headers"]
         try:
-            response = requests.post(
-                f"{self.url}/moderations", headers=self.headers, json={"input": text}
+            response = http_client.post(
+                f"{self.url}/moderations", headers=headers, json={"input": text}
             )
         except Exception as exc:
             raise ProviderException(str(exc), code=500)
@@ -220,43 +229,38 @@ class OpenaiTextApi(TextInterface):
         if model is None:
             model = "1536__text-embedding-ada-002"
 
-        # Import the function
-        function_score = METRICS[similarity_metric]
+        def embed(texts_to_embed: List[str]):
+            response = OpenaiTextApi.text__embeddings(
+                self, texts=texts_to_embed, model=model
+            ).original_response
+            return [item["embedding"] for item in response["data"]], response
 
-        # Embed the texts & query
-        texts_embed_response = OpenaiTextApi.text__embeddings(
-            self, texts=texts, model=model
-        ).original_response
-        query_embed_response = OpenaiTextApi.text__embeddings(
-            self, texts=[query], model=model
-        ).original_response
+        # Embed the texts & query, only texts not embedded yet are sent to the provider
+        index, texts_embed_response = get_corpus_index(
+            self.provider_name, model, texts, embed
+        )
+        query_embed, query_embed_response = embed_texts(
+            self.provider_name, model, [query], embed
+        )
 
         # Extract Tokens consumed
-        texts_usage = texts_embed_response.get("usage").get("total_tokens")
-        query_usage = query_embed_response.get("usage").get("total_tokens")
-
-        # Extracts embeddings from texts & query
-        texts_embed = [item["embedding"] for item in texts_embed_response.get("data")]
-        query_embed = query_embed_response["data"][0]["embedding"]
-
-        items = []
-        # Calculate score for each text index
-        for index, text in enumerate(texts_embed):
-            score = function_score(query_embed, text)
-            items.append(
-                InfosSearchDataClass(
-                    object="search_result", document=index, score=score
-                )
-            )
+        usage = sum(
+            response["usage"]["total_tokens"]
+            for response in (texts_embed_response, query_embed_response)
+            if response is not None
+        )
 
-        # Sort items by score in descending order
-        sorted_items = sorted(items, key=lambda x: x.score, reverse=True)
+        # Score all texts at once, sorted by descending score
+        sorted_items = [
+            InfosSearchDataClass(object="search_result", document=document, score=score)
+            for document, score in index.search(query_embed[0], similarity_metric)
+        ]
 
         # Build the original response
         original_response = {
             "texts_embeddings": texts_embed_response,
             "embeddings_query": query_embed_response,
-            "usage": {"total_tokens": texts_usage + query_usage},
+            "usage": {"total_tokens": usage},
         }
 
         result = ResponseType[SearchDataClass](
@@ -274,6 +278,7 @@ class OpenaiTextApi(TextInterface):
         examples: List[List[str]],
         model: Optional[str],
     ) -> ResponseType[QuestionAnswerDataClass]:
+        headers = self._key_setting()["headers"]
         url = f"{self.url}/completions"
         # With search get the top document with the question & construct the context
         document = self.text__search(texts, question).model_dump()
@@ -300,7 +305,7 @@ class OpenaiTextApi(TextInterface):
             "frequency_penalty": 0,
             "presence_penalty": 0,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = get_openapi_response(response)
 
         answers = []
@@ -318,6 +323,7 @@ class OpenaiTextApi(TextInterface):
     def text__anonymization(
         self, text: str, language: str
     ) -> ResponseType[AnonymizationDataClass]:
+        headers = self._key_setting()["headers"]
         prompt = construct_anonymization_context(text)
         json_output = '{{"redactedText" : "...", "entities": [{{content: entity, label: category, confidence_score: confidence score, offset: start_offset}}]}}'
         messages = [{"role": "user", "content": prompt}]
@@ -336,7 +342,7 @@ class OpenaiTextApi(TextInterface):
             "messages": messages,
         }
         url = f"{self.url}/chat/completions"
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = get_openapi_response(response)
         pii_data = original_response["choices"][0]["message"]["content"]
         try:
@@ -435,6 +441,7 @@ class OpenaiTextApi(TextInterface):
     def text__code_generation(
         self, instruction: str, temperature: float, max_tokens: int, prompt: str = ""
     ) -> ResponseType[CodeGenerationDataClass]:
+        headers = self._key_setting()["headers"]
         url = f"{self.url}/chat/completions"
         model = "gpt-3.5-turbo"
 
@@ -456,7 +463,7 @@ class OpenaiTextApi(TextInterface):
         }
 
         try:
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = http_client.post(url, json=payload, headers=headers)
         except requests.exceptions.ChunkedEncodingError:
             raise ProviderException("Connection closed with provider", 400)
         original_response = get_openapi_response(response)
@@ -476,6 +483,7 @@ class OpenaiTextApi(TextInterface):
         max_tokens: int,
         model: str,
     ) -> ResponseType[GenerationDataClass]:
+        headers = self._key_setting()["headers"]
         self.check_content_moderation(text=text)
         url = f"{self.url}/completions"
 
@@ -487,7 +495,7 @@ class OpenaiTextApi(TextInterface):
         if max_tokens != 0:
             payload["max_tokens"] = max_tokens
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = get_openapi_response(response)
 
         standardized_response = GenerationDataClass(
@@ -584,21 +592,20 @@ class OpenaiTextApi(TextInterface):
             original_response=original_response, standardized_response=result
         )
 
-    def text__embeddings(
-        self, texts: List[str], model: str
-    ) -> ResponseType[EmbeddingsDataClass]:
-        url = "https://api.openai.com/v1/embeddings"
+    @staticmethod
+    def _embeddings_payload(texts: List[str], model: str) -> Dict:
         model = model.split("__")
         if len(texts) == 1:
             texts = texts[0]
-        payload = {
+        return {
             "input": texts,
             "model": model[1],
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
-        original_response = get_openapi_response(response)
-
+    @staticmethod
+    def _embeddings_response(
+        original_response: Dict,
+    ) -> ResponseType[EmbeddingsDataClass]:
         items: Sequence[EmbeddingsDataClass] = []
         embeddings = original_response["data"]
 
@@ -612,25 +619,37 @@ class OpenaiTextApi(TextInterface):
             standardized_response=standardized_response,
         )
 
-    def text__chat(
-        self,
+    def text__embeddings(
+        self, texts: List[str], model: str
+    ) -> ResponseType[EmbeddingsDataClass]:
+        headers = self._key_setting()["headers"]
+        url = "https://api.openai.com/v1/embeddings"
+        payload = self._embeddings_payload(texts, model)
+        response = http_client.post(url, json=payload, headers=headers)
+        return self._embeddings_response(get_openapi_response(response))
+
+    async def atext__embeddings(
+        self, texts: List[str], model: str
+    ) -> ResponseType[EmbeddingsDataClass]:
+        headers = self._key_setting()["headers"]
+        url = "https://api.openai.com/v1/embeddings"
+        payload = self._embeddings_payload(texts, model)
+        response = await async_http_client.post(url, json=payload, headers=headers)
+        return self._embeddings_response(get_openapi_response(response))
+
+    @staticmethod
+    def _chat_payload(
         text: str,
         chatbot_global_action: Optional[str],
-        previous_history: Optional[List[Dict[str, str]]],
+        previous_history: List[Dict[str, str]],
         temperature: float,
         max_tokens: int,
         model: str,
-        stream=False,
-        available_tools: Optional[List[dict]] = None,
-        tool_choice: Literal["auto", "required", "none"] = "auto",
-        tool_results: Optional[List[dict]] = None,
-    ) -> ResponseType[Union[ChatDataClass, StreamChat]]:
-        previous_history = previous_history or []
-        self.check_content_moderation(
-            text=text,
-            chatbot_global_action=chatbot_global_action,
-            previous_history=previous_history,
-        )
+        stream: bool,
+        available_tools: Optional[List[dict]],
+        tool_choice: Literal["auto", "required", "none"],
+        tool_results: Optional[List[dict]],
+    ) -> Dict:
         is_o1_model = "o1-" in model
         messages = []
         for msg in previous_history:
@@ -686,44 +705,84 @@ class OpenaiTextApi(TextInterface):
         if available_tools and not tool_results:
             payload["tools"] = convert_tools_to_openai(available_tools)
             payload["tool_choice"] = tool_choice
+        return payload
+
+    @staticmethod
+    def _chat_response(
+        original_response: Dict, text: str, available_tools: Optional[List[dict]]
+    ) -> ResponseType[ChatDataClass]:
+        message = original_response["choices"][0]["message"]
+        generated_text = message.get("content")
+        original_tool_calls = message.get("tool_calls") or []
+        tool_calls = []
+        for call in original_tool_calls:
+            tool_calls.append(
+                ToolCall(
+                    id=call["id"],
+                    name=call["function"]["name"],
+                    arguments=call["function"]["arguments"],
+                )
+            )
+        messages = [
+            ChatMessageDataClass(role="user", message=text, tools=available_tools),
+            ChatMessageDataClass(
+                role="assistant",
+                message=generated_text,
+                tool_calls=tool_calls,
+            ),
+        ]
+        messages_json = [m.dict() for m in messages]
+
+        standardized_response = ChatDataClass(
+            generated_text=generated_text, message=messages_json
+        )
+
+        return ResponseType[ChatDataClass](
+            original_response=original_response,
+            standardized_response=standardized_response,
+        )
+
+    def text__chat(
+        self,
+        text: str,
+        chatbot_global_action: Optional[str],
+        previous_history: Optional[List[Dict[str, str]]],
+        temperature: float,
+        max_tokens: int,
+        model: str,
+        stream=False,
+        available_tools: Optional[List[dict]] = None,
+        tool_choice: Literal["auto", "required", "none"] = "auto",
+        tool_results: Optional[List[dict]] = None,
+    ) -> ResponseType[Union[ChatDataClass, StreamChat]]:
+        client = self._key_setting()["client"]
+        previous_history = previous_history or []
+        self.check_content_moderation(
+            text=text,
+            chatbot_global_action=chatbot_global_action,
+            previous_history=previous_history,
+        )
+        payload = self._chat_payload(
+            text,
+            chatbot_global_action,
+            previous_history,
+            temperature,
+            max_tokens,
+            model,
+            stream,
+            available_tools,
+            tool_choice,
+            tool_results,
+        )
 
         try:
-            response = self.client.chat.completions.create(**payload)
+            response = client.chat.completions.create(**payload)
         except Exception as exc:
             raise ProviderException(str(exc))
 
         # Standardize the response
         if stream is False:
-            message = response.choices[0].message
-            generated_text = message.content
-            original_tool_calls = message.tool_calls or []
-            tool_calls = []
-            for call in original_tool_calls:
-                tool_calls.append(
-                    ToolCall(
-                        id=call["id"],
-                        name=call["function"]["name"],
-                        arguments=call["function"]["arguments"],
-                    )
-                )
-            messages = [
-                ChatMessageDataClass(role="user", message=text, tools=available_tools),
-                ChatMessageDataClass(
-                    role="assistant",
-                    message=generated_text,
-                    tool_calls=tool_calls,
-                ),
-            ]
-            messages_json = [m.dict() for m in messages]
-
-            standardized_response = ChatDataClass(
-                generated_text=generated_text, message=messages_json
-            )
-
-            return ResponseType[ChatDataClass](
-                original_response=response.to_dict(),
-                standardized_response=standardized_response,
-            )
+            return self._chat_response(response.to_dict(), text, available_tools)
         else:
             stream = (
                 ChatStreamResponse(
@@ -740,9 +799,64 @@ class OpenaiTextApi(TextInterface):
                 original_response=None, standardized_response=StreamChat(stream=stream)
             )
 
+    async def atext__chat(
+        self,
+        text: str,
+        chatbot_global_action: Optional[str],
+        previous_history: Optional[List[Dict[str, str]]],
+        temperature: float,
+        max_tokens: int,
+        model: str,
+        stream=False,
+        available_tools: Optional[List[dict]] = None,
+        tool_choice: Literal["auto", "required", "none"] = "auto",
+        tool_results: Optional[List[dict]] = None,
+    ) -> ResponseType[Union[ChatDataClass, StreamChat]]:
+        headers = self._key_setting()["headers"]
+        if stream:
+            # streamed chunks are consumed synchronously by the caller
+            return await run_sync(
+                self.text__chat,
+                text,
+                chatbot_global_action,
+                previous_history,
+                temperature,
+                max_tokens,
+                model,
+                stream,
+                available_tools,
+                tool_choice,
+                tool_results,
+            )
+        previous_history = previous_history or []
+        await self.check_content_moderation_async(
+            text=text,
+            chatbot_global_action=chatbot_global_action,
+            previous_history=previous_history,
+        )
+        payload = self._chat_payload(
+            text,
+            chatbot_global_action,
+            previous_history,
+            temperature,
+            max_tokens,
+            model,
+            stream,
+            available_tools,
+            tool_choice,
+            tool_results,
+        )
+        response = await async_http_client.post(
+            f"{self.url}/chat/completions", json=payload, headers=headers
+        )
+        return self._chat_response(
+            get_openapi_response(response), text, available_tools
+        )
+
     def text__prompt_optimization(
         self, text: str, target_provider: str
     ) -> ResponseType[PromptOptimizationDataClass]:
+        headers = self._key_setting()["headers"]
         url = f"{self.url}/chat/completions"
         prompt = construct_prompt_optimization_instruction(text, target_provider)
         messages = [{"role": "user", "content": prompt}]
@@ -760,10 +874,10 @@ class OpenaiTextApi(TextInterface):
             "n": 3,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = get_openapi_response(response)
 
-        missing_information_call = requests.post(
+        missing_information_call = http_client.post(
             url,
             json={
                 "model": "gpt-4",
@@ -774,7 +888,7 @@ class OpenaiTextApi(TextInterface):
                     }
                 ],
             },
-            headers=self.headers,
+            headers=headers,
         )
         missing_information_response = get_openapi_response(missing_information_call)
 
@@ -0,0 +1,98 @@
+import asyncio
+import json
+
+import pytest
+import responses
+
+from edenai_apis.apis.openai.helpers import (
+    MODERATION_CACHE,
+    MODERATION_URL,
+    extract_moderation_contents,
+    moderate_contents,
+    moderate_contents_async,
+)
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import AsyncHTTPResponse
+
+HEADERS = {"Authorization": "Bearer abc"}
+
+
+def moderation_result(content: str) -> dict:
+    flagged = "explicit" in content
+    return {
+        "flagged": flagged,
+        "categories": {"sexual": flagged, "sexual/minors": False},
+    }
+
+
+def moderation_callback(request):
+    inputs = json.loads(request.body)["input"]
+    body = {"results": [moderation_result(content) for content in inputs]}
+    return 200, {}, json.dumps(body)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    MODERATION_CACHE.clear()
+    yield
+    MODERATION_CACHE.clear()
+
+
+@pytest.fixture
+def moderation_api():
+    with responses.RequestsMock() as mocked:
+        mocked.add_callback(responses.POST, MODERATION_URL, moderation_callback)
+        yield mocked
+
+
+def test_extract_moderation_contents():
+    contents = extract_moderation_contents(
+        text="hello",
+        chatbot_global_action=None,
+        previous_history=[{"role": "user", "message": "hi"}, {"role": "assistant"}],
+        messages=[{"content": [{"content": {"text": "how are you"}}]}],
+    )
+    assert contents == ["hello", "hi", "how are you"]
+
+
+class TestModerateContents:
+    def test_single_batched_call(self, moderation_api):
+        moderate_contents(HEADERS, ["hello", "world", "hello"])
+        assert len(moderation_api.calls) == 1
+        assert json.loads(moderation_api.calls[0].request.body) == {
+            "input": ["hello", "world"]
+        }
+
+    def test_moderated_contents_are_cached(self, moderation_api):
+        moderate_contents(HEADERS, ["hello", "world"])
+        moderate_contents(HEADERS, ["hello", "world", "new message"])
+        assert len(moderation_api.calls) == 2
+        assert json.loads(moderation_api.calls[1].request.body) == {
+            "input": ["new message"]
+        }
+        moderate_contents(HEADERS, ["hello", "new message"])
+        assert len(moderation_api.calls) == 2
+
+    def test_rejected_content(self, moderation_api):
+        for _ in range(2):
+            with pytest.raises(ProviderException):
+                moderate_contents(HEADERS, ["hello", "explicit content"])
+        # rejection is cached as well
+        assert len(moderation_api.calls) == 1
+
+    def test_async(self, mocker):
+        post = mocker.patch(
+            "edenai_apis.apis.openai.helpers.async_http_client.post",
+            return_value=AsyncHTTPResponse(
+                200,
+                {},
+                json.dumps(
+                    {"results": [moderation_result("a"), moderation_result("b")]}
+                ).encode(),
+                MODERATION_URL,
+            ),
+        )
+        asyncio.run(moderate_contents_async(HEADERS, ["a", "b", "a"]))
+        asyncio.run(moderate_contents_async(HEADERS, ["b"]))
+        post.assert_called_once()
+        assert post.call_args.kwargs["json"] == {"input": ["a", "b"]}
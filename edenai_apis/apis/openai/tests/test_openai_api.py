@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from edenai_apis.apis.openai.openai_api import OpenaiApi
+from edenai_apis.utils import upload_cache, upload_s3
+from edenai_apis.utils.exception import ProviderException
+
+
+def test_api_key_is_picked_per_request(mocker: MockerFixture):
+    mocker.patch(
+        "edenai_apis.apis.openai.openai_api.load_provider",
+        side_effect=[
+            [
+                {"api_key": "key 1", "org_key": "org 1"},
+                {"api_key": "key 2", "org_key": "org 2"},
+            ],
+            {"webhook_token": "token"},
+        ],
+    )
+    api = OpenaiApi()
+
+    key_settings = [api._key_setting() for _ in range(50)]
+
+    assert {key_setting["api_key"] for key_setting in key_settings} == {
+        "key 1",
+        "key 2",
+    }
+    for key_setting in key_settings:
+        # a single request never mixes the credentials of two keys
+        number = key_setting["api_key"][-1]
+        assert key_setting["org_key"] == f"org {number}"
+        assert key_setting["headers"]["Authorization"] == f"Bearer key {number}"
+        assert key_setting["headers"]["OpenAI-Organization"] == f"org {number}"
+        assert key_setting["client"].api_key == f"key {number}"
+    # clients are built once per key
+    assert len({id(key_setting["client"]) for key_setting in key_settings}) == 2
+
+
+def test_assistant_uses_a_single_client(mocker: MockerFixture):
+    mocker.patch(
+        "edenai_apis.apis.openai.openai_api.load_provider",
+        side_effect=[
+            [
+                {"api_key": "key 1", "org_key": "org 1"},
+                {"api_key": "key 2", "org_key": "org 2"},
+            ],
+            {"webhook_token": "token"},
+        ],
+    )
+    api = OpenaiApi()
+    clients = [mocker.MagicMock(), mocker.MagicMock()]
+    for key_setting, client in zip(api.key_settings, clients):
+        key_setting["client"] = client
+        client.beta.threads.runs.create_and_poll.return_value.status = "failed"
+
+    for _ in range(20):
+        with pytest.raises(ProviderException):
+            api._OpenaiTextApi__assistant_text(
+                name="name",
+                instruction="instruction",
+                message_text="message",
+                example_file="outputs/text/topic_extraction_output.json",
+                dataclass=mocker.MagicMock(),
+            )
+
+    # every step of a run goes through the client that created the assistant
+    for client in clients:
+        assert (
+            client.beta.assistants.create.call_count
+            == client.beta.threads.create.call_count
+            == client.beta.threads.runs.create_and_poll.call_count
+        )
+
+
+def test_text_to_speech_returns_before_the_upload(mocker: MockerFixture):
+    mocker.patch(
+        "edenai_apis.apis.openai.openai_api.load_provider",
+        side_effect=[{"api_key": "key", "org_key": "org"}, {"webhook_token": "token"}],
+    )
+    mocker.patch(
+        "edenai_apis.apis.openai.openai_audio_api.http_client.post",
+        return_value=mocker.MagicMock(content=b"audio"),
+    )
+    uploading = threading.Event()
+    s3_client = mocker.MagicMock()
+    s3_client.upload_fileobj.side_effect = lambda *args: uploading.wait(5)
+    mocker.patch.object(upload_s3, "s3_client_load", return_value=s3_client)
+    mocker.patch.object(
+        upload_s3,
+        "get_cloud_front_file_url",
+        side_effect=lambda filename, process_time: f"https://cdn/{filename}",
+    )
+    upload_cache.clear_upload_cache()
+
+    response = OpenaiApi().audio__text_to_speech(
+        language="en",
+        text="text",
+        option="FEMALE",
+        voice_id="en_nova",
+        audio_format="mp3",
+        speaking_rate=0,
+        speaking_pitch=0,
+        speaking_volume=0,
+        sampling_rate=0,
+    )
+
+    upload = response.standardized_response.audio_resource_upload
+    assert not upload.done()
+    uploading.set()
+    assert upload.result(timeout=5) is None
+    upload_cache.clear_upload_cache()
@@ -2,6 +2,7 @@ from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.features.text import ChatDataClass, ChatMessageDataClass
 from edenai_apis.features.text.chat.chat_dataclass import StreamChat, ChatStreamResponse
@@ -86,7 +87,7 @@ class PerplexityApi(ProviderInterface, TextInterface):
             "max_tokens": max_tokens,
             "stream": stream,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=self.headers)
         if response.status_code != 200:
             raise ProviderException(response.text, response.status_code)
         else:
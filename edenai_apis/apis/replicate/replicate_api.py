@@ -18,6 +18,7 @@ from edenai_apis.features.text import (
 from edenai_apis.features.text.chat.chat_dataclass import StreamChat, ChatStreamResponse
 from edenai_apis.loaders.loaders import load_provider, ProviderDataEnum
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from .config import get_model_id, get_model_id_image
 
@@ -63,7 +64,7 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
 
     def __get_stream_response(self, url: str) -> Generator:
         headers = {**self.headers, "Accept": "text/event-stream"}
-        response = requests.get(url, headers=headers, stream=True)
+        response = http_client.get(url, headers=headers, stream=True)
         last_chunk = ""
         for chunk in response.iter_lines():
             if b"event: done" in chunk:
@@ -102,7 +103,7 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
         # Launch job
         if stream:
             payload["stream"] = True
-        launch_job_response = requests.post(url, headers=self.headers, json=payload)
+        launch_job_response = http_client.post(url, headers=self.headers, json=payload)
         try:
             launch_job_response_dict = launch_job_response.json()
         except requests.JSONDecodeError:
@@ -122,7 +123,7 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
         url_get_response = launch_job_response_dict["urls"]["get"]
 
         # Get job response
-        response = requests.get(url_get_response, headers=self.headers)
+        response = http_client.get(url_get_response, headers=self.headers)
 
         if response.status_code >= 500:
             raise ProviderException(
@@ -137,7 +138,7 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
 
         status = response_dict["status"]
         while status != "succeeded":
-            response = requests.get(url_get_response, headers=self.headers)
+            response = http_client.get(url_get_response, headers=self.headers)
             try:
                 response_dict = response.json()
             except requests.JSONDecodeError:
@@ -183,14 +184,14 @@ class ReplicateApi(ProviderInterface, ImageInterface, TextInterface):
             for image in image_url:
                 generated_images.append(
                     GeneratedImageDataClass(
-                        image=base64.b64encode(requests.get(image).content),
+                        image=base64.b64encode(http_client.get(image).content),
                         image_resource_url=image,
                     )
                 )
         else:
             generated_images.append(
                 GeneratedImageDataClass(
-                    image=base64.b64encode(requests.get(image_url).content),
+                    image=base64.b64encode(http_client.get(image_url).content),
                     image_resource_url=image_url,
                 )
             )
@@ -1,7 +1,6 @@
 from enum import Enum
 from io import BufferedReader
-from time import sleep
-from typing import Dict
+from typing import Dict, Tuple
 
 import requests
 
@@ -19,12 +18,17 @@ from edenai_apis.features.ocr.ocr_interface import OcrInterface
 from edenai_apis.features.provider.provider_interface import ProviderInterface
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.async_to_sync import PollingPolicy, poll_until
+from edenai_apis.utils.credentials import credential_broker
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
 class RossumApi(ProviderInterface, OcrInterface):
     provider_name = "rossum"
+    # tokens are valid 162 hours, renewed 10 minutes before they expire
+    TOKEN_LIFETIME_SECONDS = 162 * 60 * 60 - 10 * 60
 
     def __init__(self, api_keys: Dict = {}):
         self.api_settings = load_provider(
@@ -37,14 +41,33 @@ class RossumApi(ProviderInterface, OcrInterface):
 
         self._login()
 
+    @property
+    def _credentials(self) -> Dict[str, str]:
+        return {"url": self.url, "username": self.username, "password": self.password}
+
     def _login(self):
         """
-        Login to the provider and store the token in token attribute
+        Login to the provider and store the token in token attribute.
+        The token is shared by all instances using the same account until it expires.
 
         Raises:
             ProviderException: If the status code is not 200
         """
-        response = requests.post(
+        self.token = credential_broker.get(
+            self.provider_name, self._credentials, self._fetch_token
+        )
+
+    def _fetch_token(self) -> Tuple[str, float]:
+        """
+        Post the credentials to get a new token
+
+        Returns:
+            tuple: The token and its lifetime in seconds
+
+        Raises:
+            ProviderException: If the status code is not 200
+        """
+        response = http_client.post(
             url=self.url + "auth/login",
             json={"username": self.username, "password": self.password},
             headers={"Content-Type": "application/json"},
@@ -61,7 +84,32 @@ class RossumApi(ProviderInterface, OcrInterface):
                 code=response.status_code,
             )
 
-        self.token = response_json["key"]
+        return response_json["key"], self.TOKEN_LIFETIME_SECONDS
+
+    def _authorized_request(self, method: str, **kwargs) -> requests.Response:
+        """
+        Send a request with the token, login again and retry once if it was rejected
+
+        Args:
+            method (str): HTTP method
+            **kwargs: arguments of `requests.request`
+
+        Returns:
+            requests.Response: The response of the provider
+        """
+        response = http_client.request(
+            method, headers={"Authorization": f"Token {self.token}"}, **kwargs
+        )
+        if response.status_code != 401:
+            return response
+
+        credential_broker.invalidate(self.provider_name, self._credentials, self.token)
+        self._login()
+        for file in (kwargs.get("files") or {}).values():
+            file.seek(0)
+        return http_client.request(
+            method, headers={"Authorization": f"Token {self.token}"}, **kwargs
+        )
 
     class EndpointType(Enum):
         LOGIN = "LOGIN"
@@ -99,12 +147,10 @@ class RossumApi(ProviderInterface, OcrInterface):
         Raises:
             ProviderException: If an error occurs while uploading the file (Status code != 201)
         """
-        response = requests.post(
+        response = self._authorized_request(
+            "POST",
             url=self._get_endpoint(self.EndpointType.UPLOAD),
             files={"content": file},
-            headers={
-                "Authorization": f"Token {self.token}",
-            },
         )
 
         try:
@@ -133,9 +179,7 @@ class RossumApi(ProviderInterface, OcrInterface):
         Raises:
             ProviderException: If an error occurs while checking the status (Status code != 200)
         """
-        response = requests.get(
-            url=annotation_endpoint, headers={"Authorization": f"Token {self.token}"}
-        )
+        response = self._authorized_request("GET", url=annotation_endpoint)
 
         try:
             response_json = response.json()
@@ -160,10 +204,10 @@ class RossumApi(ProviderInterface, OcrInterface):
         Raises:
             ProviderException: If an error occurs while downloading the reviewing data (Status code != 200)
         """
-        response = requests.get(
+        response = self._authorized_request(
+            "GET",
             url=self._get_endpoint(self.EndpointType.DOWNLOAD)
             + f"?status=to_review&format=json&id={id}",
-            headers={"Authorization": f"Token {self.token}"},
         )
 
         try:
@@ -397,14 +441,18 @@ class RossumApi(ProviderInterface, OcrInterface):
     ) -> ResponseType[InvoiceParserDataClass]:
         with open(file, "rb") as file_:
             _, annotation_endpoint = self._upload(file_)
-            id, status = self._get_status_and_id(annotation_endpoint)
-            while status != "to_review":
-                sleep(1)
-                id, status = self._get_status_and_id(annotation_endpoint)
-                if status == "failed_import":
-                    raise ProviderException(
-                        "Invalid file, please check the file format."
-                    )
+
+        def is_imported(id_and_status: tuple) -> bool:
+            if id_and_status[1] == "failed_import":
+                raise ProviderException("Invalid file, please check the file format.")
+            return id_and_status[1] == "to_review"
+
+        id, _ = poll_until(
+            lambda: self._get_status_and_id(annotation_endpoint),
+            is_imported,
+            PollingPolicy(initial_delay=1, max_delay=5),
+            name="rossum",
+        )
 
         original_response = self._download_reviewing_data(id)
         standardized_response = self._invoice_standardization(original_response)
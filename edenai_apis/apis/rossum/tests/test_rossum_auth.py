@@ -0,0 +1,63 @@
+import io
+
+import pytest
+import responses
+
+from edenai_apis.apis.rossum.rossum_api import RossumApi
+from edenai_apis.utils.credentials import credential_broker
+
+API_KEYS = {"username": "user", "password": "password", "queue_id": "42"}
+URL = "https://elis.rossum.ai/api/v1/"
+
+
+@pytest.fixture(autouse=True)
+def api_settings(mocker):
+    mocker.patch(
+        "edenai_apis.apis.rossum.rossum_api.load_provider", return_value=API_KEYS
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_credentials():
+    credential_broker.clear()
+    yield
+    credential_broker.clear()
+
+
+def add_login(token: str) -> None:
+    responses.add(responses.POST, URL + "auth/login", json={"key": token})
+
+
+@responses.activate
+def test_login_is_shared_by_instances():
+    add_login("token-1")
+
+    tokens = [RossumApi().token for _ in range(3)]
+
+    assert tokens == ["token-1"] * 3
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_rejected_token_is_renewed():
+    add_login("token-1")
+    add_login("token-2")
+    upload_url = URL + "queues/42/upload"
+    responses.add(responses.POST, upload_url, status=401, json={"detail": "expired"})
+    responses.add(
+        responses.POST,
+        upload_url,
+        status=201,
+        json={"document": "document", "annotation": "annotation"},
+    )
+    api = RossumApi()
+
+    result = api._upload(io.BytesIO(b"pdf"))
+
+    assert result == ("document", "annotation")
+    upload_calls = [call for call in responses.calls if call.request.url == upload_url]
+    assert [call.request.headers["Authorization"] for call in upload_calls] == [
+        "Token token-1",
+        "Token token-2",
+    ]
+    assert RossumApi().token == "token-2"
@@ -10,7 +10,7 @@ from typing import Optional
 import requests
 
 from edenai_apis.utils.exception import ProviderException
-from edenai_apis.utils.http import HTTPMethod
+from edenai_apis.utils.http import http_client, HTTPMethod
 from .models import ResponseData
 
 
@@ -60,7 +60,7 @@ class Client:
         params: Optional[dict] = None,
         return_type: Optional[str] = "json",
     ) -> ResponseData:
-        response: requests.Response = requests.request(
+        response: requests.Response = http_client.request(
             method=method.value,
             url=url,
             data=data,
@@ -251,7 +251,7 @@ class Client:
         filename = url.split("/")[-1]
         filepath = os.path.join(tempdir, filename)
         with open(filepath, "wb") as f:
-            f.write(requests.get(url).content)
+            f.write(http_client.get(url).content)
         return self.__parse_jd_from_file(filepath)
 
     def __parse_resume(
@@ -1,7 +1,6 @@
 import base64
 from typing import Dict, Sequence, Optional, Any
 
-import requests
 from PIL import Image as Img
 
 from edenai_apis.features import ProviderInterface, OcrInterface, ImageInterface
@@ -33,6 +32,7 @@ from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.conversion import add_query_param_in_url
 from edenai_apis.utils.exception import ProviderException, LanguageException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType, ResponseSuccess
 from .sentisight_helpers import (
     calculate_bounding_box,
@@ -62,7 +62,7 @@ class SentiSightApi(ProviderInterface, OcrInterface, ImageInterface):
             raise LanguageException("Language not provided")
 
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 url=add_query_param_in_url(url, {"lang": get_formatted_language(language)}),
                 headers={
                     "accept": "*/*",
@@ -110,7 +110,7 @@ class SentiSightApi(ProviderInterface, OcrInterface, ImageInterface):
         self, file: str, file_url: str = "", model: Optional[str] = None
     ) -> ResponseType[ObjectDetectionDataClass]:
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 self.base_url + SentisightPreTrainModel.OBJECT_DETECTION.value,
                 headers={
                     "accept": "*/*",
@@ -150,7 +150,7 @@ class SentiSightApi(ProviderInterface, OcrInterface, ImageInterface):
         self, file: str, file_url: str = ""
     ) -> ResponseType[ExplicitContentDataClass]:
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 self.base_url + SentisightPreTrainModel.NSFW_CLASSIFICATION.value,
                 headers={
                     "accept": "*/*",
@@ -203,7 +203,7 @@ class SentiSightApi(ProviderInterface, OcrInterface, ImageInterface):
         json_data = {
             "name": project_name,
         }
-        response = requests.post(
+        response = http_client.post(
             create_project_url,
             headers={
                 "accept": "*/*",
@@ -227,7 +227,7 @@ class SentiSightApi(ProviderInterface, OcrInterface, ImageInterface):
         )
         # Build the request
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 upload_project_url,
                 headers={
                     "accept": "*/*",
@@ -252,7 +252,7 @@ class SentiSightApi(ProviderInterface, OcrInterface, ImageInterface):
             f"https://platform.sentisight.ai/api/image/{project_id}/{image_name}/"
         )
 
-        response = requests.delete(delete_project_url, headers=self.headers, data={})
+        response = http_client.delete(delete_project_url, headers=self.headers, data={})
 
         if response.status_code != 200:
             handle_error_image_search(response)
@@ -266,7 +266,7 @@ class SentiSightApi(ProviderInterface, OcrInterface, ImageInterface):
         self, project_id: str
     ) -> ResponseType[SearchGetImagesDataClass]:
         get_images_url = f"https://platform.sentisight.ai/api/images/{project_id}/"
-        response = requests.get(get_images_url, headers=self.headers)
+        response = http_client.get(get_images_url, headers=self.headers)
 
         if response.status_code != 200:
             handle_error_image_search(response)
@@ -289,7 +289,7 @@ class SentiSightApi(ProviderInterface, OcrInterface, ImageInterface):
         )
 
         # Build the request
-        response = requests.get(get_image_url, headers=self.headers, data={})
+        response = http_client.get(get_image_url, headers=self.headers, data={})
 
         # Handle provider error
         if response.status_code != 200:
@@ -313,7 +313,7 @@ class SentiSightApi(ProviderInterface, OcrInterface, ImageInterface):
         if not file:
             raise ValueError("file is required.")
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 search_project_url,
                 headers={
                     "accept": "*/*",
@@ -348,7 +348,7 @@ class SentiSightApi(ProviderInterface, OcrInterface, ImageInterface):
             else:
                 sentisight_params = SentisightBackgroundRemovalParams(**provider_params)
 
-            response = requests.post(
+            response = http_client.post(
                 self.base_url + SentisightPreTrainModel.BACKGROUND_REMOVAL.value,
                 headers={
                     "X-Auth-token": self.key,
@@ -14,6 +14,7 @@ from edenai_apis.features.image.deepfake_detection.deepfake_detection_dataclass
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.parsing import extract
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
@@ -72,7 +73,7 @@ class SightEngineApi(ProviderInterface, ImageInterface, VideoInterface):
             params["method"] = "POST"
 
         try:
-            response = requests.request(**params)
+            response = http_client.request(**params)
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             raise ProviderException(f"Request failed: {str(e)}")
@@ -113,7 +114,7 @@ class SightEngineApi(ProviderInterface, ImageInterface, VideoInterface):
             if file:
                 with open(file, "rb") as video_file:
                     files = {"media": video_file}
-                    response = requests.request(
+                    response = http_client.request(
                         method=method,
                         url=url,
                         files=files,
@@ -122,7 +123,7 @@ class SightEngineApi(ProviderInterface, ImageInterface, VideoInterface):
                     )
             else:
                 payload["stream_url"] = file_url
-                response = requests.request(
+                response = http_client.request(
                     method=method,
                     url=url,
                     params=payload,
@@ -138,7 +139,7 @@ class SightEngineApi(ProviderInterface, ImageInterface, VideoInterface):
         if not media_id:
             raise ProviderException("Media ID not found in response.")
 
-        requests.post(
+        http_client.post(
             self.webhook_url,
             json={"media_id": media_id},
             headers={"content-type": "application/json"},
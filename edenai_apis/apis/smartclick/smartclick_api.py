@@ -1,7 +1,5 @@
 from typing import Dict, Optional, Sequence
 
-import requests
-
 from edenai_apis.features import ProviderInterface, ImageInterface
 from edenai_apis.features.image import (
     LogoDetectionDataClass,
@@ -12,6 +10,7 @@ from edenai_apis.features.image import (
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from edenai_apis.utils.upload_s3 import upload_file_to_s3
 
@@ -41,7 +40,7 @@ class SmartClickApi(ProviderInterface, ImageInterface):
             content_url = upload_file_to_s3(file, file)
 
         payload = {"url": content_url}
-        response = requests.request("POST", url, json=payload, headers=self.headers)
+        response = http_client.request("POST", url, json=payload, headers=self.headers)
 
         if response.status_code != 200:
             # Poorly documented
@@ -1,8 +1,6 @@
 import json
 from typing import Dict, Optional, List
 
-import requests
-
 from edenai_apis.features import ProviderInterface, AudioInterface
 from edenai_apis.features.audio.speech_to_text_async import (
     SpeechToTextAsyncDataClass,
@@ -16,6 +14,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncResponseType,
     AsyncPendingResponseType,
@@ -66,7 +65,7 @@ class SpeechmaticsApi(ProviderInterface, AudioInterface):
                 **provider_params,
             }
             # Send request
-            response = requests.post(
+            response = http_client.post(
                 url=self.base_url,
                 headers=self.headers,
                 data=payload,
@@ -80,7 +79,7 @@ class SpeechmaticsApi(ProviderInterface, AudioInterface):
     def audio__speech_to_text_async__get_job_result(
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[SpeechToTextAsyncDataClass]:
-        response = requests.get(
+        response = http_client.get(
             f"{self.base_url}/{provider_job_id}", headers=self.headers
         )
         original_response = response.json()
@@ -106,7 +105,7 @@ class SpeechmaticsApi(ProviderInterface, AudioInterface):
                 provider_job_id=provider_job_id
             )
         elif status == "done":
-            response = requests.get(
+            response = http_client.get(
                 f"{self.base_url}/{provider_job_id}/transcript",
                 headers=self.headers,
             )
@@ -4,8 +4,6 @@ from io import BytesIO
 from json import JSONDecodeError
 from typing import Dict, Literal, Optional, Any, List, Sequence
 
-import requests
-
 from edenai_apis.features import ProviderInterface, ImageInterface
 from edenai_apis.features.image import BackgroundRemovalDataClass
 from edenai_apis.features.image.generation import (
@@ -19,8 +17,9 @@ from edenai_apis.features.image.variation import (
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
-from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_file_bytes_to_s3
+from edenai_apis.utils.upload_s3 import USER_PROCESS, upload_files_bytes_to_s3
 
 
 class StabilityAIApi(ProviderInterface, ImageInterface):
@@ -58,7 +57,7 @@ class StabilityAIApi(ProviderInterface, ImageInterface):
         }
 
         try:
-            response = requests.post(url, headers=self.headers, json=payload)
+            response = http_client.post(url, headers=self.headers, json=payload)
             original_response = response.json()
         except json.JSONDecodeError as exc:
             raise ProviderException("Internal Server Error", code=500) from exc
@@ -69,18 +68,22 @@ class StabilityAIApi(ProviderInterface, ImageInterface):
                 message=original_response.get("message"), code=response.status_code
             )
 
-        generations: List[GeneratedImageDataClass] = []
-        for generated_image in original_response.get("artifacts"):
-            image_b64 = generated_image.get("base64")
-
-            image_data = image_b64.encode()
-            image_content = BytesIO(base64.b64decode(image_data))
-            resource_url = upload_file_bytes_to_s3(image_content, ".png", USER_PROCESS)
-            generations.append(
-                GeneratedImageDataClass(
-                    image=image_b64, image_resource_url=resource_url
-                )
-            )
+        images_b64 = [
+            generated_image.get("base64")
+            for generated_image in original_response.get("artifacts")
+        ]
+        resource_urls = upload_files_bytes_to_s3(
+            [
+                (BytesIO(base64.b64decode(image_b64.encode())), ".png")
+                for image_b64 in images_b64
+            ],
+            USER_PROCESS,
+            background=True,
+        )
+        generations: List[GeneratedImageDataClass] = [
+            GeneratedImageDataClass(image=image_b64, image_resource_url=resource_url)
+            for image_b64, resource_url in zip(images_b64, resource_urls)
+        ]
 
         return ResponseType[GenerationDataClass](
             original_response=original_response,
@@ -98,7 +101,7 @@ class StabilityAIApi(ProviderInterface, ImageInterface):
             files = {"image": f.read()}
             headers = {"Authorization": f"Bearer {self.api_key}", "accept": "image/*"}
 
-            response = requests.post(url, files=files, headers=headers)
+            response = http_client.post(url, files=files, headers=headers)
         try:
             original_response = response.json()
         except json.JSONDecodeError as exc:
@@ -144,7 +147,7 @@ class StabilityAIApi(ProviderInterface, ImageInterface):
             }
             files = {"init_image": img}
 
-            response = requests.post(url, headers=self.headers, data=data, files=files)
+            response = http_client.post(url, headers=self.headers, data=data, files=files)
 
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
@@ -157,21 +160,24 @@ class StabilityAIApi(ProviderInterface, ImageInterface):
                     message=response.text, code=response.status_code
                 )
 
-            generations: Sequence[VariationImageDataClass] = []
-
-            for generated_image in original_response.get("artifacts"):
-                image_b64 = generated_image.get("base64")
-                image_data = image_b64.encode()
-                image_content = BytesIO(base64.b64decode(image_data))
-
-                resource_url = upload_file_bytes_to_s3(
-                    image_content, ".png", USER_PROCESS
-                )
-                generations.append(
-                    VariationImageDataClass(
-                        image=image_b64, image_resource_url=resource_url
-                    )
+            images_b64 = [
+                generated_image.get("base64")
+                for generated_image in original_response.get("artifacts")
+            ]
+            resource_urls = upload_files_bytes_to_s3(
+                [
+                    (BytesIO(base64.b64decode(image_b64.encode())), ".png")
+                    for image_b64 in images_b64
+                ],
+                USER_PROCESS,
+                background=True,
+            )
+            generations: Sequence[VariationImageDataClass] = [
+                VariationImageDataClass(
+                    image=image_b64, image_resource_url=resource_url
                 )
+                for image_b64, resource_url in zip(images_b64, resource_urls)
+            ]
             return ResponseType[VariationDataClass](
                 original_response=original_response,
                 standardized_response=VariationDataClass(items=generations),
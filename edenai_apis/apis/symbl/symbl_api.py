@@ -2,8 +2,6 @@ import json
 import os
 from typing import Dict, List, Optional
 
-import requests
-
 from edenai_apis.features import ProviderInterface, AudioInterface
 from edenai_apis.features.audio import (
     SpeechToTextAsyncDataClass,
@@ -17,6 +15,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -52,7 +51,7 @@ class SymblApi(ProviderInterface, AudioInterface):
         }
         headers = {"Content-Type": "application/json"}
 
-        response = requests.post(
+        response = http_client.post(
             "https://api.symbl.ai/oauth2/token:generate",
             headers=headers,
             data=json.dumps(payload),
@@ -94,7 +93,7 @@ class SymblApi(ProviderInterface, AudioInterface):
 
         params.update(provider_params)
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 url="https://api.symbl.ai/v1/process/audio",
                 headers=headers,
                 data=file_,
@@ -127,7 +126,7 @@ class SymblApi(ProviderInterface, AudioInterface):
 
         url_status = f"https://api.symbl.ai/v1/job/{job_id}"
 
-        response_status = requests.get(url=url_status, headers=headers)
+        response_status = http_client.get(url=url_status, headers=headers)
         original_response = response_status.json()
 
         if not original_response.get("status"):
@@ -147,7 +146,7 @@ class SymblApi(ProviderInterface, AudioInterface):
 
         if original_response["status"] == "completed":
             url = f"https://api.symbl.ai/v1/conversations/{conversation_id}/messages?sentiment=true&verbose=true"
-            response = requests.get(url=url, headers=headers)
+            response = http_client.get(url=url, headers=headers)
             if response.status_code != 200:
                 raise ProviderException(response_status.text, code = response.status_code)
 
@@ -1,9 +1,6 @@
 from io import BufferedReader
-from time import sleep
 from typing import Any, Dict, Sequence
 
-import requests
-
 from edenai_apis.features import ProviderInterface, OcrInterface
 from edenai_apis.features.ocr import (
     ReceiptParserDataClass,
@@ -29,8 +26,10 @@ from edenai_apis.features.ocr.financial_parser.financial_parser_dataclass import
 from edenai_apis.features.ocr.receipt_parser.receipt_parser_dataclass import BarCode
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.async_to_sync import PollingPolicy, poll_until
 from edenai_apis.utils.conversion import convert_string_to_number
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -48,7 +47,7 @@ class TabscannerApi(ProviderInterface, OcrInterface):
         payload = {"documentType": document_type}
         files = {"file": file}
         headers = {"apikey": self.api_key}
-        response = requests.post(
+        response = http_client.post(
             self.url + "2/process", files=files, data=payload, headers=headers
         )
         response_json = response.json()
@@ -58,21 +57,26 @@ class TabscannerApi(ProviderInterface, OcrInterface):
             )
         return response_json["token"]
 
-    def _get_response(self, token: str, retry=0) -> Any:
+    def _get_response(self, token: str) -> Any:
         headers = {"apikey": self.api_key}
-        response = requests.get(self.url + "result/" + token, headers=headers)
-        response_json = response.json()
-        if response_json["status"] == "pending" and retry <= 5:
-            sleep(1)
-            return self._get_response(token, retry + 1)
-        return response_json, response.status_code
+
+        def get_result() -> tuple:
+            response = http_client.get(self.url + "result/" + token, headers=headers)
+            return response.json(), response.status_code
+
+        # documents are usually processed a few seconds after their upload
+        return poll_until(
+            get_result,
+            lambda result: result[0].get("status") != "pending",
+            PollingPolicy(first_delay=1, initial_delay=1, max_delay=3, timeout=15),
+            name="tabscanner",
+        )
 
     def ocr__receipt_parser(
         self, file: str, language: str, file_url: str = ""
     ) -> ResponseType[ReceiptParserDataClass]:
         with open(file, "rb") as file_:
             token = self._process(file_, "receipt")
-            sleep(1)
             original_response, status_code = self._get_response(token)
 
         if "result" not in original_response:
@@ -164,7 +168,6 @@ class TabscannerApi(ProviderInterface, OcrInterface):
     ) -> ResponseType[FinancialParserDataClass]:
         with open(file, "rb") as file_:
             token = self._process(file_, document_type)
-            sleep(1)
             original_response, status_code = self._get_response(token)
 
         if "result" not in original_response:
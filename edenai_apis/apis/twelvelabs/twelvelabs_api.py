@@ -1,8 +1,6 @@
 import random
 from typing import Dict
 
-import requests
-
 from edenai_apis.apis.twelvelabs.helpers import (
     convert_json_to_logo_dataclass,
     convert_json_to_text_dataclass,
@@ -21,6 +19,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -54,7 +53,7 @@ class TwelveLabsApi(ProviderInterface, VideoInterface):
             "index_name": str(random.randint(0, 10000000)),
         }
 
-        response = requests.post(
+        response = http_client.post(
             index_url, headers=self.headers, json=index_data_config
         )
 
@@ -79,7 +78,7 @@ class TwelveLabsApi(ProviderInterface, VideoInterface):
             "disable_video_stream": "false",
         }
 
-        response = requests.post(
+        response = http_client.post(
             task_url, headers=self.headers, data=video_data_config, files=file_param
         )
         if file_stream is not None:
@@ -92,7 +91,7 @@ class TwelveLabsApi(ProviderInterface, VideoInterface):
 
         status_task_url = f"{self.base_url}/tasks/{task_id}"
 
-        response = requests.get(status_task_url, headers=self.headers)
+        response = http_client.get(status_task_url, headers=self.headers)
 
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
@@ -117,7 +116,7 @@ class TwelveLabsApi(ProviderInterface, VideoInterface):
         task_url = f"{self.base_url}/indexes/{index_id}/videos/{video_id}/logo"
         status_task_url = f"{self.base_url}/tasks/{task_id}"
 
-        response = requests.get(task_url, headers=self.headers)
+        response = http_client.get(task_url, headers=self.headers)
 
         if response.status_code == 422:
             raise AsyncJobException(reason=AsyncJobExceptionReason.DEPRECATED_JOB_ID)
@@ -128,7 +127,7 @@ class TwelveLabsApi(ProviderInterface, VideoInterface):
         original_response = response.json()
 
         if original_response.get("data") is None:
-            response = requests.get(status_task_url, headers=self.headers)
+            response = http_client.get(status_task_url, headers=self.headers)
             if response.status_code != 200:
                 raise ProviderException(
                     message=response.text, code=response.status_code
@@ -144,7 +143,7 @@ class TwelveLabsApi(ProviderInterface, VideoInterface):
 
         url = f"https://api.twelvelabs.io/v1.1/indexes/{index_id}"
 
-        response = requests.delete(url, headers=self.headers)
+        response = http_client.delete(url, headers=self.headers)
 
         if response.status_code != 204:
             raise ProviderException(message=response.text, code=response.status_code)
@@ -170,7 +169,7 @@ class TwelveLabsApi(ProviderInterface, VideoInterface):
         }
 
         # Create index
-        response = requests.post(
+        response = http_client.post(
             index_url, headers=self.headers, json=index_data_config
         )
 
@@ -196,7 +195,7 @@ class TwelveLabsApi(ProviderInterface, VideoInterface):
         }
 
         # Create video task
-        response = requests.post(
+        response = http_client.post(
             task_url, headers=self.headers, data=video_data_config, files=file_param
         )
         if file_stream is not None:
@@ -208,7 +207,7 @@ class TwelveLabsApi(ProviderInterface, VideoInterface):
 
         status_task_url = f"{self.base_url}/tasks/{task_id}"
 
-        response = requests.get(status_task_url, headers=self.headers)
+        response = http_client.get(status_task_url, headers=self.headers)
 
         if response.status_code != 200:
             raise ProviderException(message=response.text, code=response.status_code)
@@ -232,7 +231,7 @@ class TwelveLabsApi(ProviderInterface, VideoInterface):
         task_url = f"{self.base_url}/indexes/{index_id}/videos/{video_id}/text-in-video"
         status_task_url = f"{self.base_url}/tasks/{task_id}"
 
-        response = requests.get(task_url, headers=self.headers)
+        response = http_client.get(task_url, headers=self.headers)
 
         if response.status_code == 422:
             raise AsyncJobException(reason=AsyncJobExceptionReason.DEPRECATED_JOB_ID)
@@ -245,7 +244,7 @@ class TwelveLabsApi(ProviderInterface, VideoInterface):
         if original_response.get("data") is None:
 
             # check task status
-            response = requests.get(status_task_url, headers=self.headers)
+            response = http_client.get(status_task_url, headers=self.headers)
             if response.status_code != 200:
                 raise ProviderException(
                     message=response.text, code=response.status_code
@@ -261,7 +260,7 @@ class TwelveLabsApi(ProviderInterface, VideoInterface):
 
         url = f"https://api.twelvelabs.io/v1.1/indexes/{index_id}"
 
-        response = requests.delete(url, headers=self.headers)
+        response = http_client.delete(url, headers=self.headers)
 
         if response.status_code != 204:
             raise ProviderException(message=response.text, code=response.status_code)
@@ -1,12 +1,11 @@
 from typing import Dict, Sequence
 
-import requests
-
 from edenai_apis.features import ProviderInterface, TextInterface
 from edenai_apis.features.text import EmotionDetectionDataClass, EmotionItem, EmotionEnum
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 
 
@@ -23,7 +22,7 @@ class VernaiApi(ProviderInterface, TextInterface):
     def text__emotion_detection(
             self, text: str
     ) -> ResponseType[EmotionDetectionDataClass]:
-        response = requests.post(
+        response = http_client.post(
             url=self.url_emotion_detection,
             headers={"Authorization": f"{self.api_key}"},
             data={"text": text}
@@ -1,7 +1,5 @@
 from typing import Dict, List, Optional
 
-import requests
-
 from edenai_apis.features import AudioInterface
 from edenai_apis.features.audio.speech_to_text_async import (
     SpeechToTextAsyncDataClass,
@@ -16,6 +14,7 @@ from edenai_apis.utils.exception import (
     AsyncJobExceptionReason,
     ProviderException,
 )
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import (
     AsyncBaseResponseType,
     AsyncLaunchJobResponseType,
@@ -69,7 +68,7 @@ class VociApi(ProviderInterface, AudioInterface):
 
         data_config.update(provider_params)
         with open(file, "rb") as file_:
-            response = requests.post(
+            response = http_client.post(
                 url="https://vcloud.vocitec.com/transcribe",
                 data=data_config,
                 files=[("file", file_)],
@@ -89,12 +88,12 @@ class VociApi(ProviderInterface, AudioInterface):
         self, provider_job_id: str
     ) -> AsyncBaseResponseType[SpeechToTextAsyncDataClass]:
         payload = {"token": self.key, "requestid": provider_job_id}
-        response = requests.get(
+        response = http_client.get(
             url="https://vcloud.vocitec.com/transcribe/result", params=payload
         )
         if response.status_code == 200:
             url = response.json()
-            response_text = requests.get(url=url)
+            response_text = http_client.get(url=url)
 
             if response_text.status_code != 200:
                 raise ProviderException(
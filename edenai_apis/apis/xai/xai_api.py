@@ -1,12 +1,13 @@
 import random
-from typing import Dict
-import asyncio
-import aiohttp
+from typing import Any, Dict
 
 import openai
 from openai import OpenAI
 
-from edenai_apis.apis.openai.helpers import moderate_if_exists
+from edenai_apis.apis.openai.helpers import (
+    extract_moderation_contents,
+    moderate_contents_async,
+)
 from edenai_apis.apis.xai.xai_multimodal_api import XAiMultimodalApi
 from edenai_apis.apis.xai.xai_text_api import XAiTextApi
 from edenai_apis.apis.xai.xai_translation_api import XAiTranslationApi
@@ -22,67 +23,45 @@ class XAiApi(
     XAiMultimodalApi,
 ):
     provider_name = "xai"
+    poolable = True
 
     def __init__(self, api_keys: Dict = {}):
         self.api_settings = load_provider(
             ProviderDataEnum.KEY, self.provider_name, api_keys=api_keys
         )
 
-        if isinstance(self.api_settings, list):
-            chosen_api_setting = random.choice(self.api_settings)
-        else:
-            chosen_api_setting = self.api_settings
-
-        self.api_key = chosen_api_setting["api_key"]
-        openai.api_key = self.api_key
+        api_settings = (
+            self.api_settings
+            if isinstance(self.api_settings, list)
+            else [self.api_settings]
+        )
+        openai.api_key = random.choice(api_settings)["api_key"]
         self.url = "https://api.x.ai/v1"
         self.model = "grok-beta"
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        # one client per api key, a key is picked for each request so that
+        # pooled instances still balance the load between the keys
+        self.key_settings = [
+            {
+                "api_key": api_setting["api_key"],
+                "headers": {
+                    "Authorization": f"Bearer {api_setting['api_key']}",
+                    "Content-Type": "application/json",
+                },
+                "client": OpenAI(base_url=self.url, api_key=api_setting["api_key"]),
+            }
+            for api_setting in api_settings
+        ]
         self.max_tokens = 270
 
-        self.client = OpenAI(
-            base_url=self.url,
-            api_key=self.api_key,
-        )
-
         self.webhook_settings = load_provider(ProviderDataEnum.KEY, "webhooksite")
         self.webhook_token = self.webhook_settings["webhook_token"]
         self.moderation_flag = True
 
-    async def check_content_moderation_async(self, *args, **kwargs):
-        tasks = []
+    def _key_setting(self) -> Dict[str, Any]:
+        """Pick the api key, headers and client used for a single request"""
+        return random.choice(self.key_settings)
 
-        tasks.append(moderate_if_exists(self.headers, kwargs.get("text")))
-        tasks.append(
-            moderate_if_exists(self.headers, kwargs.get("chatbot_global_action"))
+    async def check_content_moderation_async(self, *args, **kwargs):
+        await moderate_contents_async(
+            self._key_setting()["headers"], extract_moderation_contents(**kwargs)
         )
-        tasks.append(moderate_if_exists(self.headers, kwargs.get("instruction")))
-
-        if "previous_history" in kwargs:
-            tasks.extend(
-                moderate_if_exists(self.headers, item.get("message"))
-                for item in kwargs["previous_history"]
-                if isinstance(item, dict)
-            )
-
-        if "texts" in kwargs:
-            tasks.extend(
-                moderate_if_exists(self.headers, item) for item in kwargs["texts"]
-            )
-
-        if "messages" in kwargs:
-            for message in kwargs["messages"]:
-                if isinstance(message, dict) and "content" in message:
-                    for content in message["content"]:
-                        if isinstance(content, dict) and "content" in content:
-                            tasks.append(
-                                moderate_if_exists(
-                                    self.headers, content["content"].get("text")
-                                )
-                            )
-
-        async with aiohttp.ClientSession() as session:
-            await asyncio.gather(*tasks)
@@ -94,6 +94,7 @@ class XAiMultimodalApi(MultimodalInterface):
         response_format=None,
     ) -> ResponseType[Union[ChatDataClass, StreamChat]]:
 
+        client = self._key_setting()["client"]
         self.check_content_moderation(
             messages=messages, chatbot_global_action=chatbot_global_action
         )
@@ -124,7 +125,7 @@ class XAiMultimodalApi(MultimodalInterface):
             payload["stop"] = stop_sequences
 
         try:
-            response = self.client.chat.completions.create(**payload)
+            response = client.chat.completions.create(**payload)
         except Exception as exc:
             raise ProviderException(str(exc))
 
@@ -2,7 +2,6 @@ import itertools
 import json
 import asyncio
 import os
-from time import sleep
 from typing import Dict, List, Literal, Optional, Sequence, Union
 from edenai_apis.features.text.chat.helpers import get_tool_call_from_history_by_id
 
@@ -62,6 +61,7 @@ from edenai_apis.utils.conversion import (
     find_all_occurrence,
 )
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.metrics import METRICS
 from edenai_apis.utils.types import ResponseType
 from .helpers import (
@@ -78,10 +78,11 @@ class XAiTextApi(TextInterface):
         self, name, instruction, message_text, example_file, dataclass
     ):
 
+        client = self._key_setting()["client"]
         with open(os.path.join(os.path.dirname(__file__), example_file), "r") as f:
             output_response = json.load(f)["standardized_response"]
 
-        assistant = self.client.beta.assistants.create(
+        assistant = client.beta.assistants.create(
             response_format={"type": "json_object"},
             model="grok-beta",
             name=name,
@@ -89,7 +90,7 @@ class XAiTextApi(TextInterface):
                 instruction, output_response, dataclass.schema()
             ),
         )
-        thread = self.client.beta.threads.create(
+        thread = client.beta.threads.create(
             messages=[
                 {
                     "role": "user",
@@ -103,15 +104,20 @@ class XAiTextApi(TextInterface):
             ]
         )
 
-        run = self.client.beta.threads.runs.create_and_poll(
+        run = client.beta.threads.runs.create_and_poll(
             thread_id=thread.id,
             assistant_id=assistant.id,
         )
 
-        while run.status != "completed":
-            sleep(1)
+        # create_and_poll returns once the run is over, it will not complete later
+        if run.status != "completed":
+            raise ProviderException(
+                run.last_error.message
+                if run.last_error
+                else f"Assistant run ended with status {run.status}"
+            )
 
-        messages = self.client.beta.threads.messages.list(thread_id=thread.id)
+        messages = client.beta.threads.messages.list(thread_id=thread.id)
         usage = run.to_dict()["usage"]
         original_response = messages.to_dict()
         original_response["usage"] = usage
@@ -130,6 +136,7 @@ class XAiTextApi(TextInterface):
     def text__summarize(
         self, text: str, output_sentences: int, language: str, model: str
     ) -> ResponseType[SummarizeDataClass]:
+        headers = self._key_setting()["headers"]
         url = f"{self.url}/chat/completions"
         prompt = f"""Given the following text, please provide a concise summary in the same language:
         text : {text}
@@ -142,7 +149,7 @@ class XAiTextApi(TextInterface):
             "messages": messages,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = get_openapi_response(response)
 
         standardized_response = SummarizeDataClass(
@@ -164,7 +171,7 @@ class XAiTextApi(TextInterface):
     #         "model": model[1],
     #     }
 
-    #     response = requests.post(url, json=payload, headers=self.headers)
+    #     response = http_client.post(url, json=payload, headers=self.headers)
     #     original_response = get_openapi_response(response)
 
     #     items: Sequence[EmbeddingsDataClass] = []
@@ -272,7 +279,7 @@ class XAiTextApi(TextInterface):
     #         "frequency_penalty": 0,
     #         "presence_penalty": 0,
     #     }
-    #     response = requests.post(url, json=payload, headers=self.headers)
+    #     response = http_client.post(url, json=payload, headers=self.headers)
     #     original_response = get_openapi_response(response)
 
     #     answers = []
@@ -290,6 +297,7 @@ class XAiTextApi(TextInterface):
     def text__anonymization(
         self, text: str, language: str
     ) -> ResponseType[AnonymizationDataClass]:
+        headers = self._key_setting()["headers"]
         prompt = construct_anonymization_context(text)
         json_output = '{{"redactedText" : "...", "entities": [{{content: entity, label: category, confidence_score: confidence score, offset: start_offset}}]}}'
         messages = [{"role": "user", "content": prompt}]
@@ -308,7 +316,7 @@ class XAiTextApi(TextInterface):
             "messages": messages,
         }
         url = f"{self.url}/chat/completions"
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = get_openapi_response(response)
         pii_data = original_response["choices"][0]["message"]["content"]
         try:
@@ -407,6 +415,7 @@ class XAiTextApi(TextInterface):
     def text__code_generation(
         self, instruction: str, temperature: float, max_tokens: int, prompt: str = ""
     ) -> ResponseType[CodeGenerationDataClass]:
+        headers = self._key_setting()["headers"]
         url = f"{self.url}/chat/completions"
         model = "grok-beta"
 
@@ -428,7 +437,7 @@ class XAiTextApi(TextInterface):
         }
 
         try:
-            response = requests.post(url, json=payload, headers=self.headers)
+            response = http_client.post(url, json=payload, headers=headers)
         except requests.exceptions.ChunkedEncodingError:
             raise ProviderException("Connection closed with provider", 400)
         original_response = get_openapi_response(response)
@@ -448,6 +457,7 @@ class XAiTextApi(TextInterface):
         max_tokens: int,
         model: str,
     ) -> ResponseType[GenerationDataClass]:
+        headers = self._key_setting()["headers"]
         url = f"{self.url}/chat/completions"
 
         payload = {
@@ -458,7 +468,7 @@ class XAiTextApi(TextInterface):
         if max_tokens != 0:
             payload["max_tokens"] = max_tokens
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = get_openapi_response(response)
 
         standardized_response = GenerationDataClass(
@@ -568,6 +578,7 @@ class XAiTextApi(TextInterface):
         tool_choice: Literal["auto", "required", "none"] = "auto",
         tool_results: Optional[List[dict]] = None,
     ) -> ResponseType[Union[ChatDataClass, StreamChat]]:
+        client = self._key_setting()["client"]
         previous_history = previous_history or []
         messages = []
         for msg in previous_history:
@@ -625,7 +636,7 @@ class XAiTextApi(TextInterface):
             payload["tool_choice"] = tool_choice
 
         try:
-            response = self.client.chat.completions.create(**payload)
+            response = client.chat.completions.create(**payload)
         except Exception as exc:
             raise ProviderException(str(exc))
 
@@ -680,6 +691,7 @@ class XAiTextApi(TextInterface):
     def text__prompt_optimization(
         self, text: str, target_provider: str
     ) -> ResponseType[PromptOptimizationDataClass]:
+        headers = self._key_setting()["headers"]
         url = f"{self.url}/chat/completions"
         prompt = construct_prompt_optimization_instruction(text, target_provider)
         messages = [{"role": "user", "content": prompt}]
@@ -697,10 +709,10 @@ class XAiTextApi(TextInterface):
             "n": 3,
         }
 
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = get_openapi_response(response)
 
-        missing_information_call = requests.post(
+        missing_information_call = http_client.post(
             url,
             json={
                 "model": "grok-base",
@@ -711,7 +723,7 @@ class XAiTextApi(TextInterface):
                     }
                 ],
             },
-            headers=self.headers,
+            headers=headers,
         )
         missing_information_response = get_openapi_response(missing_information_call)
 
@@ -1,5 +1,4 @@
 
-import requests
 import json
 from edenai_apis.features import TranslationInterface
 from edenai_apis.features.translation.automatic_translation import (
@@ -9,6 +8,7 @@ from edenai_apis.features.translation.language_detection import (
     LanguageDetectionDataClass,
 )
 from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.http import http_client
 from edenai_apis.utils.types import ResponseType
 from .helpers import (
     get_openapi_response,
@@ -21,6 +21,7 @@ class XAiTranslationApi(TranslationInterface):
     def translation__language_detection(
         self, text: str
     ) -> ResponseType[LanguageDetectionDataClass]:
+        headers = self._key_setting()["headers"]
         url = f"{self.url}/chat/completions"
         prompt = construct_language_detection_context(text)
         json_output = {"items" : [{"language" : "isocode", "display_name": "language display name", "confidence" : 0.8}]}
@@ -39,7 +40,7 @@ class XAiTranslationApi(TranslationInterface):
             "model": "grok-beta",
             "messages": messages,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = get_openapi_response(response)
         languages = original_response["choices"][0]["message"]["content"]
         try:
@@ -56,6 +57,7 @@ class XAiTranslationApi(TranslationInterface):
     def translation__automatic_translation(
         self, source_language: str, target_language: str, text: str
     ) -> ResponseType[AutomaticTranslationDataClass]:
+        headers = self._key_setting()["headers"]
         url = f"{self.url}/chat/completions"
         prompt = construct_translation_context(text, source_language, target_language)
         messages = [{"role": "user", "content": prompt}]
@@ -71,7 +73,7 @@ class XAiTranslationApi(TranslationInterface):
             "model": "grok-beta",
             "messages": messages,
         }
-        response = requests.post(url, json=payload, headers=self.headers)
+        response = http_client.post(url, json=payload, headers=headers)
         original_response = get_openapi_response(response)
         translation = original_response["choices"][0]["message"]["content"]
 
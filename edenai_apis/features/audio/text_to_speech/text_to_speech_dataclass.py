@@ -1,4 +1,6 @@
-from typing import Dict
+import importlib
+from concurrent.futures import Future
+from typing import Dict, Optional
 
 from pydantic import BaseModel, StrictStr
 
@@ -8,6 +10,13 @@ class TextToSpeechDataClass(BaseModel):
     voice_type: int
     audio_resource_url: StrictStr
 
+    @property
+    def audio_resource_upload(self) -> Optional[Future]:
+        """Background upload of the audio, the url can not be downloaded before it
+        is done. See `edenai_apis.utils.upload_s3.get_asset_upload`"""
+        s3_module = importlib.import_module("edenai_apis.utils.upload_s3")
+        return s3_module.get_asset_upload(self.audio_resource_url)
+
     @staticmethod
     def direct_response(api_response: Dict):
         return api_response["audio"]
@@ -1,4 +1,6 @@
-from typing import Sequence
+import importlib
+from concurrent.futures import Future
+from typing import Optional, Sequence
 
 from pydantic import BaseModel, Field, StrictStr
 
@@ -7,6 +9,13 @@ class VariationImageDataClass(BaseModel):
     image: str
     image_resource_url: StrictStr
 
+    @property
+    def image_resource_upload(self) -> Optional[Future]:
+        """Background upload of the image variation, see `get_asset_upload` in
+        `edenai_apis.utils.upload_s3`"""
+        s3_module = importlib.import_module("edenai_apis.utils.upload_s3")
+        return s3_module.get_asset_upload(self.image_resource_url)
+
 
 class VariationDataClass(BaseModel):
     items: Sequence[VariationImageDataClass] = Field(default_factory=list)
\ No newline at end of file
@@ -3,6 +3,9 @@ from abc import ABC
 
 class ProviderInterface(ABC):
     provider_name: str
+    # whether one instance can serve concurrent calls, ie: it keeps no per-call
+    # state, see `edenai_apis.loaders.provider_pool`
+    poolable: bool = False
 
     @classmethod
     def __init_subclass__(cls) -> None:
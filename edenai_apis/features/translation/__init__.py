@@ -2,6 +2,11 @@ from .automatic_translation import (
     AutomaticTranslationDataClass,
     automatic_translation_arguments,
 )
+from .automatic_translation_batch import (
+    AutomaticTranslationBatchDataClass,
+    InfosAutomaticTranslationBatchDataClass,
+    automatic_translation_batch_arguments,
+)
 from .language_detection import (
     LanguageDetectionDataClass,
     InfosLanguageDetectionDataClass,
@@ -0,0 +1,5 @@
+from .automatic_translation_batch_args import automatic_translation_batch_arguments
+from .automatic_translation_batch_dataclass import (
+    AutomaticTranslationBatchDataClass,
+    InfosAutomaticTranslationBatchDataClass,
+)
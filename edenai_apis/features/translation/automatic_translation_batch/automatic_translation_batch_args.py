@@ -0,0 +1,10 @@
+def automatic_translation_batch_arguments(provider_name: str):
+    return {
+        "texts": [
+            "Artificial intelligence is the intelligence of machines.",
+            "The term also refers to the field of study of such systems.",
+            "Many jobs are gradually being automated.",
+        ],
+        "source_language": "en",
+        "target_language": "fr",
+    }
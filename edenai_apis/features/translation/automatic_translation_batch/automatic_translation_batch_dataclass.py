@@ -0,0 +1,25 @@
+from typing import Literal, Optional, Sequence
+
+from pydantic import BaseModel, Field, StrictStr
+
+
+class InfosAutomaticTranslationBatchDataClass(BaseModel):
+    """Translation of one of the input texts
+
+    Attributes:
+        text (str, optional): translated text, None if the translation failed
+        status (str): `success` or `fail`
+        error (str, optional): why the translation failed
+    """
+
+    text: Optional[StrictStr] = None
+    status: Literal["success", "fail"] = "success"
+    error: Optional[StrictStr] = None
+
+
+class AutomaticTranslationBatchDataClass(BaseModel):
+    """Translations of the input texts, in the order of the input"""
+
+    items: Sequence[InfosAutomaticTranslationBatchDataClass] = Field(
+        default_factory=list
+    )
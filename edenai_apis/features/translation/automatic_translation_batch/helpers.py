@@ -0,0 +1,171 @@
+"""
+Packing of many short texts into few provider requests, for
+`translation__automatic_translation_batch`.
+
+Texts are packed in input order up to the per-request limits of the provider
+(number of texts and size), identical texts are sent once, and packs are sent
+concurrently. Each input text gets its own result, so a failed request or a text
+above the provider limits only fails the texts concerned.
+
+Packs are sent on a dedicated thread pool, not on the provider executor, since the
+provider methods waiting for them may already run on it. Its size can be set with
+the `TRANSLATION_BATCH_MAX_WORKERS` environment variable (default 8).
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from edenai_apis.features.translation.automatic_translation_batch.automatic_translation_batch_dataclass import (
+    AutomaticTranslationBatchDataClass,
+    InfosAutomaticTranslationBatchDataClass,
+)
+from edenai_apis.utils.exception import ProviderException
+
+TRANSLATION_BATCH_MAX_WORKERS = int(os.environ.get("TRANSLATION_BATCH_MAX_WORKERS", 8))
+
+# translated texts of a pack, in the order of the pack, and the provider response
+TranslatedPack = Tuple[List[str], Any]
+
+_BATCH_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_BATCH_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_batch_executor() -> ThreadPoolExecutor:
+    global _BATCH_EXECUTOR
+    if _BATCH_EXECUTOR is None:
+        with _BATCH_EXECUTOR_LOCK:
+            if _BATCH_EXECUTOR is None:
+                _BATCH_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=TRANSLATION_BATCH_MAX_WORKERS,
+                    thread_name_prefix="edenai-translation-batch",
+                )
+    return _BATCH_EXECUTOR
+
+
+@dataclass(frozen=True)
+class BatchLimits:
+    """Documented limits of one translation request of a provider
+
+    Args:
+        max_items (int): number of texts per request
+        max_size (int): total size of the texts of a request
+        text_size (Callable): size of a text, eg: `len` for characters or the length
+            of its utf-8 encoding for providers limiting bytes
+    """
+
+    max_items: int
+    max_size: int
+    text_size: Callable[[str], int] = len
+
+
+def utf8_size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def pack_texts(
+    texts: Sequence[str], limits: BatchLimits
+) -> Tuple[List[List[str]], List[str]]:
+    """Pack texts in order into requests respecting `limits`
+
+    Returns:
+        the packs, and the texts too big to be sent even alone
+    """
+    packs: List[List[str]] = []
+    too_big: List[str] = []
+    pack: List[str] = []
+    pack_size = 0
+    for text in texts:
+        size = limits.text_size(text)
+        if size > limits.max_size:
+            too_big.append(text)
+            continue
+        if pack and (
+            len(pack) >= limits.max_items or pack_size + size > limits.max_size
+        ):
+            packs.append(pack)
+            pack, pack_size = [], 0
+        pack.append(text)
+        pack_size += size
+    if pack:
+        packs.append(pack)
+    return packs, too_big
+
+
+def translate_in_batches(
+    texts: Sequence[str],
+    translate_pack: Callable[[List[str]], TranslatedPack],
+    limits: BatchLimits,
+) -> Tuple[AutomaticTranslationBatchDataClass, List[Any]]:
+    """Translate `texts` with as few concurrent provider requests as possible
+
+    Args:
+        texts (Sequence[str]): texts to translate
+        translate_pack (Callable): translates a list of texts in one request, returns
+            the translations in the same order and the provider response
+        limits (BatchLimits): per-request limits of the provider
+
+    Returns:
+        the translation of each text in input order, and the responses of the
+        successful requests in pack order
+
+    Raises:
+        ProviderException: if no text could be translated
+    """
+    # empty texts are not sent, some providers reject them
+    distinct_texts = list(dict.fromkeys(text for text in texts if text))
+    packs, too_big = pack_texts(distinct_texts, limits)
+
+    translations: Dict[str, str] = {"": ""}
+    errors: Dict[str, str] = {
+        text: f"Text is longer than the provider limit of {limits.max_size}"
+        for text in too_big
+    }
+    responses: List[Any] = []
+    if len(packs) == 1:
+        outcomes = [_translate_pack(translate_pack, packs[0])]
+    else:
+        executor = _get_batch_executor()
+        futures = [executor.submit(_translate_pack, translate_pack, p) for p in packs]
+        outcomes = [future.result() for future in futures]
+    failure: Optional[Exception] = None
+    for pack, (translated, response, exc) in zip(packs, outcomes):
+        if exc is not None:
+            failure = failure or exc
+            errors.update((text, str(exc) or type(exc).__name__) for text in pack)
+            continue
+        translations.update(zip(pack, translated))
+        responses.append(response)
+
+    if texts and not any(text in translations for text in texts):
+        # nothing translated, eg: invalid credentials
+        if isinstance(failure, ProviderException):
+            raise failure
+        raise ProviderException(next(iter(errors.values()))) from failure
+
+    items = [
+        (
+            InfosAutomaticTranslationBatchDataClass(text=translations[text])
+            if text in translations
+            else InfosAutomaticTranslationBatchDataClass(
+                status="fail", error=errors[text]
+            )
+        )
+        for text in texts
+    ]
+    return AutomaticTranslationBatchDataClass(items=items), responses
+
+
+def _translate_pack(
+    translate_pack: Callable[[List[str]], TranslatedPack], pack: List[str]
+) -> Tuple[Optional[List[str]], Any, Optional[Exception]]:
+    try:
+        translated, response = translate_pack(pack)
+    except Exception as exc:
+        return None, None, exc
+    if len(translated) != len(pack):
+        message = f"{len(translated)} translations returned for {len(pack)} texts"
+        return None, None, ProviderException(message)
+    return translated, response, None
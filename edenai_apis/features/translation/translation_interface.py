@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 from edenai_apis.features.translation.automatic_translation.automatic_translation_dataclass import (
     AutomaticTranslationDataClass,
 )
+from edenai_apis.features.translation.automatic_translation_batch.automatic_translation_batch_dataclass import (
+    AutomaticTranslationBatchDataClass,
+)
 from edenai_apis.features.translation.document_translation import (
     DocumentTranslationDataClass,
 )
@@ -30,6 +34,25 @@ class TranslationInterface:
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def translation__automatic_translation_batch(
+        self, source_language: str, target_language: str, texts: List[str]
+    ) -> ResponseType[AutomaticTranslationBatchDataClass]:
+        """
+        Translate many texts, with as few requests to the provider as possible
+
+        Args:
+            texts (List[str]): texts to translate
+            source_language (str): texts language code in ISO format
+            target_language (str): to which language to translate texts
+
+        Note:
+            results are in the order of `texts`, a text which could not be
+            translated has a `fail` status and an error, other texts are still
+            translated
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def translation__language_detection(
         self, text: str
@@ -1,18 +1,27 @@
 # pylint: disable=locally-disabled, too-many-branches
+import asyncio
 import os
 import random
 import time
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Type, Union, overload
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union, overload
 from uuid import uuid4
 
+from pydantic import BaseModel
+
 from edenai_apis import interface_v2
-from edenai_apis.features.provider.provider_interface import ProviderInterface
+from edenai_apis.loaders.capabilities import get_capability_registry
 from edenai_apis.loaders.data_loader import FeatureDataEnum, ProviderDataEnum
 from edenai_apis.loaders.loaders import load_feature, load_provider
+from edenai_apis.utils.concurrency import get_provider_executor, run_sync
 from edenai_apis.utils.constraints import validate_all_provider_constraints
 from edenai_apis.utils.exception import ProviderException, get_appropriate_error
 from edenai_apis.utils.monitoring import insert_api_call, monitor_call
-from edenai_apis.utils.types import AsyncLaunchJobResponseType
+from edenai_apis.utils.result_cache import ResultCache, get_result_cache, is_cacheable
+from edenai_apis.utils.types import (
+    AsyncLaunchJobResponseType,
+    original_response_included,
+)
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -97,53 +106,23 @@ def list_features(
         (list | dict): Return all possible provider/feature/subfeature or provider/feature/subfeature/phase as a list or dict
     """
 
-    method_set: Set[FeatureSubfeatureProviderTuple] = set()
-    ApiClasses: List[Type[ProviderInterface]] = load_provider(ProviderDataEnum.CLASS)
-    for cls in ApiClasses:
-        if (
-            not provider_name or cls.provider_name == provider_name
-        ):  # filter for provider_name if provided
-            # detect feature,subfeature,phase by looking at methods names
-            for method_name in filter(
-                lambda method_name: not method_name.startswith("_")
-                and "__" in method_name
-                and getattr(getattr(cls, method_name), "__isabstractmethod__", False)
-                is False,  # do not include method that are not implemented yet (interfaces abstract methods)
-                dir(cls),
-            ):
-                feature_i, subfeature_i, *others = method_name.split("__")
-                if not (feature or feature == feature_i) and not (
-                    subfeature or subfeature == subfeature_i
-                ):  # filter by subfeature if provided
-                    if len(others) > 0 and "async" not in subfeature_i:
-                        phase = others[0]
-                        method_set.add(
-                            (cls.provider_name, feature_i, subfeature_i, phase)
-                        )
-                    else:
-                        method_set.add((cls.provider_name, feature_i, subfeature_i))
-    method_list: ProviderList = list(method_set)
-    method_list.sort()
+    registry = get_capability_registry()
     if not as_dict:
-        return method_list  # return a list
-
-    # return resutls as dict
-    result = {}
-    for provider, feature_i, subfeature_i, *phase in method_list:
-        if provider not in result:
-            result[provider] = {}
-        if feature_i not in result[provider]:
-            result[provider][feature_i] = {}
-        have_phases = isinstance(result[provider][feature_i].get(subfeature_i), dict)
-        if result[provider][feature_i].get(subfeature_i) is None or have_phases:
-            if phase:
-                if not have_phases:
-                    result[provider][feature_i][subfeature_i] = {}
-                if not phase[0] in result[provider][feature_i][subfeature_i]:
-                    result[provider][feature_i][subfeature_i][phase[0]] = True
-            else:
-                result[provider][feature_i][subfeature_i] = True
-
+        return registry.features(provider_name, feature, subfeature)  # return a list
+
+    # return results as dict
+    if not feature and not subfeature:
+        return registry.to_dict(provider_name)
+
+    result: Dict = {}
+    for provider, feature_i, subfeature_i, *phase in registry.features(
+        provider_name, feature, subfeature
+    ):
+        subfeatures = result.setdefault(provider, {}).setdefault(feature_i, {})
+        if phase:
+            subfeatures.setdefault(subfeature_i, {})[phase[0]] = True
+        else:
+            subfeatures[subfeature_i] = True
     return result
 
 
@@ -160,13 +139,7 @@ def list_providers(
     Returns:
         List[str]: list of provider names
     """
-    # TO DO: keep the set as output, don't convert to list
-    providers_set = set()
-    for provider, feature_i, subfeature_i, *_phase in list_features():
-        if not feature or feature_i == feature:
-            if not subfeature or subfeature_i == subfeature:
-                providers_set.add(provider)
-    return list(providers_set)
+    return list(get_capability_registry().providers_for(feature, subfeature))
 
 
 STATUS_SUCCESS = "success"
@@ -182,6 +155,9 @@ def compute_output(
     fake: bool = False,
     api_keys: Dict = {},
     user_email: Optional[str] = None,
+    include_original_response: bool = True,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
 ) -> Dict:
     """
     Compute subfeature for provider and subfeature
@@ -195,67 +171,449 @@ def compute_output(
         fake (bool, optional): take result from sample. Defaults to `False`.
         api_keys (dict, optional): optional user's api_keys for each providers
         user_email (str, optional): optinal user email for monitoring (opted-out by default)
+        include_original_response (bool, optional): when `False`, the raw provider
+            response is neither built nor serialized and `original_response` is `None`.
+            Defaults to `True`.
+        use_cache (bool, optional): serve and store the result in the result cache, when
+            enabled and the subfeature is cacheable (see `edenai_apis.utils.result_cache`).
+            Defaults to `True`.
+        refresh_cache (bool, optional): call the provider even if the result is cached,
+            and store the new result. Defaults to `False`.
 
     Returns:
         dict: Result dict
     """
-    # check if the function we're running is asyncronous
-    is_async = ("_async" in phase) if phase else ("_async" in subfeature)
-    # suffix is used for async
-    suffix = "__launch_job" if is_async else ""
-
     # if language input, update args with a standardized language
     args = validate_all_provider_constraints(
         provider_name, feature, subfeature, phase, args
     )
 
+    return _compute_validated_output(
+        provider_name,
+        feature,
+        subfeature,
+        args,
+        phase=phase,
+        fake=fake,
+        api_keys=api_keys,
+        user_email=user_email,
+        include_original_response=include_original_response,
+        use_cache=use_cache,
+        refresh_cache=refresh_cache,
+    )
+
+
+def _compute_validated_output(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    args: Dict[str, Any],
+    phase: str = "",
+    fake: bool = False,
+    api_keys: Dict = {},
+    user_email: Optional[str] = None,
+    include_original_response: bool = True,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+) -> Dict:
+    # check if the function we're running is asyncronous
+    is_async = ("_async" in phase) if phase else ("_async" in subfeature)
+    # suffix is used for async
+    suffix = "__launch_job" if is_async else ""
+
     if fake:
         time.sleep(
             random.uniform(0.5, 1.5)
         )  # sleep to fake the response time from a provider
-        sample_args = load_feature(
-            FeatureDataEnum.SAMPLES_ARGS,
-            feature=feature,
-            subfeature=subfeature,
-            phase=phase,
-            provider_name=provider_name,
-        )
-        # replace File Wrapper by file and file_url inputs and also transform input attributes as settings for tts
-        sample_args = validate_all_provider_constraints(
-            provider_name, feature, subfeature, phase, sample_args
+        subfeature_result = _fake_output(
+            provider_name, feature, subfeature, phase, is_async
         )
+        if not include_original_response:
+            subfeature_result = _without_original_response(subfeature_result)
 
-        # Return mocked results
-        if is_async:
-            subfeature_result: Any = AsyncLaunchJobResponseType(
-                provider_job_id=str(uuid4())
-            ).model_dump()
-        # TODO: refacto image search to save output with this phase
-        elif phase in ["upload_image", "delete_image"]:
-            subfeature_result = {"status": STATUS_SUCCESS}
-        else:
-            subfeature_result = load_provider(
-                ProviderDataEnum.OUTPUT,
-                provider_name=provider_name,
-                feature=feature,
-                subfeature=subfeature,
-                phase=phase,
+    else:
+        # Fake == False : Compute real output
+        subfeature_method = _get_subfeature_method(feature, subfeature, phase, suffix)
+        cache = _result_cache(feature, subfeature, phase, use_cache)
+        cache_key = (
+            cache.key(provider_name, feature, subfeature, phase, args, api_keys)
+            if cache
+            else None
+        )
+        cached_result = (
+            cache.get(cache_key, include_original_response)
+            if cache and not refresh_cache
+            else None
+        )
+        if cached_result is not None:
+            return _final_result(
+                provider_name, feature, subfeature, cached_result, fake, user_email
             )
 
+        try:
+            with original_response_included(include_original_response):
+                subfeature_result = _dump_result(
+                    subfeature_method(provider_name, api_keys)(**args),
+                    include_original_response,
+                )
+        except ProviderException as exc:
+            raise get_appropriate_error(provider_name, exc)
+        if cache:
+            cache.set(cache_key, subfeature_result, include_original_response)
+
+    return _final_result(
+        provider_name, feature, subfeature, subfeature_result, fake, user_email
+    )
+
+
+FAN_OUT_MODES = ("all", "first_success", "quorum")
+STATUS_FAIL = "fail"
+STATUS_CANCELLED = "cancelled"
+
+ProviderRequest = Union[
+    Dict[str, Any],
+    Tuple[str, str, str, Dict[str, Any]],
+    Tuple[str, str, str, Dict[str, Any], str],
+]
+
+_monitored_compute_validated_output = monitor_call(condition=IS_MONITORING)(
+    _compute_validated_output
+)
+
+
+def _as_request_dict(request: ProviderRequest) -> Dict[str, Any]:
+    if isinstance(request, dict):
+        return {"phase": "", "api_keys": {}, **request}
+    provider_name, feature, subfeature, args, *phase = request
+    return {
+        "provider_name": provider_name,
+        "feature": feature,
+        "subfeature": subfeature,
+        "args": args,
+        "phase": phase[0] if phase else "",
+        "api_keys": {},
+    }
+
+
+def _timed_call(
+    func: Callable, *args, **kwargs
+) -> Tuple[Optional[Dict], Optional[Exception], float]:
+    start = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+    except Exception as exc:
+        return None, exc, time.perf_counter() - start
+    return result, None, time.perf_counter() - start
+
+
+def compute_output_many(
+    requests: List[ProviderRequest],
+    mode: Literal["all", "first_success", "quorum"] = "all",
+    quorum: Optional[int] = None,
+    timeout: Optional[float] = None,
+    fake: bool = False,
+    user_email: Optional[str] = None,
+    include_original_response: bool = True,
+) -> List[Dict]:
+    """
+    Run several `compute_output` calls concurrently on the shared provider executor,
+    eg: to compare providers on the same input or to fall back on other providers.
+
+    Inputs of all requests are validated against their provider constraints before any
+    call is made, invalid requests are reported as failed without being run.
+
+    Args:
+        requests (List): requests given either as dicts of `compute_output` arguments
+            (`provider_name`, `feature`, `subfeature`, `args`, and optionally `phase`
+            and `api_keys`) or as (provider_name, feature, subfeature, args[, phase]) tuples
+        mode (str, optional): one of
+            - `all`: wait for all requests. Default.
+            - `first_success`: return as soon as one request succeeds
+            - `quorum`: return as soon as `quorum` requests succeed
+        quorum (int, optional): number of successes needed in `quorum` mode.
+            Defaults to the majority of requests.
+        timeout (float, optional): maximum number of seconds to wait for the results
+        fake (bool, optional): take results from samples. Defaults to `False`.
+        user_email (str, optional): optinal user email for monitoring (opted-out by default)
+        include_original_response (bool, optional): see `compute_output`. Defaults to `True`.
+
+    Returns:
+        List[Dict]: one report per request, in the order of `requests`, with the
+            `provider`, `feature`, `subfeature` and `phase` of the request, its `status`
+            (`success`, `fail` or `cancelled` when not needed anymore or timed out),
+            its `latency` in seconds, its `result` (`compute_output` dict) and its `error`.
+    """
+    if mode not in FAN_OUT_MODES:
+        raise ValueError(f"mode should be one of {FAN_OUT_MODES}, got '{mode}'")
+
+    requests = [_as_request_dict(request) for request in requests]
+    reports: List[Dict[str, Any]] = [
+        {
+            "provider": request["provider_name"],
+            "feature": request["feature"],
+            "subfeature": request["subfeature"],
+            "phase": request["phase"],
+            "status": STATUS_CANCELLED,
+            "latency": None,
+            "result": None,
+            "error": None,
+        }
+        for request in requests
+    ]
+
+    if mode == "all":
+        needed = len(requests)
+    elif mode == "first_success":
+        needed = 1
     else:
-        # Fake == False : Compute real output
+        needed = quorum if quorum is not None else len(requests) // 2 + 1
+        if needed < 1:
+            raise ValueError(f"quorum should be at least 1, got {needed}")
+
+    executor = get_provider_executor()
+    futures: Dict[Future, int] = {}
+    for index, request in enumerate(requests):
+        try:
+            args = validate_all_provider_constraints(
+                request["provider_name"],
+                request["feature"],
+                request["subfeature"],
+                request["phase"],
+                request["args"],
+            )
+        except Exception as exc:
+            reports[index].update(status=STATUS_FAIL, error=str(exc))
+            continue
+        future = executor.submit(
+            _timed_call,
+            _monitored_compute_validated_output,
+            request["provider_name"],
+            request["feature"],
+            request["subfeature"],
+            args,
+            phase=request["phase"],
+            fake=fake,
+            api_keys=request["api_keys"],
+            user_email=user_email,
+            include_original_response=include_original_response,
+        )
+        futures[future] = index
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    successes = 0
+    pending = set(futures)
+    while pending and (mode == "all" or successes < needed):
+        remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        if not done:
+            break  # timed out
+        for future in done:
+            result, error, latency = future.result()
+            report = reports[futures[future]]
+            if error is not None:
+                report.update(status=STATUS_FAIL, latency=latency, error=str(error))
+            else:
+                successes += 1
+                report.update(status=STATUS_SUCCESS, latency=latency, result=result)
+
+    # results of the remaining requests are not needed anymore
+    for future in pending:
+        future.cancel()
+
+    return reports
 
-        feature_class = getattr(interface_v2, feature.title())
-        subfeature_method_name = f'{subfeature}{f"__{phase}" if phase else ""}{suffix}'
-        subfeature_class = getattr(feature_class, subfeature_method_name)
+
+@monitor_call(condition=IS_MONITORING)
+async def compute_output_async(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    args: Dict[str, Any],
+    phase: str = "",
+    fake: bool = False,
+    api_keys: Dict = {},
+    user_email: Optional[str] = None,
+    include_original_response: bool = True,
+    use_cache: bool = True,
+    refresh_cache: bool = False,
+) -> Dict:
+    """
+    asyncio version of `compute_output`, to serve many concurrent calls from one event loop.
+
+    Providers with a native async implementation of the subfeature (`a<feature>__<subfeature>`
+    methods, eg: `atext__chat`) are awaited directly, others are run on the shared
+    provider thread pool (see `edenai_apis.utils.concurrency`).
+
+    Args:
+        provider_name (str): EdenAI provider name
+        feature (str): EdenAI feature name
+        subfeature (str): EdenAI subfeature name
+        phase (str): Eden AI phase name if give, Default to `Literal[""]`
+        args (Dict): inputs arguments for the feature call
+        fake (bool, optional): take result from sample. Defaults to `False`.
+        api_keys (dict, optional): optional user's api_keys for each providers
+        user_email (str, optional): optinal user email for monitoring (opted-out by default)
+        include_original_response (bool, optional): see `compute_output`. Defaults to `True`.
+        use_cache (bool, optional): see `compute_output`. Defaults to `True`.
+        refresh_cache (bool, optional): see `compute_output`. Defaults to `False`.
+
+    Returns:
+        dict: Result dict
+    """
+    is_async = ("_async" in phase) if phase else ("_async" in subfeature)
+    suffix = "__launch_job" if is_async else ""
+
+    args = validate_all_provider_constraints(
+        provider_name, feature, subfeature, phase, args
+    )
+
+    if fake:
+        await asyncio.sleep(random.uniform(0.5, 1.5))
+        subfeature_result = _fake_output(
+            provider_name, feature, subfeature, phase, is_async
+        )
+        if not include_original_response:
+            subfeature_result = _without_original_response(subfeature_result)
+    else:
+        provider_method = await _get_async_subfeature_method(
+            provider_name, feature, subfeature, phase, suffix, api_keys
+        )
+        cache = _result_cache(feature, subfeature, phase, use_cache)
+        # keys of file inputs hash the file content, keep it off the event loop
+        cache_key = (
+            await run_sync(
+                cache.key, provider_name, feature, subfeature, phase, args, api_keys
+            )
+            if cache
+            else None
+        )
+        cached_result = (
+            await _run_cache_call(
+                cache, cache.get, cache_key, include_original_response
+            )
+            if cache and not refresh_cache
+            else None
+        )
+        if cached_result is not None:
+            return _final_result(
+                provider_name, feature, subfeature, cached_result, fake, user_email
+            )
 
         try:
-            subfeature_result = subfeature_class(provider_name, api_keys)(
-                **args
-            ).model_dump()
+            with original_response_included(include_original_response):
+                subfeature_result = _dump_result(
+                    await provider_method(**args), include_original_response
+                )
         except ProviderException as exc:
             raise get_appropriate_error(provider_name, exc)
+        if cache:
+            await _run_cache_call(
+                cache,
+                cache.set,
+                cache_key,
+                subfeature_result,
+                include_original_response,
+            )
+
+    return _final_result(
+        provider_name, feature, subfeature, subfeature_result, fake, user_email
+    )
 
+
+def _result_cache(
+    feature: str, subfeature: str, phase: str, use_cache: bool
+) -> Optional[ResultCache]:
+    """Result cache of a call, None when it is not cached"""
+    cache = get_result_cache() if use_cache else None
+    if cache is None or not is_cacheable(feature, subfeature, phase):
+        return None
+    return cache
+
+
+async def _run_cache_call(cache: ResultCache, func: Callable, *args) -> Any:
+    if cache.backend.blocking_io:
+        return await run_sync(func, *args)
+    return func(*args)
+
+
+def _dump_result(result: BaseModel, include_original_response: bool) -> Dict:
+    if include_original_response or "original_response" not in result.model_fields:
+        return result.model_dump()
+    # the key is kept so results have the same shape either way
+    return {
+        **result.model_dump(exclude={"original_response"}),
+        "original_response": None,
+    }
+
+
+def _without_original_response(result: Dict) -> Dict:
+    if "original_response" not in result:
+        return result
+    return {**result, "original_response": None}
+
+
+def _get_subfeature_method(
+    feature: str, subfeature: str, phase: str, suffix: str = ""
+) -> Callable:
+    feature_class = getattr(interface_v2, feature.title())
+    subfeature_method_name = f'{subfeature}{f"__{phase}" if phase else ""}{suffix}'
+    return getattr(feature_class, subfeature_method_name)
+
+
+async def _get_async_subfeature_method(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    phase: str,
+    suffix: str,
+    api_keys: Dict,
+) -> Callable:
+    # raises the same errors as the sync path for unknown subfeatures
+    _get_subfeature_method(feature, subfeature, phase, suffix)
+    method_name = f'{feature}__{subfeature}{f"__{phase}" if phase else ""}{suffix}'
+    return await interface_v2.get_async_provider_method(
+        provider_name, method_name, api_keys
+    )
+
+
+def _fake_output(
+    provider_name: str, feature: str, subfeature: str, phase: str, is_async: bool
+) -> Dict:
+    sample_args = load_feature(
+        FeatureDataEnum.SAMPLES_ARGS,
+        feature=feature,
+        subfeature=subfeature,
+        phase=phase,
+        provider_name=provider_name,
+    )
+    # replace File Wrapper by file and file_url inputs and also transform input attributes as settings for tts
+    sample_args = validate_all_provider_constraints(
+        provider_name, feature, subfeature, phase, sample_args
+    )
+
+    # Return mocked results
+    if is_async:
+        return AsyncLaunchJobResponseType(provider_job_id=str(uuid4())).model_dump()
+    # TODO: refacto image search to save output with this phase
+    if phase in ["upload_image", "delete_image"]:
+        return {"status": STATUS_SUCCESS}
+    return load_provider(
+        ProviderDataEnum.OUTPUT,
+        provider_name=provider_name,
+        feature=feature,
+        subfeature=subfeature,
+        phase=phase,
+    )
+
+
+def _final_result(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    subfeature_result: Dict,
+    fake: bool,
+    user_email: Optional[str],
+) -> Dict:
     final_result: Dict[str, Any] = {
         "status": STATUS_SUCCESS,
         "provider": provider_name,
@@ -299,26 +657,16 @@ def check_provider_constraints(
         Tuple[bool, str]: Provider is ok, debug string
     """
 
-    # Refacto : use list_providers ?
-    subfeatures_providers = list_features(as_dict=True)
-    provider_info = subfeatures_providers.get(provider_name, None)
-    if not provider_info:
+    registry = get_capability_registry()
+    if provider_name not in registry.providers:
         return False, f"Provider : '{provider_name}' unknown."
-    if feature not in provider_info:
-        return (
-            False,
-            f"Provider : '{provider_name}' does not provide an API for '{feature} {subfeature}'",
-        )
-    if subfeature not in provider_info[feature]:
+    if not registry.has(provider_name, feature, subfeature):
         return (
             False,
             f"Provider : '{provider_name}' does not provide an API for '{feature} {subfeature}'",
         )
     if phase:
-        if not isinstance(provider_info[feature][subfeature], dict) or (
-            isinstance(provider_info[feature][subfeature], dict)
-            and phase not in provider_info[feature][subfeature].keys()
-        ):
+        if not registry.has(provider_name, feature, subfeature, phase):
             return (
                 False,
                 f"Provider : '{provider_name}' does not provide an API for "
@@ -355,6 +703,7 @@ def get_async_job_result(
     fake: bool = False,
     user_email=None,
     api_keys=dict(),
+    include_original_response: bool = True,
 ) -> Dict:
     """Get async result from job id
 
@@ -365,6 +714,7 @@ def get_async_job_result(
         async_job_id (str): async job id to get result to
         phase (str): EdenAI phase. Default to empty string ("")
         fake (bool): Load fake results
+        include_original_response (bool, optional): see `compute_output`. Defaults to `True`.
 
     Returns:
         Dict: Result dict
@@ -374,29 +724,88 @@ def get_async_job_result(
         time.sleep(
             random.uniform(0.5, 1.5)
         )  # sleep to fake the response time from a provider
-        # Load fake data from edenai_apis' saved output
-        fake_result = load_provider(
-            ProviderDataEnum.OUTPUT,
-            provider_name=provider_name,
-            feature=feature,
-            subfeature=subfeature,
-            phase=phase,
+        fake_result = _fake_job_result(
+            provider_name, feature, subfeature, phase, async_job_id
         )
-        fake_result["provider_job_id"] = async_job_id
-
+        if not include_original_response:
+            return _without_original_response(fake_result)
         return fake_result
 
-    feature_class = getattr(interface_v2, feature.title())
-    subfeature_method_name = (
-        f'{subfeature}{f"__{phase}" if phase else ""}__get_job_result'
+    subfeature_method = _get_subfeature_method(
+        feature, subfeature, phase, "__get_job_result"
     )
-    subfeature_class = getattr(feature_class, subfeature_method_name)
 
     try:
-        subfeature_result = subfeature_class(provider_name, api_keys)(
-            async_job_id
-        ).model_dump()
+        with original_response_included(include_original_response):
+            subfeature_result = _dump_result(
+                subfeature_method(provider_name, api_keys)(async_job_id),
+                include_original_response,
+            )
+    except ProviderException as exc:
+        raise get_appropriate_error(provider_name, exc)
+
+    return subfeature_result
+
+
+@monitor_call(condition=IS_MONITORING)
+async def get_async_job_result_async(
+    provider_name: str,
+    feature: str,
+    subfeature: str,
+    async_job_id: AsyncLaunchJobResponseType,
+    phase: str = "",
+    fake: bool = False,
+    user_email=None,
+    api_keys=dict(),
+    include_original_response: bool = True,
+) -> Dict:
+    """asyncio version of `get_async_job_result`, see `compute_output_async`
+
+    Args:
+        provider_name (str): EdenAI provider name
+        feature (str): EdenAI feature
+        subfeature (str): EdenAI subfeature
+        async_job_id (str): async job id to get result to
+        phase (str): EdenAI phase. Default to empty string ("")
+        fake (bool): Load fake results
+        include_original_response (bool, optional): see `compute_output`. Defaults to `True`.
+
+    Returns:
+        Dict: Result dict
+    """
+    if fake is True:
+        await asyncio.sleep(random.uniform(0.5, 1.5))
+        fake_result = _fake_job_result(
+            provider_name, feature, subfeature, phase, async_job_id
+        )
+        if not include_original_response:
+            return _without_original_response(fake_result)
+        return fake_result
+
+    provider_method = await _get_async_subfeature_method(
+        provider_name, feature, subfeature, phase, "__get_job_result", api_keys
+    )
+    try:
+        with original_response_included(include_original_response):
+            subfeature_result = _dump_result(
+                await provider_method(async_job_id), include_original_response
+            )
     except ProviderException as exc:
         raise get_appropriate_error(provider_name, exc)
 
     return subfeature_result
+
+
+def _fake_job_result(
+    provider_name: str, feature: str, subfeature: str, phase: str, async_job_id: str
+) -> Dict:
+    # Load fake data from edenai_apis' saved output
+    fake_result = load_provider(
+        ProviderDataEnum.OUTPUT,
+        provider_name=provider_name,
+        feature=feature,
+        subfeature=subfeature,
+        phase=phase,
+    )
+    fake_result["provider_job_id"] = async_job_id
+    return fake_result
@@ -11,7 +11,9 @@ Example:
     >>> response = 3d_from_img(image=...)
 """
 
-from typing import Callable, Dict, Type
+import functools
+import inspect
+from typing import Awaitable, Callable, Dict, Type
 
 from edenai_apis.features import (
     AudioInterface,
@@ -21,8 +23,8 @@ from edenai_apis.features import (
 )
 from edenai_apis.features import ProviderInterface
 from edenai_apis.features import TextInterface, TranslationInterface, VideoInterface
-from edenai_apis.loaders.data_loader import ProviderDataEnum
-from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.loaders.provider_pool import get_provider_instance
+from edenai_apis.utils.concurrency import run_sync
 
 
 def return_provider_method(func: Callable) -> Callable:
@@ -44,13 +46,9 @@ def return_provider_method(func: Callable) -> Callable:
         Returns:
             Callable: provider's function
         """
-        # Get the provider's class.
-        # Example : GoogleAPI
-        ProviderClass = load_provider(ProviderDataEnum.CLASS, provider_name=provider)
-
-        # Instantiate the provider's class.
+        # Get an instance of the provider's class, reused across calls with the same api_keys.
         # Example : google_api = GoogleAPI()
-        provider_instance = ProviderClass(api_keys)
+        provider_instance = get_provider_instance(provider, api_keys)
 
         # Get the right function.
         # Example : google_api.image__object_detection
@@ -61,6 +59,30 @@ def return_provider_method(func: Callable) -> Callable:
     return wrapped
 
 
+async def get_async_provider_method(
+    provider: str, method_name: str, api_keys: Dict = {}
+) -> Callable[..., Awaitable]:
+    """find the async version of a provider's method
+
+    Args:
+        provider (str): provider name
+        method_name (str): provider's method name, eg: `text__chat`
+        api_keys (Dict, optional): user's api keys
+
+    Returns:
+        Callable: the native async variant (eg: `atext__chat`) if the provider implements it,
+            otherwise a coroutine function running the sync method on the provider executor
+    """
+    # building the provider instance may load settings or create clients
+    provider_instance = await run_sync(get_provider_instance, provider, api_keys)
+
+    async_method = getattr(provider_instance, f"a{method_name}", None)
+    if async_method is not None and inspect.iscoroutinefunction(async_method):
+        return async_method
+
+    return functools.partial(run_sync, getattr(provider_instance, method_name))
+
+
 def abstract(InterfaceClass: Type[ProviderInterface], method_prefix: str):
     """create an Abstracted Class and set all the methods of given InterfaceClass
     to it with modified names, methods have the same names as the subfeature
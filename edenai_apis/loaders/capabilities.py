@@ -0,0 +1,208 @@
+"""
+Registry of the provider/feature/subfeature(/phase) capabilities.
+
+Capabilities are detected by looking at the implemented `feature__subfeature` methods
+of every provider class. Since this scan is costly, it is done once and kept in memory,
+then served through constant time lookups and precomputed views.
+
+The registry can also be loaded from a json snapshot generated at build time
+(see `edenai_apis/scripts/capabilities_snapshot.py`) by setting the
+`CAPABILITIES_SNAPSHOT_PATH` environment variable.
+"""
+import inspect
+import json
+import os
+import threading
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple, Type, Union
+
+from edenai_apis.features.provider.provider_interface import ProviderInterface
+from edenai_apis.loaders.data_loader import ProviderDataEnum
+from edenai_apis.loaders.loaders import load_provider
+
+Capability = Union[Tuple[str, str, str], Tuple[str, str, str, str]]
+
+CAPABILITIES_SNAPSHOT_PATH = os.environ.get("CAPABILITIES_SNAPSHOT_PATH")
+
+
+def detect_class_capabilities(cls: Type[ProviderInterface]) -> List[Capability]:
+    """Detect feature, subfeature and phase by looking at the implemented methods names of a provider class"""
+    capabilities = set()
+    for method_name in dir(cls):
+        if method_name.startswith("_") or "__" not in method_name:
+            continue
+        # do not include method that are not implemented yet (interfaces abstract methods)
+        method = getattr(cls, method_name)
+        if getattr(method, "__isabstractmethod__", False):
+            continue
+        # async variants (eg: `atext__chat`) are not features on their own
+        if inspect.iscoroutinefunction(method):
+            continue
+        feature, subfeature, *others = method_name.split("__")
+        if len(others) > 0 and "async" not in subfeature:
+            capabilities.add((cls.provider_name, feature, subfeature, others[0]))
+        else:
+            capabilities.add((cls.provider_name, feature, subfeature))
+    return sorted(capabilities)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(val) for key, val in value.items()})
+    return value
+
+
+class CapabilityRegistry:
+    """In-memory index of all providers capabilities
+
+    Args:
+        capabilities (Iterable[Capability]): (provider, feature, subfeature)
+            or (provider, feature, subfeature, phase) tuples
+    """
+
+    def __init__(self, capabilities: Iterable[Capability]) -> None:
+        self.capabilities: Tuple[Capability, ...] = tuple(
+            sorted(set(tuple(capability) for capability in capabilities))
+        )
+        self._capabilities_set = frozenset(self.capabilities)
+        self._subfeatures: set = set()
+        self._providers_by_feature: Dict[str, set] = {}
+        self._providers_by_subfeature: Dict[Tuple[str, str], set] = {}
+        self._providers_by_subfeature_name: Dict[str, set] = {}
+
+        as_dict: Dict = {}
+        for provider, feature, subfeature, *phase in self.capabilities:
+            self._subfeatures.add((provider, feature, subfeature))
+            self._providers_by_feature.setdefault(feature, set()).add(provider)
+            self._providers_by_subfeature.setdefault((feature, subfeature), set()).add(
+                provider
+            )
+            self._providers_by_subfeature_name.setdefault(subfeature, set()).add(
+                provider
+            )
+
+            features = as_dict.setdefault(provider, {}).setdefault(feature, {})
+            if phase:
+                if subfeature not in features:
+                    features[subfeature] = {}
+                if isinstance(features[subfeature], dict):
+                    features[subfeature][phase[0]] = True
+            elif subfeature not in features:
+                features[subfeature] = True
+
+        self._as_dict: Mapping = _freeze(as_dict)
+        self.providers: FrozenSet[str] = frozenset(as_dict)
+
+    @classmethod
+    def from_provider_classes(
+        cls, provider_classes: Iterable[Type[ProviderInterface]]
+    ) -> "CapabilityRegistry":
+        capabilities: List[Capability] = []
+        for provider_class in provider_classes:
+            capabilities.extend(detect_class_capabilities(provider_class))
+        return cls(capabilities)
+
+    @classmethod
+    def from_snapshot(cls, path: str) -> "CapabilityRegistry":
+        with open(path, "r", encoding="utf-8") as snapshot:
+            return cls(tuple(capability) for capability in json.load(snapshot))
+
+    def save_snapshot(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as snapshot:
+            json.dump([list(capability) for capability in self.capabilities], snapshot)
+
+    def has(
+        self,
+        provider_name: str,
+        feature: str,
+        subfeature: str,
+        phase: Optional[str] = None,
+    ) -> bool:
+        """Check if a provider implements a feature/subfeature (and phase if given)"""
+        if phase:
+            return (
+                provider_name,
+                feature,
+                subfeature,
+                phase,
+            ) in self._capabilities_set
+        return (provider_name, feature, subfeature) in self._subfeatures
+
+    def providers_for(
+        self, feature: Optional[str] = None, subfeature: Optional[str] = None
+    ) -> FrozenSet[str]:
+        """Reverse index: providers implementing the given feature and/or subfeature"""
+        if feature and subfeature:
+            providers = self._providers_by_subfeature.get((feature, subfeature))
+        elif feature:
+            providers = self._providers_by_feature.get(feature)
+        elif subfeature:
+            providers = self._providers_by_subfeature_name.get(subfeature)
+        else:
+            return self.providers
+        return frozenset(providers or ())
+
+    def features(
+        self,
+        provider_name: Optional[str] = None,
+        feature: Optional[str] = None,
+        subfeature: Optional[str] = None,
+    ) -> List[Capability]:
+        """Capabilities tuples, filtered on provider, feature and subfeature if given"""
+        return [
+            capability
+            for capability in self.capabilities
+            if (not provider_name or capability[0] == provider_name)
+            and (not feature or capability[1] == feature)
+            and (not subfeature or capability[2] == subfeature)
+        ]
+
+    def as_dict(self, provider_name: Optional[str] = None) -> Mapping:
+        """Read-only nested view {provider: {feature: {subfeature: True | {phase: True}}}}"""
+        if provider_name:
+            provider_view = self._as_dict.get(provider_name)
+            return MappingProxyType(
+                {provider_name: provider_view} if provider_view else {}
+            )
+        return self._as_dict
+
+    def to_dict(self, provider_name: Optional[str] = None) -> Dict:
+        """Mutable copy of `as_dict`"""
+        return _thaw(self.as_dict(provider_name))
+
+
+def _thaw(value):
+    if isinstance(value, Mapping):
+        return {key: _thaw(val) for key, val in value.items()}
+    return value
+
+
+_REGISTRY: Optional[CapabilityRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_capability_registry() -> CapabilityRegistry:
+    """Get the process-wide capability registry, building it on first use"""
+    global _REGISTRY
+    registry = _REGISTRY
+    if registry is not None:
+        return registry
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            if CAPABILITIES_SNAPSHOT_PATH and os.path.exists(
+                CAPABILITIES_SNAPSHOT_PATH
+            ):
+                _REGISTRY = CapabilityRegistry.from_snapshot(CAPABILITIES_SNAPSHOT_PATH)
+            else:
+                _REGISTRY = CapabilityRegistry.from_provider_classes(
+                    load_provider(ProviderDataEnum.CLASS)
+                )
+        return _REGISTRY
+
+
+def invalidate_capability_registry() -> None:
+    """Drop the process-wide registry, it will be rebuilt on next use.
+    Useful for tests registering fake providers."""
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        _REGISTRY = None
@@ -6,9 +6,8 @@ from typing import Callable, Dict, List, Optional, Union, overload, Type
 from pydantic import BaseModel
 
 from edenai_apis.features.provider.provider_interface import ProviderInterface
-from edenai_apis.loaders.utils import load_json, check_messsing_keys
+from edenai_apis.loaders.utils import FrozenDict, freeze, load_json, check_messsing_keys
 from edenai_apis.settings import info_path, keys_path, outputs_path
-from edenai_apis.utils.compare import is_valid
 
 
 class FeatureDataEnum(Enum):
@@ -23,6 +22,7 @@ class ProviderDataEnum(Enum):
     SUBFEATURE = "load_subfeature"
     PROVIDER_INFO = "load_provider_subfeature_info"
     KEY = "load_key"
+    PROVIDER_NAMES = "load_provider_names"
 
 
 def load_key(provider_name, location=False, api_keys: Dict = {}):
@@ -76,25 +76,33 @@ def load_class(
     """
     from edenai_apis import apis
 
-    api_class_list: List[Type[ProviderInterface]] = [
-        getattr(apis, api) for api in dir(apis) if is_valid(".*Api", api)
-    ]
-    api_class_list.sort(key=lambda api: api.provider_name)
     if provider_name:
-        # get first occurence of class with given provider_name, or None
-        api_class: Optional[Type[ProviderInterface]] = next(
-            filter(lambda cls: cls.provider_name == provider_name, api_class_list), None
-        )
-
-        if api_class is None:
+        class_name = apis.PROVIDERS.get(provider_name)
+        if class_name is None:
             raise ValueError(
                 f"No ProviderInterface class implemented for provider: {provider_name}."
             )
+        # only import the package of the requested provider
+        return getattr(apis, class_name)
 
-        return api_class
+    api_class_list: List[Type[ProviderInterface]] = [
+        getattr(apis, class_name) for class_name in apis.PROVIDERS.values()
+    ]
+    api_class_list.sort(key=lambda api: api.provider_name)
     return api_class_list
 
 
+def load_provider_names() -> List[str]:
+    """Get all provider names from the providers manifest, without importing any provider package
+
+    Returns:
+        List[str]: sorted provider names
+    """
+    from edenai_apis import apis
+
+    return sorted(apis.PROVIDERS)
+
+
 def load_dataclass(
     feature: str, subfeature: str, phase: Optional[str] = None
 ) -> BaseModel:
@@ -143,9 +151,7 @@ def load_info_file(provider_name: str = "") -> Dict:
         return load_json(info_path(provider_name))
 
     all_infos = {}
-    for provider_name_i in map(
-        lambda provider_class: provider_class.provider_name, load_class()
-    ):
+    for provider_name_i in load_provider_names():
         provider_info = load_info_file(provider_name_i)
         for feature in provider_info:
             for subfeature in provider_info[feature]:
@@ -165,20 +171,27 @@ def load_info_file(provider_name: str = "") -> Dict:
     return all_infos
 
 
+# loaded on first use, see `load_provider_subfeature_info`
 global ALL_PROVIDERS_INFOS
-ALL_PROVIDERS_INFOS = load_info_file()
+ALL_PROVIDERS_INFOS: Dict = {}
+
+_EMPTY_INFO = FrozenDict()
 
 
 def load_provider_subfeature_info(
     provider_name: str, feature: str, subfeature: str, phase: str = ""
-):
-    """Get provider subfeature info.json from memory"""
+) -> FrozenDict:
+    """Get provider subfeature info.json from memory
+
+    The info is shared between all callers and returned without copy: it is a
+    read-only `FrozenDict` whose lists are tuples, use `.copy()` to modify it.
+    """
     global ALL_PROVIDERS_INFOS
     if len(ALL_PROVIDERS_INFOS) == 0:
-        ALL_PROVIDERS_INFOS = load_info_file()
+        ALL_PROVIDERS_INFOS = freeze(load_info_file())
     if phase:
-        return ALL_PROVIDERS_INFOS[(provider_name, feature, subfeature, phase)].copy()
-    return ALL_PROVIDERS_INFOS.get((provider_name, feature, subfeature), {}).copy()
+        return ALL_PROVIDERS_INFOS[(provider_name, feature, subfeature, phase)]
+    return ALL_PROVIDERS_INFOS.get((provider_name, feature, subfeature), _EMPTY_INFO)
 
 
 def load_output(
@@ -78,6 +78,7 @@ def load_provider(
         `load_subfeature(provider_name: str, feature: str, subfeature: str, phase: str = "", suffix="") -> Callable`
         `load_provider_subfeature_info(provider_name: str, feature: str, subfeature: str, phase: str = "")`
         `load_key(provider_name, location=False)`
+        `load_provider_names() -> List[str]`
 
     Args:
         data_feature(ProviderDataEnum): wich data_loader to call
@@ -0,0 +1,171 @@
+"""
+Process-wide pool of provider instances.
+
+Building a provider class (eg: `GoogleApi`, `AmazonApi`) loads its settings and
+creates all of its SDK clients, which is often more expensive than the provider
+call itself. The pool keeps built instances keyed by provider name and a
+fingerprint of the api_keys they were built with, so that `compute_output` and
+`get_async_job_result` can reuse them across calls.
+
+Pooled instances are shared by concurrent calls, so only provider classes keeping
+no per-call state on the instance (eg: current workspace, last response, token
+fetched during the call) opt in with `poolable = True`. Other providers are built
+for every call.
+
+The pool can be tuned with the following environment variables:
+    - `PROVIDER_POOL_MAX_SIZE`: maximum number of instances kept (0 disables the pool)
+    - `PROVIDER_POOL_TTL`: number of seconds an instance is kept before being rebuilt
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from edenai_apis.features.provider.provider_interface import ProviderInterface
+from edenai_apis.loaders.data_loader import ProviderDataEnum
+from edenai_apis.loaders.loaders import load_provider
+
+DEFAULT_MAX_SIZE = int(os.environ.get("PROVIDER_POOL_MAX_SIZE", 128))
+DEFAULT_TTL = float(os.environ.get("PROVIDER_POOL_TTL", 3600))
+
+PoolKey = Tuple[str, str]
+
+
+def fingerprint_api_keys(api_keys: Optional[Dict]) -> str:
+    """Return a stable hash of the given api_keys, keys themselves are never stored
+
+    Args:
+        api_keys (Dict, optional): user's api keys, empty means default settings
+
+    Returns:
+        str: hex digest, empty string for default settings
+    """
+    if not api_keys:
+        return ""
+    serialized = json.dumps(api_keys, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class ProviderPool:
+    """Thread-safe LRU/TTL cache of provider instances
+
+    Args:
+        max_size (int): maximum number of instances kept, 0 disables the pool
+        ttl (float): lifetime of an instance in seconds, 0 or less means no expiry
+        factory (Callable, optional): function building an instance from
+            (provider_name, api_keys). Defaults to loading the provider class.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+        factory: Optional[Callable[[str, Dict], ProviderInterface]] = None,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._factory = factory or self._build_instance
+        self._instances: "OrderedDict[PoolKey, Tuple[float, ProviderInterface]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _build_instance(provider_name: str, api_keys: Dict) -> ProviderInterface:
+        ProviderClass = load_provider(
+            ProviderDataEnum.CLASS, provider_name=provider_name
+        )
+        return ProviderClass(api_keys)
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl > 0 and time.monotonic() - created_at > self.ttl
+
+    def get(self, provider_name: str, api_keys: Optional[Dict] = None):
+        """Return a pooled instance of the provider, building it if needed.
+        Instances of providers which are not `poolable` are never shared.
+
+        Args:
+            provider_name (str): EdenAI provider name
+            api_keys (Dict, optional): user's api keys. Defaults to provider settings.
+
+        Returns:
+            ProviderInterface: provider instance
+        """
+        api_keys = api_keys or {}
+        if self.max_size <= 0:
+            return self._factory(provider_name, api_keys)
+
+        key = (provider_name, fingerprint_api_keys(api_keys))
+        with self._lock:
+            entry = self._instances.get(key)
+            if entry is not None:
+                if not self._is_expired(entry[0]):
+                    self._instances.move_to_end(key)
+                    return entry[1]
+                del self._instances[key]
+
+        # build outside the lock, provider construction can be slow
+        instance = self._factory(provider_name, api_keys)
+        if not getattr(instance, "poolable", False):
+            return instance
+
+        with self._lock:
+            entry = self._instances.get(key)
+            if entry is not None and not self._is_expired(entry[0]):
+                # another thread built it meanwhile, keep a single instance
+                self._instances.move_to_end(key)
+                return entry[1]
+            self._instances[key] = (time.monotonic(), instance)
+            while len(self._instances) > self.max_size:
+                self._instances.popitem(last=False)
+        return instance
+
+    def invalidate(
+        self, provider_name: Optional[str] = None, api_keys: Optional[Dict] = None
+    ) -> int:
+        """Drop pooled instances, eg: when provider keys are rotated
+
+        Args:
+            provider_name (str, optional): only drop instances of this provider.
+                Drop everything if not given.
+            api_keys (Dict, optional): only drop the instance built with these keys
+
+        Returns:
+            int: number of dropped instances
+        """
+        with self._lock:
+            if provider_name is None:
+                count = len(self._instances)
+                self._instances.clear()
+                return count
+
+            if api_keys is not None:
+                key = (provider_name, fingerprint_api_keys(api_keys))
+                return 1 if self._instances.pop(key, None) is not None else 0
+
+            keys = [key for key in self._instances if key[0] == provider_name]
+            for key in keys:
+                del self._instances[key]
+            return len(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._instances)
+
+
+PROVIDER_POOL = ProviderPool()
+
+
+def get_provider_instance(provider_name: str, api_keys: Optional[Dict] = None):
+    """Get a provider instance from the process-wide pool"""
+    return PROVIDER_POOL.get(provider_name, api_keys)
+
+
+def invalidate_provider_instances(
+    provider_name: Optional[str] = None, api_keys: Optional[Dict] = None
+) -> int:
+    """Drop instances from the process-wide pool, see `ProviderPool.invalidate`"""
+    return PROVIDER_POOL.invalidate(provider_name, api_keys)
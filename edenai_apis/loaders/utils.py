@@ -1,6 +1,6 @@
 import json
 import ntpath
-from typing import Dict
+from typing import Any, Dict
 
 from edenai_apis.utils.exception import ProviderException
 
@@ -19,3 +19,32 @@ def check_messsing_keys(owr_dict: Dict, own_dict: Dict):
     if len(different_keys) > 0:
         raise ProviderException(f"Setting keys missing: {', '.join(different_keys)}")
     return True
+
+
+class FrozenDict(dict):
+    """Read-only dict, shared without copies between callers.
+    `copy()` returns a regular mutable dict."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def freeze(data: Any) -> Any:
+    """Recursively convert dicts to `FrozenDict` and lists to tuples"""
+    if isinstance(data, dict):
+        return FrozenDict((key, freeze(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return tuple(freeze(value) for value in data)
+    return data
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Generate a json snapshot of all providers capabilities, to be loaded at runtime
+with the `CAPABILITIES_SNAPSHOT_PATH` environment variable instead of scanning
+every provider class.
+
+Usage: python -m edenai_apis.scripts.capabilities_snapshot [output_path]
+"""
+import os
+import sys
+
+from edenai_apis.loaders.capabilities import CapabilityRegistry
+from edenai_apis.loaders.data_loader import ProviderDataEnum
+from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.settings import base_path
+
+
+def main(path: str):
+    """write capabilities snapshot to a json file"""
+    print(f"=== Generating {path} ===")
+    registry = CapabilityRegistry.from_provider_classes(
+        load_provider(ProviderDataEnum.CLASS)
+    )
+    registry.save_snapshot(path)
+
+
+if __name__ == "__main__":
+    main(
+        sys.argv[1]
+        if len(sys.argv) > 1
+        else os.path.join(base_path, "capabilities_snapshot.json")
+    )
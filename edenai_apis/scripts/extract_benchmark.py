@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark `utils.parsing` on the saved provider outputs (`apis/*/outputs`):
+`extract` called once per path vs a `PathExtractor` built once, with paths found
+in each original response plus as many missing paths (optional fields).
+
+Usage: python -m edenai_apis.scripts.extract_benchmark [--runs 20] [--paths 50] [--pattern "ocr/*_output.json"]
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import random
+import time
+from typing import Any, Dict, List, Tuple
+
+from edenai_apis.utils.parsing import PathExtractor, extract
+
+OUTPUTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "apis")
+
+
+def leaf_paths(obj: Any, prefix: Tuple = ()) -> List[Tuple]:
+    """All paths leading to a scalar value of `obj`"""
+    if isinstance(obj, dict):
+        items = obj.items()
+    elif isinstance(obj, list):
+        items = enumerate(obj)
+    else:
+        return [prefix]
+    paths = []
+    for key, value in items:
+        paths.extend(leaf_paths(value, prefix + (key,)))
+    return paths
+
+
+def sample_paths(obj: Any, count: int, rng: random.Random) -> List[Tuple]:
+    """`count` existing paths of `obj` and `count` missing ones"""
+    paths = leaf_paths(obj)
+    found = rng.sample(paths, min(count, len(paths)))
+    missing = [path[:-1] + ("missing_field",) for path in found if path]
+    return found + missing
+
+
+def time_calls(func, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs
+
+
+def benchmark_output(
+    original_response: Any, runs: int, count: int, rng: random.Random
+) -> Dict[str, float]:
+    paths = sample_paths(original_response, count, rng)
+    extractor = PathExtractor({str(index): path for index, path in enumerate(paths)})
+
+    def extract_each():
+        return [extract(original_response, list(path)) for path in paths]
+
+    def extract_batch():
+        return extractor.extract(original_response)
+
+    return {
+        "paths": len(paths),
+        "extract": time_calls(extract_each, runs),
+        "path_extractor": time_calls(extract_batch, runs),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--paths", type=int, default=50)
+    parser.add_argument("--pattern", default="*/*_output.json")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # misses are logged, as in production, but not printed
+    logging.basicConfig(level=logging.WARNING, handlers=[logging.NullHandler()])
+    rng = random.Random(args.seed)
+    totals = {"paths": 0, "extract": 0.0, "path_extractor": 0.0}
+    files = sorted(glob.glob(os.path.join(OUTPUTS_DIR, "*", "outputs", args.pattern)))
+    for path in files:
+        with open(path, "r", encoding="utf-8") as file:
+            output = json.load(file)
+        original_response = output.get("original_response")
+        if not isinstance(original_response, (dict, list)) or not original_response:
+            continue
+        result = benchmark_output(original_response, args.runs, args.paths, rng)
+        for key, value in result.items():
+            totals[key] += value
+
+    print(f"saved outputs: {len(files)}, paths extracted per run: {totals['paths']}")
+    print(f"extract (one call per path): {totals['extract'] * 1000:.2f}ms")
+    print(f"PathExtractor (one traversal): {totals['path_extractor'] * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
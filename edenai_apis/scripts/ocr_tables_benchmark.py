@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark the word-to-cell assignment of Microsoft `ocr_tables_async`
+(`microsoft_helpers.WordGrid`) against a scan of every word of the page per cell.
+
+The saved output (`apis/microsoft/outputs/ocr/ocr_tables_async_output.json`) only
+has one page, so a multi-page document is built from it: the page is repeated
+`--pages` times, and its words and tables are tiled `--tile` x `--tile` times on
+each page to reproduce dense pages (eg: financial statements).
+
+Usage: python -m edenai_apis.scripts.ocr_tables_benchmark [--pages 10] [--tile 4] [--runs 5]
+"""
+import argparse
+import json
+import os
+import time
+from copy import deepcopy
+from statistics import mean
+from typing import Dict, List
+
+from edenai_apis.apis.microsoft.microsoft_helpers import (
+    WordGrid,
+    _is_word_in_bounding_box,
+    microsoft_ocr_tables_standardize_response,
+)
+
+OUTPUT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    "apis",
+    "microsoft",
+    "outputs",
+    "ocr",
+    "ocr_tables_async_output.json",
+)
+
+
+def tile_polygon(polygon: List[float], col: int, row: int, tile: int, page: dict):
+    """Scale `polygon` down to one tile of the page and move it to tile (col, row)"""
+    offsets = (col * page["width"] / tile, row * page["height"] / tile)
+    return [value / tile + offsets[index % 2] for index, value in enumerate(polygon)]
+
+
+def tile_region(region: dict, col: int, row: int, tile: int, page: dict) -> dict:
+    return {**region, "polygon": tile_polygon(region["polygon"], col, row, tile, page)}
+
+
+def build_document(analyze_result: dict, pages: int, tile: int) -> dict:
+    """Multi-page `analyzeResult` made of dense copies of the saved first page"""
+    page = analyze_result["pages"][0]
+    tables = [
+        table
+        for table in analyze_result.get("tables", [])
+        if table["boundingRegions"][0]["pageNumber"] == 1
+    ]
+    document = {"pages": [], "tables": []}
+    for page_number in range(1, pages + 1):
+        words = []
+        for col in range(tile):
+            for row in range(tile):
+                words.extend(
+                    {
+                        **word,
+                        "polygon": tile_polygon(word["polygon"], col, row, tile, page),
+                    }
+                    for word in page["words"]
+                )
+                for table in tables:
+                    table = deepcopy(table)
+                    table["boundingRegions"] = [
+                        {
+                            **tile_region(region, col, row, tile, page),
+                            "pageNumber": page_number,
+                        }
+                        for region in table["boundingRegions"]
+                    ]
+                    for cell in table["cells"]:
+                        cell["boundingRegions"] = [
+                            {
+                                **tile_region(region, col, row, tile, page),
+                                "pageNumber": page_number,
+                            }
+                            for region in cell["boundingRegions"]
+                        ]
+                    document["tables"].append(table)
+        document["pages"].append({**page, "pageNumber": page_number, "words": words})
+    return document
+
+
+def scan_confidences(document: dict) -> List[float]:
+    """Confidence of every cell, comparing each cell to all the words of its page"""
+    confidences = []
+    for table in document["tables"]:
+        words = document["pages"][table["boundingRegions"][0]["pageNumber"] - 1][
+            "words"
+        ]
+        for cell in table["cells"]:
+            box = cell["boundingRegions"][0]["polygon"]
+            cell_words = [
+                word for word in words if _is_word_in_bounding_box(word["polygon"], box)
+            ]
+            confidences.append(
+                mean(word["confidence"] for word in cell_words) if cell_words else 1.0
+            )
+    return confidences
+
+
+def grid_confidences(document: dict) -> List[float]:
+    """Confidence of every cell, using one `WordGrid` per page"""
+    grids: Dict[int, WordGrid] = {}
+    confidences = []
+    for table in document["tables"]:
+        page_index = table["boundingRegions"][0]["pageNumber"] - 1
+        if page_index not in grids:
+            grids[page_index] = WordGrid(document["pages"][page_index]["words"])
+        for cell in table["cells"]:
+            cell_words = grids[page_index].words_in_bounding_box(
+                cell["boundingRegions"][0]["polygon"]
+            )
+            confidences.append(
+                mean(word["confidence"] for word in cell_words) if cell_words else 1.0
+            )
+    return confidences
+
+
+def time_calls(func, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--tile", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(OUTPUT_PATH, "r", encoding="utf-8") as file:
+        analyze_result = json.load(file)["original_response"]["analyzeResult"]
+    document = build_document(analyze_result, args.pages, args.tile)
+    assert scan_confidences(document) == grid_confidences(document)
+
+    words = sum(len(page["words"]) for page in document["pages"])
+    cells = sum(len(table["cells"]) for table in document["tables"])
+    print(f"pages: {args.pages}, words: {words}, table cells: {cells}")
+    scan = time_calls(lambda: scan_confidences(document), args.runs)
+    grid = time_calls(lambda: grid_confidences(document), args.runs)
+    standardize = time_calls(
+        lambda: microsoft_ocr_tables_standardize_response(document), args.runs
+    )
+    print(f"scan of the page words per cell: {scan * 1000:.2f}ms")
+    print(f"WordGrid per page: {grid * 1000:.2f}ms")
+    print(f"microsoft_ocr_tables_standardize_response: {standardize * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
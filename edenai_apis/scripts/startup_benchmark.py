@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Measure `import edenai_apis` cold start: import time, peak RSS and provider
+packages loaded at import. Each run is done in a fresh interpreter.
+
+Usage: python -m edenai_apis.scripts.startup_benchmark [--runs 5] [--max-seconds 3] [--max-rss-mb 300]
+Exits with a non zero status if one of the given limits is exceeded.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+MEASURE_SCRIPT = """
+import json, resource, sys, time
+start = time.perf_counter()
+import edenai_apis
+duration = time.perf_counter() - start
+print(json.dumps({
+    "seconds": duration,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "providers": sorted(
+        {name.split(".")[2] for name in sys.modules if name.startswith("edenai_apis.apis.")}
+    ),
+}))
+"""
+
+
+def measure_startup() -> Dict:
+    """Import edenai_apis in a new interpreter and return its measures"""
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=None)
+    parser.add_argument("--max-rss-mb", type=float, default=None)
+    args = parser.parse_args()
+
+    measures = [measure_startup() for _ in range(args.runs)]
+    seconds = statistics.median(measure["seconds"] for measure in measures)
+    rss_mb = max(measure["rss_mb"] for measure in measures)
+    providers = measures[-1]["providers"]
+
+    print(f"import time (median of {args.runs}): {seconds:.3f}s")
+    print(f"peak rss: {rss_mb:.1f}MB")
+    print(f"providers imported at startup: {providers or 'none'}")
+
+    failed = False
+    if args.max_seconds is not None and seconds > args.max_seconds:
+        print(f"import time exceeds {args.max_seconds}s")
+        failed = True
+    if args.max_rss_mb is not None and rss_mb > args.max_rss_mb:
+        print(f"peak rss exceeds {args.max_rss_mb}MB")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import threading
+import time
+from urllib.parse import parse_qs
+
+import pytest
+import responses
+from pytest_mock import MockerFixture
+
+from edenai_apis.apis.deepl.deepl_api import DeeplApi
+from edenai_apis.features.translation.automatic_translation_batch.helpers import (
+    BatchLimits,
+    pack_texts,
+    translate_in_batches,
+    utf8_size,
+)
+from edenai_apis.utils.exception import ProviderException
+
+
+def upper_pack(pack):
+    return [text.upper() for text in pack], {"texts": pack}
+
+
+def test_pack_texts_limits():
+    packs, too_big = pack_texts(
+        ["aaa", "bb", "c", "dddd", "eeeeee", "f"], BatchLimits(max_items=2, max_size=5)
+    )
+
+    assert packs == [["aaa", "bb"], ["c", "dddd"], ["f"]]
+    assert too_big == ["eeeeee"]
+
+
+def test_pack_texts_byte_size():
+    packs, too_big = pack_texts(
+        ["ééé", "abc"], BatchLimits(max_items=10, max_size=6, text_size=utf8_size)
+    )
+
+    assert packs == [["ééé"], ["abc"]]
+    assert too_big == []
+
+
+def test_results_in_input_order():
+    texts = [f"text {index}" for index in range(25)] + ["text 3", ""]
+
+    result, responses_ = translate_in_batches(
+        texts, upper_pack, BatchLimits(max_items=10, max_size=1000)
+    )
+
+    assert [item.text for item in result.items] == [text.upper() for text in texts]
+    assert all(item.status == "success" for item in result.items)
+    # duplicates and empty texts are not sent
+    assert [len(response["texts"]) for response in responses_] == [10, 10, 5]
+
+
+def test_packs_are_sent_concurrently():
+    running = []
+    lock = threading.Lock()
+
+    def slow_pack(pack):
+        with lock:
+            running.append(len(running))
+        time.sleep(0.1)
+        return upper_pack(pack)
+
+    start = time.monotonic()
+    translate_in_batches(
+        [str(index) for index in range(4)],
+        slow_pack,
+        BatchLimits(max_items=1, max_size=100),
+    )
+
+    assert time.monotonic() - start < 0.35
+
+
+def test_partial_failures():
+    def failing_pack(pack):
+        if "bad" in pack:
+            raise ProviderException("Unsupported text", code=400)
+        return upper_pack(pack)
+
+    result, _ = translate_in_batches(
+        ["good", "bad", "x" * 20, "fine"],
+        failing_pack,
+        BatchLimits(max_items=1, max_size=10),
+    )
+
+    assert [item.status for item in result.items] == [
+        "success",
+        "fail",
+        "fail",
+        "success",
+    ]
+    assert result.items[1].error == "Unsupported text"
+    assert result.items[1].text is None
+    assert "limit of 10" in result.items[2].error
+    assert result.items[3].text == "FINE"
+
+
+def test_all_failed_raises():
+    def failing_pack(pack):
+        raise ProviderException("Invalid api key", code=403)
+
+    with pytest.raises(ProviderException) as exc:
+        translate_in_batches(
+            ["a", "b"], failing_pack, BatchLimits(max_items=1, max_size=10)
+        )
+    assert exc.value.code == 403
+
+
+def test_wrong_number_of_translations():
+    result, _ = translate_in_batches(
+        ["a", "b", "c"],
+        lambda pack: (["A"], None) if len(pack) > 1 else upper_pack(pack),
+        BatchLimits(max_items=2, max_size=10),
+    )
+
+    assert [item.status for item in result.items] == ["fail", "fail", "success"]
+
+
+@responses.activate
+def test_deepl_batch(mocker: MockerFixture):
+    mocker.patch(
+        "edenai_apis.apis.deepl.deepl_api.load_provider",
+        return_value={"api_key": "key"},
+    )
+
+    def translate(request):
+        texts = parse_qs(request.body)["text"]
+        return (
+            200,
+            {},
+            '{"translations": [%s]}'
+            % ", ".join(f'{{"text": "{text.upper()}"}}' for text in texts),
+        )
+
+    responses.add_callback(
+        responses.POST, "https://api.deepl.com/v2/translate", callback=translate
+    )
+    texts = [f"text {index}" for index in range(120)]
+
+    result = DeeplApi().translation__automatic_translation_batch("en", "fr", texts)
+
+    assert len(responses.calls) == 3
+    assert [item.text for item in result.standardized_response.items] == [
+        text.upper() for text in texts
+    ]
+    assert len(result.original_response) == 3
@@ -0,0 +1,91 @@
+import pytest
+
+from edenai_apis.features import ProviderInterface
+from edenai_apis.loaders.capabilities import (
+    CapabilityRegistry,
+    detect_class_capabilities,
+    get_capability_registry,
+    invalidate_capability_registry,
+)
+
+
+class FakeApi(ProviderInterface):
+    provider_name = "fake"
+
+    def text__sentiment_analysis(self):
+        pass
+
+    async def atext__sentiment_analysis(self):
+        pass
+
+    def ocr__ocr_async__launch_job(self):
+        pass
+
+    def ocr__ocr_async__get_job_result(self):
+        pass
+
+    def image__search__upload_image(self):
+        pass
+
+    def image__search__launch_similarity(self):
+        pass
+
+
+@pytest.fixture
+def registry():
+    return CapabilityRegistry.from_provider_classes([FakeApi])
+
+
+def test_detect_class_capabilities():
+    assert detect_class_capabilities(FakeApi) == [
+        ("fake", "image", "search", "launch_similarity"),
+        ("fake", "image", "search", "upload_image"),
+        ("fake", "ocr", "ocr_async"),
+        ("fake", "text", "sentiment_analysis"),
+    ]
+
+
+class TestCapabilityRegistry:
+    def test_has(self, registry: CapabilityRegistry):
+        assert registry.has("fake", "text", "sentiment_analysis")
+        assert registry.has("fake", "ocr", "ocr_async")
+        assert registry.has("fake", "image", "search")
+        assert registry.has("fake", "image", "search", "upload_image")
+        assert not registry.has("fake", "image", "search", "delete_image")
+        assert not registry.has("fake", "text", "keyword_extraction")
+        assert not registry.has("other", "text", "sentiment_analysis")
+
+    def test_providers_for(self, registry: CapabilityRegistry):
+        assert registry.providers_for("text") == {"fake"}
+        assert registry.providers_for("text", "sentiment_analysis") == {"fake"}
+        assert registry.providers_for(subfeature="ocr_async") == {"fake"}
+        assert registry.providers_for("audio") == frozenset()
+
+    def test_as_dict(self, registry: CapabilityRegistry):
+        assert registry.to_dict() == {
+            "fake": {
+                "image": {"search": {"launch_similarity": True, "upload_image": True}},
+                "ocr": {"ocr_async": True},
+                "text": {"sentiment_analysis": True},
+            }
+        }
+        with pytest.raises(TypeError):
+            registry.as_dict()["fake"] = {}
+        assert registry.to_dict("other") == {}
+
+    def test_features_filters(self, registry: CapabilityRegistry):
+        assert registry.features(feature="ocr") == [("fake", "ocr", "ocr_async")]
+        assert registry.features(provider_name="other") == []
+
+    def test_snapshot_roundtrip(self, registry: CapabilityRegistry, tmp_path):
+        path = str(tmp_path / "capabilities.json")
+        registry.save_snapshot(path)
+        loaded = CapabilityRegistry.from_snapshot(path)
+        assert loaded.capabilities == registry.capabilities
+
+
+def test_invalidate_capability_registry():
+    registry = get_capability_registry()
+    assert get_capability_registry() is registry
+    invalidate_capability_registry()
+    assert get_capability_registry() is not registry
@@ -11,6 +11,7 @@ from edenai_apis.loaders.data_loader import (
     load_info_file,
     load_key,
     load_output,
+    load_provider_names,
     load_provider_subfeature_info,
     load_samples,
     load_subfeature,
@@ -76,6 +77,20 @@ class TestLoadClass:
         assert len_klass == nb_providers
 
 
+class TestLoadProviderNames:
+    def test_manifest_lists_all_provider_packages(self):
+        apis_path = os.path.join(os.path.dirname(__file__), "..", "..", "apis")
+        provider_packages = sorted(
+            name
+            for name in os.listdir(apis_path)
+            if os.path.isfile(os.path.join(apis_path, name, "__init__.py"))
+        )
+        assert load_provider_names() == provider_packages
+
+    def test_provider_names_match_classes(self):
+        assert load_provider_names() == [klass.provider_name for klass in load_class()]
+
+
 class TestLoadDataclass:
     @pytest.mark.parametrize(
         ("feature", "subfeature", "phase"), _get_feature_subfeature_phase()
@@ -111,6 +126,20 @@ class TestLoadProviderSubfeatureInfo:
         assert info.get("version")
 
 
+    def test_info_is_shared_and_read_only(self):
+        info = load_provider_subfeature_info("amazon", "text", "sentiment_analysis")
+
+        assert info is load_provider_subfeature_info(
+            "amazon", "text", "sentiment_analysis"
+        )
+        assert isinstance(info["constraints"]["languages"], tuple)
+        with pytest.raises(TypeError):
+            info["version"] = "v0"
+        editable_info = info.copy()
+        editable_info["version"] = "v0"
+        assert info.get("version") != "v0"
+
+
 class TestLoadOutput:
     @pytest.mark.parametrize(
         ("provider", "feature", "subfeature", "phase"),
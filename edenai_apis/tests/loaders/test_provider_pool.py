@@ -0,0 +1,86 @@
+import threading
+import time
+
+from edenai_apis.loaders.provider_pool import ProviderPool, fingerprint_api_keys
+
+
+class FakeProvider:
+    poolable = True
+
+    def __init__(self, provider_name, api_keys):
+        self.provider_name = provider_name
+        self.api_keys = api_keys
+
+
+class TestProviderPool:
+    def test_reuse_instance_for_same_keys(self):
+        pool = ProviderPool(max_size=4, ttl=0, factory=FakeProvider)
+        first = pool.get("openai", {"api_key": "a"})
+        second = pool.get("openai", {"api_key": "a"})
+        assert first is second
+        assert len(pool) == 1
+
+    def test_different_keys_build_different_instances(self):
+        pool = ProviderPool(max_size=4, ttl=0, factory=FakeProvider)
+        default = pool.get("openai")
+        custom = pool.get("openai", {"api_key": "b"})
+        assert default is not custom
+        assert custom.api_keys == {"api_key": "b"}
+
+    def test_lru_eviction(self):
+        pool = ProviderPool(max_size=2, ttl=0, factory=FakeProvider)
+        first = pool.get("amazon")
+        pool.get("google")
+        pool.get("amazon")  # amazon is now the most recently used
+        pool.get("openai")
+        assert len(pool) == 2
+        assert pool.get("amazon") is first
+
+    def test_ttl_expiry(self):
+        pool = ProviderPool(max_size=2, ttl=0.01, factory=FakeProvider)
+        first = pool.get("amazon")
+        time.sleep(0.02)
+        assert pool.get("amazon") is not first
+
+    def test_invalidate(self):
+        pool = ProviderPool(max_size=4, ttl=0, factory=FakeProvider)
+        pool.get("amazon")
+        pool.get("amazon", {"key": "1"})
+        pool.get("google")
+        assert pool.invalidate("amazon", {"key": "1"}) == 1
+        assert pool.invalidate("amazon") == 1
+        assert pool.invalidate() == 1
+        assert len(pool) == 0
+
+    def test_disabled_pool(self):
+        pool = ProviderPool(max_size=0, factory=FakeProvider)
+        assert pool.get("amazon") is not pool.get("amazon")
+        assert len(pool) == 0
+
+    def test_stateful_provider_is_not_pooled(self):
+        class StatefulProvider(FakeProvider):
+            poolable = False
+
+        pool = ProviderPool(max_size=4, ttl=0, factory=StatefulProvider)
+        assert pool.get("symbl") is not pool.get("symbl")
+        assert len(pool) == 0
+
+    def test_concurrent_get_returns_single_instance(self):
+        pool = ProviderPool(max_size=4, ttl=0, factory=FakeProvider)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(pool.get("amazon")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(instance) for instance in results}) == 1
+
+
+def test_fingerprint_api_keys_is_order_independent():
+    assert fingerprint_api_keys({"a": 1, "b": 2}) == fingerprint_api_keys(
+        {"b": 2, "a": 1}
+    )
+    assert fingerprint_api_keys({}) == ""
@@ -1,20 +1,30 @@
 """
-    Test interface functions :
-    - compute_output
-    - list_features
-    - list_providers
-    - check_provider_constraints
+Test interface functions :
+- compute_output
+- compute_output_async
+- list_features
+- list_providers
+- check_provider_constraints
 """
 
+import asyncio
+import threading
+import time
+
 import pytest
 from pytest_mock import MockerFixture
 
 from edenai_apis.interface import (
     check_provider_constraints,
     compute_output,
+    compute_output_async,
+    compute_output_many,
+    get_async_job_result_async,
     list_features,
     list_providers,
 )
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.types import ResponseType, lazy_original_response
 from edenai_apis.tests.conftest import global_features, only_async
 
 VALID_PROVIDER = "amazon"
@@ -60,6 +70,251 @@ class TestGetAsyncJobResult:
         assert final_result["status"] == "success"
 
 
+class AsyncFakeApi:
+    def text__chat(self, **kwargs):
+        return ResponseType[dict](
+            original_response=threading.current_thread().name,
+            standardized_response={},
+        )
+
+    async def atext__chat(self, **kwargs):
+        return ResponseType[dict](original_response="native", standardized_response={})
+
+    def text__embeddings(self, **kwargs):
+        return ResponseType[dict](
+            original_response=threading.current_thread().name,
+            standardized_response={},
+        )
+
+    def text__moderation(self, **kwargs):
+        raise ProviderException("provider error", code=400)
+
+
+class TestComputeOutputAsync:
+    @pytest.fixture(autouse=True)
+    def fake_provider(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface.validate_all_provider_constraints",
+            side_effect=lambda *args: args[-1],
+        )
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance",
+            return_value=AsyncFakeApi(),
+        )
+
+    def test_native_async_method_is_awaited(self):
+        result = asyncio.run(compute_output_async("openai", "text", "chat", {}))
+        assert result["status"] == "success"
+        assert result["original_response"] == "native"
+
+    def test_fallback_to_provider_executor(self):
+        result = asyncio.run(compute_output_async("openai", "text", "embeddings", {}))
+        assert result["original_response"].startswith("edenai-provider")
+
+    def test_provider_error(self):
+        with pytest.raises(ProviderException):
+            asyncio.run(compute_output_async("openai", "text", "moderation", {}))
+
+    def test_concurrent_calls(self):
+        async def run_all():
+            return await asyncio.gather(
+                *(
+                    compute_output_async("openai", "text", "embeddings", {})
+                    for _ in range(10)
+                )
+            )
+
+        results = asyncio.run(run_all())
+        assert all(result["status"] == "success" for result in results)
+
+    def test_output_fake(self, mocker: MockerFixture):
+        mocker.patch("edenai_apis.interface.asyncio.sleep")
+        result = asyncio.run(
+            compute_output_async("openai", "text", "chat", {}, fake=True)
+        )
+        assert result["provider"] == "openai"
+        assert result["status"] == "success"
+
+    def test_get_async_job_result_fake(self, mocker: MockerFixture):
+        mocker.patch("edenai_apis.interface.asyncio.sleep")
+        result = asyncio.run(
+            get_async_job_result_async(
+                "amazon", "audio", "speech_to_text_async", "job_id", fake=True
+            )
+        )
+        assert result["provider_job_id"] == "job_id"
+
+
+class LazyFakeApi:
+    def __init__(self):
+        self.conversions = 0
+
+    def _convert(self):
+        self.conversions += 1
+        return {"raw": "response"}
+
+    def text__chat(self, **kwargs):
+        return ResponseType[dict](
+            original_response=lazy_original_response(self._convert),
+            standardized_response={"text": "hi"},
+        )
+
+    async def atext__chat(self, **kwargs):
+        return self.text__chat(**kwargs)
+
+
+class TestIncludeOriginalResponse:
+    @pytest.fixture(autouse=True)
+    def fake_provider(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface.validate_all_provider_constraints",
+            side_effect=lambda *args: args[-1],
+        )
+        self.api = LazyFakeApi()
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=self.api
+        )
+
+    def test_original_response_is_built_when_included(self):
+        result = compute_output("openai", "text", "chat", {})
+        assert result["original_response"] == {"raw": "response"}
+        assert self.api.conversions == 1
+
+    def test_original_response_is_built_on_access(self):
+        response = self.api.text__chat()
+        assert self.api.conversions == 0
+
+        assert response.original_response["raw"] == "response"
+        assert response.model_dump()["original_response"] == {"raw": "response"}
+        assert self.api.conversions == 1
+
+    def test_original_response_is_skipped(self):
+        result = compute_output(
+            "openai", "text", "chat", {}, include_original_response=False
+        )
+        assert result["original_response"] is None
+        assert result["standardized_response"] == {"text": "hi"}
+        assert self.api.conversions == 0
+
+    def test_original_response_is_skipped_async(self):
+        result = asyncio.run(
+            compute_output_async(
+                "openai", "text", "chat", {}, include_original_response=False
+            )
+        )
+        assert result["original_response"] is None
+        assert self.api.conversions == 0
+
+    def test_fake_original_response_is_skipped(self, mocker: MockerFixture):
+        mocker.patch("edenai_apis.interface.time.sleep")
+        result = compute_output(
+            "openai", "text", "chat", {}, fake=True, include_original_response=False
+        )
+        assert result["original_response"] is None
+
+
+PROVIDER_DELAYS = {"fast": 0.05, "slow": 0.5, "failing": 0.01}
+
+
+def fake_provider_call(provider_name, feature, subfeature, args, **kwargs):
+    time.sleep(PROVIDER_DELAYS[provider_name])
+    if provider_name == "failing":
+        raise ProviderException("provider error", code=500)
+    return {"status": "success", "provider": provider_name, "args": args}
+
+
+class TestComputeOutputMany:
+    @pytest.fixture(autouse=True)
+    def fake_provider(self, mocker: MockerFixture):
+        self.validate = mocker.patch(
+            "edenai_apis.interface.validate_all_provider_constraints",
+            side_effect=lambda *args: {**args[-1], "validated": True},
+        )
+        mocker.patch(
+            "edenai_apis.interface._monitored_compute_validated_output",
+            side_effect=fake_provider_call,
+        )
+
+    def test_all_results(self):
+        start = time.perf_counter()
+        reports = compute_output_many(
+            [
+                ("slow", "text", "chat", {"text": "hello"}),
+                {
+                    "provider_name": "fast",
+                    "feature": "text",
+                    "subfeature": "chat",
+                    "args": {"text": "hello"},
+                },
+                ("failing", "text", "chat", {"text": "hello"}),
+                ("slow", "text", "chat", {"text": "hello"}),
+            ]
+        )
+        # run concurrently, as long as the slowest provider
+        assert time.perf_counter() - start < 2 * PROVIDER_DELAYS["slow"]
+        assert [report["provider"] for report in reports] == [
+            "slow",
+            "fast",
+            "failing",
+            "slow",
+        ]
+        assert [report["status"] for report in reports] == [
+            "success",
+            "success",
+            "fail",
+            "success",
+        ]
+        assert reports[0]["result"]["args"] == {"text": "hello", "validated": True}
+        assert reports[0]["latency"] >= PROVIDER_DELAYS["slow"]
+        assert reports[2]["error"] == "provider error"
+        assert self.validate.call_count == 4
+
+    def test_first_success(self):
+        reports = compute_output_many(
+            [
+                ("slow", "text", "chat", {}),
+                ("failing", "text", "chat", {}),
+                ("fast", "text", "chat", {}),
+            ],
+            mode="first_success",
+        )
+        assert [report["status"] for report in reports] == [
+            "cancelled",
+            "fail",
+            "success",
+        ]
+
+    def test_quorum(self):
+        reports = compute_output_many(
+            [("fast", "text", "chat", {}), ("fast", "text", "chat", {})]
+            + [("slow", "text", "chat", {})],
+            mode="quorum",
+        )
+        assert [report["status"] for report in reports] == [
+            "success",
+            "success",
+            "cancelled",
+        ]
+
+    def test_invalid_request_is_not_run(self):
+        self.validate.side_effect = ProviderException("invalid language")
+        reports = compute_output_many([("fast", "text", "chat", {})])
+        assert reports[0]["status"] == "fail"
+        assert reports[0]["error"] == "invalid language"
+        assert reports[0]["latency"] is None
+
+    def test_timeout(self):
+        reports = compute_output_many(
+            [("fast", "text", "chat", {}), ("slow", "text", "chat", {})],
+            timeout=PROVIDER_DELAYS["slow"] / 2,
+        )
+        assert [report["status"] for report in reports] == ["success", "cancelled"]
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            compute_output_many([], mode="fastest")
+
+
 def test_list_features():
     # with a list as return
     method_list = list_features()
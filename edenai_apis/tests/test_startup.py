@@ -0,0 +1,10 @@
+"""
+    Test package cold start: importing edenai_apis must not import provider packages
+"""
+
+from edenai_apis.scripts.startup_benchmark import measure_startup
+
+
+def test_import_does_not_load_providers():
+    measure = measure_startup()
+    assert measure["providers"] == []
@@ -0,0 +1,224 @@
+import asyncio
+import threading
+
+import pytest
+
+from edenai_apis.utils.async_to_sync import (
+    PollingCancelled,
+    PollingPolicy,
+    PollingTimeout,
+    fibonacci_waiting_call,
+    poll_until,
+    poll_until_async,
+    polling_metrics,
+    reset_polling_metrics,
+)
+from edenai_apis.utils.exception import ProviderException
+
+FAST_POLICY = PollingPolicy(initial_delay=0.001, max_delay=0.005, jitter=0)
+
+
+class FakeJob:
+    """Status call of a job done after `polls_to_done` calls"""
+
+    def __init__(self, polls_to_done: int, eta: float = None) -> None:
+        self.polls_to_done = polls_to_done
+        self.eta = eta
+        self.calls = 0
+
+    def __call__(self) -> dict:
+        self.calls += 1
+        status = "done" if self.calls >= self.polls_to_done else "running"
+        return {"status": status, "eta": self.eta}
+
+
+def is_done(response: dict) -> bool:
+    return response["status"] == "done"
+
+
+@pytest.fixture(autouse=True)
+def clear_metrics():
+    reset_polling_metrics()
+    yield
+    reset_polling_metrics()
+
+
+@pytest.fixture
+def sleeps(mocker):
+    """Delays waited by `poll_until`, without waiting them"""
+    sleep = mocker.patch("edenai_apis.utils.async_to_sync.time.sleep")
+    return lambda: [call.args[0] for call in sleep.call_args_list]
+
+
+def test_polls_until_done():
+    job = FakeJob(4)
+
+    response = poll_until(job, is_done, FAST_POLICY, name="test")
+
+    assert response["status"] == "done"
+    assert job.calls == 4
+    metrics = polling_metrics()["test"]
+    assert metrics["jobs"] == 1
+    assert metrics["polls"] == 4
+    assert metrics["wasted_wait"] == pytest.approx(0.001 * 1.5**2)
+
+
+def test_first_response_is_checked_before_polling(sleeps):
+    job = FakeJob(1)
+
+    response = poll_until(job, is_done, first_response={"status": "done"})
+
+    assert response == {"status": "done"}
+    assert job.calls == 0
+    assert sleeps() == []
+
+
+def test_exponential_backoff(sleeps):
+    policy = PollingPolicy(initial_delay=1, max_delay=4, factor=2, jitter=0)
+
+    poll_until(FakeJob(6), is_done, policy)
+
+    assert sleeps() == [1, 2, 4, 4, 4]
+
+
+def test_jitter_shortens_delays():
+    policy = PollingPolicy(initial_delay=1, max_delay=1, jitter=0.5)
+    delays = policy.delays()
+
+    assert all(0.5 <= next(delays) <= 1 for _ in range(100))
+
+
+def test_first_delay(sleeps):
+    poll_until(FakeJob(1), is_done, FAST_POLICY.with_options(first_delay=2))
+
+    assert sleeps() == [2]
+
+
+def test_provider_hint_replaces_backoff(sleeps):
+    policy = PollingPolicy(initial_delay=1, max_delay=4, factor=2, jitter=0)
+
+    poll_until(
+        FakeJob(3, eta=7), is_done, policy, retry_after=lambda response: response["eta"]
+    )
+    poll_until(
+        FakeJob(2, eta=0), is_done, policy, retry_after=lambda response: response["eta"]
+    )
+
+    # a hint of 0 second is not polled immediately
+    assert sleeps() == [7, 7, 1]
+
+
+def test_timeout():
+    job = FakeJob(10**6)
+    policy = FAST_POLICY.with_options(timeout=0.05)
+
+    with pytest.raises(PollingTimeout) as exc_info:
+        poll_until(job, is_done, policy, name="test")
+
+    assert exc_info.value.code == 504
+    assert polling_metrics()["test"]["timeouts"] == 1
+    assert polling_metrics()["test"]["waited"] == pytest.approx(0.05, abs=0.02)
+
+
+def test_last_wait_is_shortened_to_deadline(mocker):
+    clock = [0.0]
+    mocker.patch(
+        "edenai_apis.utils.async_to_sync.time.monotonic", side_effect=lambda: clock[0]
+    )
+    sleep = mocker.patch(
+        "edenai_apis.utils.async_to_sync.time.sleep",
+        side_effect=lambda delay: clock.__setitem__(0, clock[0] + delay),
+    )
+    job = FakeJob(10)
+    policy = PollingPolicy(initial_delay=4, factor=2, jitter=0, timeout=10)
+
+    with pytest.raises(PollingTimeout):
+        poll_until(job, is_done, policy)
+
+    assert [call.args[0] for call in sleep.call_args_list] == [4, 6]
+    assert job.calls == 3
+
+
+def test_failed_job_stops_polling():
+    job = FakeJob(10)
+
+    def fail_on_second_poll(response: dict) -> bool:
+        if job.calls == 2:
+            raise ProviderException("job failed")
+        return False
+
+    with pytest.raises(ProviderException, match="job failed"):
+        poll_until(job, fail_on_second_poll, FAST_POLICY)
+    assert job.calls == 2
+
+
+def test_cancel():
+    cancel = threading.Event()
+    policy = PollingPolicy(initial_delay=10, jitter=0)
+    threading.Timer(0.05, cancel.set).start()
+
+    with pytest.raises(PollingCancelled):
+        poll_until(FakeJob(10), is_done, policy, cancel=cancel, name="test")
+
+    assert polling_metrics()["test"]["cancelled"] == 1
+
+
+def test_async_polling():
+    job = FakeJob(3)
+
+    async def get_status():
+        await asyncio.sleep(0)
+        return job()
+
+    response = asyncio.run(poll_until_async(get_status, is_done, FAST_POLICY))
+
+    assert response["status"] == "done"
+    assert job.calls == 3
+
+
+def test_async_polling_of_sync_function():
+    job = FakeJob(2)
+
+    response = asyncio.run(poll_until_async(job, is_done, FAST_POLICY, name="test"))
+
+    assert response["status"] == "done"
+    assert polling_metrics()["test"]["polls"] == 2
+
+
+def test_async_cancel():
+    policy = PollingPolicy(initial_delay=10, jitter=0)
+
+    async def cancelled_polling():
+        cancel = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.05, cancel.set)
+        await poll_until_async(FakeJob(10), is_done, policy, cancel=cancel)
+
+    with pytest.raises(PollingCancelled):
+        asyncio.run(cancelled_polling())
+
+
+def test_async_task_cancellation():
+    policy = PollingPolicy(initial_delay=10, jitter=0)
+
+    async def cancel_task():
+        task = asyncio.ensure_future(
+            poll_until_async(FakeJob(10), is_done, policy, name="test")
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_task())
+
+    assert polling_metrics()["test"]["cancelled"] == 1
+
+
+def test_fibonacci_waiting_call_returns_last_response_on_timeout():
+    responses = iter([{"JobStatus": "IN_PROGRESS"}] * 100)
+
+    response = fibonacci_waiting_call(
+        max_time=0.05, status="SUCCEEDED", func=lambda: next(responses)
+    )
+
+    assert response == {"JobStatus": "IN_PROGRESS"}
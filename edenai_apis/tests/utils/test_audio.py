@@ -15,6 +15,7 @@ from edenai_apis.utils.audio import (
     audio_format,
     supported_extension,
     get_file_extension,
+    VoiceIndex,
 )
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.files import FileInfo, FileWrapper
@@ -273,3 +274,31 @@ class TestFileWithGoodExtension:
             file_wrapper = FileWrapper(data_path, "", file_info)
             get_file_extension(file_wrapper, accepted_extensions, channels)
         assert str(exc.value) == "File audio must be Mono"
+
+
+class TestVoiceIndex:
+    VOICE_IDS = {
+        "MALE": ("en-US_Guy", "fr-FR_Henri", "en-GB_Ryan"),
+        "FEMALE": ("en-US_Jenny", "fr-FR_Denise"),
+    }
+
+    def test_find_by_language_and_gender(self):
+        index = VoiceIndex(self.VOICE_IDS)
+
+        assert index.find("en", "male") == ["en-US_Guy", "en-GB_Ryan"]
+        assert index.find("fr-FR", "FEMALE") == ["fr-FR_Denise"]
+        assert index.find("en", "") == ["en-US_Guy", "en-GB_Ryan", "en-US_Jenny"]
+        assert index.find("it", "MALE") == []
+
+    def test_find_returns_a_new_list(self):
+        index = VoiceIndex(self.VOICE_IDS)
+
+        index.find("en", "MALE").append("en-US_Other")
+        assert index.find("en", "MALE") == ["en-US_Guy", "en-GB_Ryan"]
+
+    def test_contains(self):
+        index = VoiceIndex(self.VOICE_IDS)
+
+        assert "fr-FR_Henri" in index
+        assert "it-IT_Diego" not in index
+        assert "en-US_Guy" not in VoiceIndex({})
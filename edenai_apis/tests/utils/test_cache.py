@@ -0,0 +1,40 @@
+from edenai_apis.utils.cache import LRUCache
+
+
+class TestLRUCache:
+    def test_least_recently_used_is_evicted(self):
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert len(cache) == 2
+
+    def test_ttl(self, mocker):
+        monotonic = mocker.patch("edenai_apis.utils.cache.time.monotonic")
+        monotonic.return_value = 0
+        cache = LRUCache(max_size=2, ttl=10)
+        cache.set("a", False)
+        monotonic.return_value = 5
+        assert cache.get("a") is False
+        monotonic.return_value = 11
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_disabled(self):
+        cache = LRUCache(max_size=0)
+        cache.set("a", 1)
+        assert cache.get("a", "default") == "default"
+
+    def test_entry_ttl(self, mocker):
+        monotonic = mocker.patch("edenai_apis.utils.cache.time.monotonic")
+        monotonic.return_value = 0
+        cache = LRUCache(max_size=2, ttl=10)
+        cache.set("short", 1, ttl=2)
+        cache.set("forever", 2, ttl=0)
+        monotonic.return_value = 5
+        assert cache.get("short") is None
+        monotonic.return_value = 1000
+        assert cache.get("forever") == 2
@@ -14,7 +14,7 @@ from edenai_apis.utils.constraints import (
 )
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.files import FileInfo, FileWrapper
-from edenai_apis.utils.languages import LanguageErrorMessage
+from edenai_apis.utils.languages import LanguageErrorMessage, LanguageResolution
 
 PROVIDER = "test_provider"
 FEATURE = "test_feature"
@@ -140,11 +140,10 @@ class TestValidateSingleLanguage:
         null_language: bool,
         ret_mock_function: Optional[str],
     ):
-        # Create mock for provide_appropriate_language
+        # Create mock for the provider language index
         mocker.patch(
-            "edenai_apis.utils.constraints.provide_appropriate_language",
-            return_value=ret_mock_function,
-        )
+            "edenai_apis.utils.constraints.get_language_index"
+        ).return_value.resolve.return_value = LanguageResolution(ret_mock_function)
 
         # Action
         output = validate_single_language(
@@ -160,36 +159,31 @@ class TestValidateSingleLanguage:
     @pytest.mark.parametrize(
         (
             "language",
-            "ret_mock_load",
             "expected_raise",
-            "ret_mock_provide",
+            "ret_mock_resolve",
         ),
         [
             [
                 {"key": "language", "value": None},
-                None,
                 LanguageErrorMessage.LANGUAGE_REQUIRED("language"),
                 None,
             ],
             [
                 {"key": "language", "value": "abc"},
-                [],
                 LanguageErrorMessage.LANGUAGE_NOT_SUPPORTED("abc", "language"),
-                None,
+                LanguageResolution(None),
             ],
             [
                 {"key": "language", "value": "fr-FR"},
-                ["fr"],
                 LanguageErrorMessage.LANGUAGE_GENERIQUE_REQUESTED(
                     "fr-FR", "fr", "language"
                 ),
-                None,
+                LanguageResolution(None, suggested_language="fr"),
             ],
             [
                 {"key": "language", "value": "fr_FR_123"},
-                ["fr"],
                 LanguageErrorMessage.LANGUAGE_SYNTAX_ERROR("fr_FR_123"),
-                SyntaxError,
+                SyntaxError("badly formatted"),
             ],
         ],
         ids=[
@@ -203,25 +197,13 @@ class TestValidateSingleLanguage:
         self,
         mocker: MockerFixture,
         language: dict,
-        ret_mock_load: list,
         expected_raise: str,
-        ret_mock_provide,
+        ret_mock_resolve,
     ):
-        # Create mock for provide_appropriate_language and load_standardize_language
-        def fake_provider_appropriate_language(*args, **kwargs):
-            if ret_mock_provide:
-                raise ret_mock_provide
-            return None
-
+        # Create mock for the provider language index
         mocker.patch(
-            "edenai_apis.utils.constraints.provide_appropriate_language",
-            side_effect=fake_provider_appropriate_language,
-        )
-
-        mocker.patch(
-            "edenai_apis.utils.constraints.load_standardized_language",
-            return_value=ret_mock_load,
-        )
+            "edenai_apis.utils.constraints.get_language_index"
+        ).return_value.resolve.side_effect = [ret_mock_resolve]
 
         # Try to except ProviderException with specific error message
         with pytest.raises(ProviderException) as excinfo:
@@ -0,0 +1,131 @@
+import threading
+import time
+
+import pytest
+
+from edenai_apis.utils.credentials import CredentialBroker, credentials_key
+
+CREDENTIALS = {"client_id": "id", "client_secret": "secret"}
+
+
+class FakeFetch:
+    def __init__(self, ttl=None, delay: float = 0) -> None:
+        self.ttl = ttl
+        self.delay = delay
+        self.count = 0
+
+    def __call__(self):
+        time.sleep(self.delay)
+        self.count += 1
+        return f"token-{self.count}", self.ttl
+
+
+@pytest.fixture
+def broker():
+    return CredentialBroker(max_size=8)
+
+
+def test_value_is_fetched_once(broker):
+    fetch = FakeFetch()
+
+    values = [broker.get("provider", dict(CREDENTIALS), fetch) for _ in range(5)]
+
+    assert values == ["token-1"] * 5
+    assert fetch.count == 1
+
+
+def test_credentials_are_cached_separately(broker):
+    fetch = FakeFetch()
+
+    broker.get("provider", CREDENTIALS, fetch)
+    broker.get("provider", {**CREDENTIALS, "client_secret": "other"}, fetch)
+    broker.get("other_provider", CREDENTIALS, fetch)
+
+    assert fetch.count == 3
+
+
+def test_key_does_not_contain_secrets():
+    key = credentials_key("provider", CREDENTIALS)
+
+    assert key[0] == "provider"
+    assert "secret" not in key[1]
+
+
+def test_concurrent_calls_fetch_once(broker):
+    fetch = FakeFetch(delay=0.05)
+    values = []
+
+    threads = [
+        threading.Thread(
+            target=lambda: values.append(broker.get("provider", CREDENTIALS, fetch))
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert values == ["token-1"] * 8
+    assert fetch.count == 1
+
+
+def test_fetch_locks_are_dropped(broker):
+    for index in range(10):
+        broker.get("provider", {"api_key": str(index)}, FakeFetch())
+    broker.invalidate("provider", {"api_key": "0"})
+
+    assert broker._fetch_locks == {}
+
+
+def test_expired_value_is_fetched_again(broker, mocker):
+    monotonic = mocker.patch("edenai_apis.utils.cache.time.monotonic")
+    monotonic.return_value = 0
+    fetch = FakeFetch(ttl=100)
+
+    assert broker.get("provider", CREDENTIALS, fetch) == "token-1"
+    monotonic.return_value = 99
+    assert broker.get("provider", CREDENTIALS, fetch) == "token-1"
+    monotonic.return_value = 101
+    assert broker.get("provider", CREDENTIALS, fetch) == "token-2"
+
+
+def test_value_without_lifetime_is_not_cached(broker):
+    fetch = FakeFetch(ttl=0)
+
+    broker.get("provider", CREDENTIALS, fetch)
+    broker.get("provider", CREDENTIALS, fetch)
+
+    assert fetch.count == 2
+
+
+def test_failed_fetch_is_not_cached(broker):
+    def failing_fetch():
+        raise ValueError("bad credentials")
+
+    with pytest.raises(ValueError):
+        broker.get("provider", CREDENTIALS, failing_fetch)
+
+    assert broker.get("provider", CREDENTIALS, FakeFetch()) == "token-1"
+
+
+def test_invalidate(broker):
+    fetch = FakeFetch()
+    broker.get("provider", CREDENTIALS, fetch)
+
+    broker.invalidate("provider", CREDENTIALS)
+
+    assert broker.get("provider", CREDENTIALS, fetch) == "token-2"
+
+
+def test_invalidate_stale_value_keeps_refreshed_one(broker):
+    fetch = FakeFetch()
+    broker.get("provider", CREDENTIALS, fetch)
+    broker.invalidate("provider", CREDENTIALS, "token-1")
+    broker.get("provider", CREDENTIALS, fetch)
+
+    # a second request rejected with the first token must not drop the new one
+    broker.invalidate("provider", CREDENTIALS, "token-1")
+
+    assert broker.get("provider", CREDENTIALS, fetch) == "token-2"
+    assert fetch.count == 2
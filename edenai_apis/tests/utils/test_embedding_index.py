@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from edenai_apis.utils.cache import LRUCache
+from edenai_apis.utils.embedding_index import (
+    EmbeddingIndex,
+    embed_texts,
+    get_corpus_index,
+)
+from edenai_apis.utils.metrics import MATRIX_METRICS, METRICS
+
+EMBEDDINGS = {
+    "hello": [1.0, 0.5, -0.2],
+    "world": [-0.3, 0.8, 0.1],
+    "foo": [0.2, -0.9, 0.4],
+    "bar": [0.9, 0.4, -0.1],
+}
+
+
+class FakeEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(texts)
+        return [EMBEDDINGS[text] for text in texts], {"texts": texts}
+
+
+class TestEmbedTexts:
+    def test_only_missing_texts_are_embedded(self):
+        embed = FakeEmbedder()
+        cache = LRUCache(100)
+        embeddings, response = embed_texts(
+            "provider", "model", ["hello", "world", "hello"], embed, cache
+        )
+        assert embed.calls == [["hello", "world"]]
+        assert response == {"texts": ["hello", "world"]}
+        np.testing.assert_array_equal(embeddings[0], embeddings[2])
+
+        embeddings, response = embed_texts(
+            "provider", "model", ["world", "foo"], embed, cache
+        )
+        assert embed.calls[-1] == ["foo"]
+        np.testing.assert_array_equal(embeddings[1], EMBEDDINGS["foo"])
+
+        _, response = embed_texts("provider", "model", ["foo"], embed, cache)
+        assert response is None
+        assert len(embed.calls) == 2
+
+    def test_cache_key_includes_model(self):
+        embed = FakeEmbedder()
+        cache = LRUCache(100)
+        embed_texts("provider", "model", ["hello"], embed, cache)
+        embed_texts("provider", "other_model", ["hello"], embed, cache)
+        assert len(embed.calls) == 2
+
+
+@pytest.mark.parametrize("metric", sorted(METRICS))
+def test_matrix_metrics_match_pairwise_metrics(metric):
+    corpus = np.array(list(EMBEDDINGS.values()))
+    query = np.array([0.5, 0.5, 0.5])
+    expected = [METRICS[metric](query, row) for row in corpus]
+    np.testing.assert_allclose(MATRIX_METRICS[metric](query, corpus), expected)
+
+
+class TestEmbeddingIndex:
+    @pytest.fixture
+    def index(self):
+        return EmbeddingIndex(np.array(list(EMBEDDINGS.values())))
+
+    def test_search_sorted_by_score(self, index):
+        results = index.search(EMBEDDINGS["hello"])
+        assert results[0][0] == 0
+        scores = [score for _, score in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_top_k(self, index):
+        assert (
+            index.search(EMBEDDINGS["hello"], top_k=2)
+            == index.search(EMBEDDINGS["hello"])[:2]
+        )
+
+    def test_save_and_load(self, index, tmp_path):
+        path = str(tmp_path / "index.npy")
+        index.save(path)
+        assert EmbeddingIndex.load(path).search(
+            EMBEDDINGS["foo"], "euclidean"
+        ) == index.search(EMBEDDINGS["foo"], "euclidean")
+
+    def test_corpus_index_is_reused(self):
+        embed = FakeEmbedder()
+        texts = ["hello", "world", "bar"]
+        index, response = get_corpus_index("test_reuse", "model", texts, embed)
+        assert response is not None
+        same_index, response = get_corpus_index("test_reuse", "model", texts, embed)
+        assert same_index is index
+        assert response is None
+        assert len(embed.calls) == 1
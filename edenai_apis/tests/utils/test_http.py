@@ -0,0 +1,173 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from edenai_apis.utils.http import (
+    HTTPMethod,
+    async_http_client,
+    close_async_http_sessions,
+    close_http_sessions,
+    get_async_http_session,
+    get_http_session,
+    http_client,
+)
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Answer an error to the first request of each path, then 200:
+    - /flaky: 503
+    - /gateway: 502
+    - /busy: 503 asking to retry in one hour
+    """
+
+    seen_paths = set()
+    ports = []
+    errors = {"/flaky": (503, "0"), "/gateway": (502, "0"), "/busy": (503, "3600")}
+
+    def _answer(self):
+        self.ports.append(self.client_address[1])
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        error = self.errors.get("/" + self.path.split("/")[1])
+        if error and self.path not in self.seen_paths:
+            self.seen_paths.add(self.path)
+            status, retry_after = error
+            self.send_response(status)
+            self.send_header("Retry-After", retry_after)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session_id=secret; Path=/")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _answer
+    do_POST = _answer
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    FlakyHandler.seen_paths = set()
+    FlakyHandler.ports = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    FlakyHandler.protocol_version = "HTTP/1.1"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    close_http_sessions()
+
+
+class TestHttpClient:
+    def test_session_is_shared_per_host(self, server_url):
+        assert get_http_session(f"{server_url}/a") is get_http_session(
+            f"{server_url}/b?c=d"
+        )
+        assert get_http_session(f"{server_url}/a") is not get_http_session(
+            "https://example.com/a"
+        )
+
+    def test_connection_is_kept_alive(self, server_url):
+        for _ in range(3):
+            response = http_client.get(f"{server_url}/ok")
+            assert response.json() == {"ok": True}
+        assert len(set(FlakyHandler.ports)) == 1
+
+    def test_retry_on_unavailable(self, server_url):
+        response = http_client.post(f"{server_url}/flaky", json={"text": "hello"})
+        assert response.status_code == 200
+        assert len(FlakyHandler.ports) == 2
+
+    def test_gateway_error_only_retried_for_idempotent_methods(self, server_url):
+        assert http_client.get(f"{server_url}/gateway/get").status_code == 200
+        response = http_client.post(f"{server_url}/gateway/post", json={"text": "a"})
+        assert response.status_code == 502
+        assert len(FlakyHandler.ports) == 3
+
+    def test_long_retry_after_is_not_waited(self, server_url):
+        response = http_client.get(f"{server_url}/busy")
+        assert response.status_code == 503
+        assert len(FlakyHandler.ports) == 1
+
+    def test_request_with_http_method(self, server_url):
+        response = http_client.request(HTTPMethod.GET, url=f"{server_url}/ok")
+        assert response.status_code == 200
+
+    def test_default_timeout(self, server_url, mocker):
+        send = mocker.spy(HTTPAdapter, "send")
+        http_client.get(f"{server_url}/ok")
+        assert send.call_args.kwargs["timeout"] is not None
+
+    def test_cookies_are_not_kept(self, server_url):
+        http_client.get(f"{server_url}/ok")
+        assert len(get_http_session(server_url).cookies) == 0
+
+
+async def run_and_close(coroutine):
+    try:
+        return await coroutine
+    finally:
+        await close_async_http_sessions()
+
+
+class TestAsyncHttpClient:
+    def test_connection_is_kept_alive(self, server_url):
+        async def get_many():
+            return [await async_http_client.get(f"{server_url}/ok") for _ in range(3)]
+
+        responses = asyncio.run(run_and_close(get_many()))
+        assert [response.json() for response in responses] == [{"ok": True}] * 3
+        assert len(set(FlakyHandler.ports)) == 1
+
+    def test_retry_on_unavailable(self, server_url):
+        response = asyncio.run(
+            run_and_close(
+                async_http_client.post(f"{server_url}/flaky", json={"text": "hello"})
+            )
+        )
+        assert response.status_code == 200
+        assert len(FlakyHandler.ports) == 2
+
+    def test_gateway_error_only_retried_for_idempotent_methods(self, server_url):
+        async def call_gateway():
+            return [
+                await async_http_client.get(f"{server_url}/gateway/get"),
+                await async_http_client.post(f"{server_url}/gateway/post"),
+            ]
+
+        responses = asyncio.run(run_and_close(call_gateway()))
+        assert [response.status_code for response in responses] == [200, 502]
+        assert len(FlakyHandler.ports) == 3
+
+    def test_long_retry_after_is_not_waited(self, server_url):
+        response = asyncio.run(
+            run_and_close(async_http_client.get(f"{server_url}/busy"))
+        )
+        assert response.status_code == 503
+        assert len(FlakyHandler.ports) == 1
+
+    def test_request_with_http_method(self, server_url):
+        response = asyncio.run(
+            run_and_close(
+                async_http_client.request(HTTPMethod.GET, url=f"{server_url}/ok")
+            )
+        )
+        assert response.ok
+        assert response.text == '{"ok": true}'
+
+    def test_cookies_are_not_kept(self, server_url):
+        async def get_cookies():
+            await async_http_client.get(f"{server_url}/ok")
+            return len(get_async_http_session().cookie_jar)
+
+        assert asyncio.run(run_and_close(get_cookies())) == 0
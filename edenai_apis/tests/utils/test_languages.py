@@ -6,6 +6,7 @@
 import pytest
 from pytest_mock import MockerFixture
 
+from edenai_apis.utils import languages
 from edenai_apis.utils.languages import (
     AUTO_DETECT,
     AUTO_DETECT_NAME,
@@ -15,13 +16,23 @@ from edenai_apis.utils.languages import (
     expand_languages_for_user,
     format_language_name,
     get_code_from_language_name,
+    get_language_index,
     get_language_name_from_code,
+    invalidate_language_indexes,
     load_language_constraints,
     load_standardized_language,
     provide_appropriate_language,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_language_indexes():
+    # language indexes are cached by provider, some tests mock their languages
+    invalidate_language_indexes()
+    yield
+    invalidate_language_indexes()
+
+
 class TestCheckLanguageFormat:
     def test_valid_language_code(self):
         assert check_language_format("en") == True, '"en" should be a valid language'
@@ -184,6 +195,27 @@ class TestLoadLanguageConstraints:
         ), f"Expected `{expected_output}` but got `{output}`"
 
 
+    def test_allow_null_language_does_not_mutate_provider_info(
+        self, mocker: MockerFixture
+    ):
+        provider_languages = ("en", "fr")
+        ret_mock_value = {
+            "constraints": {
+                "languages": provider_languages,
+                "allow_null_language": True,
+            }
+        }
+        mocker.patch(
+            "edenai_apis.utils.languages.load_provider", return_value=ret_mock_value
+        )
+        for _ in range(2):
+            output = load_language_constraints(
+                self.PROVIDER, self.FEATUTRE, self.SUBFEATURE
+            )
+            assert output == ["en", "fr", "auto-detect"]
+        assert ret_mock_value["constraints"]["languages"] == ("en", "fr")
+
+
 class TestExpandLanguagesForUser:
     def test_valid_list_languages(self):
         result = expand_languages_for_user(["auto-detect", "en", "fra", "it-IT"])
@@ -491,3 +523,30 @@ class TestProvideAppropriateLanguage:
             provide_appropriate_language(
                 iso_code, self.PROVIDER, self.FEATURE, self.SUBFEATURE
             )
+
+    def test_resolutions_are_memoized(self, mocker: MockerFixture):
+        load = mocker.patch(
+            "edenai_apis.utils.languages.load_language_constraints",
+            return_value=["en-US", "fr", "es"],
+        )
+        match = mocker.spy(languages, "closest_supported_match")
+        for _ in range(3):
+            assert (
+                provide_appropriate_language(
+                    "en", self.PROVIDER, self.FEATURE, self.SUBFEATURE
+                )
+                == "en-US"
+            )
+        assert load.call_count == 1
+        assert match.call_count == 1
+
+    def test_generic_language_suggestion(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.utils.languages.load_language_constraints",
+            return_value=["en-US", "fr", "es"],
+        )
+        index = get_language_index(self.PROVIDER, self.FEATURE, self.SUBFEATURE)
+        resolution = index.resolve("fr-CA")
+        assert resolution.code is None
+        assert resolution.suggested_language == "fr"
+        assert index.resolve("de-DE").suggested_language is None
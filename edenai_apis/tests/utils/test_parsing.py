@@ -1,4 +1,9 @@
-from edenai_apis.utils.parsing import extract
+import logging
+
+import pytest
+
+from edenai_apis.utils import parsing
+from edenai_apis.utils.parsing import PathExtractor, extract, parse_path
 
 
 def test_parsing_extract_dict():
@@ -97,3 +102,57 @@ def test_parsing_type_validation_error():
     )
 
     assert test_output == expected_output
+
+
+def test_parse_path():
+    assert parse_path("first_level[1].second") == ("first_level", 1, "second")
+    assert parse_path("[0][2]") == (0, 2)
+    assert parse_path(["first_level", 1]) == ("first_level", 1)
+
+
+@pytest.mark.parametrize("path", ["", "first..second", ".first", "first[0]second"])
+def test_parse_invalid_path(path):
+    with pytest.raises(ValueError):
+        parse_path(path)
+
+
+def test_path_extractor():
+    test_obj = {
+        "vendor": {"value": {"name": "yay", "city": None}},
+        "items": [{"amount": 1}, {"amount": 2}],
+    }
+    extractor = PathExtractor(
+        {
+            "name": "vendor.value.name",
+            "city": "vendor.value.city",
+            "zip": "vendor.value.zip",
+            "first_amount": "items[0].amount",
+            "third_amount": "items[2].amount",
+            "items": ["items"],
+        },
+        fallbacks={"third_amount": 0},
+        type_validators={"first_amount": str},
+    )
+
+    assert extractor.extract(test_obj) == {
+        "name": "yay",
+        "city": None,
+        "zip": None,
+        "first_amount": None,
+        "third_amount": 0,
+        "items": test_obj["items"],
+    }
+    assert extractor.extract_one(test_obj, "name") == "yay"
+
+
+def test_extraction_misses_are_rate_limited(mocker, caplog):
+    mocker.patch.dict(parsing._last_miss_logs, clear=True)
+    test_obj = {"first_level": ["x" * 1000]}
+
+    with caplog.at_level(logging.WARNING):
+        for _ in range(3):
+            extract(test_obj, ["missing"])
+
+    assert len(caplog.records) == 1
+    # the object is truncated in the log
+    assert len(caplog.records[0].getMessage()) < 300
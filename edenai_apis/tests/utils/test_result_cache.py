@@ -0,0 +1,329 @@
+import asyncio
+import fnmatch
+import socketserver
+import threading
+import time
+
+import pytest
+from pytest_mock import MockerFixture
+
+from edenai_apis.interface import compute_output, compute_output_async
+from edenai_apis.utils.result_cache import (
+    MemoryResultCache,
+    RedisResultCache,
+    ResultCache,
+    SQLiteResultCache,
+    canonical_args,
+    is_cacheable,
+    set_result_cache,
+)
+from edenai_apis.utils.types import ResponseType
+
+
+class RespHandler(socketserver.StreamRequestHandler):
+    """Stand-in of a Redis server, for the commands used by `RedisResultCache`"""
+
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def write_bulk(self, value):
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def handle(self):
+        server = self.server
+        while True:
+            command = self.read_command()
+            if command is None:
+                return
+            name, args = command[0].upper(), command[1:]
+            server.commands.append(name)
+            if name == b"AUTH":
+                reply = b"+OK\r\n" if args[0] == b"secret" else b"-ERR invalid\r\n"
+            elif name == b"SELECT":
+                reply = b"+OK\r\n"
+            elif name == b"GET":
+                value, expires_at = server.data.get(args[0], (None, None))
+                if expires_at is not None and expires_at <= time.time():
+                    value = None
+                reply = self.write_bulk(value)
+            elif name == b"SET":
+                expires_at = None
+                if len(args) == 4 and args[2].upper() == b"PX":
+                    expires_at = time.time() + int(args[3]) / 1000
+                server.data[args[0]] = (args[1], expires_at)
+                reply = b"+OK\r\n"
+            elif name == b"DEL":
+                deleted = [server.data.pop(key, None) for key in args]
+                reply = b":%d\r\n" % sum(value is not None for value in deleted)
+            elif name == b"SCAN":
+                pattern = args[args.index(b"MATCH") + 1].decode()
+                keys = [
+                    key for key in server.data if fnmatch.fnmatch(key.decode(), pattern)
+                ]
+                reply = b"*2\r\n$1\r\n0\r\n*%d\r\n" % len(keys) + b"".join(
+                    self.write_bulk(key) for key in keys
+                )
+            else:
+                reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+
+
+@pytest.fixture
+def redis_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), RespHandler)
+    server.daemon_threads = True
+    server.data = {}
+    server.commands = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return MemoryResultCache(max_size=10)
+    if request.param == "sqlite":
+        return SQLiteResultCache(str(tmp_path / "results.db"), max_size=10)
+    server = request.getfixturevalue("redis_server")
+    host, port = server.server_address
+    return RedisResultCache(f"redis://:secret@{host}:{port}/1")
+
+
+class TestBackends:
+    def test_get_set_delete(self, backend):
+        assert backend.get("key") is None
+        backend.set("key", '{"a": 1}', ttl=0)
+        assert backend.get("key") == '{"a": 1}'
+        backend.delete("key")
+        assert backend.get("key") is None
+
+    def test_ttl(self, backend):
+        backend.set("key", "value", ttl=0.05)
+        assert backend.get("key") == "value"
+        time.sleep(0.1)
+        assert backend.get("key") is None
+
+    def test_clear(self, backend):
+        backend.set("key1", "value", ttl=0)
+        backend.set("key2", "value", ttl=0)
+        backend.clear()
+        assert backend.get("key1") is None
+        assert backend.get("key2") is None
+
+
+def test_sqlite_evicts_least_recently_used(tmp_path):
+    path = str(tmp_path / "results.db")
+    backend = SQLiteResultCache(path, max_size=2)
+    backend.set("a", "1", ttl=0)
+    backend.set("b", "2", ttl=0)
+    backend.get("a")
+    backend.set("c", "3", ttl=0)
+
+    assert len(backend) == 2
+    assert backend.get("b") is None
+    # results are shared with other connections to the same file
+    assert SQLiteResultCache(path).get("a") == "1"
+
+
+def test_redis_auth_and_db(redis_server):
+    host, port = redis_server.server_address
+    backend = RedisResultCache(f"redis://:secret@{host}:{port}/2", prefix="test:")
+    backend.set("key", "value", ttl=10)
+
+    assert redis_server.commands[:3] == [b"AUTH", b"SELECT", b"SET"]
+    assert list(redis_server.data) == [b"test:key"]
+
+
+def test_unreachable_backend_is_a_miss():
+    cache = ResultCache(RedisResultCache("redis://127.0.0.1:1/0", timeout=0.1))
+
+    assert cache.get("key") is None
+    cache.set("key", {"standardized_response": {}})
+    assert cache.metrics() == {
+        "hits": 0,
+        "misses": 1,
+        "writes": 0,
+        "skipped": 0,
+        "errors": 2,
+    }
+
+
+def test_corrupt_value_is_a_miss():
+    backend = MemoryResultCache()
+    backend.set("key", '{"result": ', ttl=0)
+    cache = ResultCache(backend)
+
+    assert cache.get("key") is None
+    assert cache.metrics()["errors"] == 1
+    assert cache.metrics()["misses"] == 1
+
+
+def test_original_response_is_only_served_when_stored():
+    cache = ResultCache(MemoryResultCache())
+    cache.set("key", {"original_response": None}, include_original_response=False)
+    assert cache.get("key", include_original_response=True) is None
+
+    cache.set("key", {"original_response": "raw"}, include_original_response=True)
+    assert cache.get("key", include_original_response=False) == {
+        "original_response": None
+    }
+    assert cache.get("key", include_original_response=True) == {
+        "original_response": "raw"
+    }
+
+
+def test_big_results_are_not_stored():
+    cache = ResultCache(MemoryResultCache(), max_value_size=100)
+    cache.set("key", {"text": "x" * 100})
+
+    assert cache.get("key") is None
+    assert cache.metrics()["skipped"] == 1
+
+
+def test_key_uses_file_content(tmp_path):
+    first, second, other = (tmp_path / "1.txt", tmp_path / "2.txt", tmp_path / "3.txt")
+    first.write_text("content")
+    second.write_text("content")
+    other.write_text("other content")
+
+    def key(file):
+        args = {"file": str(file), "file_url": f"https://host/{file.name}"}
+        return ResultCache.key("amazon", "ocr", "ocr", "", args)
+
+    assert key(first) == key(second)
+    assert key(first) != key(other)
+    assert canonical_args({"file_url": "https://host/1.txt"}) == {
+        "file_url": "https://host/1.txt"
+    }
+
+
+def test_key_uses_args_and_api_keys():
+    key = ResultCache.key(
+        "openai", "text", "embeddings", "", {"texts": ["a"], "model": "small"}
+    )
+
+    assert key == ResultCache.key(
+        "openai", "text", "embeddings", "", {"model": "small", "texts": ["a"]}
+    )
+    assert key != ResultCache.key(
+        "openai", "text", "embeddings", "", {"texts": ["a"], "model": "large"}
+    )
+    assert key != ResultCache.key(
+        "openai",
+        "text",
+        "embeddings",
+        "",
+        {"texts": ["a"], "model": "small"},
+        api_keys={"api_key": "user key"},
+    )
+
+
+def test_is_cacheable():
+    assert is_cacheable("translation", "automatic_translation")
+    assert not is_cacheable("text", "chat")
+    assert not is_cacheable("image", "search", "upload_image")
+
+
+class CountingApi:
+    def __init__(self):
+        self.calls = 0
+
+    def translation__automatic_translation(self, **kwargs):
+        self.calls += 1
+        return ResponseType[dict](
+            original_response={"call": self.calls},
+            standardized_response={"text": "bonjour"},
+        )
+
+    def text__chat(self, **kwargs):
+        self.calls += 1
+        return ResponseType[dict](original_response={}, standardized_response={})
+
+
+class TestComputeOutputCache:
+    @pytest.fixture(autouse=True)
+    def fake_provider(self, mocker: MockerFixture):
+        mocker.patch(
+            "edenai_apis.interface.validate_all_provider_constraints",
+            side_effect=lambda *args: args[-1],
+        )
+        self.api = CountingApi()
+        mocker.patch(
+            "edenai_apis.interface_v2.get_provider_instance", return_value=self.api
+        )
+        self.cache = ResultCache(MemoryResultCache())
+        set_result_cache(self.cache)
+        yield
+        set_result_cache(None)
+
+    def translate(self, **kwargs):
+        return compute_output(
+            "deepl", "translation", "automatic_translation", {"text": "hello"}, **kwargs
+        )
+
+    def test_result_is_cached(self):
+        first = self.translate()
+        second = self.translate()
+
+        assert first == second
+        assert self.api.calls == 1
+        assert self.cache.metrics()["hits"] == 1
+
+    def test_bypass_and_refresh(self):
+        self.translate()
+        self.translate(use_cache=False)
+        assert self.api.calls == 2
+
+        refreshed = self.translate(refresh_cache=True)
+        assert refreshed["original_response"] == {"call": 3}
+        assert self.translate()["original_response"] == {"call": 3}
+        assert self.api.calls == 3
+
+    def test_not_cacheable_subfeature(self):
+        compute_output("openai", "text", "chat", {})
+        compute_output("openai", "text", "chat", {})
+
+        assert self.api.calls == 2
+        assert len(self.cache.backend._cache) == 0
+
+    def test_async_shares_the_cache(self):
+        self.translate()
+        result = asyncio.run(
+            compute_output_async(
+                "deepl", "translation", "automatic_translation", {"text": "hello"}
+            )
+        )
+
+        assert result["standardized_response"] == {"text": "bonjour"}
+        assert self.api.calls == 1
+
+    def test_async_key_is_computed_off_the_event_loop(self, mocker: MockerFixture):
+        threads = []
+        original_key = ResultCache.key
+
+        def key(*args):
+            threads.append(threading.current_thread())
+            return original_key(*args)
+
+        mocker.patch.object(ResultCache, "key", staticmethod(key))
+
+        asyncio.run(
+            compute_output_async(
+                "deepl", "translation", "automatic_translation", {"text": "hello"}
+            )
+        )
+
+        assert threads and threading.main_thread() not in threads
+        assert self.api.calls == 1
@@ -0,0 +1,121 @@
+import hashlib
+import threading
+import time
+from io import BytesIO
+from unittest.mock import MagicMock
+
+import pytest
+
+from edenai_apis.utils import upload_cache
+from edenai_apis.utils.upload_cache import (
+    cached_upload,
+    clear_upload_cache,
+    hash_file,
+    hash_fileobj,
+    url_ttl,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    clear_upload_cache()
+    yield
+    clear_upload_cache()
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"frame" * 1000)
+    return str(path)
+
+
+class TestHash:
+    def test_hash_fileobj_reads_by_chunks_and_restores_position(self, mocker):
+        mocker.patch.object(upload_cache, "HASH_CHUNK_SIZE", 7)
+        file = BytesIO(b"header" + b"content" * 10)
+        file.seek(6)
+        file_read = mocker.spy(file, "read")
+
+        assert hash_fileobj(file) == hashlib.sha256(b"content" * 10).hexdigest()
+        assert all(call.args == (7,) for call in file_read.call_args_list)
+        assert file.tell() == 6
+
+    def test_hash_file_is_memoized_until_modified(self, mocker, video):
+        hash_fileobj = mocker.spy(upload_cache, "hash_fileobj")
+
+        first_hash = hash_file(video)
+        assert hash_file(video) == first_hash
+        assert hash_fileobj.call_count == 1
+
+        with open(video, "ab") as file:
+            file.write(b"more")
+        assert hash_file(video) != first_hash
+        assert hash_fileobj.call_count == 2
+
+
+class TestCachedUpload:
+    def test_same_content_is_uploaded_once(self, video):
+        upload = MagicMock(return_value="gs://bucket/video.mp4")
+
+        for _ in range(3):
+            uri = cached_upload(("gcs", "bucket"), hash_file(video), upload)
+
+        assert uri == "gs://bucket/video.mp4"
+        assert upload.call_count == 1
+
+    def test_destinations_are_not_shared(self, video):
+        upload = MagicMock(side_effect=["gs://a/video.mp4", "gs://b/video.mp4"])
+
+        assert cached_upload(("gcs", "a"), hash_file(video), upload).startswith(
+            "gs://a"
+        )
+        assert cached_upload(("gcs", "b"), hash_file(video), upload).startswith(
+            "gs://b"
+        )
+
+    def test_expired_upload_is_uploaded_again(self, mocker):
+        monotonic = mocker.patch("edenai_apis.utils.cache.time.monotonic")
+        monotonic.return_value = 0
+        upload = MagicMock(side_effect=["url-1", "url-2"])
+
+        assert cached_upload("s3", "hash", upload, ttl=10) == "url-1"
+        monotonic.return_value = 5
+        assert cached_upload("s3", "hash", upload, ttl=10) == "url-1"
+        monotonic.return_value = 11
+        assert cached_upload("s3", "hash", upload, ttl=10) == "url-2"
+
+    def test_short_lived_urls_are_not_cached(self):
+        upload = MagicMock(side_effect=["url-1", "url-2"])
+        ttl = url_ttl(upload_cache.UPLOAD_CACHE_URL_MARGIN)
+
+        assert cached_upload("s3", "hash", upload, ttl=ttl) == "url-1"
+        assert cached_upload("s3", "hash", upload, ttl=ttl) == "url-2"
+
+    def test_concurrent_uploads_are_single_flight(self):
+        def upload():
+            time.sleep(0.05)
+            return "gs://bucket/video.mp4"
+
+        upload_mock = MagicMock(side_effect=upload)
+        uris = []
+        threads = [
+            threading.Thread(
+                target=lambda: uris.append(cached_upload("gcs", "hash", upload_mock))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert uris == ["gs://bucket/video.mp4"] * 5
+        assert upload_mock.call_count == 1
+
+    def test_failed_upload_is_not_cached(self):
+        upload = MagicMock(side_effect=[Exception("network"), "url"])
+
+        with pytest.raises(Exception):
+            cached_upload("s3", "hash", upload)
+        assert cached_upload("s3", "hash", upload) == "url"
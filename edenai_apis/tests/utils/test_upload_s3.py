@@ -1,8 +1,11 @@
 import os
+import threading
+from io import BytesIO
 
 import pytest
 from settings import base_path
 
+from edenai_apis.utils import upload_cache, upload_s3
 from edenai_apis.utils.upload_s3 import (
     get_providers_json_from_s3,
     s3_client_load,
@@ -36,3 +39,159 @@ def test_upload_to_s3():
 def test_get_providers_json_from_s3():
     providers_info = get_providers_json_from_s3()
     assert isinstance(providers_info, dict)
+
+
+AMAZON_SETTINGS = {
+    "aws_access_key_id": "key",
+    "aws_secret_access_key": "secret",
+    "providers_resource_bucket": "providers-bucket",
+    "users_resource_bucket": "users-bucket",
+    "cloudfront_key_id": "cloudfront-key",
+    "ressource_region": "eu-west-1",
+}
+
+
+@pytest.fixture
+def s3_mocks(mocker):
+    upload_s3.reload_s3_settings()
+    upload_cache.clear_upload_cache()
+    upload_s3._ASSET_UPLOADS.clear()
+    load_provider = mocker.patch.object(
+        upload_s3, "load_provider", return_value=AMAZON_SETTINGS
+    )
+    boto3_client = mocker.patch.object(upload_s3.boto3, "client")
+    yield load_provider, boto3_client
+    upload_s3.reload_s3_settings()
+    upload_cache.clear_upload_cache()
+
+
+def test_s3_client_is_cached_until_reload(s3_mocks):
+    load_provider, boto3_client = s3_mocks
+
+    assert s3_client_load() is s3_client_load()
+    assert upload_s3.BUCKET == "providers-bucket"
+    assert load_provider.call_count == 1
+    assert boto3_client.call_count == 1
+
+    upload_s3.reload_s3_settings()
+    s3_client_load()
+    assert boto3_client.call_count == 2
+
+
+def test_private_key_is_loaded_once(mocker, s3_mocks):
+    load_key = mocker.patch.object(upload_s3.serialization, "load_pem_private_key")
+    mocker.patch("builtins.open", mocker.mock_open(read_data=b"pem"))
+    signer = mocker.patch.object(upload_s3, "CloudFrontSigner")
+
+    for _ in range(3):
+        upload_s3.get_cloud_front_file_url("image.png", 60)
+        upload_s3.rsa_signer(b"message")
+
+    assert load_key.call_count == 1
+    assert signer.call_count == 1
+
+
+def test_upload_files_bytes_keeps_order(mocker, s3_mocks):
+    mocker.patch.object(
+        upload_s3,
+        "get_s3_file_url",
+        side_effect=lambda filename, process_time: f"https://s3/{filename}",
+    )
+    files = [(BytesIO(f"image {index}".encode()), f".{index}") for index in range(5)]
+
+    urls = upload_s3.upload_files_bytes_to_s3(files)
+
+    assert [url.rsplit("_", 1)[-1] for url in urls] == [
+        f".{index}" for index in range(5)
+    ]
+
+
+def test_user_assets_are_uploaded_in_background(mocker, s3_mocks):
+    _, boto3_client = s3_mocks
+    mocker.patch.object(
+        upload_s3,
+        "get_cloud_front_file_url",
+        side_effect=lambda filename, process_time: f"https://cdn/{filename}",
+    )
+    uploading = threading.Event()
+    boto3_client.return_value.upload_fileobj.side_effect = lambda *args: uploading.wait(
+        5
+    )
+
+    url = upload_s3.upload_file_bytes_to_s3(
+        BytesIO(b"audio"), ".mp3", upload_s3.USER_PROCESS, background=True
+    )
+
+    # the url is known before the upload is done
+    assert url.startswith("https://cdn/") and url.endswith(".mp3")
+    assert not upload_s3.wait_for_asset_uploads(timeout=0.01)
+    assert not upload_s3.get_asset_upload(url).done()
+    uploading.set()
+    assert upload_s3.wait_for_asset_uploads(timeout=5)
+    assert upload_s3.get_asset_upload(url).exception() is None
+    assert boto3_client.return_value.upload_fileobj.call_count == 1
+
+
+def test_background_uploads_are_bounded(mocker, s3_mocks):
+    _, boto3_client = s3_mocks
+    mocker.patch.object(upload_s3, "get_cloud_front_file_url", return_value="url")
+    slots = threading.BoundedSemaphore(2)
+    mocker.patch.object(upload_s3, "_ASSET_UPLOAD_SLOTS", slots)
+    uploading = threading.Event()
+    boto3_client.return_value.upload_fileobj.side_effect = lambda *args: uploading.wait(
+        5
+    )
+
+    for index in range(2):
+        upload_s3.upload_file_bytes_to_s3(
+            BytesIO(f"image {index}".encode()),
+            ".png",
+            upload_s3.USER_PROCESS,
+            background=True,
+        )
+    third_upload = threading.Thread(
+        target=upload_s3.upload_file_bytes_to_s3,
+        args=(BytesIO(b"image 2"), ".png", upload_s3.USER_PROCESS, True),
+    )
+    third_upload.start()
+    third_upload.join(0.1)
+    # the queue is full, the third upload waits for a free slot
+    assert third_upload.is_alive()
+
+    uploading.set()
+    third_upload.join(5)
+    assert not third_upload.is_alive()
+    assert upload_s3.wait_for_asset_uploads(timeout=5)
+
+
+def test_failed_background_upload_is_not_reused(mocker, s3_mocks):
+    _, boto3_client = s3_mocks
+    mocker.patch.object(
+        upload_s3,
+        "get_cloud_front_file_url",
+        side_effect=lambda filename, process_time: filename,
+    )
+    boto3_client.return_value.upload_fileobj.side_effect = [Exception("s3"), None]
+
+    first_url = upload_s3.upload_file_bytes_to_s3(
+        BytesIO(b"audio"), ".mp3", upload_s3.USER_PROCESS, background=True
+    )
+    assert upload_s3.wait_for_asset_uploads(timeout=5)
+    second_url = upload_s3.upload_file_bytes_to_s3(
+        BytesIO(b"audio"), ".mp3", upload_s3.USER_PROCESS, background=True
+    )
+
+    assert first_url != second_url
+    assert str(upload_s3.get_asset_upload(first_url).exception()) == "s3"
+
+
+def test_user_assets_are_uploaded_before_returning_by_default(mocker, s3_mocks):
+    _, boto3_client = s3_mocks
+    mocker.patch.object(upload_s3, "get_cloud_front_file_url", return_value="url")
+
+    url = upload_s3.upload_file_bytes_to_s3(
+        BytesIO(b"audio"), ".mp3", upload_s3.USER_PROCESS
+    )
+
+    assert boto3_client.return_value.upload_fileobj.call_count == 1
+    assert upload_s3.get_asset_upload(url) is None
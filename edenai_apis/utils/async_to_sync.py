@@ -1,5 +1,291 @@
-from time import sleep
-from typing import Callable
+"""
+Polling of provider jobs, used by synchronous methods wrapping an async provider endpoint.
+
+`poll_until` (and its asyncio counterpart `poll_until_async`) calls a status function
+until the job is done, waiting between calls with an exponential backoff:
+    - delays are jittered, so that jobs started together do not poll together;
+    - a delay hint given by the provider (`Retry-After` header, estimated remaining
+      time...) replaces the backoff delay, but is never shorter than the first delay;
+    - the last wait is shortened to the deadline, `PollingTimeout` is raised when the
+      job is still not done at the deadline;
+    - polling stops with `PollingCancelled` when the `cancel` event is set.
+
+Default delays can be tuned with the following environment variables:
+    - `POLL_INITIAL_DELAY` / `POLL_MAX_DELAY`: first and longest delays in seconds
+      (default 0.5 and 10)
+    - `POLL_BACKOFF_FACTOR`: delay multiplier between polls (default 1.5)
+    - `POLL_JITTER`: part of each delay which is randomized (default 0.2)
+    - `POLL_TIMEOUT`: time after which jobs are considered failed (default 600)
+
+Polls are counted per poller name, see `polling_metrics`.
+"""
+
+import asyncio
+import inspect
+import os
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, TypeVar, Union
+
+from edenai_apis.utils.exception import ProviderTimeoutError
+from edenai_apis.utils.http import MAX_RETRY_AFTER, _get_retry_after
+
+T = TypeVar("T")
+
+POLL_INITIAL_DELAY = float(os.environ.get("POLL_INITIAL_DELAY", 0.5))
+POLL_MAX_DELAY = float(os.environ.get("POLL_MAX_DELAY", 10))
+POLL_BACKOFF_FACTOR = float(os.environ.get("POLL_BACKOFF_FACTOR", 1.5))
+POLL_JITTER = float(os.environ.get("POLL_JITTER", 0.2))
+POLL_TIMEOUT = float(os.environ.get("POLL_TIMEOUT", 600))
+
+
+class PollingTimeout(ProviderTimeoutError):
+    """When a provider job is not done before the polling deadline"""
+
+
+class PollingCancelled(Exception):
+    """When polling is stopped by its `cancel` event"""
+
+
+@dataclass(frozen=True)
+class PollingPolicy:
+    """Delays between the polls of a job
+
+    Args:
+        initial_delay (float): delay before the second poll, in seconds
+        max_delay (float): longest delay between two polls
+        factor (float): delay multiplier between polls
+        jitter (float): part of each delay which is randomized, between 0 and 1.
+            Delays are never longer than the backoff delay.
+        timeout (float, optional): time after which polling stops, None to poll forever
+        first_delay (float): delay before the first poll, when there is no first response
+    """
+
+    initial_delay: float = POLL_INITIAL_DELAY
+    max_delay: float = POLL_MAX_DELAY
+    factor: float = POLL_BACKOFF_FACTOR
+    jitter: float = POLL_JITTER
+    timeout: Optional[float] = POLL_TIMEOUT
+    first_delay: float = 0
+
+    def with_options(self, **options) -> "PollingPolicy":
+        """Copy of the policy with some options changed"""
+        return replace(self, **options)
+
+    def delays(self) -> Iterator[float]:
+        delay = self.initial_delay
+        while True:
+            yield delay * (1 - self.jitter * random.random())
+            delay = min(delay * self.factor, self.max_delay)
+
+
+DEFAULT_POLLING_POLICY = PollingPolicy()
+
+
+@dataclass
+class PollingStats:
+    """Counters of the jobs polled under one name
+
+    Attributes:
+        jobs (int): number of jobs polled
+        polls (int): number of status calls
+        waited (float): total time waited between polls, in seconds
+        wasted_wait (float): upper bound of the time done jobs waited for their last
+            poll, ie: the sum of the last delays of done jobs
+        timeouts (int): number of jobs not done before their deadline
+        cancelled (int): number of cancelled pollings
+    """
+
+    jobs: int = 0
+    polls: int = 0
+    waited: float = 0
+    wasted_wait: float = 0
+    timeouts: int = 0
+    cancelled: int = 0
+
+
+_POLLING_STATS: Dict[str, PollingStats] = {}
+_POLLING_STATS_LOCK = threading.Lock()
+
+
+def polling_metrics() -> Dict[str, Dict[str, float]]:
+    """Counters of all polled jobs by poller name (see `PollingStats`)"""
+    with _POLLING_STATS_LOCK:
+        return {name: asdict(stats) for name, stats in _POLLING_STATS.items()}
+
+
+def reset_polling_metrics() -> None:
+    with _POLLING_STATS_LOCK:
+        _POLLING_STATS.clear()
+
+
+def retry_after_header(response: Any) -> Optional[float]:
+    """Delay hint of a `requests.Response`-like object, from its `Retry-After` header"""
+    headers = getattr(response, "headers", None)
+    delay = _get_retry_after(headers) if headers else None
+    # a job asking to be checked much later is still polled every `MAX_RETRY_AFTER`
+    return delay if delay is None else min(delay, MAX_RETRY_AFTER)
+
+
+class _Polling:
+    """State of one polling, shared by the sync and asyncio front-ends"""
+
+    def __init__(
+        self,
+        name: str,
+        policy: PollingPolicy,
+        retry_after: Optional[Callable[[Any], Optional[float]]],
+    ) -> None:
+        self.name = name
+        self.policy = policy
+        self.retry_after = retry_after
+        self.delays = policy.delays()
+        self.deadline = (
+            None if policy.timeout is None else time.monotonic() + policy.timeout
+        )
+        self.polls = 0
+        self.waited = 0.0
+        self.last_delay = 0.0
+
+    def next_delay(self, response: Any) -> float:
+        """Delay before the next poll, raise `PollingTimeout` after the deadline"""
+        backoff_delay = next(self.delays)
+        hint = self.retry_after(response) if self.retry_after else None
+        # hints are not shorter than the first delay, so a provider answering
+        # "0 seconds remaining" is not polled in a tight loop
+        delay = backoff_delay if hint is None else max(hint, self.policy.initial_delay)
+        if self.deadline is not None:
+            remaining = self.deadline - time.monotonic()
+            if remaining <= 0:
+                self.record(timeouts=1)
+                raise PollingTimeout(
+                    f"Provider job not done after {self.polls} status checks",
+                    code=504,
+                )
+            delay = min(delay, remaining)
+        self.waited += delay
+        self.last_delay = delay
+        return delay
+
+    def cancelled(self) -> PollingCancelled:
+        self.record(cancelled=1)
+        return PollingCancelled(f"Polling of {self.name} job cancelled")
+
+    def record(self, timeouts: int = 0, cancelled: int = 0) -> None:
+        wasted_wait = self.last_delay if not (timeouts or cancelled) else 0
+        with _POLLING_STATS_LOCK:
+            stats = _POLLING_STATS.setdefault(self.name, PollingStats())
+            stats.jobs += 1
+            stats.polls += self.polls
+            stats.waited += self.waited
+            stats.wasted_wait += wasted_wait
+            stats.timeouts += timeouts
+            stats.cancelled += cancelled
+
+
+def poll_until(
+    func: Callable[[], T],
+    is_done: Callable[[T], bool],
+    policy: PollingPolicy = DEFAULT_POLLING_POLICY,
+    first_response: Optional[T] = None,
+    retry_after: Optional[Callable[[T], Optional[float]]] = None,
+    cancel: Optional[threading.Event] = None,
+    name: str = "default",
+) -> T:
+    """Call `func` until `is_done` returns True for its response
+
+    Args:
+        func (Callable): status call of the job
+        is_done (Callable): whether a response is final. It can raise to stop polling
+            a failed job (eg: `ProviderException`).
+        policy (PollingPolicy): delays between polls and deadline
+        first_response (optional): response already received, checked before polling
+        retry_after (Callable, optional): delay hint of a response in seconds, or None
+            to use the backoff delay (eg: `retry_after_header`)
+        cancel (threading.Event, optional): stops polling when set
+        name (str): name of the poller in `polling_metrics`
+
+    Returns:
+        the final response
+
+    Raises:
+        PollingTimeout: if the job is not done at the deadline
+        PollingCancelled: if `cancel` is set while polling
+    """
+    polling = _Polling(name, policy, retry_after)
+    response = first_response
+    if response is None:
+        if policy.first_delay and _wait(policy.first_delay, cancel):
+            raise polling.cancelled()
+        polling.polls += 1
+        response = func()
+    while not is_done(response):
+        if _wait(polling.next_delay(response), cancel):
+            raise polling.cancelled()
+        polling.polls += 1
+        response = func()
+    polling.record()
+    return response
+
+
+def _wait(delay: float, cancel: Optional[threading.Event]) -> bool:
+    """Sleep `delay` seconds, return True if cancelled meanwhile"""
+    if cancel is None:
+        time.sleep(delay)
+        return False
+    return cancel.wait(delay)
+
+
+async def poll_until_async(
+    func: Callable[[], Union[T, Awaitable[T]]],
+    is_done: Callable[[T], bool],
+    policy: PollingPolicy = DEFAULT_POLLING_POLICY,
+    first_response: Optional[T] = None,
+    retry_after: Optional[Callable[[T], Optional[float]]] = None,
+    cancel: Optional[asyncio.Event] = None,
+    name: str = "default",
+) -> T:
+    """asyncio version of `poll_until`, `func` can be a coroutine function
+
+    Polling also stops when the awaiting task is cancelled.
+    """
+    polling = _Polling(name, policy, retry_after)
+
+    async def call() -> T:
+        polling.polls += 1
+        response = func()
+        if inspect.isawaitable(response):
+            response = await response
+        return response
+
+    try:
+        response = first_response
+        if response is None:
+            if policy.first_delay and await _wait_async(policy.first_delay, cancel):
+                raise polling.cancelled()
+            response = await call()
+        while not is_done(response):
+            if await _wait_async(polling.next_delay(response), cancel):
+                raise polling.cancelled()
+            response = await call()
+    except asyncio.CancelledError:
+        polling.record(cancelled=1)
+        raise
+    polling.record()
+    return response
+
+
+async def _wait_async(delay: float, cancel: Optional[asyncio.Event]) -> bool:
+    if cancel is None:
+        await asyncio.sleep(delay)
+        return False
+    try:
+        await asyncio.wait_for(cancel.wait(), delay)
+        return True
+    except asyncio.TimeoutError:
+        return False
 
 
 def fibonacci_waiting_call(
@@ -12,6 +298,9 @@ def fibonacci_waiting_call(
 ):
     """Check response call if succeeded synchronously form an async endpoint
 
+    Kept for compatibility, new code should use `poll_until`. The last response is
+    returned when the job is not done after `max_time`.
+
     Args:
         max_time (int): Max time to wait
         status (str): The success/wating string to check with if job finished
@@ -20,29 +309,25 @@ def fibonacci_waiting_call(
         provider_handel_call (Callable): The function wrapper for the provider call
         to handle errors
     """
-    first_occurence, second_occurence = (
-        1,
-        2,
-    )  # waiting exponentially using fibonacci
-    wait_time = first_occurence + second_occurence
-    total_wait_time = wait_time
-    get_response = (
-        func(**func_args)
-        if not provider_handel_call
-        else provider_handel_call(func, **func_args)
+    last_response = {}
+
+    def get_response():
+        response = (
+            func(**func_args)
+            if not provider_handel_call
+            else provider_handel_call(func, **func_args)
+        )
+        last_response["response"] = response
+        return response
+
+    def is_done(response) -> bool:
+        return (response["JobStatus"] == status) == status_positif
+
+    # waiting exponentially using fibonacci
+    policy = PollingPolicy(
+        initial_delay=3, max_delay=max_time, factor=1.618, jitter=0, timeout=max_time
     )
-    while total_wait_time < max_time:  # Wait for the answer from provider
-        if (status_positif and get_response["JobStatus"] == status) or (
-            not status_positif and get_response["JobStatus"] != status
-        ):
-            break
-        sleep(wait_time)
-        first_occurence = second_occurence
-        second_occurence = wait_time
-        wait_time = first_occurence + second_occurence
-        total_wait_time += wait_time
-        if provider_handel_call:
-            get_response = provider_handel_call(func, **func_args)
-        else:
-            get_response = func(**func_args)
-    return get_response
+    try:
+        return poll_until(get_response, is_done, policy, name="fibonacci")
+    except PollingTimeout:
+        return last_response["response"]
@@ -1,5 +1,6 @@
+import threading
 from io import BufferedReader
-from typing import Union, List, Dict
+from typing import Dict, List, Tuple, Union
 
 from pydub import AudioSegment
 from pydub.utils import mediainfo
@@ -153,29 +154,6 @@ def confirm_appropriate_language(language: str, provider: str, subfeature: str):
     return formated_language
 
 
-def __get_voices_from_constrains(constraints: Dict, language: str, gender: str = ""):
-    if isinstance(language, list):
-        return []
-    voices = {
-        "MALE": constraints["voice_ids"]["MALE"],
-        "FEMALE": constraints["voice_ids"]["FEMALE"],
-    }
-    if language:
-        voices = {
-            "MALE": list(
-                filter(lambda voice: voice.startswith(language), voices["MALE"])
-            ),
-            "FEMALE": list(
-                filter(lambda voice: voice.startswith(language), voices["FEMALE"])
-            ),
-        }
-    if gender:
-        voices = voices["MALE"] if gender.upper() == "MALE" else voices["FEMALE"]
-    else:
-        voices = voices.get("MALE", []) + voices.get("FEMALE", [])
-    return voices
-
-
 def __get_provider_tts_constraints(provider, subfeature):
     if "text_to_speech" not in subfeature:
         return {}
@@ -190,9 +168,64 @@ def __get_provider_tts_constraints(provider, subfeature):
     return {}
 
 
-def __has_voice_in_contrains(contraints: Dict, voice: str):
-    all_voices = contraints["voice_ids"]["MALE"] + contraints["voice_ids"]["FEMALE"]
-    return voice in all_voices
+class VoiceIndex:
+    """Text to speech voices of a provider, with memoized lookups by language and gender
+
+    Args:
+        voice_ids (Dict): `voice_ids` constraint, mapping MALE and FEMALE to voice ids
+    """
+
+    def __init__(self, voice_ids: Dict) -> None:
+        self.voices = {
+            gender: tuple(voice_ids.get(gender) or ()) for gender in ("MALE", "FEMALE")
+        }
+        self.all_voices = frozenset(self.voices["MALE"] + self.voices["FEMALE"])
+        self._lookups: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+
+    def __contains__(self, voice: str) -> bool:
+        return voice in self.all_voices
+
+    def find(self, language: str, gender: str = "") -> List[str]:
+        """Voices starting with the language code, of the given gender if any"""
+        if isinstance(language, list):
+            return []
+        key = (language or "", (gender or "").upper())
+        voices = self._lookups.get(key)
+        if voices is None:
+            by_gender = {
+                voice_gender: tuple(
+                    voice for voice in voice_ids if voice.startswith(key[0])
+                )
+                for voice_gender, voice_ids in self.voices.items()
+            }
+            if key[1]:
+                voices = by_gender["MALE"] if key[1] == "MALE" else by_gender["FEMALE"]
+            else:
+                voices = by_gender["MALE"] + by_gender["FEMALE"]
+            self._lookups[key] = voices
+        return list(voices)
+
+
+_VOICE_INDEXES: Dict[Tuple[str, str], VoiceIndex] = {}
+_VOICE_INDEXES_LOCK = threading.Lock()
+
+
+def get_voice_index(provider: str, subfeature: str) -> VoiceIndex:
+    """Get the voice index of a text to speech provider, built on first use"""
+    key = (provider, subfeature)
+    index = _VOICE_INDEXES.get(key)
+    if index is None:
+        constraints = __get_provider_tts_constraints(provider, subfeature)
+        index = VoiceIndex(constraints.get("voice_ids") or {})
+        with _VOICE_INDEXES_LOCK:
+            index = _VOICE_INDEXES.setdefault(key, index)
+    return index
+
+
+def invalidate_voice_indexes() -> None:
+    """Drop all voice indexes, eg: after providers info are reloaded"""
+    with _VOICE_INDEXES_LOCK:
+        _VOICE_INDEXES.clear()
 
 
 def get_voices(
@@ -210,18 +243,12 @@ def get_voices(
     """
     voices = {}
     for provider in providers:
-        constrains = __get_provider_tts_constraints(provider, subfeature)
-        if constrains:
+        voice_index = get_voice_index(provider, subfeature)
+        if voice_index.all_voices:
             formtatted_language = confirm_appropriate_language(
                 language, provider, subfeature
             )
-            voices.update(
-                {
-                    provider: __get_voices_from_constrains(
-                        constrains, formtatted_language, gender
-                    )
-                }
-            )
+            voices.update({provider: voice_index.find(formtatted_language, gender)})
     return voices
 
 
@@ -244,18 +271,18 @@ def retreive_voice_id(
         str: the voice id selected
     """
     # provider_name = getattr(object_instance, "provider_name")
-    constrains = __get_provider_tts_constraints(provider_name, subfeature)
+    voice_index = get_voice_index(provider_name, subfeature)
     language = confirm_appropriate_language(language, provider_name, subfeature)
     if isinstance(language, list):
         language = None
     if settings and provider_name in settings:
         selected_voice = settings[provider_name]
-        if constrains and __has_voice_in_contrains(constrains, selected_voice):
+        if selected_voice in voice_index:
             return selected_voice
         raise ProviderException(VOICE_EXCEPTION_MESSAGE)
     if not language:
         raise ProviderException(f"Language '{language}' not supported")
-    suited_voices = __get_voices_from_constrains(constrains, language, option)
+    suited_voices = voice_index.find(language, option)
     if not suited_voices:
         option_supported = "MALE" if option.upper() == "FEMALE" else "FEMALE"
         raise ProviderException(
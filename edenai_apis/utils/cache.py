@@ -0,0 +1,61 @@
+"""
+In-memory caches shared by providers helpers.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    """Thread-safe LRU mapping with an optional time to live
+
+    Args:
+        max_size (int): maximum number of entries, 0 or less disables the cache
+        ttl (float, optional): lifetime of an entry in seconds, 0 or less means no expiry
+    """
+
+    def __init__(self, max_size: int, ttl: float = 0) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
+                del self._items[key]
+                return default
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Set a value, `ttl` overrides the cache time to live for this entry"""
+        if self.max_size <= 0:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl > 0 else math.inf
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        with self._lock:
+            entry = self._items.pop(key, None)
+            return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
@@ -0,0 +1,43 @@
+"""
+Shared thread pool used to run blocking provider code from asyncio.
+
+Provider methods which do not have a native async variant yet (and blocking steps
+of async variants such as SDK calls or file uploads) are run on this executor so
+they never block the event loop.
+
+The pool size can be set with the `PROVIDER_EXECUTOR_MAX_WORKERS` environment variable.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+PROVIDER_EXECUTOR_MAX_WORKERS = int(os.environ.get("PROVIDER_EXECUTOR_MAX_WORKERS", 64))
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_provider_executor() -> ThreadPoolExecutor:
+    """Get the process-wide provider executor, created on first use"""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=PROVIDER_EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix="edenai-provider",
+                )
+    return _EXECUTOR
+
+
+async def run_sync(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking function on the provider executor and await its result"""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_provider_executor(), call)
@@ -5,11 +5,7 @@ from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.utils.audio import get_file_extension, retreive_voice_id
 from edenai_apis.utils.exception import ProviderException
 from edenai_apis.utils.files import FileWrapper
-from edenai_apis.utils.languages import (
-    LanguageErrorMessage,
-    provide_appropriate_language,
-    load_standardized_language,
-)
+from edenai_apis.utils.languages import LanguageErrorMessage, get_language_index
 from edenai_apis.utils.resolutions import provider_appropriate_resolution
 
 
@@ -148,37 +144,28 @@ def validate_single_language(
             )
 
     try:
-        formated_language = provide_appropriate_language(
-            language["value"],
-            provider_name=provider_name,
-            feature=feature,
-            subfeature=subfeature,
+        resolution = get_language_index(provider_name, feature, subfeature).resolve(
+            language["value"]
         )
     except SyntaxError as exc:
         raise ProviderException(
             LanguageErrorMessage.LANGUAGE_SYNTAX_ERROR(language["value"])
         )
 
-    if null_language_accepted is False:
-        if formated_language is None:
-            if "-" in language["value"]:
-                supported_languages = load_standardized_language(
-                    feature, subfeature, [provider_name]
-                )
-                suggested_language = language["value"].split("-")[0]
-                if suggested_language in supported_languages:
-                    raise ProviderException(
-                        LanguageErrorMessage.LANGUAGE_GENERIQUE_REQUESTED(
-                            language["value"], suggested_language, language["key"]
-                        )
-                    )
+    if null_language_accepted is False and resolution.code is None:
+        if resolution.suggested_language:
             raise ProviderException(
-                LanguageErrorMessage.LANGUAGE_NOT_SUPPORTED(
-                    language["value"], language["key"]
+                LanguageErrorMessage.LANGUAGE_GENERIQUE_REQUESTED(
+                    language["value"], resolution.suggested_language, language["key"]
                 )
             )
+        raise ProviderException(
+            LanguageErrorMessage.LANGUAGE_NOT_SUPPORTED(
+                language["value"], language["key"]
+            )
+        )
 
-    return formated_language
+    return resolution.code
 
 
 def validate_all_input_languages(
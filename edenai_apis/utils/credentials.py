@@ -0,0 +1,136 @@
+"""
+Process-wide cache of provider credentials obtained through an auth round-trip.
+
+Some providers need a login or bootstrap request before any work (eg: an OAuth
+client-credentials token, a session key, the identifier of the account
+organization). Provider objects are built for every call, so `credential_broker`
+keeps these values per provider and credentials, until they expire:
+    - the first call for given credentials fetches the value, concurrent calls
+      wait for it instead of fetching it again (single-flight);
+    - providers invalidate the value when it is rejected (401), so that the next
+      call fetches a new one.
+
+The cache can be tuned with the following environment variables:
+    - `CREDENTIALS_CACHE_SIZE`: number of credentials kept (default 1024)
+    - `CREDENTIALS_DEFAULT_TTL`: lifetime in seconds of values fetched without an
+      advertised expiry (default 3600)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Mapping, Optional, Tuple
+
+from edenai_apis.utils.cache import LRUCache
+
+CREDENTIALS_CACHE_SIZE = int(os.environ.get("CREDENTIALS_CACHE_SIZE", 1024))
+CREDENTIALS_DEFAULT_TTL = float(os.environ.get("CREDENTIALS_DEFAULT_TTL", 3600))
+
+# value and its lifetime in seconds, None for `CREDENTIALS_DEFAULT_TTL`
+FetchedCredential = Tuple[Any, Optional[float]]
+
+
+def credentials_key(provider: str, credentials: Mapping[str, Any]) -> Tuple[str, str]:
+    """Cache key of `credentials`, secrets are hashed so they are never kept in keys"""
+    serialized = json.dumps(credentials, sort_keys=True, default=str)
+    return provider, hashlib.sha256(serialized.encode()).hexdigest()
+
+
+class _FetchLock:
+    """Lock of one credentials key and the number of threads using it"""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+class CredentialBroker:
+    """Cache of auth tokens and bootstrap metadata, fetched once per credentials
+
+    Args:
+        max_size (int): maximum number of cached credentials
+    """
+
+    def __init__(self, max_size: int = CREDENTIALS_CACHE_SIZE) -> None:
+        self._cache = LRUCache(max_size=max_size)
+        self._fetch_locks: Dict[Hashable, _FetchLock] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _fetch_lock(self, key: Hashable) -> Iterator[None]:
+        """Hold the lock of `key`, it is dropped once no thread uses it so that
+        locks are only kept for credentials being fetched"""
+        with self._lock:
+            fetch_lock = self._fetch_locks.get(key)
+            if fetch_lock is None:
+                fetch_lock = self._fetch_locks[key] = _FetchLock()
+            fetch_lock.users += 1
+        try:
+            with fetch_lock.lock:
+                yield
+        finally:
+            with self._lock:
+                fetch_lock.users -= 1
+                if not fetch_lock.users:
+                    del self._fetch_locks[key]
+
+    def get(
+        self,
+        provider: str,
+        credentials: Mapping[str, Any],
+        fetch: Callable[[], FetchedCredential],
+    ) -> Any:
+        """Get the cached value of `credentials`, fetching it if missing or expired
+
+        Args:
+            provider (str): provider name
+            credentials (Mapping): settings the value depends on (eg: client id and secret)
+            fetch (Callable): auth round-trip, returns the value and its lifetime in
+                seconds (None for `CREDENTIALS_DEFAULT_TTL`). Values with a lifetime
+                of 0 or less are returned without being cached.
+
+        Returns:
+            the cached or fetched value
+        """
+        key = credentials_key(provider, credentials)
+        value = self._cache.get(key)
+        if value is not None:
+            return value
+
+        with self._fetch_lock(key):
+            # another thread may have fetched it while we were waiting
+            value = self._cache.get(key)
+            if value is None:
+                value, ttl = fetch()
+                ttl = CREDENTIALS_DEFAULT_TTL if ttl is None else ttl
+                if ttl > 0:
+                    self._cache.set(key, value, ttl=ttl)
+            return value
+
+    def invalidate(
+        self,
+        provider: str,
+        credentials: Mapping[str, Any],
+        value: Optional[Any] = None,
+    ) -> None:
+        """Forget the value of `credentials`, eg: after a 401 response
+
+        Args:
+            value (optional): rejected value, the cached value is only forgotten if it
+                is still this one, so a value refreshed meanwhile by another thread is kept
+        """
+        key = credentials_key(provider, credentials)
+        with self._fetch_lock(key):
+            if value is None or self._cache.get(key) == value:
+                self._cache.pop(key)
+
+    def clear(self) -> None:
+        """Forget all cached values"""
+        self._cache.clear()
+
+
+credential_broker = CredentialBroker()
@@ -0,0 +1,186 @@
+"""
+Embedding cache and corpus index used by embedding-based `text__search`.
+
+Embeddings are cached by (provider, model, text hash), so that a corpus which was
+already embedded by a provider is never sent again, only new texts are.
+Scoring is done with NumPy against the whole corpus matrix at once
+(see `utils.metrics.MATRIX_METRICS`).
+
+`EmbeddingIndex` can also be built, saved and loaded directly to search the same
+corpus many times, each search only costing the query embedding.
+
+The caches can be tuned with the following environment variables:
+    - `EMBEDDING_CACHE_MAX_SIZE`: maximum number of cached embeddings (0 disables it)
+    - `CORPUS_INDEX_CACHE_MAX_SIZE`: maximum number of corpus indexes kept in memory
+"""
+
+import hashlib
+import os
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from edenai_apis.utils.cache import LRUCache
+from edenai_apis.utils.exception import ProviderException
+from edenai_apis.utils.metrics import MATRIX_METRICS
+
+EMBEDDING_CACHE_MAX_SIZE = int(os.environ.get("EMBEDDING_CACHE_MAX_SIZE", 10000))
+CORPUS_INDEX_CACHE_MAX_SIZE = int(os.environ.get("CORPUS_INDEX_CACHE_MAX_SIZE", 32))
+
+# Takes the texts to embed, returns their embeddings and the provider's raw response
+EmbedFunction = Callable[[List[str]], Tuple[Sequence[Sequence[float]], Any]]
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+EMBEDDING_CACHE = LRUCache(EMBEDDING_CACHE_MAX_SIZE)
+CORPUS_INDEX_CACHE = LRUCache(CORPUS_INDEX_CACHE_MAX_SIZE)
+
+
+def embed_texts(
+    provider_name: str,
+    model: str,
+    texts: List[str],
+    embed: EmbedFunction,
+    cache: LRUCache = EMBEDDING_CACHE,
+) -> Tuple[np.ndarray, Any]:
+    """Embed texts, only sending to the provider the ones which are not cached yet
+
+    Args:
+        provider_name (str): provider name, part of the cache key
+        model (str): embedding model, part of the cache key
+        texts (List[str]): texts to embed
+        embed (EmbedFunction): provider call embedding a list of texts
+        cache (LRUCache, optional): embeddings cache. Defaults to `EMBEDDING_CACHE`.
+
+    Returns:
+        Tuple[np.ndarray, Any]: (len(texts), dimension) embeddings matrix and the raw
+            provider response, `None` if all embeddings were cached
+    """
+    if not texts:
+        return np.empty((0, 0)), None
+    keys = [(provider_name, model, hash_text(text)) for text in texts]
+    embeddings = [cache.get(key) for key in keys]
+
+    # embed each missing text once, even if it is repeated in texts
+    missing = {
+        key: text
+        for key, text, embedding in zip(keys, texts, embeddings)
+        if embedding is None
+    }
+    original_response = None
+    if missing:
+        missing_embeddings, original_response = embed(list(missing.values()))
+        if len(missing_embeddings) != len(missing):
+            raise ProviderException(
+                f"Expected {len(missing)} embeddings, got {len(missing_embeddings)}"
+            )
+        computed = {
+            key: np.asarray(embedding, dtype=np.float64)
+            for key, embedding in zip(missing, missing_embeddings)
+        }
+        for key, embedding in computed.items():
+            cache.set(key, embedding)
+        embeddings = [
+            computed[key] if embedding is None else embedding
+            for key, embedding in zip(keys, embeddings)
+        ]
+
+    return np.vstack(embeddings), original_response
+
+
+class EmbeddingIndex:
+    """Embeddings of a corpus, with precomputed values to score queries against it
+
+    Args:
+        embeddings (np.ndarray): (n_texts, dimension) embeddings matrix
+    """
+
+    def __init__(self, embeddings: np.ndarray) -> None:
+        self.embeddings = np.asarray(embeddings, dtype=np.float64)
+        self.norms = np.linalg.norm(self.embeddings, axis=1)
+        self.bits = self.embeddings > 0
+
+    @classmethod
+    def from_texts(
+        cls, provider_name: str, model: str, texts: List[str], embed: EmbedFunction
+    ) -> Tuple["EmbeddingIndex", Any]:
+        """Build the index of texts, embedding them with the cache
+
+        Returns:
+            Tuple[EmbeddingIndex, Any]: index and raw provider response (see `embed_texts`)
+        """
+        embeddings, original_response = embed_texts(provider_name, model, texts, embed)
+        return cls(embeddings), original_response
+
+    def __len__(self) -> int:
+        return len(self.embeddings)
+
+    def scores(self, query_embedding: Sequence[float], metric: str) -> np.ndarray:
+        """Similarity score of every text of the corpus with the query"""
+        query = np.asarray(query_embedding, dtype=np.float64)
+        if metric == "cosine":
+            return MATRIX_METRICS[metric](query, self.embeddings, self.norms)
+        if metric == "hamming":
+            return MATRIX_METRICS[metric](query, self.embeddings, self.bits)
+        return MATRIX_METRICS[metric](query, self.embeddings)
+
+    def search(
+        self,
+        query_embedding: Sequence[float],
+        metric: str = "cosine",
+        top_k: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """Return (document index, score) of the best matching texts, by descending score
+
+        Args:
+            query_embedding (Sequence[float]): embedding of the query
+            metric (str, optional): one of `MATRIX_METRICS`. Defaults to "cosine".
+            top_k (int, optional): only return the k best texts. Defaults to all texts.
+        """
+        if len(self) == 0:
+            return []
+        scores = self.scores(query_embedding, metric)
+        if top_k is not None and top_k < len(scores):
+            # only sort the k best scores
+            best = np.argpartition(-scores, top_k)[:top_k]
+            order = best[np.argsort(-scores[best], kind="stable")]
+        else:
+            order = np.argsort(-scores, kind="stable")
+        return [(int(index), float(scores[index])) for index in order]
+
+    def save(self, path: str) -> None:
+        """Save the index embeddings to a `.npy` file"""
+        with open(path, "wb") as file:
+            np.save(file, self.embeddings)
+
+    @classmethod
+    def load(cls, path: str) -> "EmbeddingIndex":
+        """Load an index saved with `save`"""
+        return cls(np.load(path))
+
+
+def get_corpus_index(
+    provider_name: str, model: str, texts: List[str], embed: EmbedFunction
+) -> Tuple[EmbeddingIndex, Any]:
+    """Get the index of a corpus, reused across searches on the same texts
+
+    Returns:
+        Tuple[EmbeddingIndex, Any]: index and raw provider response, `None` if nothing
+            had to be embedded
+    """
+    corpus_hash = hashlib.sha256()
+    for text in texts:
+        corpus_hash.update(hash_text(text).encode("ascii"))
+    key = (provider_name, model, corpus_hash.hexdigest())
+
+    index = CORPUS_INDEX_CACHE.get(key)
+    if index is not None:
+        return index, None
+    index, original_response = EmbeddingIndex.from_texts(
+        provider_name, model, texts, embed
+    )
+    CORPUS_INDEX_CACHE.set(key, index)
+    return index, original_response
@@ -1,4 +1,46 @@
+"""
+Shared HTTP layer for providers.
+
+`http_client` exposes the same helpers as the `requests` module (`get`, `post`, ...)
+but sends requests through one pooled `requests.Session` per host, so that
+connections to providers are kept alive and reused across calls.
+
+Sessions have default connect/read timeouts and retry with backoff on connection
+errors and on 429 and 503 responses, honoring the `Retry-After` header. Gateway
+errors (502, 504) are only retried for idempotent methods, since the provider may
+have processed (and billed) the request. Responses asking to retry later than
+`HTTP_MAX_RETRY_AFTER` are returned as is.
+They can be tuned with the following environment variables:
+    - `HTTP_POOL_MAXSIZE`: number of connections kept per host (default 32)
+    - `HTTP_CONNECT_TIMEOUT` / `HTTP_READ_TIMEOUT`: default timeouts in seconds
+    - `HTTP_MAX_RETRIES`: number of retries (default 3)
+    - `HTTP_BACKOFF_FACTOR`: backoff factor between retries (default 0.5)
+    - `HTTP_MAX_RETRY_AFTER`: longest `Retry-After` waited, in seconds (default 60)
+
+`async_http_client` is the asyncio counterpart used by async provider methods
+(eg: `atext__chat`). It keeps one aiohttp session per event loop, with the same
+pool size, timeouts and retry policy, and returns fully read responses exposing
+the `requests.Response` attributes used by provider helpers (`status_code`,
+`text`, `json()`...).
+"""
+
+import asyncio
+import json as jsonlib
+import os
+import threading
+import weakref
+from email.utils import parsedate_to_datetime
 from enum import Enum
+from http.cookiejar import DefaultCookiePolicy
+from time import time
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
 
 
 class HTTPMethod(Enum):
@@ -7,3 +49,349 @@ class HTTPMethod(Enum):
     PUT = "PUT"
     PATCH = "PATCH"
     DELETE = "DELETE"
+
+
+POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", 32))
+CONNECT_TIMEOUT = float(os.environ.get("HTTP_CONNECT_TIMEOUT", 10))
+READ_TIMEOUT = float(os.environ.get("HTTP_READ_TIMEOUT", 600))
+MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", 3))
+BACKOFF_FACTOR = float(os.environ.get("HTTP_BACKOFF_FACTOR", 0.5))
+MAX_RETRY_AFTER = float(os.environ.get("HTTP_MAX_RETRY_AFTER", 60))
+
+# Statuses meaning the request was not processed by the provider, retried for all
+# methods. Gateways may answer 502/504 after the provider processed the request, so
+# these are only retried for idempotent methods: a POST is never executed twice
+RETRY_STATUSES = frozenset({429, 503})
+IDEMPOTENT_RETRY_STATUSES = RETRY_STATUSES | {502, 504}
+IDEMPOTENT_METHODS = Retry.DEFAULT_ALLOWED_METHODS
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter applying a default timeout when none is given to the request"""
+
+    def __init__(
+        self, *args, timeout: Timeout = (CONNECT_TIMEOUT, READ_TIMEOUT), **kwargs
+    ):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def retry_statuses(method: str) -> FrozenSet[int]:
+    """Statuses on which a request with the given method can be retried"""
+    if method.upper() in IDEMPOTENT_METHODS:
+        return IDEMPOTENT_RETRY_STATUSES
+    return RETRY_STATUSES
+
+
+class ProviderRetry(Retry):
+    """Retry only retrying the statuses allowed for the method (see `retry_statuses`),
+    and giving up on responses asking to retry later than `max_retry_after` seconds
+    """
+
+    def __init__(self, *args, max_retry_after: float = MAX_RETRY_AFTER, **kwargs):
+        self.max_retry_after = max_retry_after
+        super().__init__(*args, **kwargs)
+
+    def new(self, **kw: Any) -> "ProviderRetry":
+        kw.setdefault("max_retry_after", self.max_retry_after)
+        return super().new(**kw)
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if status_code not in retry_statuses(method):
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(
+        self, method=None, url=None, response=None, error=None, _pool=None, **kwargs
+    ) -> "ProviderRetry":
+        if (
+            response is not None
+            and response.status in self.status_forcelist
+            and self.respect_retry_after_header
+        ):
+            retry_after = _get_retry_after(response.headers)
+            if retry_after is not None and retry_after > self.max_retry_after:
+                # the response is returned to the provider, see `raise_on_status`
+                raise MaxRetryError(
+                    _pool, url, ResponseError(f"Retry-After of {retry_after:.0f}s")
+                )
+        return super().increment(method, url, response, error, _pool, **kwargs)
+
+
+def build_retry(
+    total: int = MAX_RETRIES,
+    backoff_factor: float = BACKOFF_FACTOR,
+    max_retry_after: float = MAX_RETRY_AFTER,
+) -> Retry:
+    return ProviderRetry(
+        total=total,
+        connect=total,
+        read=0,  # the provider may have received the request
+        status=total,
+        backoff_factor=backoff_factor,
+        status_forcelist=IDEMPOTENT_RETRY_STATUSES,
+        allowed_methods=None,  # statuses are filtered by method in `is_retry`
+        respect_retry_after_header=True,
+        raise_on_status=False,  # let the provider handle the last error response
+        max_retry_after=max_retry_after,
+    )
+
+
+def build_session(
+    pool_maxsize: int = POOL_MAXSIZE,
+    timeout: Timeout = (CONNECT_TIMEOUT, READ_TIMEOUT),
+    retry: Optional[Retry] = None,
+) -> requests.Session:
+    """Create a keep-alive session with pooled connections, default timeouts and retries"""
+    session = requests.Session()
+    # sessions are shared between calls made with different api keys, never keep cookies
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = TimeoutHTTPAdapter(
+        timeout=timeout,
+        pool_connections=1,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry or build_retry(),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSIONS: Dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_http_session(url: str) -> requests.Session:
+    """Get the pooled session of the host of the given url, creating it on first use"""
+    parts = urlsplit(url)
+    host = f"{parts.scheme}://{parts.netloc}"
+    session = _SESSIONS.get(host)
+    if session is None:
+        with _SESSIONS_LOCK:
+            session = _SESSIONS.get(host)
+            if session is None:
+                session = build_session()
+                _SESSIONS[host] = session
+    return session
+
+
+def close_http_sessions() -> None:
+    """Close all pooled sessions and their connections"""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+
+class HTTPClient:
+    """Drop-in replacement of the `requests` module helpers using pooled sessions"""
+
+    def request(
+        self, method: Union[str, HTTPMethod], url: str, **kwargs
+    ) -> requests.Response:
+        if isinstance(method, HTTPMethod):
+            method = method.value
+        return get_http_session(url).request(method, url, **kwargs)
+
+    def get(self, url: str, params=None, **kwargs) -> requests.Response:
+        return self.request("GET", url, params=params, **kwargs)
+
+    def options(self, url: str, **kwargs) -> requests.Response:
+        return self.request("OPTIONS", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("allow_redirects", False)
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, data=None, json=None, **kwargs) -> requests.Response:
+        return self.request("POST", url, data=data, json=json, **kwargs)
+
+    def put(self, url: str, data=None, **kwargs) -> requests.Response:
+        return self.request("PUT", url, data=data, **kwargs)
+
+    def patch(self, url: str, data=None, **kwargs) -> requests.Response:
+        return self.request("PATCH", url, data=data, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+
+http_client = HTTPClient()
+
+
+class AsyncHTTPResponse:
+    """Fully read response of `AsyncHTTPClient`, mimicking `requests.Response`"""
+
+    def __init__(
+        self, status_code: int, headers: Dict[str, str], content: bytes, url: str
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self, **kwargs) -> Any:
+        return jsonlib.loads(self.content, **kwargs)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise requests.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+
+def _get_retry_after(headers: Dict[str, str]) -> Optional[float]:
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_client_timeout(timeout: Optional[Timeout]) -> Optional[aiohttp.ClientTimeout]:
+    if timeout is None:
+        return None
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+    return aiohttp.ClientTimeout(sock_connect=timeout, sock_read=timeout)
+
+
+_ASYNC_SESSIONS: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]"
+) = weakref.WeakKeyDictionary()
+
+
+def get_async_http_session() -> aiohttp.ClientSession:
+    """Get the pooled aiohttp session of the running event loop, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    session = _ASYNC_SESSIONS.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, limit_per_host=POOL_MAXSIZE),
+            timeout=_as_client_timeout((CONNECT_TIMEOUT, READ_TIMEOUT)),
+            # sessions are shared between calls made with different api keys
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+        _ASYNC_SESSIONS[loop] = session
+    return session
+
+
+async def close_async_http_sessions() -> None:
+    """Close the pooled aiohttp session of the running event loop"""
+    session = _ASYNC_SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+class AsyncHTTPClient:
+    """asyncio version of `HTTPClient`, with the retry policy of `build_retry`"""
+
+    def __init__(
+        self,
+        max_retries: int = MAX_RETRIES,
+        backoff_factor: float = BACKOFF_FACTOR,
+        max_retry_after: float = MAX_RETRY_AFTER,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_retry_after = max_retry_after
+
+    async def request(
+        self,
+        method: Union[str, HTTPMethod],
+        url: str,
+        timeout: Optional[Timeout] = None,
+        **kwargs,
+    ) -> AsyncHTTPResponse:
+        if isinstance(method, HTTPMethod):
+            method = method.value
+        params = kwargs.get("params")
+        if isinstance(params, dict):
+            # like requests, drop unset query parameters
+            kwargs["params"] = {
+                key: value for key, value in params.items() if value is not None
+            }
+        client_timeout = _as_client_timeout(timeout)
+        if client_timeout is not None:
+            kwargs["timeout"] = client_timeout
+        session = get_async_http_session()
+
+        attempt = 0
+        while True:
+            try:
+                async with session.request(method, url, **kwargs) as response:
+                    result = AsyncHTTPResponse(
+                        status_code=response.status,
+                        headers=dict(response.headers),
+                        content=await response.read(),
+                        url=str(response.url),
+                    )
+            except aiohttp.ClientConnectorError as exc:
+                # the provider did not receive the request, safe to retry
+                if attempt >= self.max_retries:
+                    raise requests.ConnectionError(str(exc)) from exc
+                delay = None
+            except asyncio.TimeoutError as exc:
+                raise requests.Timeout(f"Request to {url} timed out") from exc
+            else:
+                if (
+                    result.status_code not in retry_statuses(method)
+                    or attempt >= self.max_retries
+                ):
+                    return result
+                delay = _get_retry_after(result.headers)
+                if delay is not None and delay > self.max_retry_after:
+                    return result
+            if delay is None:
+                delay = self.backoff_factor * (2 ** (attempt - 1)) if attempt else 0
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str, params=None, **kwargs) -> AsyncHTTPResponse:
+        return await self.request("GET", url, params=params, **kwargs)
+
+    async def options(self, url: str, **kwargs) -> AsyncHTTPResponse:
+        return await self.request("OPTIONS", url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> AsyncHTTPResponse:
+        kwargs.setdefault("allow_redirects", False)
+        return await self.request("HEAD", url, **kwargs)
+
+    async def post(self, url: str, data=None, json=None, **kwargs) -> AsyncHTTPResponse:
+        return await self.request("POST", url, data=data, json=json, **kwargs)
+
+    async def put(self, url: str, data=None, **kwargs) -> AsyncHTTPResponse:
+        return await self.request("PUT", url, data=data, **kwargs)
+
+    async def patch(self, url: str, data=None, **kwargs) -> AsyncHTTPResponse:
+        return await self.request("PATCH", url, data=data, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> AsyncHTTPResponse:
+        return await self.request("DELETE", url, **kwargs)
+
+
+async_http_client = AsyncHTTPClient()
@@ -1,17 +1,22 @@
 import re
+import threading
 from collections import defaultdict
 from importlib import import_module
-from typing import List, Optional, Sequence
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 import pycountry
 from langcodes import Language, closest_supported_match, tag_parser
 
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
+from edenai_apis.utils.cache import LRUCache
 
 AUTO_DETECT = "auto-detect"
 AUTO_DETECT_NAME = "Auto detection"
 
+# maximum number of memoized language tags per provider (feature, subfeature)
+LANGUAGE_RESOLUTIONS_MAX_SIZE = 512
+
 
 class LanguageErrorMessage:
     LANGUAGE_REQUIRED = lambda input_lang: (
@@ -68,7 +73,8 @@ def load_language_constraints(
         subfeature=subfeature,
     )
     default = defaultdict(lambda: None)
-    languages = info.get("constraints", default).get("languages", [])
+    # provider info is shared, build a new list instead of appending to it
+    languages = list(info.get("constraints", default).get("languages") or [])
     if info.get("constraints", default).get("allow_null_language"):
         languages.append(AUTO_DETECT)
     return languages
@@ -102,13 +108,10 @@ def load_standardized_language(
         interface = import_module("edenai_apis.interface")
         providers = interface.list_providers(feature, subfeature)
 
-    result = []
+    result = set()
     for provider in providers:
-        list_languages = expand_languages_for_user(
-            load_language_constraints(provider, feature, subfeature)
-        )
-        result = list(set(list_languages + result))
-    return result
+        result.update(get_language_index(provider, feature, subfeature).standardized)
+    return list(result)
 
 
 def format_language_name(language_name: str, isocode: str) -> str:
@@ -184,16 +187,9 @@ def compare_language_and_region_code(
     )
 
 
-def provide_appropriate_language(
-    iso_code: str, provider_name: str, feature: str, subfeature: str
-):
-    if not check_language_format(iso_code):
-        raise SyntaxError(f"Language code '{iso_code}' badly formatted")
-
-    list_languages: Sequence[str] = load_language_constraints(
-        provider_name, feature, subfeature
-    )
-
+def _closest_provider_language(
+    iso_code: str, list_languages: Sequence[str]
+) -> Optional[str]:
     # Sometimes closest_supported_match raise a RuntimeError,
     # so we need a while True for catch this error and retry until function works
     while True:
@@ -211,3 +207,84 @@ def provide_appropriate_language(
         return None
 
     return selected_code_language
+
+
+class LanguageResolution(NamedTuple):
+    """Result of matching a user language with the languages supported by a provider
+
+    Attributes:
+        code (str, optional): provider's language code, `None` if not supported
+        suggested_language (str, optional): more general language supported by the
+            provider, when `code` is `None` (eg: `fr` for `fr-FR`)
+    """
+
+    code: Optional[str]
+    suggested_language: Optional[str] = None
+
+
+class LanguageIndex:
+    """Languages supported by a provider for a (feature, subfeature), with memoized
+    resolution of user language tags
+
+    Args:
+        languages (Sequence[str]): languages of the provider constraints
+    """
+
+    def __init__(self, languages: Sequence[str]) -> None:
+        self.languages = tuple(languages)
+        self.standardized = frozenset(expand_languages_for_user(list(self.languages)))
+        self._resolutions = LRUCache(max_size=LANGUAGE_RESOLUTIONS_MAX_SIZE)
+
+    def resolve(self, iso_code: str) -> LanguageResolution:
+        """Match a language tag with the provider's languages
+
+        Raises:
+            SyntaxError: if the language tag is badly formatted
+        """
+        resolution = self._resolutions.get(iso_code)
+        if resolution is not None:
+            return resolution
+
+        if not check_language_format(iso_code):
+            raise SyntaxError(f"Language code '{iso_code}' badly formatted")
+
+        code = _closest_provider_language(iso_code, list(self.languages))
+        suggested_language = None
+        if code is None and "-" in iso_code:
+            generic_language = iso_code.split("-")[0]
+            if generic_language in self.standardized:
+                suggested_language = generic_language
+        resolution = LanguageResolution(code, suggested_language)
+        self._resolutions.set(iso_code, resolution)
+        return resolution
+
+
+_LANGUAGE_INDEXES: Dict[Tuple[str, str, str], LanguageIndex] = {}
+_LANGUAGE_INDEXES_LOCK = threading.Lock()
+
+
+def get_language_index(
+    provider_name: str, feature: str, subfeature: str
+) -> LanguageIndex:
+    """Get the language index of a provider (feature, subfeature), built on first use"""
+    key = (provider_name, feature, subfeature)
+    index = _LANGUAGE_INDEXES.get(key)
+    if index is None:
+        index = LanguageIndex(
+            load_language_constraints(provider_name, feature, subfeature)
+        )
+        with _LANGUAGE_INDEXES_LOCK:
+            index = _LANGUAGE_INDEXES.setdefault(key, index)
+    return index
+
+
+def invalidate_language_indexes() -> None:
+    """Drop all language indexes, eg: after providers info are reloaded"""
+    with _LANGUAGE_INDEXES_LOCK:
+        _LANGUAGE_INDEXES.clear()
+
+
+def provide_appropriate_language(
+    iso_code: str, provider_name: str, feature: str, subfeature: str
+):
+    return get_language_index(provider_name, feature, subfeature).resolve(iso_code).code
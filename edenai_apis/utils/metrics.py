@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 
@@ -18,7 +18,7 @@ def manhattan_similarity(embedding1: List[float], embedding2: List[float]):
     """
     Computes the manhattan similarity between two vectors.
     """
-    return SCORE_MULTIPLIER - sum(abs(val1-val2) for val1, val2 in zip(embedding1,embedding2))
+    return SCORE_MULTIPLIER - np.abs(np.subtract(embedding1, embedding2)).sum()
 
 def squared_euclidean_similarity(embedding1: List[float], embedding2: List[float]):
     """
@@ -27,14 +27,67 @@ def squared_euclidean_similarity(embedding1: List[float], embedding2: List[float
     # numpy arrays
     point1 = np.array(embedding1)
     point2 = np.array(embedding2)
-    
+
     # calculating Euclidean distance
     dist = np.linalg.norm(point1 - point2)
     return  (1 - dist) * SCORE_MULTIPLIER
 
+def hamming_similarity(embedding1: List[float], embedding2: List[float]):
+    """
+    Computes the hamming similarity between the binarized (sign) vectors.
+    """
+    differing_bits = np.not_equal(np.greater(embedding1, 0), np.greater(embedding2, 0))
+    return (1 - differing_bits.mean()) * SCORE_MULTIPLIER
+
 
 METRICS = {
     "cosine" : cosine_similarity,
     "manhattan" : manhattan_similarity,
     "euclidean" : squared_euclidean_similarity,
+    "hamming" : hamming_similarity,
+}
+
+
+# Vectorized versions, scoring a query against all rows of a (n_texts, dimension) matrix at once
+
+
+def cosine_similarities(
+    query: np.ndarray, corpus: np.ndarray, corpus_norms: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Computes the cosine similarities between a vector and each row of a matrix.
+    """
+    if corpus_norms is None:
+        corpus_norms = np.linalg.norm(corpus, axis=1)
+    return corpus @ query / (corpus_norms * np.linalg.norm(query)) * SCORE_MULTIPLIER
+
+def manhattan_similarities(query: np.ndarray, corpus: np.ndarray) -> np.ndarray:
+    """
+    Computes the manhattan similarities between a vector and each row of a matrix.
+    """
+    return SCORE_MULTIPLIER - np.abs(corpus - query).sum(axis=1)
+
+def squared_euclidean_similarities(query: np.ndarray, corpus: np.ndarray) -> np.ndarray:
+    """
+    Computes the euclidean similarities between a vector and each row of a matrix.
+    """
+    return (1 - np.linalg.norm(corpus - query, axis=1)) * SCORE_MULTIPLIER
+
+def hamming_similarities(
+    query: np.ndarray, corpus: np.ndarray, corpus_bits: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Computes the hamming similarities between the binarized (sign) vector and each row of a matrix.
+    """
+    if corpus_bits is None:
+        corpus_bits = corpus > 0
+    differing_bits = corpus_bits != (query > 0)
+    return (1 - differing_bits.mean(axis=1)) * SCORE_MULTIPLIER
+
+
+MATRIX_METRICS = {
+    "cosine" : cosine_similarities,
+    "manhattan" : manhattan_similarities,
+    "euclidean" : squared_euclidean_similarities,
+    "hamming" : hamming_similarities,
 }
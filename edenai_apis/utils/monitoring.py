@@ -25,6 +25,7 @@ CREATE TABLE IF NOT EXISTS history (
 """
 
 import getpass
+import inspect
 import os
 import socket
 from datetime import datetime
@@ -36,6 +37,7 @@ from loaders.loaders import load_provider
 from psycopg2 import errors
 from psycopg2.extensions import AsIs
 
+from .concurrency import run_sync
 from .upload_s3 import get_providers_json_from_s3
 
 global INFOS_FROM_S3
@@ -77,6 +79,40 @@ def monitor_call(condition=False):
                         error=error,
                     )
 
+        async def async_wrapper(
+            provider_name,
+            feature,
+            subfeature,
+            *args,
+            **kwargs,
+        ):
+            fake = kwargs.get("fake", False)
+            error = "Fake" if fake else None
+            user_email = kwargs.get("user_email")
+            try:
+                return await compute_func(
+                    provider_name,
+                    feature,
+                    subfeature,
+                    *args,
+                    **kwargs,
+                )
+            except Exception as exc:
+                error = str(exc)
+                raise
+            finally:
+                if condition:
+                    await run_sync(
+                        insert_api_call,
+                        provider=provider_name,
+                        feature=feature,
+                        subfeature=subfeature,
+                        user_email=user_email,
+                        error=error,
+                    )
+
+        if inspect.iscoroutinefunction(compute_func):
+            return async_wrapper
         return wrapper
 
     return decorator_monitor_call
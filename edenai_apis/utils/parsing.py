@@ -1,13 +1,147 @@
 import logging
-from typing import Any, List, Optional, TypeVar, Union, Protocol
+import re
+import reprlib
+import threading
+import time
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    Protocol,
+)
 
 T = TypeVar("T")
 
+PathKey = Union[str, int]
+Path = Union[str, Sequence[PathKey]]
+
+# a missed path is logged at most once per `MISS_LOG_INTERVAL` seconds, with the
+# extracted object truncated, since misses are common for optional fields
+MISS_LOG_INTERVAL = 60.0
+_MISS_LOG_MAX_PATHS = 1024
+_MISS_REPR = reprlib.Repr()
+_MISS_REPR.maxlevel = 2
+_MISS_REPR.maxdict = 4
+_MISS_REPR.maxlist = 4
+_MISS_REPR.maxstring = 40
+_MISS_REPR.maxother = 40
+
+_last_miss_logs: Dict[Tuple, float] = {}
+_miss_log_lock = threading.Lock()
+
+_PATH_TOKEN = re.compile(r"([^.\[\]]+)|\[(-?\d+)\]")
+
 
 class Indexable(Protocol):
     def __getitem__(self, __key: Any) -> Any: ...
 
 
+@lru_cache(maxsize=1024)
+def _parse_path_string(path: str) -> Tuple[PathKey, ...]:
+    keys: List[PathKey] = []
+    position = 0
+    for match in _PATH_TOKEN.finditer(path):
+        key, index = match.groups()
+        # keys are separated by dots, indexes directly follow the previous key
+        separator = "" if index is not None or position == 0 else "."
+        if path[position : match.start()] != separator:
+            raise ValueError(f"Invalid path: '{path}'")
+        keys.append(int(index) if index is not None else key)
+        position = match.end()
+    if position != len(path) or not keys:
+        raise ValueError(f"Invalid path: '{path}'")
+    return tuple(keys)
+
+
+def parse_path(path: Path) -> Tuple[PathKey, ...]:
+    """
+    Parse a path once so it can be reused to extract values
+
+    Args:
+        path (str | list[str | int]): either a list of keys/indexes or a string where keys
+            are separated by dots and indexes are in brackets (eg: `"result[0].text"`)
+
+    Returns:
+        tuple[str | int]: keys/indexes of the path
+
+    Example:
+      >>> parse_path("one.two[1]")
+      ('one', 'two', 1)
+    """
+    if isinstance(path, str):
+        return _parse_path_string(path)
+    return tuple(path)
+
+
+def _should_log_miss(path: Tuple) -> bool:
+    now = time.monotonic()
+    with _miss_log_lock:
+        last_log = _last_miss_logs.get(path)
+        if last_log is not None and now - last_log < MISS_LOG_INTERVAL:
+            return False
+        if len(_last_miss_logs) >= _MISS_LOG_MAX_PATHS:
+            _last_miss_logs.clear()
+        _last_miss_logs[path] = now
+        return True
+
+
+class _Truncated:
+    """Truncated repr of an object, only computed if the log record is emitted"""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __str__(self) -> str:
+        return _MISS_REPR.repr(self.obj)
+
+
+def _log_extraction_miss(message: str, path: Tuple, *args: Any) -> None:
+    if logging.getLogger().isEnabledFor(logging.WARNING) and _should_log_miss(path):
+        logging.warning(message, *args)
+
+
+def _extract_path(
+    obj: Any, path: Tuple, fallback: Any, type_validator: Optional[type]
+) -> Any:
+    result = obj
+    try:
+        for key in path:
+            result = result[key]  # type: ignore
+    except (KeyError, IndexError, TypeError) as exc:
+        _log_extraction_miss(
+            "%s: %s while trying to extract %s of object %s, returning fallback: %s",
+            path,
+            exc.__class__.__name__,
+            exc,
+            list(path),
+            _Truncated(obj),
+            _Truncated(fallback),
+        )
+        return fallback
+
+    if type_validator is not None and type(result) != type_validator:
+        _log_extraction_miss(
+            "Object %s of type %s is not of expected type: %s, returning fallback: %s",
+            path,
+            _Truncated(result),
+            type(result),
+            type_validator,
+            _Truncated(fallback),
+        )
+        return fallback
+
+    return result
+
+
 def extract(
     obj: Indexable,
     path: List[Union[str, int]],
@@ -47,23 +181,91 @@ def extract(
       >>> extract(obj, ["one", "two", 1], fallback="FALLBACK_VALUE", type_validator=int)
       FALLBACK_VALUE
     """
-    result = obj
-    try:
-        for key in path:
-            result = result[key]  # type: ignore
-    except (KeyError, IndexError, TypeError) as exc:
-        logging.warning(
-            f"{exc.__class__.__name__}: {exc} while trying to extract {path} of object {obj}, returning fallback: {fallback}"
-        )
-        return fallback
+    return _extract_path(obj, tuple(path), fallback, type_validator)
 
-    if type_validator is not None and type(result) != type_validator:
-        logging.warning(
-            f"Object {result} of type {type(result)} is not of expected type: {type_validator}, returning fallback: {fallback}"
+
+class PathExtractor:
+    """
+    Extract many values from an object in one traversal, with paths parsed once
+
+    Paths sharing a prefix (eg: `"Vendor.value.name"` and `"Vendor.value.address"`)
+    only walk that prefix once. Build the extractor once, eg: at module level, and
+    reuse it for every provider response.
+
+    Example:
+      >>> vendor = PathExtractor({"name": "Vendor.value.name", "city": "Vendor.value.city"})
+      >>> vendor.extract({"Vendor": {"value": {"name": "Eden AI"}}})
+      {'name': 'Eden AI', 'city': None}
+    """
+
+    def __init__(
+        self,
+        paths: Mapping[str, Path],
+        fallbacks: Optional[Mapping[str, Any]] = None,
+        type_validators: Optional[Mapping[str, type]] = None,
+    ) -> None:
+        """
+        Args:
+            paths (dict[str, path]): name of each value and its path, see `parse_path`
+            fallbacks (dict[str, Any], optional): fallback of each value, default to None
+            type_validators (dict[str, type], optional): expected type of each value
+        """
+        self.paths = {name: parse_path(path) for name, path in paths.items()}
+        self.fallbacks = dict(fallbacks or {})
+        self.type_validators = dict(type_validators or {})
+        # trie of the paths: key -> (names of the values ending here, children)
+        self._tree: Dict[PathKey, Tuple[List[str], Dict]] = {}
+        for name, path in self.paths.items():
+            children = self._tree
+            for depth, key in enumerate(path):
+                ending, next_children = children.setdefault(key, ([], {}))
+                if depth == len(path) - 1:
+                    ending.append(name)
+                children = next_children
+
+    def extract(self, obj: Indexable) -> Dict[str, Any]:
+        """Extract all values of `obj`, missing ones are replaced by their fallback"""
+        results: Dict[str, Any] = {}
+        self._walk(obj, obj, self._tree, results)
+        return results
+
+    def extract_one(self, obj: Indexable, name: str) -> Any:
+        """Extract a single value of `obj` given its name"""
+        return _extract_path(
+            obj,
+            self.paths[name],
+            self.fallbacks.get(name),
+            self.type_validators.get(name),
         )
-        return fallback
 
-    return result
+    def _walk(
+        self, root: Any, value: Any, children: Dict, results: Dict[str, Any]
+    ) -> None:
+        for key, (ending, next_children) in children.items():
+            try:
+                child = value[key]
+            except (KeyError, IndexError, TypeError):
+                # let the slow path fill the fallbacks and log the misses
+                self._fill_missing(root, next_children, ending, results)
+                continue
+            for name in ending:
+                results[name] = self._validate(root, name, child)
+            if next_children:
+                self._walk(root, child, next_children, results)
+
+    def _fill_missing(
+        self, root: Any, children: Dict, ending: List[str], results: Dict[str, Any]
+    ) -> None:
+        for name in ending:
+            results[name] = self.extract_one(root, name)
+        for next_ending, next_children in children.values():
+            self._fill_missing(root, next_children, next_ending, results)
+
+    def _validate(self, root: Any, name: str, value: Any) -> Any:
+        type_validator = self.type_validators.get(name)
+        if type_validator is not None and type(value) != type_validator:
+            return self.extract_one(root, name)
+        return value
 
 
 def extract_amount(
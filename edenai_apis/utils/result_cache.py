@@ -0,0 +1,505 @@
+"""
+Opt-in cache of `compute_output` results for subfeatures whose result only depends
+on their input (translation, NER, embeddings, OCR of a given file...).
+
+Results are keyed by provider, feature, subfeature, phase, canonicalized arguments
+(model included), api keys and the content hash of input files, so the same file
+uploaded twice hits the cache. Only subfeatures listed in `CACHEABLE_SUBFEATURES` are
+cached, errors and fake results never are.
+
+The cache is configured with the following environment variables:
+    - `RESULT_CACHE`: backend, disabled when empty (default):
+        - `memory`: in-process LRU (`MemoryResultCache`)
+        - `sqlite:///results.db` (relative path) or `sqlite:////tmp/results.db`
+          (absolute path): on-disk SQLite database (`SQLiteResultCache`)
+        - `redis://[:password@]host:port/db`: Redis or any server speaking its
+          protocol (`RedisResultCache`)
+    - `RESULT_CACHE_TTL`: lifetime of results in seconds (default 86400, 0 for no expiry)
+    - `RESULT_CACHE_MAX_SIZE`: number of results kept by the memory and SQLite
+      backends (default 1000), Redis relies on the server eviction policy
+    - `RESULT_CACHE_MAX_VALUE_SIZE`: results bigger than this many bytes once
+      serialized are not cached (default 1MB)
+
+Backend failures (eg: unreachable Redis) are logged and handled as cache misses.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote, urlsplit
+
+from edenai_apis.utils.cache import LRUCache
+from edenai_apis.utils.upload_cache import hash_file
+
+RESULT_CACHE = os.environ.get("RESULT_CACHE", "")
+RESULT_CACHE_TTL = float(os.environ.get("RESULT_CACHE_TTL", 86400))
+RESULT_CACHE_MAX_SIZE = int(os.environ.get("RESULT_CACHE_MAX_SIZE", 1000))
+RESULT_CACHE_MAX_VALUE_SIZE = int(
+    os.environ.get("RESULT_CACHE_MAX_VALUE_SIZE", 1024 * 1024)
+)
+
+# (feature, subfeature) whose results are a pure function of their input for a
+# given provider and model
+CACHEABLE_SUBFEATURES = frozenset(
+    {
+        ("translation", "automatic_translation"),
+        ("translation", "language_detection"),
+        ("text", "named_entity_recognition"),
+        ("text", "sentiment_analysis"),
+        ("text", "keyword_extraction"),
+        ("text", "syntax_analysis"),
+        ("text", "topic_extraction"),
+        ("text", "emotion_detection"),
+        ("text", "moderation"),
+        ("text", "spell_check"),
+        ("text", "embeddings"),
+        ("image", "embeddings"),
+        ("image", "explicit_content"),
+        ("image", "face_detection"),
+        ("image", "landmark_detection"),
+        ("image", "logo_detection"),
+        ("image", "object_detection"),
+        ("ocr", "ocr"),
+        ("ocr", "invoice_parser"),
+        ("ocr", "receipt_parser"),
+        ("ocr", "identity_parser"),
+        ("ocr", "resume_parser"),
+        ("ocr", "financial_parser"),
+        ("ocr", "bank_check_parsing"),
+    }
+)
+
+FILE_ARGS = ("file", "file1", "file2")
+
+
+def is_cacheable(feature: str, subfeature: str, phase: str = "") -> bool:
+    """Whether results of a subfeature can be cached, phases (eg: image search
+    uploads) and async jobs never are"""
+    return not phase and (feature, subfeature) in CACHEABLE_SUBFEATURES
+
+
+class ResultCacheBackend(ABC):
+    """Storage of serialized results by key"""
+
+    # whether calls block on I/O, they are then run on the provider executor by
+    # `compute_output_async`
+    blocking_io: bool = True
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Store `value`, `ttl` of 0 or less means no expiry"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class MemoryResultCache(ResultCacheBackend):
+    """In-process LRU backend
+
+    Args:
+        max_size (int): maximum number of results
+    """
+
+    blocking_io = False
+
+    def __init__(self, max_size: int = RESULT_CACHE_MAX_SIZE) -> None:
+        self._cache = LRUCache(max_size)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+    def delete(self, key: str) -> None:
+        self._cache.pop(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class SQLiteResultCache(ResultCacheBackend):
+    """On-disk backend, results are shared by the processes using the same file
+
+    Least recently used results are deleted beyond `max_size` results.
+
+    Args:
+        path (str): database file, created if missing
+        max_size (int): maximum number of results
+    """
+
+    def __init__(self, path: str, max_size: int = RESULT_CACHE_MAX_SIZE) -> None:
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_used_at ON results (used_at)"
+            )
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value FROM results WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE results SET used_at = ? WHERE key = ?", (now, key)
+            )
+        return row[0]
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        now = time.time()
+        expires_at = now + ttl if ttl > 0 else float("inf")
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, now),
+            )
+            self._connection.execute(
+                "DELETE FROM results WHERE expires_at <= ?", (now,)
+            )
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM results"
+            ).fetchone()
+            if count > self.max_size:
+                self._connection.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY used_at LIMIT ?)",
+                    (count - self.max_size,),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM results WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM results")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM results"
+            ).fetchone()
+        return count
+
+
+class RedisError(Exception):
+    """Error reply of a Redis server"""
+
+
+class RedisResultCache(ResultCacheBackend):
+    """Backend storing results in Redis, or any server speaking the Redis protocol
+
+    A minimal client is used (GET, SET with expiry, DEL, SCAN), with one connection
+    per thread, so no Redis library is needed.
+
+    Args:
+        url (str): `redis://[:password@]host[:port][/db]`
+        prefix (str): prefix of the keys, `clear` only deletes keys with this prefix
+        timeout (float): socket timeout in seconds
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "edenai:result:",
+        timeout: float = 1.0,
+    ) -> None:
+        parsed = urlsplit(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.strip("/") or 0)
+        self.prefix = prefix
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self):
+        connection = socket.create_connection((self.host, self.port), self.timeout)
+        self._local.connection = connection
+        self._local.reader = connection.makefile("rb")
+        if self.password:
+            self._command("AUTH", self.password)
+        if self.db:
+            self._command("SELECT", self.db)
+
+    def _close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            try:
+                self._local.reader.close()
+                connection.close()
+            except OSError:
+                pass
+
+    def _command(self, *args: Any) -> Any:
+        if getattr(self._local, "connection", None) is None:
+            self._connect()
+        encoded = [arg if isinstance(arg, bytes) else str(arg).encode() for arg in args]
+        request = b"*%d\r\n" % len(encoded) + b"".join(
+            b"$%d\r\n%s\r\n" % (len(arg), arg) for arg in encoded
+        )
+        try:
+            self._local.connection.sendall(request)
+            return self._read_reply()
+        except (OSError, ValueError):
+            # the connection is in an unknown state
+            self._close()
+            raise
+
+    def _read_reply(self) -> Any:
+        line = self._local.reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by the Redis server")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            raise RedisError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._local.reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(payload)
+            return None if length < 0 else [self._read_reply() for _ in range(length)]
+        raise ValueError(f"Invalid Redis reply: {line!r}")
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._command("GET", self.prefix + key)
+        return None if value is None else value.decode()
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        if ttl > 0:
+            self._command("SET", self.prefix + key, value, "PX", int(ttl * 1000))
+        else:
+            self._command("SET", self.prefix + key, value)
+
+    def delete(self, key: str) -> None:
+        self._command("DEL", self.prefix + key)
+
+    def clear(self) -> None:
+        cursor = "0"
+        while True:
+            cursor, keys = self._command(
+                "SCAN", cursor, "MATCH", self.prefix + "*", "COUNT", 1000
+            )
+            if keys:
+                self._command("DEL", *keys)
+            cursor = cursor.decode()
+            if cursor == "0":
+                return
+
+
+@dataclass
+class ResultCacheStats:
+    """Counters of a result cache
+
+    Attributes:
+        hits (int): results served from the cache
+        misses (int): lookups without usable result
+        writes (int): results stored
+        skipped (int): results too big or not serializable, not stored
+        errors (int): backend failures
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    skipped: int = 0
+    errors: int = 0
+
+
+class ResultCache:
+    """Results of cacheable subfeatures stored in a backend
+
+    Args:
+        backend (ResultCacheBackend): storage of the results
+        ttl (float): lifetime of results in seconds, 0 for no expiry
+        max_value_size (int): results bigger than this many bytes once serialized
+            are not stored
+    """
+
+    def __init__(
+        self,
+        backend: ResultCacheBackend,
+        ttl: float = RESULT_CACHE_TTL,
+        max_value_size: int = RESULT_CACHE_MAX_VALUE_SIZE,
+    ) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.max_value_size = max_value_size
+        self.stats = ResultCacheStats()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def metrics(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return asdict(self.stats)
+
+    @staticmethod
+    def key(
+        provider_name: str,
+        feature: str,
+        subfeature: str,
+        phase: str,
+        args: Dict[str, Any],
+        api_keys: Optional[Dict] = None,
+    ) -> str:
+        """Cache key of a call, with validated `args` (see `canonical_args`)"""
+        serialized = json.dumps(
+            [
+                provider_name,
+                feature,
+                subfeature,
+                phase,
+                canonical_args(args),
+                api_keys or {},
+            ],
+            sort_keys=True,
+            default=repr,
+        )
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get(self, key: str, include_original_response: bool = True) -> Optional[Dict]:
+        """Cached result, None if missing or stored without the original response
+        while it is needed"""
+        try:
+            value = self.backend.get(key)
+            entry = None if value is None else json.loads(value)
+        except Exception as exc:
+            # unreachable backend or corrupt value, treated as a miss
+            logging.warning("Result cache lookup failed: %s", exc)
+            self._count("errors")
+            entry = None
+        if entry is None:
+            self._count("misses")
+            return None
+        if include_original_response and not entry["original_response"]:
+            self._count("misses")
+            return None
+        self._count("hits")
+        result = entry["result"]
+        if not include_original_response and "original_response" in result:
+            result["original_response"] = None
+        return result
+
+    def set(
+        self, key: str, result: Dict, include_original_response: bool = True
+    ) -> None:
+        try:
+            value = json.dumps(
+                {"original_response": include_original_response, "result": result}
+            )
+        except (TypeError, ValueError):
+            # results are returned as is on hits, values json can't represent
+            # exactly are not cached
+            self._count("skipped")
+            return
+        if len(value) > self.max_value_size:
+            self._count("skipped")
+            return
+        try:
+            self.backend.set(key, value, self.ttl)
+        except Exception as exc:
+            logging.warning("Result cache write failed: %s", exc)
+            self._count("errors")
+            return
+        self._count("writes")
+
+
+def canonical_args(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Arguments of a call as they matter for its result: input files on disk are
+    replaced by their content hash, and their url (same content) is dropped"""
+    canonical = dict(args)
+    for file_arg in FILE_ARGS:
+        file_hash = _file_hash(canonical.get(file_arg))
+        if file_hash is not None:
+            canonical[file_arg] = file_hash
+            canonical.pop(f"{file_arg}_url", None)
+    files = canonical.get("files")
+    if files:
+        hashes: List[Optional[str]] = [_file_hash(file) for file in files]
+        if all(hashes):
+            canonical["files"] = hashes
+            canonical.pop("files_url", None)
+    return canonical
+
+
+def _file_hash(file: Any) -> Optional[str]:
+    if isinstance(file, str) and os.path.isfile(file):
+        return "sha256:" + hash_file(file)
+    return None
+
+
+def _backend_from_url(url: str) -> ResultCacheBackend:
+    if url == "memory":
+        return MemoryResultCache()
+    if url.startswith("sqlite:///"):
+        return SQLiteResultCache(url[len("sqlite:///") :])
+    if url.startswith("redis://"):
+        return RedisResultCache(url)
+    raise ValueError(f"Unknown RESULT_CACHE backend: {url}")
+
+
+_RESULT_CACHE: Optional[ResultCache] = None
+_RESULT_CACHE_CONFIGURED = False
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """The process-wide result cache, built from `RESULT_CACHE` on first use, None
+    when disabled"""
+    global _RESULT_CACHE, _RESULT_CACHE_CONFIGURED
+    if not _RESULT_CACHE_CONFIGURED:
+        with _RESULT_CACHE_LOCK:
+            if not _RESULT_CACHE_CONFIGURED:
+                if RESULT_CACHE:
+                    _RESULT_CACHE = ResultCache(_backend_from_url(RESULT_CACHE))
+                _RESULT_CACHE_CONFIGURED = True
+    return _RESULT_CACHE
+
+
+def set_result_cache(cache: Optional[ResultCache]) -> None:
+    """Replace the process-wide result cache, None disables it"""
+    global _RESULT_CACHE, _RESULT_CACHE_CONFIGURED
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE = cache
+        _RESULT_CACHE_CONFIGURED = True
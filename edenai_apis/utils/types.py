@@ -1,9 +1,68 @@
-from typing import Any, Dict, Generic, Optional, TypeVar
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Generic, Iterator, Optional, TypeVar
 
-from pydantic import StrictStr, BaseModel
+from pydantic import StrictStr, BaseModel, field_serializer
 
 T = TypeVar("T")
 
+# set by `interface.compute_output(include_original_response=False)`, see
+# `include_original_response`
+_INCLUDE_ORIGINAL_RESPONSE: ContextVar[bool] = ContextVar(
+    "include_original_response", default=True
+)
+
+
+def include_original_response() -> bool:
+    """Whether the caller wants the raw provider response, providers can skip
+    building expensive original responses (eg: protobuf to dict conversions) when not"""
+    return _INCLUDE_ORIGINAL_RESPONSE.get()
+
+
+@contextmanager
+def original_response_included(include: bool) -> Iterator[None]:
+    """Set `include_original_response` for the provider calls made in this block"""
+    token = _INCLUDE_ORIGINAL_RESPONSE.set(include)
+    try:
+        yield
+    finally:
+        _INCLUDE_ORIGINAL_RESPONSE.reset(token)
+
+
+class LazyOriginalResponse:
+    """Original response computed on first read or dump, see `lazy_original_response`"""
+
+    __slots__ = ("_compute", "_value", "_computed")
+
+    def __init__(self, compute: Callable[[], Any]) -> None:
+        self._compute = compute
+        self._value = None
+        self._computed = False
+
+    def get(self) -> Any:
+        if not self._computed:
+            self._value = self._compute()
+            self._computed = True
+            self._compute = None
+        return self._value
+
+
+def lazy_original_response(compute: Callable[[], Any]) -> Any:
+    """Wrap the computation of an original response so it only runs when needed
+
+    The raw response is computed when `ResponseType.original_response` is read or
+    dumped, and skipped altogether when the caller does not include original responses.
+
+    Args:
+        compute (Callable): function returning the original response
+
+    Returns:
+        LazyOriginalResponse, or None if original responses are not included
+    """
+    if not include_original_response():
+        return None
+    return LazyOriginalResponse(compute)
+
 
 class ResponseSuccess(BaseModel):
     status: StrictStr = "success"
@@ -13,6 +72,20 @@ class ResponseType(BaseModel, Generic[T]):
     original_response: Any
     standardized_response: T
 
+    def __getattribute__(self, name: str) -> Any:
+        value = super().__getattribute__(name)
+        if name == "original_response" and isinstance(value, LazyOriginalResponse):
+            # callers reading the field get the response itself, computed once
+            value = value.get()
+            self.__dict__["original_response"] = value
+        return value
+
+    @field_serializer("original_response", mode="wrap")
+    def _serialize_original_response(self, value: Any, handler: Callable) -> Any:
+        if isinstance(value, LazyOriginalResponse):
+            value = value.get()
+        return handler(value)
+
 
 class AsyncLaunchJobResponseType(BaseModel):
     provider_job_id: StrictStr
@@ -0,0 +1,123 @@
+"""
+Content-addressed cache of files uploaded to providers storage (S3, GCS...).
+
+Uploads are keyed by destination and content hash: sending the same file to the same
+bucket again (eg: running label, text and face detection on one video) reuses the
+object uploaded the first time, as long as it (or its presigned url) is still valid.
+Files are hashed by chunks, never loaded whole in memory, and the hash of a file on
+disk is memoized until it is modified.
+
+The cache can be tuned with the following environment variables:
+    - `UPLOAD_CACHE_MAX_SIZE`: maximum number of cached uploads (0 disables it)
+    - `UPLOAD_CACHE_TTL`: lifetime in seconds of uploaded objects without expiry
+    - `UPLOAD_CACHE_URL_MARGIN`: an expiring url is only reused if it stays valid
+      at least this many seconds, for the provider to download the file
+"""
+
+import hashlib
+import os
+import threading
+from typing import IO, Callable, Dict, Hashable, Optional, TypeVar
+
+from edenai_apis.utils.cache import LRUCache
+
+UPLOAD_CACHE_MAX_SIZE = int(os.environ.get("UPLOAD_CACHE_MAX_SIZE", 1000))
+UPLOAD_CACHE_TTL = float(os.environ.get("UPLOAD_CACHE_TTL", 3600))
+UPLOAD_CACHE_URL_MARGIN = float(os.environ.get("UPLOAD_CACHE_URL_MARGIN", 900))
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+T = TypeVar("T")
+
+UPLOAD_CACHE = LRUCache(UPLOAD_CACHE_MAX_SIZE)
+# file hashes by (path, size, modification time)
+_FILE_HASHES = LRUCache(UPLOAD_CACHE_MAX_SIZE)
+
+_UPLOAD_LOCKS: Dict[Hashable, threading.Lock] = {}
+_UPLOAD_LOCKS_LOCK = threading.Lock()
+
+
+def hash_fileobj(file: IO[bytes]) -> str:
+    """sha256 of a binary file object, read by chunks from its current position
+
+    The file position is restored afterwards, so it can still be uploaded.
+    """
+    position = file.tell()
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    file.seek(position)
+    return digest.hexdigest()
+
+
+def hash_file(file_path: str) -> str:
+    """sha256 of a file on disk, memoized until the file is modified"""
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+    file_hash = _FILE_HASHES.get(key)
+    if file_hash is None:
+        with open(file_path, "rb") as file:
+            file_hash = hash_fileobj(file)
+        _FILE_HASHES.set(key, file_hash)
+    return file_hash
+
+
+def url_ttl(expires_in: float) -> float:
+    """Time during which an url expiring in `expires_in` seconds can be reused"""
+    return max(expires_in - UPLOAD_CACHE_URL_MARGIN, 0)
+
+
+def cached_upload(
+    destination: Hashable,
+    content_hash: str,
+    upload: Callable[[], T],
+    ttl: Optional[float] = None,
+) -> T:
+    """Upload a content once per destination, return the cached result afterwards
+
+    Concurrent uploads of the same content to the same destination wait for the
+    first one instead of uploading it again.
+
+    Args:
+        destination (Hashable): where the content is uploaded, eg: ("s3", bucket)
+        content_hash (str): hash of the uploaded content, see `hash_file`
+        upload (Callable[[], T]): uploads the content, returns its uri or url
+        ttl (float, optional): how long the result can be reused, in seconds.
+            Defaults to `UPLOAD_CACHE_TTL`, 0 or less means it is not cached.
+
+    Returns:
+        T: result of `upload`, or of a previous upload of the same content
+    """
+    ttl = UPLOAD_CACHE_TTL if ttl is None else ttl
+    if ttl <= 0 or UPLOAD_CACHE_MAX_SIZE <= 0:
+        return upload()
+
+    key = (destination, content_hash)
+    uploaded = UPLOAD_CACHE.get(key)
+    if uploaded is not None:
+        return uploaded
+
+    with _UPLOAD_LOCKS_LOCK:
+        lock = _UPLOAD_LOCKS.setdefault(key, threading.Lock())
+    try:
+        with lock:
+            uploaded = UPLOAD_CACHE.get(key)
+            if uploaded is None:
+                uploaded = upload()
+                UPLOAD_CACHE.set(key, uploaded, ttl=ttl)
+            return uploaded
+    finally:
+        with _UPLOAD_LOCKS_LOCK:
+            if not lock.locked():
+                _UPLOAD_LOCKS.pop(key, None)
+
+
+def forget_upload(destination: Hashable, content_hash: str) -> None:
+    """Forget an upload, eg: when it turned out to fail after being cached"""
+    UPLOAD_CACHE.pop((destination, content_hash))
+
+
+def clear_upload_cache() -> None:
+    """Forget all uploads, eg: after the storage buckets were emptied"""
+    UPLOAD_CACHE.clear()
+    _FILE_HASHES.clear()
@@ -1,8 +1,11 @@
 import datetime
 import json
+import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from io import BytesIO
-from typing import Callable, Tuple
+from typing import Callable, List, Optional, Sequence, Set, Tuple
 from uuid import uuid4
 
 import boto3
@@ -14,6 +17,14 @@ from cryptography.hazmat.primitives.asymmetric import padding
 from edenai_apis.loaders.data_loader import ProviderDataEnum
 from edenai_apis.loaders.loaders import load_provider
 from edenai_apis.settings import keys_path
+from edenai_apis.utils.cache import LRUCache
+from edenai_apis.utils.upload_cache import (
+    cached_upload,
+    forget_upload,
+    hash_file,
+    hash_fileobj,
+    url_ttl,
+)
 
 BUCKET = ""
 BUCKET_RESSOURCE = ""
@@ -27,6 +38,22 @@ USER_PROCESS = "users_process"
 URL_SHORT_PERIOD = 3600
 URL_LONG_PERIOD = 3600 * 24 * 7
 
+# threads used by `upload_files_bytes_to_s3` and background uploads, separate from
+# the provider executor since providers methods running on it wait for these uploads
+S3_UPLOAD_MAX_WORKERS = int(os.environ.get("S3_UPLOAD_MAX_WORKERS", 8))
+# generated assets (USER_PROCESS) can be uploaded in the background, either for all
+# of them with `ASSET_UPLOAD_IN_BACKGROUND` or per call, as text to speech and image
+# generation and variation do (see their `*_resource_upload`). Their url is returned
+# before the file is on s3: until the upload is done (or forever if it fails) the url
+# answers 403/404. At most `ASSET_UPLOAD_QUEUE_SIZE` uploads can be pending, new ones wait for
+# a free slot, and the uploads of the last `ASSET_UPLOAD_TRACKED` urls can be checked
+# with `get_asset_upload`
+ASSET_UPLOAD_IN_BACKGROUND = (
+    os.environ.get("ASSET_UPLOAD_IN_BACKGROUND", "false").lower() == "true"
+)
+ASSET_UPLOAD_QUEUE_SIZE = int(os.environ.get("ASSET_UPLOAD_QUEUE_SIZE", 64))
+ASSET_UPLOAD_TRACKED = int(os.environ.get("ASSET_UPLOAD_TRACKED", 1024))
+
 
 def set_time_and_presigned_url_process(process_type: str) -> Tuple[Callable, int, str]:
     """Returns A tuple with the adequat function to call, the url expiration time and the bucket to which
@@ -45,54 +72,273 @@ def set_time_and_presigned_url_process(process_type: str) -> Tuple[Callable, int
         return get_cloud_front_file_url, URL_LONG_PERIOD, BUCKET_RESSOURCE
 
 
+_S3_CLIENT = None
+_PRIVATE_KEY = None
+_CLOUDFRONT_SIGNER = None
+_S3_LOCK = threading.Lock()
+_UPLOAD_EXECUTOR = None
+_ASSET_UPLOAD_SLOTS = threading.BoundedSemaphore(ASSET_UPLOAD_QUEUE_SIZE)
+_PENDING_UPLOADS: Set[Future] = set()
+_ASSET_UPLOADS = LRUCache(max_size=ASSET_UPLOAD_TRACKED, ttl=URL_LONG_PERIOD)
+
+
+def _get_upload_executor() -> ThreadPoolExecutor:
+    global _UPLOAD_EXECUTOR
+    if _UPLOAD_EXECUTOR is None:
+        with _S3_LOCK:
+            if _UPLOAD_EXECUTOR is None:
+                _UPLOAD_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=S3_UPLOAD_MAX_WORKERS,
+                    thread_name_prefix="edenai-s3-upload",
+                )
+    return _UPLOAD_EXECUTOR
+
+
+def _load_private_key():
+    global _PRIVATE_KEY
+    if _PRIVATE_KEY is None:
+        with _S3_LOCK:
+            if _PRIVATE_KEY is None:
+                with open(
+                    os.path.join(keys_path, "cloudfront_private_key.pem"), "rb"
+                ) as key:
+                    _PRIVATE_KEY = serialization.load_pem_private_key(
+                        key.read(), password=None, backend=default_backend()
+                    )
+    return _PRIVATE_KEY
+
+
 def rsa_signer(message):
-    with open(os.path.join(keys_path, "cloudfront_private_key.pem"), "rb") as key:
-        private_key = serialization.load_pem_private_key(
-            key.read(), password=None, backend=default_backend()
-        )
-    return private_key.sign(message, padding.PKCS1v15(), hashes.SHA1())
+    return _load_private_key().sign(message, padding.PKCS1v15(), hashes.SHA1())
 
 
 def s3_client_load():
-    api_settings = load_provider(ProviderDataEnum.KEY, "amazon")
-    aws_access_key_id = api_settings["aws_access_key_id"]
-    aws_secret_access_key = api_settings["aws_secret_access_key"]
-
-    global BUCKET, BUCKET_RESSOURCE, CLOUDFRONT_KEY_ID, REGION
-    BUCKET = api_settings["providers_resource_bucket"]
-    BUCKET_RESSOURCE = api_settings["users_resource_bucket"]
-    CLOUDFRONT_KEY_ID = api_settings["cloudfront_key_id"]
-    REGION = api_settings["ressource_region"]
-    return boto3.client(
-        "s3",
-        region_name=REGION,
-        aws_access_key_id=aws_access_key_id,
-        aws_secret_access_key=aws_secret_access_key,
-    )
+    """Get the S3 client and load amazon resources settings, both are created once
+    and shared by all threads (see `reload_s3_settings`)"""
+    global _S3_CLIENT
+    if _S3_CLIENT is not None:
+        return _S3_CLIENT
+    with _S3_LOCK:
+        if _S3_CLIENT is None:
+            api_settings = load_provider(ProviderDataEnum.KEY, "amazon")
+            aws_access_key_id = api_settings["aws_access_key_id"]
+            aws_secret_access_key = api_settings["aws_secret_access_key"]
+
+            global BUCKET, BUCKET_RESSOURCE, CLOUDFRONT_KEY_ID, REGION
+            BUCKET = api_settings["providers_resource_bucket"]
+            BUCKET_RESSOURCE = api_settings["users_resource_bucket"]
+            CLOUDFRONT_KEY_ID = api_settings["cloudfront_key_id"]
+            REGION = api_settings["ressource_region"]
+            _S3_CLIENT = boto3.client(
+                "s3",
+                region_name=REGION,
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+            )
+    return _S3_CLIENT
+
+
+def reload_s3_settings() -> None:
+    """Drop the S3 client, settings and CloudFront private key, they are loaded
+    again on next use, eg: after amazon keys were rotated"""
+    global _S3_CLIENT, _PRIVATE_KEY, _CLOUDFRONT_SIGNER
+    with _S3_LOCK:
+        _S3_CLIENT = None
+        _PRIVATE_KEY = None
+        _CLOUDFRONT_SIGNER = None
 
 
 def upload_file_to_s3(file_path: str, file_name: str, process_type=PROVIDER_PROCESS):
-    """Upload file to s3"""
-    filename = str(uuid4()) + "_" + str(file_name)
-    s3_client = s3_client_load()
-    func_call, process_time, bucket = set_time_and_presigned_url_process(process_type)
-    s3_client.upload_file(file_path, bucket, filename)
-    return func_call(filename, process_time)
+    """Upload file to s3, the url of a previous upload of the same file is reused
+    while it is still valid (see `utils.upload_cache`)"""
+
+    def upload() -> str:
+        filename = str(uuid4()) + "_" + str(file_name)
+        s3_client = s3_client_load()
+        func_call, process_time, bucket = set_time_and_presigned_url_process(
+            process_type
+        )
+        s3_client.upload_file(file_path, bucket, filename)
+        return func_call(filename, process_time)
+
+    return cached_upload(
+        ("s3", process_type, str(file_name)),
+        hash_file(file_path),
+        upload,
+        ttl=url_ttl(_url_period(process_type)),
+    )
 
 
 def upload_file_bytes_to_s3(
-    file: BytesIO, file_name: str, process_type: str = PROVIDER_PROCESS
+    file: BytesIO,
+    file_name: str,
+    process_type: str = PROVIDER_PROCESS,
+    background: Optional[bool] = None,
 ) -> str:
-    """Upload file byte to s3"""
-    filename = str(uuid4()) + "_" + str(file_name)
-    s3_client = s3_client_load()
-    func_call, process_time, bucket = set_time_and_presigned_url_process(process_type)
-    s3_client.upload_fileobj(file, bucket, filename)
-    return func_call(filename, process_time)
+    """Upload file byte to s3, the url of a previous upload of the same content is
+    reused while it is still valid (see `utils.upload_cache`)
+
+    Signed urls only depend on the object key, so when uploading in the background
+    the url is returned right away and the file is sent to s3 on the upload
+    executor. The url is not usable until the upload is done, its outcome can be
+    checked with `get_asset_upload`, see `ASSET_UPLOAD_IN_BACKGROUND`.
+
+    Args:
+        file (BytesIO): file content, it must not be modified afterwards
+        file_name (str): name of the uploaded file
+        process_type (str): Specifies the upload type. Defaults to PROVIDER_PROCESS.
+        background (bool, optional): upload in the background. Defaults to
+            `ASSET_UPLOAD_IN_BACKGROUND` for USER_PROCESS, providers need their
+            files to be uploaded before they download them.
+    """
+    if background is None:
+        background = _uploads_in_background(process_type)
+    background_uploads: List[Future] = []
+    destination = ("s3", process_type, str(file_name))
+    content_hash = hash_fileobj(file) if file.seekable() else None
+
+    def forget_failed_upload() -> None:
+        # do not reuse the url of an upload which failed
+        if content_hash is not None:
+            forget_upload(destination, content_hash)
+
+    def upload_in_background(s3_client, bucket: str, filename: str) -> None:
+        try:
+            s3_client.upload_fileobj(file, bucket, filename)
+        except Exception:
+            forget_failed_upload()
+            raise
+
+    def upload() -> str:
+        filename = str(uuid4()) + "_" + str(file_name)
+        s3_client = s3_client_load()
+        func_call, process_time, bucket = set_time_and_presigned_url_process(
+            process_type
+        )
+        if not background:
+            s3_client.upload_fileobj(file, bucket, filename)
+            return func_call(filename, process_time)
+        url = func_call(filename, process_time)
+        future = _upload_in_background(
+            upload_in_background, s3_client, bucket, filename
+        )
+        _ASSET_UPLOADS.set(url, future)
+        background_uploads.append(future)
+        return url
+
+    if content_hash is None:
+        return upload()
+    url = cached_upload(
+        destination,
+        content_hash,
+        upload,
+        ttl=url_ttl(_url_period(process_type)),
+    )
+
+    def forget_if_failed(future: Future) -> None:
+        # the upload may have failed before its url was cached
+        if future.cancelled() or future.exception() is not None:
+            forget_failed_upload()
+
+    for future in background_uploads:
+        future.add_done_callback(forget_if_failed)
+    return url
+
+
+def upload_files_bytes_to_s3(
+    files: Sequence[Tuple[BytesIO, str]],
+    process_type: str = PROVIDER_PROCESS,
+    background: Optional[bool] = None,
+) -> List[str]:
+    """Upload many files bytes to s3 concurrently, eg: all images generated by a
+    provider, see `upload_file_bytes_to_s3`
+
+    Args:
+        files (Sequence[Tuple[BytesIO, str]]): (file content, file name) to upload
+        process_type (str): Specifies the upload type. Defaults to PROVIDER_PROCESS.
+        background (bool, optional): upload in the background, see
+            `upload_file_bytes_to_s3`
+
+    Returns:
+        List[str]: urls of the files, in the same order
+    """
+    if background is None:
+        background = _uploads_in_background(process_type)
+    # background uploads return right away, and must not wait for a free upload slot
+    # from the threads running the uploads
+    if len(files) < 2 or background:
+        return [
+            upload_file_bytes_to_s3(file, file_name, process_type, background)
+            for file, file_name in files
+        ]
+    # load the shared client once before using it from several threads
+    s3_client_load()
+    futures = [
+        _get_upload_executor().submit(
+            upload_file_bytes_to_s3, file, file_name, process_type
+        )
+        for file, file_name in files
+    ]
+    return [future.result() for future in futures]
+
+
+def _uploads_in_background(process_type: str) -> bool:
+    return ASSET_UPLOAD_IN_BACKGROUND and process_type == USER_PROCESS
+
+
+def _upload_in_background(upload: Callable, *args) -> Future:
+    # waits for a free slot when too many uploads are pending, to cap memory usage
+    _ASSET_UPLOAD_SLOTS.acquire()
+    try:
+        future = _get_upload_executor().submit(upload, *args)
+    except BaseException:
+        _ASSET_UPLOAD_SLOTS.release()
+        raise
+    with _S3_LOCK:
+        _PENDING_UPLOADS.add(future)
+    future.add_done_callback(_background_upload_done)
+    return future
+
+
+def _background_upload_done(future: Future) -> None:
+    _ASSET_UPLOAD_SLOTS.release()
+    with _S3_LOCK:
+        _PENDING_UPLOADS.discard(future)
+    if not future.cancelled() and future.exception() is not None:
+        logging.error("Background upload to s3 failed: %s", future.exception())
+
+
+def get_asset_upload(url: str) -> Optional[Future]:
+    """Background upload of the file of `url`, None if it was uploaded synchronously
+    or is no longer tracked. Its result is None once the file is on s3, and its
+    exception the error of a failed upload (the url will never be usable)."""
+    return _ASSET_UPLOADS.get(url)
+
+
+def wait_for_asset_uploads(timeout: Optional[float] = None) -> bool:
+    """Wait for the pending background uploads, eg: before exiting
+
+    Returns:
+        bool: True if all uploads are done, False on timeout
+    """
+    with _S3_LOCK:
+        pending = list(_PENDING_UPLOADS)
+    _, not_done = wait(pending, timeout=timeout)
+    return not not_done
+
+
+def _url_period(process_type: str) -> int:
+    return URL_LONG_PERIOD if process_type == USER_PROCESS else URL_SHORT_PERIOD
 
 
 def get_cloud_front_file_url(filename: str, process_time: int) -> str:
-    cloudfront_signer = CloudFrontSigner(CLOUDFRONT_KEY_ID, rsa_signer)
+    global _CLOUDFRONT_SIGNER
+    s3_client_load()
+    cloudfront_signer = _CLOUDFRONT_SIGNER
+    if cloudfront_signer is None:
+        cloudfront_signer = _CLOUDFRONT_SIGNER = CloudFrontSigner(
+            CLOUDFRONT_KEY_ID, rsa_signer
+        )
 
     signed_url = cloudfront_signer.generate_presigned_url(
         f"{CLOUDFRONT_URL}{filename}",